@@ -41,9 +41,9 @@ def address_sla() -> SlaPolicy:
     constants if the skill registry cannot resolve it (keeps the demo self-contained).
     """
     try:
-        from bridge.adapters.local.skill_registry import LocalSkillRegistry
+        from bridge.adapters.local.skill_registry import shared_skill_registry
 
-        skill = LocalSkillRegistry()._skills.get("address-proof")
+        skill = shared_skill_registry().current().get("address-proof")
         if skill is not None and skill.policy is not None and skill.policy.sla is not None:
             return skill.policy.sla
     except Exception:
@@ -100,9 +100,8 @@ class DemoWorld:
         )
         self.exchanges: dict[str, _Exchange] = {chasing.id: chasing, hitl.id: hitl}
         # Schedule the SLA ladder on the chasing exchange (from tick 0).
-        self._timers = self.scheduler._timers  # (mutated by due() in place — A7)
         for timer in _plan(self.sla, context_id=CHASING_EXCHANGE):
-            self._timers[timer.id] = timer
+            self.scheduler.schedule_nowait(timer)  # (mutated by due() in place — A7)
 
     def reset(self) -> None:
         """Replay: reset the clock, scheduler, and read-model to their seeds."""
@@ -136,11 +135,18 @@ class DemoWorld:
                     exchange.ledger[i] = entry.model_copy(update={"disposition": new_disp})
                     if accept and doc_id.startswith("gov-id"):
                         exchange.outstanding = []
+                    if exchange.terminal:
+                        # Done: its follow-up summary shrinks to counts (M1.12).
+                        self.scheduler.retire_context(exchange.id)
                     return True
         return False
 
     def read_model(self) -> dict:
-        """Project the seeded exchanges + scheduler into the ops read-model snapshot."""
+        """Project the seeded exchanges + scheduler into the ops read-model snapshot.
+
+        Linear in exchanges: each follow-up status is read off the scheduler's
+        per-context tally, not filtered out of every timer.
+        """
         exchanges = []
         escalation_queue = []
         hitl_queue = []
@@ -13,6 +13,9 @@ to camel, lessons B3):
 - ``POST /portal/intake`` body ``{"context", "mode", "fixture_id", "text?", "fields?"}``
   → ``submit_intake(...)`` → ``{"fulfillment": FulfillmentResult, "screen": A2uiScreen}``.
   ``attempts`` are threaded per-context for the non-resumable resubmit loop (A1).
+  A multi-document upload sends ``"fixture_ids": [...]`` instead of ``fixture_id``
+  → ``submit_intakes(...)`` (one batched extraction) →
+  ``{"fulfillments": [FulfillmentResult, ...], "screen": A2uiScreen}``.
 
 Demo furniture (A9): imports the A2UI edge + fixture engine from ``bridge``.
 """
@@ -20,9 +23,15 @@ Demo furniture (A9): imports the A2UI edge + fixture engine from ``bridge``.
 from __future__ import annotations
 
 from bridge.adapters.local.extraction import FixtureExtractionEngine
-from bridge.adapters.local.skill_registry import LocalSkillRegistry
-from bridge.edges.a2ui import A2uiResponse, IntakeMode, build_screen, submit_intake
-from bridge.requirements import SkillExplanations, load_explanations, propose_requirements
+from bridge.adapters.local.skill_registry import shared_skill_registry
+from bridge.edges.a2ui import (
+    A2uiResponse,
+    IntakeMode,
+    build_screen,
+    submit_intake,
+    submit_intakes,
+)
+from bridge.requirements import SkillExplanations, propose_requirements
 from contract import CollectionStatus, LedgerEntry
 from starlette.applications import Starlette
 from starlette.requests import Request
@@ -38,8 +47,7 @@ DEFAULT_CONTEXT = "portal-demo"
 
 def _explanations() -> SkillExplanations:
     """Load the address-proof skill's verbatim explanations (M1.9 relay)."""
-    skill = LocalSkillRegistry()._skills.get("address-proof")
-    return load_explanations(skill) if skill is not None else SkillExplanations()
+    return shared_skill_registry().explanations("address-proof") or SkillExplanations()
 
 
 class _PortalContext:
@@ -87,32 +95,46 @@ def create_app() -> Starlette:
         context_id = body.get("context") or DEFAULT_CONTEXT
         ctx = _context(context_id)
 
+        fixture_ids = body.get("fixture_ids")
         try:
-            response = A2uiResponse(
-                mode=IntakeMode(body.get("mode", "upload")),
-                fixture_id=body.get("fixture_id"),
-                text=body.get("text"),
-                fields=body.get("fields") or {},
-            )
+            mode = IntakeMode(body.get("mode", "upload"))
+            if fixture_ids is not None:
+                if not isinstance(fixture_ids, list):
+                    raise ValueError("fixture_ids must be a list")
+                responses = [A2uiResponse(mode=mode, fixture_id=fid) for fid in fixture_ids]
+            else:
+                responses = [
+                    A2uiResponse(
+                        mode=mode,
+                        fixture_id=body.get("fixture_id"),
+                        text=body.get("text"),
+                        fields=body.get("fields") or {},
+                    )
+                ]
         except Exception as exc:  # bad mode / shape
             return json_response({"error": f"invalid intake: {exc}"}, status_code=400)
 
         try:
-            result = await submit_intake(response, engine=engine, attempts=ctx.attempts)
+            if fixture_ids is not None:
+                results = await submit_intakes(responses, engine=engine, attempts=ctx.attempts)
+            else:
+                results = [await submit_intake(responses[0], engine=engine, attempts=ctx.attempts)]
         except ValueError as exc:  # e.g. missing fixture_id in Phase-1 local
             return json_response({"error": str(exc)}, status_code=400)
 
-        # Record the classified entry into the context ledger so the refreshed screen
-        # reflects it. Thread attempts forward on the non-resumable resubmit loop (A1).
-        if result.entry is not None:
-            ctx.upsert(result.entry)
-        if result.awaiting_resubmission:
-            ctx.attempts = result.attempts
-
-        payload = {
-            "fulfillment": result.model_dump(mode="json"),
-            "screen": _screen_json(ctx),
-        }
+        # Record the classified entries into the context ledger so the refreshed screen
+        # reflects them. Thread attempts forward on the non-resumable resubmit loop (A1).
+        for result in results:
+            if result.entry is not None:
+                ctx.upsert(result.entry)
+            if result.awaiting_resubmission:
+                ctx.attempts = result.attempts
+
+        if fixture_ids is not None:
+            payload = {"fulfillments": [result.model_dump(mode="json") for result in results]}
+        else:
+            payload = {"fulfillment": results[0].model_dump(mode="json")}
+        payload["screen"] = _screen_json(ctx)
         return json_response(payload)
 
     routes = [
@@ -2,7 +2,12 @@
 
 from .app import build_agent_card, create_app
 from .executor import MockBridgeExecutor
-from .fixtures import build_exchange_turn, load_entry, load_gov_id_clean_entry
+from .fixtures import (
+    build_exchange_turn,
+    load_entry,
+    load_fixture_index,
+    load_gov_id_clean_entry,
+)
 from .scenarios import (
     GOV_ID_INSTANT,
     REJECT_RESUBMIT,
@@ -18,6 +23,7 @@ __all__ = [
     "create_app",
     "GOV_ID_INSTANT",
     "load_entry",
+    "load_fixture_index",
     "load_gov_id_clean_entry",
     "MockBridgeExecutor",
     "MockScenario",
@@ -2,11 +2,18 @@
 
 This module loads eval data from wiki/evals/address/expected.json and builds
 ExchangeTurn responses for the mock server.
+
+The corpus is parsed once per file into a fixture index (entry id -> LedgerEntry),
+re-read only when the file's mtime or size changes, so ``load_entry`` is a stat and a
+dict lookup — the console SSE stream and the mock executor do no per-entry file I/O.
+The returned entries are shared between callers; treat them as values.
 """
 
 import json
 import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from contract import CollectionStatus, Disposition, ExchangeTurn, Extraction, LedgerEntry
 
@@ -37,8 +44,57 @@ def _resolve_evals_path(evals_path: Path | None) -> Path:
     return evals_path
 
 
+# Parsed corpora: path -> ((mtime_ns, size) it was parsed at, entry id -> LedgerEntry).
+_fixture_indexes: dict[Path, tuple[tuple[int, int], Mapping[str, LedgerEntry]]] = {}
+
+
+def _ledger_entry(entry: dict) -> LedgerEntry:
+    # The raw eval entry has extra keys that fail LedgerEntry's
+    # extra="forbid". Build LedgerEntry explicitly:
+    ext = Extraction.model_validate(entry["extraction"])
+    return LedgerEntry(
+        id=entry["id"],
+        doctype=entry["doctype"],
+        issuer=entry["issuer"],
+        disposition=Disposition(entry["expected_disposition"]),
+        extraction=ext,
+    )
+
+
+def load_fixture_index(evals_path: Path | None = None) -> Mapping[str, LedgerEntry]:
+    """Return the evals fixture as an entry id -> LedgerEntry index (parsed once).
+
+    The index is cached per path and revalidated by the file's mtime and size, so an
+    edited corpus is picked up on the next call without a restart.
+
+    Args:
+        evals_path: Explicit path to expected.json; if None, reads from
+            ADDRESS_EVALS_PATH env var or falls back to
+            repo_root/wiki/evals/address/expected.json.
+
+    Returns:
+        A read-only mapping of every entry in the fixture, in fixture order.
+
+    Raises:
+        FileNotFoundError: If the fixture file doesn't exist.
+    """
+    evals_path = _resolve_evals_path(evals_path)
+    stat = evals_path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _fixture_indexes.get(evals_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with open(evals_path) as f:
+        data = json.load(f)
+
+    index = MappingProxyType({e["id"]: _ledger_entry(e) for e in data.get("documents", [])})
+    _fixture_indexes[evals_path] = (version, index)
+    return index
+
+
 def load_entry(entry_id: str, evals_path: Path | None = None) -> LedgerEntry:
-    """Load any entry from the address evals fixture.
+    """Load any entry from the address evals fixture (an O(1) fixture-index lookup).
 
     Args:
         entry_id: The id of the entry to load (e.g., "gov-id-clean",
@@ -57,28 +113,12 @@ def load_entry(entry_id: str, evals_path: Path | None = None) -> LedgerEntry:
     Note:
         The raw eval entry has extra keys (issuer_raw, expected_disposition,
         expected_gate, artifact, synthetic, note) that fail LedgerEntry's
-        extra="forbid". This function maps explicitly to the LedgerEntry fields.
+        extra="forbid". The index maps explicitly to the LedgerEntry fields.
     """
-    evals_path = _resolve_evals_path(evals_path)
-
-    with open(evals_path) as f:
-        data = json.load(f)
-
-    for entry in data.get("documents", []):
-        if entry["id"] == entry_id:
-            # The raw eval entry has extra keys that fail LedgerEntry's
-            # extra="forbid". Build LedgerEntry explicitly:
-            ext = Extraction.model_validate(entry["extraction"])
-            le = LedgerEntry(
-                id=entry["id"],
-                doctype=entry["doctype"],
-                issuer=entry["issuer"],
-                disposition=Disposition(entry["expected_disposition"]),
-                extraction=ext,
-            )
-            return le
-
-    raise ValueError(f"{entry_id} entry not found in the fixture")
+    entry = load_fixture_index(evals_path).get(entry_id)
+    if entry is None:
+        raise ValueError(f"{entry_id} entry not found in the fixture")
+    return entry
 
 
 def load_gov_id_clean_entry(evals_path: Path | None = None) -> LedgerEntry:
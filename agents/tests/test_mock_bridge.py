@@ -174,6 +174,41 @@ def test_load_entry_distinct_issuer_bills():
     assert aqua.disposition == Disposition.ACCEPTED
 
 
+def test_fixture_index_parses_once_and_revalidates_on_change(tmp_path, monkeypatch):
+    """load_entry reads the corpus once per version; an edit is picked up by mtime."""
+    import json
+    import os
+
+    from agents.mock_bridge import fixtures, load_entry, load_fixture_index
+
+    source = fixtures._resolve_evals_path(None)
+    corpus = tmp_path / "expected.json"
+    corpus.write_text(source.read_text())
+
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(fixtures.json, "load", lambda f: loads.append(1) or real_load(f))
+
+    first = load_entry("gov-id-clean", corpus)
+    assert load_entry("bill-powerco-clean", corpus).issuer == "power-co"
+    assert load_entry("gov-id-clean", corpus) is first
+    assert load_fixture_index(corpus)["gov-id-clean"] == load_gov_id_clean_entry()
+    assert len(loads) == 1
+    with pytest.raises(ValueError, match="not-there entry not found"):
+        load_entry("not-there", corpus)
+
+    data = json.loads(corpus.read_text())
+    data["documents"] = [d for d in data["documents"] if d["id"] == "gov-id-clean"]
+    corpus.write_text(json.dumps(data))
+    stat = corpus.stat()
+    os.utime(corpus, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(load_fixture_index(corpus)) == ["gov-id-clean"]
+    assert len(loads) == 2
+    with pytest.raises(FileNotFoundError):
+        load_entry("gov-id-clean", tmp_path / "missing.json")
+
+
 def test_two_bills_scenario_steps():
     """TWO_BILLS scenario steps: round 0 not terminal, round 1 terminal, clamp."""
     from agents.mock_bridge import TWO_BILLS
@@ -45,12 +45,15 @@ def test_state_read_model_buckets():
 
 
 def test_hitl_approve_resolves_item():
-    client = TestClient(create_app())
+    world = DemoWorld()
+    client = TestClient(create_app(world))
 
     resp = client.post("/ops/hitl/gov-id-expired/approve")
     assert resp.status_code == 200
     state = resp.json()["state"]
     assert all(h["doc_id"] != "gov-id-expired" for h in state["hitl_queue"])
+    # The now-terminal exchange is retired from the scheduler.
+    assert HITL_EXCHANGE in world.scheduler._retired
 
     # Idempotency guard: resolving again 404s (no longer pending).
     assert client.post("/ops/hitl/gov-id-expired/approve").status_code == 404
@@ -1,7 +1,8 @@
 """Frontend-v1 — Provider Portal BFF tests (A2UI Path-B wrapper).
 
 Asserts the three canonical dispositions travel through ``POST /portal/intake``
-(auto-approve / resubmit / rejected), that the refreshed screen reflects the
+(auto-approve / resubmit / rejected), that a multi-document upload is answered
+per document, that the refreshed screen reflects the
 classified ledger, and that ``GET /portal/screen`` round-trips a declarative
 ``A2uiScreen`` (content-not-pixels, M1.10).
 """
@@ -82,7 +83,36 @@ def test_intake_reflected_in_subsequent_screen():
     assert screen["status"]["done"] is True
 
 
+def test_multi_document_upload_returns_one_fulfillment_per_document():
+    client = TestClient(create_app())
+    resp = client.post(
+        "/portal/intake",
+        json={
+            "context": "ctx-multi",
+            "mode": "upload",
+            "fixture_ids": ["bill-aquautil-blurry", "gov-id-clean"],
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    phases = [fulfillment["phase"] for fulfillment in body["fulfillments"]]
+    assert phases == ["resubmit", "auto_approve"]
+    sent_ids = {doc["id"] for doc in body["screen"]["status"]["sent"]}
+    assert {"bill-aquautil-blurry", "gov-id-clean"} <= sent_ids
+
+    # The blurry bill's resubmission is threaded per context, as for a single upload.
+    again = _intake(client, "ctx-multi", "bill-aquautil-blurry")
+    assert again["fulfillment"]["attempts"] == 2
+
+
 def test_missing_fixture_id_400():
     client = TestClient(create_app())
     resp = client.post("/portal/intake", json={"context": "ctx-x", "mode": "upload"})
     assert resp.status_code == 400
+
+
+def test_fixture_ids_must_be_a_list_of_ids_400():
+    client = TestClient(create_app())
+    for fixture_ids in ("gov-id-clean", ["gov-id-clean", None]):
+        resp = client.post("/portal/intake", json={"context": "ctx-x", "fixture_ids": fixture_ids})
+        assert resp.status_code == 400
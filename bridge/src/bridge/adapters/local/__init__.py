@@ -6,12 +6,21 @@ here in M1.2+/deploy.
 
 Local adapters:
 - Sessions: InMemorySessionService (google.adk.sessions — native class, no skeleton)
-- Task store: InMemoryTaskStore (a2a.server.tasks — native class, no skeleton)
+- Task store: InMemoryTaskStore (a2a.server.tasks — native class, no skeleton);
+    durable: SequencedTaskStore (DatabaseTaskStore + atomic per-context ordinals)
 - Exchange store: LocalExchangeStore (in-memory, M1.2)
 - Skill registry: LocalSkillRegistry (directory-backed, loads Agent Skills folders +
     builds dynamic Agent Card; BRIDGE_SKILLS_DIR env override, M1.3)
-- Scheduler: LocalScheduler (in-memory + virtual clock, M1.12)
-- Extraction: FixtureExtractionEngine (deterministic fixtures, M1.7)
+- Scheduler: LocalScheduler (in-memory + virtual clock, M1.12);
+    durable: DatabaseScheduler (SQLite timer table, atomic UPDATE … RETURNING claim);
+    opt-in: TimingWheelScheduler (hierarchical timing wheel, very high timer counts)
+- Extraction: FixtureExtractionEngine (deterministic fixtures, M1.7);
+    opt-in: CachingExtractionEngine (content-addressed result cache over any engine,
+    optional DatabaseExtractionCache SQLite tier)
+    opt-in: MicroBatchingExtractionEngine (coalesces concurrent extract calls into
+    extract_many batches)
+    opt-in: ExtractionRouter (ordered engines with a deadline, p95 hedging and
+    circuit breakers)
 
 GCP adapters land in Sprint 2 via a parallel build_gcp_adapter factory.
 """
@@ -23,35 +32,47 @@ from bridge.adapters.local.exchange_store import LocalExchangeStore
 from bridge.adapters.local.extraction import FixtureExtractionEngine
 from bridge.adapters.local.scheduler import LocalScheduler
 from bridge.adapters.local.skill_registry import LocalSkillRegistry
+from bridge.scheduler import VirtualClock, WallClock
 from bridge.seams import Seam
 
 __all__ = ["build_local_adapter"]
 
 
-def build_local_adapter(seam: Seam, *, durable: bool = False, db_path: str | None = None) -> object:
+def build_local_adapter(
+    seam: Seam,
+    *,
+    durable: bool = False,
+    db_path: str | None = None,
+    clock: VirtualClock | WallClock | None = None,
+) -> object:
     """Build and return a local adapter instance for the given seam.
 
     Args:
         seam: The seam to build an adapter for.
-        durable: When True, SESSIONS/TASK_STORE return the SQLite-backed
-            ``Database*`` variants (survive a process restart — lessons A13); the
-            other seams ignore it. ``db_path`` is then required. Default False
-            keeps the M1.1 in-memory behavior.
+        durable: When True, SESSIONS/TASK_STORE/SCHEDULER return the SQLite-backed
+            ``Database*`` variants (survive a process restart — lessons A13; the task
+            store is the ``SequencedTaskStore`` subclass); the other seams ignore it.
+            ``db_path`` is then required. Default False keeps the M1.1 in-memory
+            behavior.
         db_path: Filesystem path for the SQLite database when ``durable=True``.
+        clock: The SCHEDULER's clock (other seams ignore it). Default: a
+            ``VirtualClock`` at tick 0 in memory (time-warp demos), a ``WallClock`` when
+            durable — persisted ``fire_at`` ticks must mean the same instant after a
+            restart, which a virtual clock that restarts at 0 in every process breaks.
 
     Returns:
         A local adapter instance conforming to the seam's Protocol.
 
     Raises:
         ValueError: If the seam is not recognized, or ``durable=True`` is requested
-            for SESSIONS/TASK_STORE without a ``db_path``.
+            for SESSIONS/TASK_STORE/SCHEDULER without a ``db_path``.
 
     Note: Env-var seam selection (C3: BRIDGE_SEAM_*, BRIDGE_EXTRACTION_ENGINE)
     will layer on here in M1.2+/deploy. Today this is a direct seam→adapter dispatch.
     The durable variant keeps the "swap is a no-op for the agent" idiom: same seam,
     same Protocol, storage swapped (InMemory* ↔ Database* on sqlite+aiosqlite).
     """
-    if durable and seam in (Seam.SESSIONS, Seam.TASK_STORE):
+    if durable and seam in (Seam.SESSIONS, Seam.TASK_STORE, Seam.SCHEDULER):
         if not db_path:
             raise ValueError(f"durable={seam.value} requires a db_path")
         # Lazy import so a plain `import bridge.adapters.local` does not pull
@@ -63,16 +84,20 @@ def build_local_adapter(seam: Seam, *, durable: bool = False, db_path: str | Non
             from google.adk.sessions import DatabaseSessionService
 
             return DatabaseSessionService(db_url=db_url)
-        from a2a.server.tasks import DatabaseTaskStore
+        if seam == Seam.SCHEDULER:
+            from bridge.adapters.local.durable_scheduler import DatabaseScheduler
 
-        return DatabaseTaskStore(engine=create_async_engine(db_url), create_table=True)
+            return DatabaseScheduler(create_async_engine(db_url), clock=clock or WallClock())
+        from bridge.adapters.local.task_store import SequencedTaskStore
+
+        return SequencedTaskStore(engine=create_async_engine(db_url), create_table=True)
 
     builders = {
         Seam.SESSIONS: lambda: InMemorySessionService(),
         Seam.TASK_STORE: lambda: InMemoryTaskStore(),
         Seam.EXCHANGE_STORE: lambda: LocalExchangeStore(),
         Seam.SKILL_REGISTRY: lambda: LocalSkillRegistry(),
-        Seam.SCHEDULER: lambda: LocalScheduler(clock=None),
+        Seam.SCHEDULER: lambda: LocalScheduler(clock=clock),
         Seam.EXTRACTION: lambda: FixtureExtractionEngine(),
     }
 
@@ -0,0 +1,77 @@
+"""Durable extraction cache tier: SQLite table of content-addressed results (M1.7 follow-up).
+
+The persistent second tier of
+:class:`~bridge.adapters.local.extraction_cache.CachingExtractionEngine`: a
+``bridge_extraction_cache`` table on ``sqlite+aiosqlite`` mapping the cache key
+(document SHA-256 + doctype skill version) to the Extraction's JSON. A re-sent file
+is then answered from cache across a restart, and by every process sharing the file.
+
+Entries never go stale — a key names immutable content under one skill version — so
+there is no expiry; a new skill version simply keys new rows.
+
+SQLite only (``ON CONFLICT … DO UPDATE``). Import discipline: pulls ``sqlalchemy``;
+import it explicitly (a plain ``import bridge.adapters.local`` stays sqlalchemy-free).
+"""
+
+from __future__ import annotations
+
+from contract import Extraction
+from sqlalchemy import Column, MetaData, String, Table, Text, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = ["EXTRACTION_CACHE_TABLE", "DatabaseExtractionCache"]
+
+#: Name of the durable extraction cache table.
+EXTRACTION_CACHE_TABLE = "bridge_extraction_cache"
+
+_metadata = MetaData()
+
+_entries = Table(
+    EXTRACTION_CACHE_TABLE,
+    _metadata,
+    Column("key", String, primary_key=True),
+    Column("extraction", Text, nullable=False),
+)
+
+
+class DatabaseExtractionCache:
+    """SQLite-backed ``ExtractionCacheStore``.
+
+    Args:
+        engine: An async SQLAlchemy engine on ``sqlite+aiosqlite``.
+        create_table: Create the cache table on first use (default True).
+    """
+
+    def __init__(self, engine: AsyncEngine, *, create_table: bool = True) -> None:
+        """Initialize the store over ``engine``."""
+        self.engine = engine
+        self.create_table = create_table
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Create the cache table (idempotent)."""
+        if self._initialized:
+            return
+        if self.create_table:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(_metadata.create_all)
+        self._initialized = True
+
+    async def get(self, key: str) -> Extraction | None:
+        """Return the cached Extraction for ``key``, or None (primary-key lookup)."""
+        await self.initialize()
+        stmt = select(_entries.c.extraction).where(_entries.c.key == key)
+        async with self.engine.connect() as conn:
+            payload = (await conn.execute(stmt)).scalar()
+        return Extraction.model_validate_json(payload) if payload is not None else None
+
+    async def put(self, key: str, extraction: Extraction) -> None:
+        """Store ``extraction`` under ``key`` (upsert)."""
+        await self.initialize()
+        stmt = insert(_entries).values(key=key, extraction=extraction.model_dump_json())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_entries.c.key], set_={"extraction": stmt.excluded.extraction}
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt)
@@ -0,0 +1,300 @@
+"""Durable local scheduler adapter: SQLite timer table with an atomic claim (M1.12).
+
+``LocalScheduler`` keeps its timers in memory, so an SLA ladder vanishes on restart.
+:class:`DatabaseScheduler` is the same ``SchedulerSeam`` over a ``bridge_timers``
+table on ``sqlite+aiosqlite`` — the local analogue of the ``Database*`` session and
+task stores (lessons A13: restore is platform-default with a durable store).
+
+Exactly-once (lessons-learned.md A7) is enforced the way the seam requires of a
+persistent adapter — an atomic mark-as-fired + return: ``due(now)`` is a single
+``UPDATE … SET fired = 1 WHERE fired = 0 AND fire_at <= :now RETURNING …``. SQLite
+serializes writers, so when several worker processes poll the same file each due
+timer is claimed by exactly one of them. The pending scan runs on a
+``(fired, fire_at)`` index, so a tick reads only the ready rows.
+
+SQLite only (``ON CONFLICT … DO UPDATE`` / ``RETURNING``, SQLite ≥ 3.35). Import
+discipline: pulls ``sqlalchemy``, so it is imported lazily by
+:func:`bridge.adapters.local.build_local_adapter` (a plain
+``import bridge.adapters.local`` stays sqlalchemy-free).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    false,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from bridge.scheduler import (
+    FollowupStatus,
+    SlaPolicy,
+    Timer,
+    TimerKind,
+    VirtualClock,
+    WallClock,
+    followup_status,
+    plan_followups,
+)
+
+__all__ = ["TIMER_TABLE", "DatabaseScheduler"]
+
+#: Name of the durable timer table.
+TIMER_TABLE = "bridge_timers"
+
+_metadata = MetaData()
+
+_timers = Table(
+    TIMER_TABLE,
+    _metadata,
+    Column("id", String, primary_key=True),
+    Column("context_id", String, nullable=False),
+    Column("task_id", String, nullable=True),
+    Column("fire_at", Integer, nullable=False),
+    Column("kind", String, nullable=False),
+    Column("sequence", Integer, nullable=False, default=0),
+    Column("fired", Boolean, nullable=False, default=False),
+    Index("idx_bridge_timers_pending", "fired", "fire_at"),
+    Index("idx_bridge_timers_context", "context_id"),
+    Index("idx_bridge_timers_task", "task_id"),
+)
+
+
+def _create_indexes(sync_conn) -> None:
+    """Add indexes introduced after a timer table was first created (idempotent)."""
+    for index in _timers.indexes:
+        index.create(sync_conn, checkfirst=True)
+
+
+def _row(timer: Timer) -> dict:
+    return {
+        "id": timer.id,
+        "context_id": timer.context_id,
+        "task_id": timer.task_id,
+        "fire_at": timer.fire_at,
+        "kind": timer.kind.value,
+        "sequence": timer.sequence,
+        "fired": timer.fired,
+    }
+
+
+def _timer(row) -> Timer:
+    return Timer(
+        id=row.id,
+        context_id=row.context_id,
+        fire_at=row.fire_at,
+        kind=TimerKind(row.kind),
+        sequence=row.sequence,
+        task_id=row.task_id,
+        fired=bool(row.fired),
+    )
+
+
+class DatabaseScheduler:
+    """SQLite-backed scheduler adapter with injectable clock.
+
+    Same behavior as :class:`~bridge.adapters.local.scheduler.LocalScheduler` —
+    upsert ``schedule``, idempotent ``cancel``, ``due()`` in ``(fire_at, sequence,
+    id)`` order (A5) with every returned timer ``fired`` (A7) — but the timers live in
+    a table and survive a restart. The returned timers are fresh objects read back
+    from the claim, already marked fired.
+
+    Args:
+        engine: An async SQLAlchemy engine on ``sqlite+aiosqlite``.
+        clock: Injectable clock (default: a fresh ``VirtualClock()`` at tick 0; the
+            durable seam factory passes a ``WallClock``).
+        create_table: Create the timer table on first use (default True).
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        clock: VirtualClock | WallClock | None = None,
+        *,
+        create_table: bool = True,
+    ) -> None:
+        """Initialize the scheduler over ``engine``."""
+        self.engine = engine
+        self.clock = clock or VirtualClock()
+        self.create_table = create_table
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Create the timer table and its indexes (idempotent)."""
+        if self._initialized:
+            return
+        if self.create_table:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(_metadata.create_all)
+                await conn.run_sync(_create_indexes)
+        self._initialized = True
+
+    async def schedule(self, timer: Timer) -> None:
+        """Schedule a new timer (upsert by ``timer.id`` — idempotent).
+
+        Args:
+            timer: The timer to schedule.
+        """
+        await self.schedule_many([timer])
+
+    async def schedule_many(self, timers: Iterable[Timer]) -> None:
+        """Schedule a batch of timers in one transaction (upsert by id).
+
+        One ``INSERT … ON CONFLICT DO UPDATE`` executed over every row: a 1,000-leg
+        program's ladders cost one round-trip, and the batch lands all-or-nothing.
+
+        Args:
+            timers: The timers to schedule (a later duplicate id wins).
+        """
+        rows = list({timer.id: _row(timer) for timer in timers}.values())
+        if not rows:
+            return
+        await self.initialize()
+        stmt = insert(_timers)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_timers.c.id],
+            set_={name: stmt.excluded[name] for name in rows[0] if name != "id"},
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(stmt, rows)
+
+    async def due(self, now: int | None = None) -> list[Timer]:
+        """Claim all timers due at or before ``now``, marking them fired atomically.
+
+        CRITICAL (lessons-learned.md A7): the claim is one ``UPDATE … RETURNING``
+        statement — a timer is returned by exactly one ``due()`` call, across every
+        process sharing the database, and never again.
+
+        Deterministic ordering (lessons-learned.md A5): output is sorted by
+        ``(fire_at, sequence, id)`` (``RETURNING`` row order is unspecified).
+
+        Args:
+            now: The tick to check (default: ``self.clock.now()``).
+
+        Returns:
+            A list of fired timers, sorted deterministically.
+        """
+        if now is None:
+            now = self.clock.now()
+        await self.initialize()
+        claim = (
+            update(_timers)
+            .where(_timers.c.fired == false(), _timers.c.fire_at <= now)
+            .values(fired=True)
+            .returning(*_timers.c)
+        )
+        async with self.engine.begin() as conn:
+            rows = (await conn.execute(claim)).all()
+        due_timers = [_timer(row) for row in rows]
+        due_timers.sort(key=lambda t: (t.fire_at, t.sequence, t.id))
+        return due_timers
+
+    async def cancel(self, timer_id: str) -> None:
+        """Cancel a scheduled timer by ID (idempotent — no error if missing).
+
+        Args:
+            timer_id: The timer ID to cancel.
+        """
+        await self._delete(_timers.c.id == timer_id)
+
+    async def cancel_context(self, context_id: str) -> int:
+        """Cancel every unfired timer of ``context_id`` in one ``DELETE`` (context index).
+
+        Fired rows are kept: closing an exchange must not erase its follow-up history.
+
+        Args:
+            context_id: The exchange ``context_id``.
+
+        Returns:
+            The number of timers cancelled.
+        """
+        return await self._delete(_timers.c.context_id == context_id, _timers.c.fired == false())
+
+    async def cancel_task(self, task_id: str) -> int:
+        """Cancel every unfired timer scoped to ``task_id`` in one ``DELETE`` (task index).
+
+        Fired rows are kept, as for :meth:`cancel_context`.
+
+        Args:
+            task_id: The task the timers were planned for.
+
+        Returns:
+            The number of timers cancelled.
+        """
+        return await self._delete(_timers.c.task_id == task_id, _timers.c.fired == false())
+
+    async def _delete(self, *conditions) -> int:
+        await self.initialize()
+        async with self.engine.begin() as conn:
+            return (await conn.execute(delete(_timers).where(*conditions))).rowcount
+
+    # --- Convenience helpers (not part of the seam Protocol) ---
+
+    async def next_fire_at(self) -> int | None:
+        """Return the earliest ``fire_at`` of an unfired timer, or None (pending index)."""
+        await self.initialize()
+        stmt = select(func.min(_timers.c.fire_at)).where(_timers.c.fired == false())
+        async with self.engine.connect() as conn:
+            return (await conn.execute(stmt)).scalar()
+
+    async def schedule_followups(
+        self,
+        sla: SlaPolicy,
+        *,
+        context_id: str,
+        task_id: str | None = None,
+        start: int | None = None,
+    ) -> list[Timer]:
+        """Plan and schedule the SLA ladder (see ``LocalScheduler.schedule_followups``).
+
+        Args:
+            sla: The SLA policy.
+            context_id: The exchange ``context_id``.
+            task_id: Optional task ID (for per-task timers).
+            start: The tick to measure the ladder from (default: ``self.clock.now()``).
+
+        Returns:
+            The list of scheduled timers.
+        """
+        if start is None:
+            start = self.clock.now()
+
+        timers = plan_followups(sla, start=start, context_id=context_id, task_id=task_id)
+        await self.schedule_many(timers)
+        return timers
+
+    async def load_timers(self, context_id: str) -> list[Timer]:
+        """Return a context's timers (fired or not) in ``(fire_at, sequence, id)`` order."""
+        await self.initialize()
+        stmt = (
+            select(_timers)
+            .where(_timers.c.context_id == context_id)
+            .order_by(_timers.c.fire_at, _timers.c.sequence, _timers.c.id)
+        )
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(stmt)).all()
+        return [_timer(row) for row in rows]
+
+    async def load_followups(self, context_id: str) -> FollowupStatus:
+        """Compute the follow-up status read-model for a context (async: reads the table).
+
+        Args:
+            context_id: The exchange ``context_id``.
+
+        Returns:
+            A ``FollowupStatus`` snapshot.
+        """
+        return followup_status(await self.load_timers(context_id), context_id=context_id)
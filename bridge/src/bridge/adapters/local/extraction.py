@@ -1,8 +1,20 @@
 """Fixture extraction engine adapter (deterministic, local).
 
 Deterministic fixture-based extraction engine for the local development environment.
-Maps a Path-B intake (keyed to an eval fixture) to an Extraction loaded from
-wiki/evals/address/expected.json. No Gemini, no network.
+Maps a Path-B intake (keyed to an eval fixture) to an Extraction loaded from the eval
+corpora — wiki/evals/<use-case>/expected.json for every use-case (address, benefits,
+rfp, ...). No Gemini, no network.
+
+The corpora are read into a :class:`FixtureIndex`: every fixture's extraction is
+validated up front and filed by fixture id, so ``extract`` is a dict lookup, and a
+load test can replay every demo domain's fixtures (``FixtureIndex.ids``). Each corpus
+is parsed once and revalidated by its file's mtime and size, so an edited corpus is
+picked up without a restart. A corpus that cannot be read or validated is left out
+of the index and reported in ``FixtureIndex.errors`` — it does not take the other
+use-cases' fixtures down with it. Fixture ids are unique across corpora: an id found
+in two is ambiguous, so it is reported as an error on the later corpus and only that
+id fails to extract (``FixtureIndex.duplicates``). The returned Extraction objects
+are shared between calls — treat them as values.
 
 Satisfies the ExtractionSeam protocol. Gemini is Sprint 2; DocAI is Phase 4.
 See ADR-0005 for the capability-axis contract.
@@ -10,15 +22,24 @@ See ADR-0005 for the capability-axis contract.
 
 import json
 import os
-from functools import lru_cache
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 from contract import Extraction
 from pydantic import BaseModel
 
 from bridge.seams.extraction import ExtractionError, ExtractionSeam
 
-__all__ = ["FixtureDocument", "FixtureExtractionEngine", "resolve_extraction_engine"]
+__all__ = [
+    "FixtureDocument",
+    "FixtureExtractionEngine",
+    "FixtureIndex",
+    "default_fixture_corpora",
+    "load_fixture_index",
+    "resolve_extraction_engine",
+]
 
 
 class FixtureDocument(BaseModel, frozen=True):
@@ -75,37 +96,218 @@ def _resolve_evals_path() -> Path:
     )
 
 
-@lru_cache(maxsize=1)
-def _load_expected_json() -> dict:
-    """Load and cache the expected.json fixture data.
+def _resolve_evals_root() -> Path | None:
+    """Resolve the wiki/evals/ directory holding one corpus folder per use-case.
 
-    Returns:
-        Parsed JSON data (dict with "party" and "documents" keys).
+    Resolution order:
+    1. BRIDGE_EVALS_DIR env var (if set)
+    2. Walk up from this file to the first ancestor containing wiki/evals/
+    3. None (only the address corpus, via ADDRESS_EVALS_PATH, is then available)
+    """
+    if "BRIDGE_EVALS_DIR" in os.environ:
+        return Path(os.environ["BRIDGE_EVALS_DIR"])
+
+    current = Path(__file__).resolve().parent
+    while current != current.parent:
+        evals_dir = current / "wiki" / "evals"
+        if evals_dir.is_dir():
+            return evals_dir
+        current = current.parent
+    return None
+
+
+def default_fixture_corpora() -> tuple[Path, ...]:
+    """Return every eval corpus the fixture engine serves by default.
+
+    The address corpus first (honoring ADDRESS_EVALS_PATH), then each other
+    ``<use-case>/expected.json`` under the evals root, sorted by use-case.
 
     Raises:
-        ValueError: If the file cannot be loaded or parsed.
+        ValueError: If the address corpus cannot be found.
     """
-    path = _resolve_evals_path()
+    address = _resolve_evals_path()
+    corpora = [address]
+    root = _resolve_evals_root()
+    if root is not None and root.is_dir():
+        for path in sorted(root.glob("*/expected.json")):
+            if path.parent.name != "address":
+                corpora.append(path)
+    return tuple(corpora)
+
+
+@dataclass(frozen=True)
+class FixtureIndex:
+    """Every corpus's fixtures, pre-validated and filed by fixture id.
+
+    Attributes:
+        extractions: Fixture id -> validated Extraction (None: fixture has no
+            extraction data).
+        corpora: Use-case -> its fixture ids, in corpus order.
+        errors: Corpus path -> why it, or some of its fixtures, was left out of the
+            index (unreadable, invalid JSON, an invalid fixture extraction, or a fixture
+            id another corpus already defines).
+        duplicates: Fixture id -> the corpora defining it, when more than one does
+            (left out of ``extractions`` and ``corpora``).
+    """
+
+    extractions: Mapping[str, Extraction | None] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    corpora: Mapping[str, tuple[str, ...]] = field(default_factory=lambda: MappingProxyType({}))
+    errors: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    duplicates: Mapping[str, tuple[str, ...]] = field(default_factory=lambda: MappingProxyType({}))
+
+    def ids(self, use_case: str | None = None) -> tuple[str, ...]:
+        """Return the fixture ids of one use-case, or of every corpus (None)."""
+        if use_case is not None:
+            return self.corpora.get(use_case, ())
+        return tuple(self.extractions)
+
+
+def _read_corpus(path: Path) -> dict:
     try:
         with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
+            return json.load(f)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {path}: {e}") from e
     except Exception as e:
         raise ValueError(f"Cannot read {path}: {e}") from e
 
 
+@dataclass(frozen=True)
+class _Corpus:
+    """One parsed corpus: its use-case and fixtures, or why it could not be loaded."""
+
+    use_case: str
+    extractions: Mapping[str, Extraction | None]
+    error: str | None = None
+
+
+# Parsed corpora: path -> ((mtime_ns, size) it was parsed at, the corpus).
+_corpus_cache: dict[Path, tuple[tuple[int, int], _Corpus]] = {}
+
+# Merged indexes: corpus tuple -> (the corpora's stamps, the index over them).
+_index_cache: dict[tuple[Path, ...], tuple[tuple, FixtureIndex]] = {}
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_corpus(path: Path) -> _Corpus:
+    try:
+        data = _read_corpus(path)
+        extractions: dict[str, Extraction | None] = {}
+        for doc in data.get("documents", []):
+            fixture_id = doc.get("id")
+            if fixture_id in extractions:
+                raise ValueError(f"Duplicate fixture id {fixture_id!r} in {path}")
+            extraction_data = doc.get("extraction")
+            extractions[fixture_id] = (
+                Extraction.model_validate(extraction_data) if extraction_data is not None else None
+            )
+    except Exception as exc:  # scoped to this corpus: reported, not raised
+        return _Corpus(path.parent.name, MappingProxyType({}), error=str(exc))
+    use_case = data.get("use_case") or path.parent.name
+    return _Corpus(use_case, MappingProxyType(extractions))
+
+
+def _corpus(path: Path, stamp: tuple[int, int] | None) -> _Corpus:
+    if stamp is None:
+        return _Corpus(path.parent.name, MappingProxyType({}), error=f"Cannot read {path}")
+    cached = _corpus_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    corpus = _parse_corpus(path)
+    _corpus_cache[path] = (stamp, corpus)
+    return corpus
+
+
+def load_fixture_index(corpora: tuple[Path, ...]) -> FixtureIndex:
+    """Return the index over the given corpora (each parsed once, revalidated by stat).
+
+    Every call stats the corpora; a corpus whose mtime or size moved is re-parsed,
+    and the index is rebuilt only if one did.
+
+    Args:
+        corpora: ``expected.json`` paths (see :func:`default_fixture_corpora`).
+
+    Returns:
+        The FixtureIndex over all of them. A corpus that cannot be read, parsed or
+        validated is left out and reported in ``FixtureIndex.errors``; a fixture id
+        found in two corpora is left out and reported there against the later one.
+    """
+    stamps = tuple(_stamp(path) for path in corpora)
+    cached = _index_cache.get(corpora)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+
+    errors: dict[str, str] = {}
+    loaded: list[_Corpus] = []
+    defined_in: dict[str, list[str]] = {}
+    for path, stamp in zip(corpora, stamps, strict=True):
+        corpus = _corpus(path, stamp)
+        if corpus.error is not None:
+            errors[str(path)] = corpus.error
+            continue
+        loaded.append(corpus)
+        for fixture_id in corpus.extractions:
+            defined_in.setdefault(fixture_id, []).append(str(path))
+
+    duplicates = {i: tuple(paths) for i, paths in defined_in.items() if len(paths) > 1}
+    clashes: dict[str, list[str]] = {}
+    for fixture_id, paths in duplicates.items():
+        for path in paths[1:]:
+            clashes.setdefault(path, []).append(f"{fixture_id!r} (also in {paths[0]})")
+    for path, ids in clashes.items():
+        errors[path] = f"Duplicate fixture id {', '.join(ids)}"
+
+    extractions: dict[str, Extraction | None] = {}
+    by_use_case: dict[str, tuple[str, ...]] = {}
+    for corpus in loaded:
+        kept = {i: e for i, e in corpus.extractions.items() if i not in duplicates}
+        extractions.update(kept)
+        by_use_case[corpus.use_case] = by_use_case.get(corpus.use_case, ()) + tuple(kept)
+    index = FixtureIndex(
+        MappingProxyType(extractions),
+        MappingProxyType(by_use_case),
+        MappingProxyType(errors),
+        MappingProxyType(duplicates),
+    )
+    _index_cache[corpora] = (stamps, index)
+    return index
+
+
 class FixtureExtractionEngine:
     """Fixture (deterministic) extraction engine adapter.
 
-    Maps a FixtureDocument to an Extraction loaded from wiki/evals/address/expected.json.
-    Deterministic, no Gemini, no randomness. Satisfies ExtractionSeam.
+    Maps a FixtureDocument to an Extraction from the eval corpora (an O(1) lookup in
+    the shared :class:`FixtureIndex`). Deterministic, no Gemini, no randomness.
+    Satisfies ExtractionSeam.
 
     This is the LOCAL capability adapter (deterministic for testing). Gemini is
     Sprint 2; DocAI is Phase 4. See ADR-0005 for the capability-axis contract.
+
+    Args:
+        corpora: The ``expected.json`` corpora to serve. Defaults to
+            :func:`default_fixture_corpora` (every use-case), resolved on first use.
     """
 
+    def __init__(self, corpora: Iterable[Path | str] | None = None) -> None:
+        """Initialize the engine (corpora are loaded on first use)."""
+        self._corpora = tuple(Path(p) for p in corpora) if corpora is not None else None
+
+    @property
+    def index(self) -> FixtureIndex:
+        """The fixture index of this engine's corpora (parsed once, revalidated by stat)."""
+        if self._corpora is None:
+            self._corpora = default_fixture_corpora()
+        return load_fixture_index(self._corpora)
+
     async def extract(self, document: object, doctype_skill: object) -> Extraction:
         """Extract structured data from a document (fixture-based).
 
@@ -117,8 +319,8 @@ class FixtureExtractionEngine:
             An Extraction loaded from the eval fixture.
 
         Raises:
-            ExtractionError: If the fixture_id is unknown, or fail=True, or the
-                document type is unrecognized.
+            ExtractionError: If the fixture_id is unknown or defined by several
+                corpora, or fail=True, or the document type is unrecognized.
         """
         # Check fail flag first
         if getattr(document, "fail", False):
@@ -134,20 +336,20 @@ class FixtureExtractionEngine:
         if fixture_id is None:
             raise ExtractionError("Document must be a FixtureDocument with a fixture_id attribute")
 
-        # Load expected.json
-        data = _load_expected_json()
-        documents = data.get("documents", [])
-
-        # Find matching fixture
-        for doc in documents:
-            if doc.get("id") == fixture_id:
-                extraction_data = doc.get("extraction")
-                if extraction_data is None:
-                    raise ExtractionError(f"Fixture {fixture_id} has no extraction data")
-                return Extraction.model_validate(extraction_data)
-
-        # Unknown fixture_id
-        raise ExtractionError(f"No fixture found for id: {fixture_id}")
+        index = self.index
+        extractions = index.extractions
+        if fixture_id in index.duplicates:
+            corpora = ", ".join(index.duplicates[fixture_id])
+            raise ExtractionError(
+                f"Fixture id {fixture_id!r} is defined in several corpora: {corpora}"
+            )
+        if fixture_id not in extractions:
+            unloaded = f" (corpora not loaded: {', '.join(index.errors)})" if index.errors else ""
+            raise ExtractionError(f"No fixture found for id: {fixture_id}{unloaded}")
+        extraction = extractions[fixture_id]
+        if extraction is None:
+            raise ExtractionError(f"Fixture {fixture_id} has no extraction data")
+        return extraction
 
 
 def resolve_extraction_engine(
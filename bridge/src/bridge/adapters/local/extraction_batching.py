@@ -0,0 +1,149 @@
+"""Micro-batching extraction engine: coalesce concurrent ``extract`` calls (M1.7 follow-up).
+
+A model-backed engine serves several documents per request far better than one each
+(:class:`~bridge.seams.extraction.BatchExtractionSeam`), but most callers hold a single
+document — one upload per turn, across many concurrent exchanges.
+:class:`MicroBatchingExtractionEngine` wraps such an engine: each ``extract`` joins the
+open batch, and the batch is sent as one ``extract_many`` request once ``window``
+seconds have passed since its first document, or as soon as it holds ``max_batch``.
+
+- Partial failures stay per caller: a document's ExtractionError is raised to that
+  caller only. Any other exception from the batched request is a fault of the whole
+  request and is raised to every caller in it — as is a batch answered with the wrong
+  number of outcomes. Every caller's future is resolved even if the send itself is
+  cancelled, so no caller waits forever.
+- A caller cancelled while waiting is simply dropped from its batch (the document is
+  not sent if the batch has not gone out yet).
+- ``extract_many`` is passed straight through (already a batch), so the wrapper is
+  itself a ``BatchExtractionSeam``.
+
+Latency: a lone document waits up to ``window`` before it is sent; keep the window
+small next to the engine's own latency (the default is 5 ms). Wrapping an engine
+without ``extract_many`` is harmless — a batch then fans out to ``extract``.
+
+Opt-in: wrap the engine explicitly (``MicroBatchingExtractionEngine(engine)``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from functools import partial
+
+from contract import Extraction
+
+from bridge.seams.extraction import (
+    ExtractionError,
+    ExtractionOutcome,
+    ExtractionRequest,
+    ExtractionSeam,
+    extract_batch,
+)
+
+__all__ = ["DEFAULT_BATCH_WINDOW", "DEFAULT_MAX_BATCH", "MicroBatchingExtractionEngine"]
+
+#: Default seconds a batch stays open after its first document.
+DEFAULT_BATCH_WINDOW = 0.005
+
+#: Default number of documents that sends a batch immediately.
+DEFAULT_MAX_BATCH = 16
+
+_Pending = tuple[object, object, "asyncio.Future[ExtractionOutcome]"]
+
+
+class MicroBatchingExtractionEngine:
+    """``ExtractionSeam`` decorator: send concurrent single extractions as one batch.
+
+    Args:
+        engine: The engine to wrap (ideally a ``BatchExtractionSeam``).
+        window: Seconds a batch stays open after its first document.
+        max_batch: Documents that send a batch without waiting out the window.
+
+    Raises:
+        ValueError: If ``window`` is negative or ``max_batch`` is not positive.
+    """
+
+    def __init__(
+        self,
+        engine: ExtractionSeam,
+        *,
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        """Initialize the wrapper with no open batch."""
+        if window < 0:
+            raise ValueError(f"window must not be negative, got {window}")
+        if max_batch <= 0:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        self.engine = engine
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: set[asyncio.Task] = set()
+        self.batches = 0
+        """Batched requests sent to the wrapped engine."""
+        self.documents = 0
+        """Documents sent in those requests."""
+
+    async def extract(self, document: object, doctype_skill: object) -> Extraction:
+        """Extract ``document`` as part of the next batch.
+
+        Raises:
+            ExtractionError: If the engine could not extract this document.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ExtractionOutcome] = loop.create_future()
+        self._pending.append((document, doctype_skill, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        outcome = await future
+        if isinstance(outcome, ExtractionError):
+            raise outcome
+        return outcome
+
+    async def extract_many(self, requests: Sequence[ExtractionRequest]) -> list[ExtractionOutcome]:
+        """Pass an explicit batch straight to the wrapped engine."""
+        return await extract_batch(self.engine, requests)
+
+    def _flush(self) -> None:
+        """Close the open batch and send it in the background."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._flushes.add(task)
+            task.add_done_callback(partial(self._settle, batch))
+
+    def _settle(self, batch: list[_Pending], task: asyncio.Task) -> None:
+        """Fail any caller the finished send left unresolved (it was cancelled — even
+        before it started — or died of a BaseException), so no caller waits forever."""
+        self._flushes.discard(task)
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("batched extraction ended without an outcome"))
+
+    async def _send(self, batch: list[_Pending]) -> None:
+        live = [item for item in batch if not item[2].done()]  # drop cancelled callers
+        if not live:
+            return
+        self.batches += 1
+        self.documents += len(live)
+        try:
+            outcomes = await extract_batch(self.engine, [(doc, skill) for doc, skill, _ in live])
+            if len(outcomes) != len(live):
+                raise RuntimeError(
+                    f"batched extraction returned {len(outcomes)} outcomes for {len(live)} "
+                    "documents"
+                )
+            for (*_, future), outcome in zip(live, outcomes, strict=True):
+                if not future.done():
+                    future.set_result(outcome)
+        except Exception as exc:  # a fault of the whole request reaches every caller
+            for *_, future in live:
+                if not future.done():
+                    future.set_exception(exc)
@@ -0,0 +1,301 @@
+"""Content-addressed extraction result cache over any ``ExtractionSeam`` (M1.7 follow-up).
+
+Parties re-send the same file — an identical resubmitted photo, a duplicate portal
+upload — and ``run_fulfillment`` calls ``engine.extract`` again each time. Behind a
+Gemini/DocAI engine that is the most expensive step of a turn.
+:class:`CachingExtractionEngine` wraps any engine and answers a repeat from cache:
+
+- The key is the SHA-256 of the document's bytes plus the doctype skill's name and
+  version (see :func:`extraction_cache_key`): the same bytes under a new skill
+  version are a miss, so a schema/prompt change re-extracts. A skill that declares no
+  ``metadata.version`` (the repo's SKILL.md files do not) is versioned by the content
+  digest of its folder, so editing its schema or prompt still re-extracts. The digest
+  is taken once per skill object (a registry reload builds new ones), in a worker
+  thread, so reading the folder never blocks the event loop.
+- Tier 1 is a bounded in-memory LRU. Tier 2 is an optional
+  :class:`ExtractionCacheStore` (e.g. the SQLite
+  :class:`~bridge.adapters.local.durable_extraction_cache.DatabaseExtractionCache`),
+  consulted on a memory miss and written through on every engine result, so a cache
+  survives a restart and is shared by processes on one file. The tier is best-effort:
+  a failed read is a miss and a failed write-through is skipped — both are logged and
+  counted (``store_errors``), and the caller still gets its extraction.
+- Concurrent extractions of one key are coalesced: the first caller runs the engine,
+  the others await its result (and its error). If that caller is cancelled, a waiter
+  retries.
+- Only successes are cached. An ``ExtractionError`` propagates and the next attempt
+  runs the engine again (a failure may be transient).
+- A document with no stable bytes (see :func:`document_bytes`) is passed straight
+  through, uncached.
+
+Counters (``hits``, ``misses``, ...) are plain attributes, like the scheduler runner's.
+The cached Extraction objects are shared between callers — treat them as values.
+
+Opt-in: wrap the engine explicitly (``CachingExtractionEngine(engine)``) and pass it
+to ``create_app`` / ``run_fulfillment``; the seam factory still builds the bare
+fixture engine (a dict lookup gains nothing from a cache).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from contract import Extraction
+from pydantic import BaseModel
+
+from bridge.adapters.local.skill_registry import skill_folder_digest
+from bridge.seams.extraction import ExtractionSeam
+
+__all__ = [
+    "DEFAULT_CACHE_ENTRIES",
+    "CachingExtractionEngine",
+    "ExtractionCacheStore",
+    "document_bytes",
+    "extraction_cache_key",
+]
+
+_log = logging.getLogger(__name__)
+
+#: Default bound on the in-memory tier.
+DEFAULT_CACHE_ENTRIES = 1024
+
+
+@runtime_checkable
+class ExtractionCacheStore(Protocol):
+    """A second (persistent) cache tier: cache key -> Extraction."""
+
+    async def get(self, key: str) -> Extraction | None:
+        """Return the cached Extraction for ``key``, or None."""
+        ...
+
+    async def put(self, key: str, extraction: Extraction) -> None:
+        """Store ``extraction`` under ``key`` (upsert)."""
+        ...
+
+
+def document_bytes(document: object) -> bytes | None:
+    """Return the bytes that identify ``document``'s content, or None if it has none.
+
+    - ``bytes`` / ``bytearray`` / ``memoryview``: the bytes themselves.
+    - An object with a bytes ``content`` or ``data`` attribute (a blob upload): that.
+    - A pydantic model (e.g. ``FixtureDocument``): its canonical JSON.
+    """
+    if isinstance(document, bytes | bytearray | memoryview):
+        return bytes(document)
+    for attr in ("content", "data"):
+        content = getattr(document, attr, None)
+        if isinstance(content, bytes | bytearray | memoryview):
+            return bytes(content)
+    if isinstance(document, BaseModel):
+        return document.model_dump_json().encode()
+    return None
+
+
+# Skill folder -> (the skill object it was digested for, the folder digest). A
+# registry reload builds a new Skill for a changed folder, so identity is the check.
+_folder_digests: dict[Path, tuple[object, str]] = {}
+
+
+def _unversioned_folder(doctype_skill: object) -> Path | None:
+    """The folder that versions ``doctype_skill`` (no ``metadata["version"]``), if any."""
+    if doctype_skill is None or isinstance(doctype_skill, str):
+        return None
+    metadata = getattr(doctype_skill, "metadata", None) or {}
+    path = getattr(doctype_skill, "path", None)
+    if metadata.get("version") or path is None:
+        return None
+    return Path(path)
+
+
+def _read_folder_digest(path: Path) -> str:
+    """The folder's content digest, or "" if it is not a directory (blocking I/O)."""
+    return skill_folder_digest(path) if path.is_dir() else ""
+
+
+def _cached_folder_digest(doctype_skill: object, path: Path) -> str | None:
+    cached = _folder_digests.get(path)
+    if cached is not None and cached[0] is doctype_skill:
+        return cached[1]
+    return None
+
+
+def _folder_digest(doctype_skill: object, path: Path) -> str:
+    digest = _cached_folder_digest(doctype_skill, path)
+    if digest is None:
+        digest = _read_folder_digest(path)
+        _folder_digests[path] = (doctype_skill, digest)
+    return digest
+
+
+async def _warm_folder_digest(doctype_skill: object) -> None:
+    """Digest an unversioned skill's folder in a worker thread, once per skill object."""
+    path = _unversioned_folder(doctype_skill)
+    if path is None or _cached_folder_digest(doctype_skill, path) is not None:
+        return
+    digest = await asyncio.to_thread(_read_folder_digest, path)
+    _folder_digests[path] = (doctype_skill, digest)
+
+
+def _skill_version(doctype_skill: object) -> str:
+    """``name@version`` of a doctype skill (``Skill`` / ``SkillIndexEntry`` / str).
+
+    The version is ``metadata["version"]`` when declared, else the digest of the
+    skill's folder (``sha256:<hex>``), else empty.
+    """
+    if doctype_skill is None:
+        return ""
+    if isinstance(doctype_skill, str):
+        return doctype_skill
+    name = getattr(doctype_skill, "name", "")
+    version = (getattr(doctype_skill, "metadata", None) or {}).get("version")
+    path = _unversioned_folder(doctype_skill)
+    if path is not None:
+        digest = _folder_digest(doctype_skill, path)
+        version = f"sha256:{digest}" if digest else ""
+    return f"{name}@{version or ''}"
+
+
+def extraction_cache_key(document: object, doctype_skill: object) -> str | None:
+    """Return the content-addressed cache key, or None if ``document`` is uncacheable.
+
+    Args:
+        document: The document passed to ``extract`` (see :func:`document_bytes`).
+        doctype_skill: The doctype skill; its name and version (``metadata["version"]``,
+            else its folder's content digest) are part of the key.
+
+    Returns:
+        ``"<sha256 hex>:<skill name>@<version>"``, or None.
+    """
+    content = document_bytes(document)
+    if content is None:
+        return None
+    return f"{hashlib.sha256(content).hexdigest()}:{_skill_version(doctype_skill)}"
+
+
+class CachingExtractionEngine:
+    """``ExtractionSeam`` decorator: answer repeat documents from a content-addressed cache.
+
+    Args:
+        engine: The engine to wrap.
+        max_entries: Bound on the in-memory LRU tier.
+        store: Optional persistent second tier.
+
+    Raises:
+        ValueError: If ``max_entries`` is not positive.
+    """
+
+    def __init__(
+        self,
+        engine: ExtractionSeam,
+        *,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        store: ExtractionCacheStore | None = None,
+    ) -> None:
+        """Initialize an empty cache over ``engine``."""
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.engine = engine
+        self.store = store
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, Extraction] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Extraction]] = {}
+        self.hits = 0
+        """Extractions answered from cache (either tier, or a coalesced in-flight call)."""
+        self.misses = 0
+        """Extractions that ran the wrapped engine."""
+        self.store_hits = 0
+        """The subset of ``hits`` answered by the persistent tier."""
+        self.bypassed = 0
+        """Uncacheable documents passed straight to the engine."""
+        self.store_errors = 0
+        """Persistent-tier reads (taken as misses) and write-throughs that raised."""
+
+    async def extract(self, document: object, doctype_skill: object) -> Extraction:
+        """Return the cached Extraction for this content + skill version, else extract.
+
+        Raises:
+            ExtractionError: If the wrapped engine raises it (not cached).
+        """
+        await _warm_folder_digest(doctype_skill)  # off the event loop, before the key
+        key = extraction_cache_key(document, doctype_skill)
+        if key is None:
+            self.bypassed += 1
+            return await self.engine.extract(document, doctype_skill)
+
+        cached = self._memory.get(key)
+        if cached is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                extraction = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # this caller was cancelled
+                return await self.extract(document, doctype_skill)  # the leader was
+            self.hits += 1
+            return extraction
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            extraction = await self._load(key, document, doctype_skill)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved: no waiter is not an error
+            raise
+        else:
+            future.set_result(extraction)
+            self._remember(key, extraction)
+            return extraction
+        finally:
+            del self._inflight[key]
+
+    async def _load(self, key: str, document: object, doctype_skill: object) -> Extraction:
+        if self.store is not None:
+            try:
+                stored = await self.store.get(key)
+            except Exception:
+                # Same as a failed write-through: a broken tier costs an extraction,
+                # never the caller's result.
+                self.store_errors += 1
+                _log.exception("extraction cache read failed for key %s; extracting", key)
+                stored = None
+            if stored is not None:
+                self.hits += 1
+                self.store_hits += 1
+                return stored
+        self.misses += 1
+        extraction = await self.engine.extract(document, doctype_skill)
+        if self.store is not None:
+            try:
+                await self.store.put(key, extraction)
+            except Exception:
+                # The engine already paid for this result; a broken tier only costs a
+                # re-extraction after a restart, so it must not fail the caller.
+                self.store_errors += 1
+                _log.exception("extraction cache write-through failed for key %s", key)
+        return extraction
+
+    def _remember(self, key: str, extraction: Extraction) -> None:
+        self._memory[key] = extraction
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the persistent store is left as is)."""
+        self._memory.clear()
+
+    def __len__(self) -> int:
+        """Number of entries in the in-memory tier."""
+        return len(self._memory)
@@ -0,0 +1,284 @@
+"""Extraction router: deadline, hedged requests and circuit breaking over engines (ADR-0005).
+
+:func:`~bridge.adapters.local.extraction.resolve_extraction_engine` picks exactly one
+engine, and nothing bounds how long a slow call to it may take. :class:`ExtractionRouter`
+is an ``ExtractionSeam`` over an ordered list of engines — the ADR-0005 resolution
+order, preferred engine first — that bounds the tail:
+
+- **Deadline.** Each ``extract`` gets ``deadline`` seconds in total. Overrunning it
+  cancels every in-flight engine call and raises ``ExtractionError`` (the graph's
+  extraction_error leaf), so a hung engine cannot stall a turn.
+- **Hedging.** If the engine called first has not answered within its own p95 latency
+  (over the last ``latency_window`` successful or cancelled calls, once
+  ``min_samples`` were seen; before that, ``hedge_after`` if set), the next engine is
+  called as well and the first good result wins; the loser is cancelled. A cancelled
+  call's elapsed time joins its engine's latencies as a lower bound — leaving the slow
+  losers out would bias the p95 low. Only the calls slower than the quantile are
+  hedged, so the extra load is about 5% of calls.
+- **Fallback.** An engine fault (any exception other than ``ExtractionError``) hands
+  the document to the next engine at once; ``extract`` raises an ExtractionError
+  chained from the last fault only when every available engine faulted. An
+  ``ExtractionError`` is the engine's verdict on the document (illegible, wrong
+  doctype) and is raised once no other call is in flight — another engine is not
+  asked. While a hedged call is still running the verdict is held back: that call's
+  good result still wins, and the verdict is raised when it faults (or the deadline
+  passes) instead.
+- **Circuit breaker.** ``failure_threshold`` consecutive faults (a deadline overrun
+  included) open an engine's circuit: it is skipped for ``reset_after`` seconds, then
+  half-open — a single probe call is let through, and its result closes or re-opens
+  the circuit. With every circuit open, ``extract`` fails fast.
+
+Counters (``hedges``, ``fallbacks``, ``timeouts``) are plain attributes, like the
+scheduler runner's. Only faults count against an engine: an engine that answers —
+with an Extraction or an ExtractionError — is healthy, so a burst of illegible
+documents does not open its circuit.
+
+Opt-in: build it explicitly (``ExtractionRouter([gemini, docai], deadline=20.0)``);
+``resolve_extraction_engine`` still returns a single engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+
+from contract import Extraction
+
+from bridge.seams.extraction import ExtractionError, ExtractionSeam
+
+__all__ = [
+    "DEFAULT_FAILURE_THRESHOLD",
+    "DEFAULT_HEDGE_QUANTILE",
+    "DEFAULT_RESET_AFTER",
+    "ExtractionRouter",
+]
+
+#: Consecutive failures that open an engine's circuit.
+DEFAULT_FAILURE_THRESHOLD = 5
+
+#: Seconds an open circuit waits before letting a probe call through.
+DEFAULT_RESET_AFTER = 30.0
+
+#: Latency quantile after which a request is hedged.
+DEFAULT_HEDGE_QUANTILE = 0.95
+
+
+class _Route:
+    """One engine's latency history and circuit state."""
+
+    __slots__ = ("engine", "failures", "latencies", "opened_at")
+
+    def __init__(self, engine: ExtractionSeam, latency_window: int) -> None:
+        self.engine = engine
+        self.latencies: deque[float] = deque(maxlen=latency_window)
+        self.failures = 0  # consecutive
+        self.opened_at: float | None = None  # None: circuit closed
+
+    def succeeded(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.failures = 0
+        self.opened_at = None
+
+    def answered(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def failed(self, now: float, threshold: int) -> None:
+        self.failures += 1
+        if self.failures >= threshold:
+            self.opened_at = now
+
+    def quantile(self, q: float) -> float:
+        ordered = sorted(self.latencies)
+        return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+class ExtractionRouter:
+    """``ExtractionSeam`` over ordered engines with a deadline, hedging and breakers.
+
+    Args:
+        engines: The engines, most preferred first.
+        deadline: Seconds one ``extract`` may take in total (None: unbounded).
+        hedge_quantile: Latency quantile of the running engine after which the next
+            one is also called.
+        hedge_after: Hedge delay in seconds used until an engine has ``min_samples``
+            latencies (None: do not hedge before then).
+        min_samples: Successful calls needed before the quantile is trusted.
+        latency_window: Latencies (successful and cancelled calls) kept per engine.
+        failure_threshold: Consecutive failures that open an engine's circuit.
+        reset_after: Seconds before an open circuit lets a probe call through.
+        clock: Monotonic time source for the circuit breaker (injectable for tests).
+
+    Raises:
+        ValueError: If no engine is given or a bound is out of range.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[ExtractionSeam],
+        *,
+        deadline: float | None = None,
+        hedge_quantile: float = DEFAULT_HEDGE_QUANTILE,
+        hedge_after: float | None = None,
+        min_samples: int = 20,
+        latency_window: int = 200,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_after: float = DEFAULT_RESET_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the router with every circuit closed."""
+        if not engines:
+            raise ValueError("ExtractionRouter needs at least one engine")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"deadline must be positive, got {deadline}")
+        if not 0 < hedge_quantile <= 1:
+            raise ValueError(f"hedge_quantile must be in (0, 1], got {hedge_quantile}")
+        if min_samples <= 0 or latency_window < min_samples:
+            raise ValueError(
+                f"need 0 < min_samples <= latency_window, got {min_samples}, {latency_window}"
+            )
+        if failure_threshold <= 0:
+            raise ValueError(f"failure_threshold must be positive, got {failure_threshold}")
+        self._routes = [_Route(engine, latency_window) for engine in engines]
+        self._deadline = deadline
+        self._quantile = hedge_quantile
+        self._hedge_after = hedge_after
+        self._min_samples = min_samples
+        self._threshold = failure_threshold
+        self._reset_after = reset_after
+        self._clock = clock
+        self.hedges = 0
+        """Calls started because the running engine passed its hedge delay."""
+        self.fallbacks = 0
+        """Calls started because an engine failed."""
+        self.timeouts = 0
+        """Extractions that overran the deadline."""
+
+    def is_open(self, engine: ExtractionSeam) -> bool:
+        """Whether ``engine``'s circuit is open (skipped, or only probed)."""
+        return self._route_of(engine).opened_at is not None
+
+    def hedge_delay(self, engine: ExtractionSeam) -> float | None:
+        """Seconds to wait on ``engine`` before hedging (None: never hedge it)."""
+        return self._hedge_delay(self._route_of(engine))
+
+    def _route_of(self, engine: ExtractionSeam) -> _Route:
+        for route in self._routes:
+            if route.engine is engine:
+                return route
+        raise ValueError(f"{engine!r} is not routed by this router")
+
+    def _hedge_delay(self, route: _Route) -> float | None:
+        if len(route.latencies) >= self._min_samples:
+            return route.quantile(self._quantile)
+        return self._hedge_after
+
+    def _available(self) -> list[_Route]:
+        """Routes with a closed circuit, plus half-open ones (due a probe call)."""
+        now = self._clock()
+        return [
+            route
+            for route in self._routes
+            if route.opened_at is None or now - route.opened_at >= self._reset_after
+        ]
+
+    async def extract(self, document: object, doctype_skill: object) -> Extraction:
+        """Extract through the engines in order, hedged and bounded by the deadline.
+
+        Raises:
+            ExtractionError: If an engine could not extract the document, every
+                available engine faulted, every circuit is open, or the deadline passed.
+        """
+        queue = self._available()
+        if not queue:
+            raise ExtractionError("no extraction engine available (every circuit is open)")
+        loop = asyncio.get_running_loop()
+        deadline_at = None if self._deadline is None else loop.time() + self._deadline
+        pending: dict[asyncio.Task, _Route] = {}
+        last: BaseException | None = None
+        refusal: ExtractionError | None = None  # held while another call may still answer
+
+        def launch() -> _Route:
+            route = queue.pop(0)
+            if route.opened_at is not None:
+                route.opened_at = self._clock()  # the probe: one per reset period
+            call = asyncio.create_task(self._call(route, document, doctype_skill))
+            pending[call] = route
+            return route
+
+        running = launch()
+        try:
+            while pending:
+                wait = self._hedge_delay(running) if queue and refusal is None else None
+                at_deadline = False
+                if deadline_at is not None:
+                    remaining = deadline_at - loop.time()
+                    at_deadline = wait is None or remaining <= wait
+                    wait = remaining if at_deadline else wait
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=max(wait, 0.0) if wait is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    if at_deadline:
+                        self.timeouts += 1
+                        for route in pending.values():
+                            route.failed(self._clock(), self._threshold)
+                        if refusal is not None:
+                            raise refusal
+                        raise ExtractionError(
+                            f"extraction exceeded its {self._deadline}s deadline"
+                        ) from last
+                    self.hedges += 1
+                    running = launch()
+                    continue
+                finished = [(call, call.exception()) for call in done]  # retrieve every error
+                for call, _ in finished:
+                    del pending[call]
+                for call, error in finished:  # a success anywhere in the batch wins
+                    if error is None:
+                        return call.result()
+                for _, error in finished:  # a verdict on the document
+                    if isinstance(error, ExtractionError) and refusal is None:
+                        refusal = error
+                if refusal is not None:  # final once no other call can still answer
+                    if not pending:
+                        raise refusal
+                    continue
+                last = finished[-1][1]
+                for _ in finished:  # hand the document to the next engine at once
+                    if queue:
+                        self.fallbacks += 1
+                        running = launch()
+        finally:
+            for call in pending:
+                call.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        raise ExtractionError(f"every extraction engine failed: {last!r}") from last
+
+    async def _call(self, route: _Route, document: object, doctype_skill: object) -> Extraction:
+        """One engine call, recorded against its route.
+
+        A cancelled call records the time it had run as a latency sample — a lower bound
+        on the engine's latency — and counts neither for nor against its circuit.
+        """
+        started = time.perf_counter()
+        try:
+            extraction = await route.engine.extract(document, doctype_skill)
+        except asyncio.CancelledError:
+            route.latencies.append(time.perf_counter() - started)
+            raise
+        except ExtractionError:
+            route.answered()
+            raise
+        except Exception:
+            route.failed(self._clock(), self._threshold)
+            raise
+        route.succeeded(time.perf_counter() - started)
+        return extraction
@@ -3,23 +3,57 @@
 In-memory scheduler with injectable virtual clock for the local development
 environment. Satisfies the SchedulerSeam protocol.
 
-Note: "Durable" in M1.12 describes the **seam concept** — the local adapter is
-in-memory (timers lost on restart); restart-durability of the timer store is the
-Sprint-2 GCP adapter (Cloud Tasks; A7 "deletion is the fired signal"), analogous
-to the local/Database split for Sessions/Task-store (M1.2).
+Timers are indexed by a min-heap keyed on ``(fire_at, sequence, id)`` — the A5 order
+itself — so ``due(now)`` pops only the ready timers (O(k log n)) instead of scanning
+and sorting every timer ever scheduled. ``cancel`` and re-``schedule`` use lazy
+deletion: the superseded heap entry stays put and is skipped when it surfaces, and the
+heap is rebuilt once stale entries outnumber live ones.
+
+The read-model is indexed too: timers are also filed per ``context_id``, and each
+context keeps a :class:`~bridge.scheduler.FollowupTally` that ``due()`` bumps as it
+fires a timer, so ``followups_for`` is O(1) rather than a filter over every timer.
+
+Retention: a fired timer stays in the store (A7 marks it, never deletes it) until it is
+compacted — by the :class:`~bridge.scheduler.RetentionPolicy` (``fired_ticks`` after
+its ``fire_at``, checked on every ``due()``), or all at once for a terminal exchange
+(:meth:`LocalScheduler.compact_context`, or :meth:`LocalScheduler.retire_context`,
+which also withdraws its pending timers). Compaction drops the timer object but leaves
+its count in the context's tally, which is the compact per-context summary: the
+read-model is unchanged, while ``timers_for`` lists only what is still held. While the
+exchange is live the tally is keyed by timer id and the scheduler remembers which
+context a compacted id belongs to, so cancelling a compacted timer un-counts it and
+re-scheduling one supersedes its count, exactly as for a held timer. Retiring the
+exchange drops those ids: its tally is sealed to counts and a last fire tick, and the
+context refuses new timers — so what a retired exchange costs does not grow with its
+fired history.
+
+Note: "Durable" in M1.12 describes the **seam concept** — this adapter is in-memory
+(timers lost on restart). The restart-durable local variant is
+``bridge.adapters.local.durable_scheduler.DatabaseScheduler`` (SQLite); the GCP
+timer store is the Sprint-2 adapter (Cloud Tasks; A7 "deletion is the fired signal"),
+analogous to the local/Database split for Sessions/Task-store (M1.2).
 """
 
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+
 from bridge.scheduler import (
     FollowupStatus,
+    FollowupTally,
+    RetentionPolicy,
     SlaPolicy,
     Timer,
     VirtualClock,
-    followup_status,
     plan_followups,
 )
 
 __all__ = ["LocalScheduler"]
 
+#: Below this many heap entries a stale-entry rebuild is not worth doing.
+_MIN_REBUILD = 64
+
 
 class LocalScheduler:
     """Local (in-memory) scheduler adapter with injectable clock.
@@ -32,24 +66,106 @@ class LocalScheduler:
     so a fired timer NEVER re-appears in subsequent ``due()`` calls.
 
     Deterministic ordering (lessons-learned.md A5):
-    ``due()`` output is sorted by ``(fire_at, sequence, id)`` — no timestamp.
+    ``due()`` output is sorted by ``(fire_at, sequence, id)`` — no timestamp. That key
+    is the heap order, so the output comes off the heap already sorted.
 
     Args:
         clock: Injectable virtual clock (default: a fresh ``VirtualClock()`` at tick 0).
+        retention: When fired timers are compacted (default: kept forever).
     """
 
-    def __init__(self, clock: VirtualClock | None = None):
+    def __init__(
+        self, clock: VirtualClock | None = None, *, retention: RetentionPolicy | None = None
+    ):
         """Initialize the scheduler with an optional injectable clock."""
         self.clock = clock or VirtualClock()
+        self.retention = retention or RetentionPolicy()
+        # Every timer scheduled and not cancelled, fired or not (the read-model's source).
         self._timers: dict[str, Timer] = {}
+        # Read-model index: context_id -> {timer id: timer}, and its fired-timer tally.
+        self._by_context: dict[str, dict[str, Timer]] = {}
+        self._tallies: dict[str, FollowupTally] = {}
+        # Bulk-cancel index: task_id -> ids of its timers (task-scoped timers only).
+        self._by_task: dict[str, set[str]] = {}
+        # Pending index: (fire_at, sequence, id, token, timer). An entry is live iff
+        # ``_tokens[id] == token``; anything else was cancelled or superseded (lazy
+        # deletion). The unique token also keeps tuple comparison off ``Timer``.
+        self._heap: list[tuple[int, int, str, int, Timer]] = []
+        self._tokens: dict[str, int] = {}
+        self._next_token = 0
+        self._stale = 0
+        # Retention queue: (fire_at, token, id, timer) of fired timers, oldest first.
+        # Only kept under a fired_ticks policy; an entry whose timer is no longer held
+        # (compacted, cancelled, replaced) is skipped when it surfaces.
+        self._fired: list[tuple[int, int, str, Timer]] = []
+        # Compacted timer id -> its context_id, while the context's tally still counts it.
+        self._compacted: dict[str, str] = {}
+        # Retired contexts: their tallies are sealed and they accept no more timers.
+        self._retired: set[str] = set()
+        self.compacted = 0
+        """Number of fired timers compacted into their context's summary so far."""
 
     async def schedule(self, timer: Timer) -> None:
         """Schedule a new timer (upsert by ``timer.id`` — idempotent).
 
         Args:
             timer: The timer to schedule.
+
+        Raises:
+            ValueError: If the timer's context was retired (:meth:`retire_context`).
+        """
+        self.schedule_nowait(timer)
+
+    def schedule_nowait(self, timer: Timer) -> None:
+        """Synchronous :meth:`schedule` (for seeding a scheduler outside a coroutine)."""
+        self._check_open([timer])
+        if self._insert(timer):
+            self._push_pending([timer])
+
+    async def schedule_many(self, timers: Iterable[Timer]) -> None:
+        """Schedule a batch of timers in one pass (upsert by id, like :meth:`schedule`).
+
+        A batch at least as large as the pending heap is merged with one O(n) heapify
+        instead of a push per timer.
+
+        Args:
+            timers: The timers to schedule (a later duplicate id wins).
+
+        Raises:
+            ValueError: If a timer's context was retired (nothing is scheduled).
         """
+        batch = {timer.id: timer for timer in timers}.values()
+        self._check_open(batch)
+        self._push_pending([timer for timer in batch if self._insert(timer)])
+
+    def _check_open(self, timers: Iterable[Timer]) -> None:
+        """Refuse timers for a retired context (its summary no longer tracks ids)."""
+        for timer in timers:
+            if timer.context_id in self._retired:
+                raise ValueError(
+                    f"context {timer.context_id!r} is retired; cannot schedule {timer.id!r}"
+                )
+
+    def _insert(self, timer: Timer) -> bool:
+        """Store and index ``timer``; return whether it still needs a pending entry."""
+        self._drop_pending(timer.id)  # the upsert supersedes the pending entry
+        previous = self._timers.get(timer.id)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._uncount_compacted(timer.id)  # the upsert supersedes a compacted timer too
         self._timers[timer.id] = timer
+        self._by_context.setdefault(timer.context_id, {})[timer.id] = timer
+        if timer.task_id is not None:
+            self._by_task.setdefault(timer.task_id, set()).add(timer.id)
+        tally = self._tallies.get(timer.context_id)
+        if tally is None:
+            tally = self._tallies[timer.context_id] = FollowupTally()
+        tally.add(timer)
+        if timer.fired:
+            self._retain(timer)
+            return False
+        return True
 
     async def due(self, now: int | None = None) -> list[Timer]:
         """Return all timers due at or before ``now``, marking them fired IN PLACE.
@@ -59,7 +175,7 @@ class LocalScheduler:
         rides on this invariant — a fired timer NEVER re-appears.
 
         Deterministic ordering (lessons-learned.md A5): output is sorted by
-        ``(fire_at, sequence, id)`` — no timestamp.
+        ``(fire_at, sequence, id)`` — no timestamp (the heap's pop order).
 
         Args:
             now: The tick to check (default: ``self.clock.now()``).
@@ -70,25 +186,270 @@ class LocalScheduler:
         if now is None:
             now = self.clock.now()
 
-        # Select unfired timers that are due
-        due_timers = [t for t in self._timers.values() if not t.fired and t.fire_at <= now]
-
-        # Sort deterministically by (fire_at, sequence, id)
-        due_timers.sort(key=lambda t: (t.fire_at, t.sequence, t.id))
-
-        # Mark each timer fired IN PLACE (A7 exactly-once)
-        for timer in due_timers:
+        due_timers: list[Timer] = []
+        for timer in self._pop_due(now):
+            if timer.fired:
+                continue
+            # Mark each timer fired IN PLACE (A7 exactly-once)
             timer.fired = True
+            self._tallies[timer.context_id].add(timer)
+            self._retain(timer)
+            due_timers.append(timer)
 
+        self.compact(now)
         return due_timers
 
     async def cancel(self, timer_id: str) -> None:
         """Cancel a scheduled timer by ID (idempotent — no error if missing).
 
+        A timer of a retired context is no longer known by id, so cancelling it is
+        a no-op that leaves the context's sealed summary untouched.
+
         Args:
             timer_id: The timer ID to cancel.
         """
-        self._timers.pop(timer_id, None)
+        self._cancel(timer_id)
+
+    async def cancel_context(self, context_id: str) -> int:
+        """Cancel every unfired timer of ``context_id`` in one pass (its per-context index).
+
+        Fired timers are kept: closing an exchange must not erase its follow-up history.
+
+        Args:
+            context_id: The exchange ``context_id``.
+
+        Returns:
+            The number of timers cancelled.
+        """
+        return self._cancel_pending(self._by_context.get(context_id, ()))
+
+    async def cancel_task(self, task_id: str) -> int:
+        """Cancel every unfired timer scoped to ``task_id`` in one pass (its task index).
+
+        Fired timers are kept, as for :meth:`cancel_context`.
+
+        Args:
+            task_id: The task the timers were planned for.
+
+        Returns:
+            The number of timers cancelled.
+        """
+        return self._cancel_pending(self._by_task.get(task_id, ()))
+
+    def _cancel_pending(self, timer_ids: Iterable[str]) -> int:
+        pending = [timer_id for timer_id in timer_ids if not self._timers[timer_id].fired]
+        for timer_id in pending:
+            self._cancel(timer_id)
+        return len(pending)
+
+    def _cancel(self, timer_id: str) -> None:
+        previous = self._timers.get(timer_id)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._uncount_compacted(timer_id)
+        self._drop_pending(timer_id)
+
+    def _uncount_compacted(self, timer_id: str) -> None:
+        """Un-count a compacted timer from its context's tally (cancel / upsert)."""
+        context_id = self._compacted.pop(timer_id, None)
+        if context_id is None:
+            return
+        tally = self._tallies[context_id]
+        tally.discard(timer_id)
+        if context_id not in self._by_context and not tally.timer_ids:
+            del self._tallies[context_id]
+
+    def _unindex(self, timer: Timer) -> None:
+        """Drop ``timer`` from its context's index and tally (cancel / upsert)."""
+        self._tallies[timer.context_id].remove(timer)
+        self._release(timer)
+
+    def _release(self, timer: Timer) -> None:
+        """Drop ``timer`` from the store and its context's index (the tally is kept)."""
+        del self._timers[timer.id]
+        if timer.task_id is not None:
+            task_timers = self._by_task[timer.task_id]
+            task_timers.discard(timer.id)
+            if not task_timers:
+                del self._by_task[timer.task_id]
+        context_id = timer.context_id
+        context_timers = self._by_context[context_id]
+        del context_timers[timer.id]
+        if not context_timers:
+            del self._by_context[context_id]
+            tally = self._tallies[context_id]
+            if not (tally.nudges_fired or tally.escalations_fired):
+                del self._tallies[context_id]
+
+    def _retain(self, timer: Timer) -> None:
+        """Queue a fired timer for compaction under the retention policy."""
+        if self.retention.fired_ticks is None:
+            return
+        token = self._next_token
+        self._next_token += 1
+        heapq.heappush(self._fired, (timer.fire_at, token, timer.id, timer))
+
+    def compact(self, now: int | None = None) -> int:
+        """Compact fired timers past the retention window (see :class:`RetentionPolicy`).
+
+        Runs automatically at the end of every ``due()``; O(k log n) for k compacted.
+
+        Args:
+            now: The tick to measure retention from (default: ``self.clock.now()``).
+
+        Returns:
+            The number of timers compacted (0 when fired timers are kept forever).
+        """
+        if self.retention.fired_ticks is None:
+            return 0
+        if now is None:
+            now = self.clock.now()
+        cutoff = now - self.retention.fired_ticks
+        fired = self._fired
+        count = 0
+        while fired and fired[0][0] <= cutoff:
+            _, _, timer_id, timer = heapq.heappop(fired)
+            if self._timers.get(timer_id) is timer and timer.fired:
+                self._compact(timer)
+                count += 1
+        self.compacted += count
+        return count
+
+    def compact_context(self, context_id: str) -> int:
+        """Compact every fired timer of ``context_id`` now (e.g. its exchange is terminal).
+
+        Pending timers are left alone and the compacted ids stay tracked, so the
+        exchange can still be cancelled or re-scheduled; :meth:`retire_context` is the
+        terminal form. The follow-up read-model is unchanged.
+
+        Args:
+            context_id: The exchange ``context_id``.
+
+        Returns:
+            The number of timers compacted.
+        """
+        fired = [t for t in self._by_context.get(context_id, {}).values() if t.fired]
+        for timer in fired:
+            self._compact(timer)
+        self.compacted += len(fired)
+        return len(fired)
+
+    def retire_context(self, context_id: str) -> int:
+        """Retire a terminal exchange: withdraw its pending timers, compact its fired ones.
+
+        Not a cancel — the fired timers stay counted, so the follow-up read-model keeps
+        the exchange's history (an escalated exchange still reads ``ESCALATED``) while
+        the scheduler holds nothing for it but a sealed tally: counts and the last fire
+        tick, no timer ids. The context accepts no more timers; a later ``schedule`` of
+        one is refused and a ``cancel`` of one is a no-op.
+
+        Args:
+            context_id: The exchange ``context_id``.
+
+        Returns:
+            The number of fired timers compacted.
+        """
+        count = 0
+        for timer in list(self._by_context.get(context_id, {}).values()):
+            self._drop_pending(timer.id)
+            self._release(timer)
+            count += timer.fired
+        tally = self._tallies.get(context_id)
+        if tally is not None:
+            for timer_id in tally.timer_ids:
+                self._compacted.pop(timer_id, None)
+            tally.seal()
+        self._retired.add(context_id)
+        self.compacted += count
+        return count
+
+    def _compact(self, timer: Timer) -> None:
+        """Drop a fired timer but keep its count (and remember its context for cancel)."""
+        self._release(timer)
+        self._compacted[timer.id] = timer.context_id
+
+    def forget(self, context_id: str) -> None:
+        """Drop everything held for ``context_id`` — timers (pending ones are cancelled)
+        and its follow-up summary. Its read-model reverts to ``ON_TRACK`` and a retired
+        context accepts timers again."""
+        self._retired.discard(context_id)
+        for timer_id in list(self._by_context.get(context_id, {})):
+            self._drop_pending(timer_id)
+            self._release(self._timers[timer_id])
+        tally = self._tallies.pop(context_id, None)
+        for timer_id in tally.timer_ids if tally is not None else ():
+            self._compacted.pop(timer_id, None)
+
+    # --- Pending index (the heap; a subclass may swap it, see TimingWheelScheduler) ---
+
+    def _push_pending(self, timers: list[Timer]) -> None:
+        """Add unfired timers (already stored by ``_insert``) to the pending heap."""
+        entries = []
+        for timer in timers:
+            token = self._next_token
+            self._next_token += 1
+            self._tokens[timer.id] = token
+            entries.append((timer.fire_at, timer.sequence, timer.id, token, timer))
+        if len(entries) >= len(self._heap):
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+
+    def _drop_pending(self, timer_id: str) -> None:
+        """Withdraw ``timer_id``'s pending entry, if any (lazy: the entry goes stale)."""
+        if self._tokens.pop(timer_id, None) is not None:
+            self._mark_stale()
+
+    def _pop_due(self, now: int) -> list[Timer]:
+        """Remove and return the pending timers due at ``now``, in A5 order."""
+        ready: list[Timer] = []
+        heap = self._heap
+        # Pop only the ready entries, already in (fire_at, sequence, id) order.
+        while heap and heap[0][0] <= now:
+            _, _, timer_id, token, timer = heapq.heappop(heap)
+            if self._tokens.get(timer_id) != token:
+                self._stale -= 1  # cancelled or superseded
+                continue
+            del self._tokens[timer_id]
+            ready.append(timer)
+        return ready
+
+    async def next_fire_at(self) -> int | None:
+        """Return the earliest ``fire_at`` of an unfired timer, or None (O(1) amortized).
+
+        Not part of the seam Protocol — lets a driver (``SchedulerRunner``) sleep until
+        the next deadline instead of polling. Stale heap heads are discarded on the way.
+        """
+        heap = self._heap
+        while heap:
+            _, _, timer_id, token, timer = heap[0]
+            if self._tokens.get(timer_id) == token and not timer.fired:
+                return heap[0][0]
+            heapq.heappop(heap)
+            if self._tokens.get(timer_id) == token:
+                del self._tokens[timer_id]  # fired outside due(); no longer pending
+            else:
+                self._stale -= 1
+        return None
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled timers that have not fired yet (O(1))."""
+        return len(self._tokens)
+
+    def _mark_stale(self) -> None:
+        """Count one superseded heap entry; rebuild once stale entries are the majority.
+
+        The rebuild is O(n), amortized against the cancels/upserts that made the entries.
+        """
+        self._stale += 1
+        if self._stale > len(self._heap) // 2 and len(self._heap) >= _MIN_REBUILD:
+            self._heap = [entry for entry in self._heap if self._tokens.get(entry[2]) == entry[3]]
+            heapq.heapify(self._heap)
+            self._stale = 0
 
     # --- Convenience helpers (not part of the seam Protocol) ---
 
@@ -118,15 +479,24 @@ class LocalScheduler:
             start = self.clock.now()
 
         timers = plan_followups(sla, start=start, context_id=context_id, task_id=task_id)
-        for timer in timers:
-            await self.schedule(timer)
+        await self.schedule_many(timers)
         return timers
 
+    def timers_for(self, context_id: str) -> list[Timer]:
+        """Return a context's held timers in ``(fire_at, sequence, id)`` order.
+
+        Pending and fired-but-not-yet-compacted timers; compacted ones live on only in
+        the context's follow-up summary.
+        """
+        timers = self._by_context.get(context_id, {}).values()
+        return sorted(timers, key=lambda t: (t.fire_at, t.sequence, t.id))
+
     def followups_for(self, context_id: str) -> FollowupStatus:
-        """Compute the follow-up status read-model for a context.
+        """Return the follow-up status read-model for a context (O(1)).
 
-        A thin convenience over ``followup_status`` for M1.13/demo wiring. Not part
-        of the seam Protocol (documented as a helper).
+        Read off the context's incrementally maintained tally — the same result as
+        ``followup_status`` over all timers. Not part of the seam Protocol (documented
+        as a helper for M1.13/demo wiring).
 
         Args:
             context_id: The exchange ``context_id``.
@@ -134,4 +504,14 @@ class LocalScheduler:
         Returns:
             A ``FollowupStatus`` snapshot.
         """
-        return followup_status(self._timers.values(), context_id=context_id)
+        tally = self._tallies.get(context_id)
+        return (tally or FollowupTally()).status(context_id)
+
+    async def load_timers(self, context_id: str) -> list[Timer]:
+        """Async :meth:`timers_for`, shared with ``DatabaseScheduler.load_timers`` (which
+        reads its table), so a caller swaps adapters without code changes."""
+        return self.timers_for(context_id)
+
+    async def load_followups(self, context_id: str) -> FollowupStatus:
+        """Async :meth:`followups_for`, shared with ``DatabaseScheduler.load_followups``."""
+        return self.followups_for(context_id)
@@ -5,58 +5,319 @@ Skills folders (SKILL.md + assets), provides the dynamic Agent Card, and exposes
 process-skill policy (disposition thresholds, SLA). Satisfies the SkillRegistrySeam
 protocol.
 
+Hot reload: the loaded skills are held in an immutable, versioned
+:class:`SkillSnapshot`. :meth:`LocalSkillRegistry.refresh` revalidates the tree — a
+``stat`` of each skill folder's files; a folder whose mtimes/sizes moved is re-hashed,
+and only a folder whose content actually changed is re-parsed. The new snapshot is
+built aside and swapped in with one assignment, so a reader always sees a complete
+tree (a new use-case uploaded live is served without a redeploy). A skill that fails
+to load on reload — whatever the error — keeps the previous snapshot
+(``reload_error``) and is retried on the next check; only the initial load fails loud.
+
+Revalidation on read is off by default. A rescan is blocking file I/O, so a server
+drives it from a worker thread instead — :func:`refresh_periodically`, started from
+the app's lifespan (the A2A edge's ``create_app`` does) — rather than from reads on the
+event loop; ``check_interval`` opts in to revalidating on read, at most every that
+many seconds (scripts, tests, the time-warp demo).
+
+Lazy mode (``lazy=True``) for catalogues of hundreds of skills: startup reads only
+each SKILL.md's frontmatter (name, kind, description — all the card and routing
+need). A skill's body and policy are parsed on its first ``get_skill``, and its
+explanations on the first :meth:`SkillSnapshot.explanations`; both are cached on the
+snapshot. A changed folder is re-indexed, not re-hashed, so a touch alone also swaps.
+
+Process-wide sharing: :func:`shared_skill_registry` returns one registry per skills
+root, so the edge, the executor and the demo servers stop re-walking ``skills/`` and
+re-parsing YAML each time they need a policy.
+
 See bridge/src/bridge/skills.py for the Skill/SkillPolicy types and loading logic.
 """
 
+import asyncio
+import hashlib
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 from a2a.types import AgentCapabilities, AgentCard, AgentInterface, AgentSkill
 from a2a.utils.constants import TransportProtocol
 
-from bridge.skills import Skill, SkillKind, load_skill, resolve_default_skills_dir
+from bridge.requirements import SkillExplanations, load_explanations
+from bridge.skills import (
+    Skill,
+    SkillIndexEntry,
+    SkillKind,
+    index_skill,
+    load_skill,
+    resolve_default_skills_dir,
+)
+
+__all__ = [
+    "DEFAULT_CHECK_INTERVAL",
+    "LocalSkillRegistry",
+    "SkillSnapshot",
+    "refresh_periodically",
+    "shared_skill_registry",
+    "skill_folder_digest",
+]
+
+#: Suggested seconds between two revalidations of the skills tree, when enabled.
+DEFAULT_CHECK_INTERVAL = 1.0
+
+# A folder's stamp: (relative path, mtime_ns, size) of every file in it, sorted.
+_Stamp = tuple[tuple[str, int, int], ...]
+
+
+class _Folder:
+    """One skill folder as last seen: its stamp, content digest and index entry, plus
+    the skill and explanations loaded from it (on first use in lazy mode)."""
+
+    __slots__ = ("_explanations", "_skill", "digest", "entry", "path", "stamp")
+
+    def __init__(
+        self,
+        path: Path,
+        stamp: _Stamp,
+        digest: str | None,
+        entry: SkillIndexEntry,
+        skill: Skill | None = None,
+    ) -> None:
+        self.path = path
+        self.stamp = stamp
+        self.digest = digest  # None in lazy mode: the content is not read to index it
+        self.entry = entry
+        self._skill = skill
+        self._explanations: SkillExplanations | None = None
+
+    @classmethod
+    def load(cls, path: Path, stamp: _Stamp) -> "_Folder":
+        """Load the whole skill now (eager mode)."""
+        skill = load_skill(path)
+        entry = SkillIndexEntry(
+            name=skill.name,
+            description=skill.description,
+            kind=skill.kind,
+            metadata=skill.metadata,
+            path=path,
+        )
+        return cls(path, stamp, _digest(path, stamp), entry, skill)
+
+    @classmethod
+    def index(cls, path: Path, stamp: _Stamp) -> "_Folder":
+        """Read the frontmatter only; the skill loads on first use (lazy mode)."""
+        return cls(path, stamp, None, index_skill(path))
+
+    def skill(self) -> Skill:
+        if self._skill is None:
+            self._skill = load_skill(self.path)
+        return self._skill
+
+    def explanations(self) -> SkillExplanations:
+        if self._explanations is None:
+            self._explanations = load_explanations(self.skill())
+        return self._explanations
+
+
+class _LoadingSkills(Mapping[str, Skill]):
+    """Skill name -> skill, loading each skill on first access (read-only)."""
+
+    __slots__ = ("_folders",)
+
+    def __init__(self, folders: Mapping[str, _Folder]) -> None:
+        self._folders = folders
+
+    def __getitem__(self, name: str) -> Skill:
+        return self._folders[name].skill()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._folders)
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+
+@dataclass(frozen=True)
+class SkillSnapshot:
+    """An immutable view of the registry's skills at one version.
+
+    Attributes:
+        version: Bumped on every swap that changed a skill (1 for the initial load).
+        index: Skill name -> frontmatter index entry (never loads a skill).
+        skills: Skill name -> skill (read-only; in lazy mode a skill is loaded on
+            first access and cached for the life of the snapshot).
+    """
+
+    version: int
+    _folders: Mapping[str, _Folder] = field(default_factory=dict, repr=False)
+
+    @property
+    def index(self) -> Mapping[str, SkillIndexEntry]:
+        """Skill name -> frontmatter index entry."""
+        return MappingProxyType({name: folder.entry for name, folder in self._folders.items()})
+
+    @property
+    def skills(self) -> Mapping[str, Skill]:
+        """Skill name -> skill (loaded on first access)."""
+        return _LoadingSkills(self._folders)
+
+    def get(self, name: str) -> Skill | None:
+        """Return the named skill (loading it on first use), or None."""
+        folder = self._folders.get(name)
+        return folder.skill() if folder is not None else None
+
+    def explanations(self, name: str) -> SkillExplanations | None:
+        """Return the named skill's explanations (read once per snapshot), or None."""
+        folder = self._folders.get(name)
+        return folder.explanations() if folder is not None else None
+
 
-__all__ = ["LocalSkillRegistry"]
+def _stamp(folder: Path) -> _Stamp:
+    entries = []
+    for path in folder.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            entries.append((path.relative_to(folder).as_posix(), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
+def _digest(folder: Path, stamp: _Stamp) -> str:
+    sha = hashlib.sha256()
+    for rel, _, _ in stamp:
+        sha.update(rel.encode())
+        sha.update(b"\0")
+        sha.update((folder / rel).read_bytes())
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def skill_folder_digest(folder: Path) -> str:
+    """Return the SHA-256 over a skill folder's file names and bytes.
+
+    The digest the registry compares on reload: it changes exactly when a file in the
+    folder is added, removed, renamed or edited.
+    """
+    return _digest(folder, _stamp(folder))
 
 
 class LocalSkillRegistry:
     """Local (directory-backed) skill registry adapter.
 
-    Loads Agent Skills folders at construction and caches them. The registry is the
-    source of the dynamic Agent Card (process skills advertised as AgentSkill entries)
-    and the process-skill policy (disposition thresholds, SLA).
+    Loads Agent Skills folders at construction and caches them as a
+    :class:`SkillSnapshot`. The registry is the source of the dynamic Agent Card
+    (process skills advertised as AgentSkill entries) and the process-skill policy
+    (disposition thresholds, SLA).
 
     Missing/empty root yields an empty registry (no raise); a malformed *present*
-    skill fails loud at construction.
+    skill fails loud at construction (lazy mode: malformed frontmatter at
+    construction, a malformed body or policy on the skill's first use).
     """
 
-    def __init__(self, root: Path | str | None = None):
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        *,
+        check_interval: float | None = None,
+        lazy: bool = False,
+    ):
         """Initialize the registry and load skills from the given directory.
 
         Args:
             root: Path to the skills directory. Defaults to resolve_default_skills_dir()
                 (BRIDGE_SKILLS_DIR env var, else walk up to repo skills/, else cwd/skills).
+            check_interval: Seconds between revalidations of the tree on read (0: every
+                read). None (the default) disables revalidation on read — it would run
+                blocking file I/O on the reader's thread; call :meth:`refresh`, e.g.
+                from a worker thread.
+            lazy: Index only each SKILL.md's frontmatter up front and load the body,
+                policy and explanations on first use (large catalogues).
         """
         self.root = Path(root) if root else resolve_default_skills_dir()
-        self._skills: dict[str, Skill] = {}
+        self.check_interval = check_interval
+        self.lazy = lazy
+        self.reload_error: Exception | None = None
+        """The error of the last failed reload (None once a reload succeeds)."""
+        self._lock = threading.Lock()
+        self._folders: dict[Path, _Folder] = {}
+        self._snapshot = SkillSnapshot(version=0)
+        self._checked = time.monotonic()
+        self._reload(initial=True)
+
+    @property
+    def _skills(self) -> Mapping[str, Skill]:
+        """The current snapshot's skills (revalidated per ``check_interval``)."""
+        return self.current().skills
+
+    def explanations(self, name: str) -> SkillExplanations | None:
+        """Return a skill's explanations (M1.9 relay), read once per snapshot.
 
-        # Load skills if the root exists
-        if not self.root.exists() or not self.root.is_dir():
-            # Empty/missing root → empty registry (no raise)
-            return
+        Args:
+            name: The skill name.
 
-        # Scan immediate subdirectories for SKILL.md
-        for subdir in self.root.iterdir():
-            if not subdir.is_dir():
-                continue
+        Returns:
+            The SkillExplanations, or None if the skill is not found.
+        """
+        return self.current().explanations(name)
 
-            skill_md = subdir / "SKILL.md"
-            if not skill_md.exists():
-                # Not a skill folder, skip
-                continue
+    def current(self) -> SkillSnapshot:
+        """Return the current snapshot, revalidating the tree first if the check is due."""
+        interval = self.check_interval
+        if interval is not None and time.monotonic() - self._checked >= interval:
+            self.refresh()
+        return self._snapshot
 
-            # Load the skill (will raise on malformed present skill)
-            skill = load_skill(subdir)
-            self._skills[skill.name] = skill
+    def refresh(self) -> bool:
+        """Revalidate the skills tree now and swap in a new snapshot if it changed.
+
+        Returns:
+            True if a new snapshot was swapped in.
+        """
+        return self._reload(initial=False)
+
+    def _skill_folders(self) -> list[Path]:
+        """The immediate subdirectories holding a SKILL.md."""
+        if not self.root.is_dir():
+            # Empty/missing root → empty registry (no raise)
+            return []
+        return sorted(d for d in self.root.iterdir() if d.is_dir() and (d / "SKILL.md").exists())
+
+    def _reload(self, *, initial: bool) -> bool:
+        with self._lock:
+            self._checked = time.monotonic()
+            try:
+                folders = {}
+                for path in self._skill_folders():
+                    stamp = _stamp(path)
+                    known = self._folders.get(path)
+                    if known is not None and known.stamp == stamp:
+                        folders[path] = known
+                    elif self.lazy:
+                        folders[path] = _Folder.index(path, stamp)
+                    elif known is not None and known.digest == _digest(path, stamp):
+                        known.stamp = stamp  # touched only: same content, same snapshot
+                        folders[path] = known
+                    else:
+                        # Load the skill (will raise on malformed present skill)
+                        folders[path] = _Folder.load(path, stamp)
+            except Exception as exc:  # any broken upload keeps the last good snapshot
+                if initial:
+                    raise
+                self.reload_error = exc
+                return False
+            self.reload_error = None
+            previous = self._folders
+            self._folders = folders
+            changed = (
+                initial
+                or folders.keys() != previous.keys()
+                or any(folder is not previous[path] for path, folder in folders.items())
+            )
+            if changed:
+                by_name = {folder.entry.name: folder for folder in folders.values()}
+                self._snapshot = SkillSnapshot(self._snapshot.version + 1, by_name)
+            return changed
 
     async def list_skills(self) -> list[Skill]:
         """List all available skills.
@@ -64,7 +325,7 @@ class LocalSkillRegistry:
         Returns:
             List of Skill instances, sorted by name for deterministic ordering.
         """
-        return sorted(self._skills.values(), key=lambda s: s.name)
+        return sorted(self.current().skills.values(), key=lambda s: s.name)
 
     async def get_skill(self, name: str) -> Skill | None:
         """Retrieve a skill by name, or None if not found.
@@ -75,7 +336,7 @@ class LocalSkillRegistry:
         Returns:
             The Skill instance, or None if not found.
         """
-        return self._skills.get(name)
+        return self.current().get(name)
 
     def agent_skills(self) -> list[AgentSkill]:
         """Generate AgentSkill entries for the Agent Card.
@@ -87,7 +348,7 @@ class LocalSkillRegistry:
             List of AgentSkill instances, one per process skill.
         """
         skills = []
-        for skill in sorted(self._skills.values(), key=lambda s: s.name):
+        for skill in sorted(self.current().index.values(), key=lambda s: s.name):
             if skill.kind != SkillKind.PROCESS:
                 continue
 
@@ -162,3 +423,45 @@ class LocalSkillRegistry:
             default_output_modes=["application/json"],
             skills=process_skills,
         )
+
+
+_shared: dict[Path, LocalSkillRegistry] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_skill_registry(root: Path | str | None = None) -> LocalSkillRegistry:
+    """Return the process-wide registry for ``root`` (loaded on first use).
+
+    One registry per resolved skills root: every caller shares its snapshot and its
+    hot reload instead of re-walking and re-parsing the tree.
+
+    Args:
+        root: The skills directory. Defaults to resolve_default_skills_dir().
+
+    Returns:
+        The shared LocalSkillRegistry for that directory.
+    """
+    key = (Path(root) if root else resolve_default_skills_dir()).resolve()
+    with _shared_lock:
+        registry = _shared.get(key)
+        if registry is None:
+            registry = _shared[key] = LocalSkillRegistry(key)
+        return registry
+
+
+async def refresh_periodically(
+    registry: LocalSkillRegistry, interval: float = DEFAULT_CHECK_INTERVAL
+) -> None:
+    """Revalidate ``registry`` every ``interval`` seconds until cancelled.
+
+    The server-side hot reload driver: each :meth:`LocalSkillRegistry.refresh` runs on
+    a worker thread, so the rescan never blocks the event loop. Run it as a task for
+    the app's lifetime and cancel it on shutdown.
+
+    Args:
+        registry: The registry to revalidate.
+        interval: Seconds between two revalidations.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(registry.refresh)
@@ -0,0 +1,331 @@
+"""Durable local task store: atomic per-context ordinals + an indexed ordinal column.
+
+``aggregate.next_ordinal`` derives a leg's A5 sort key by counting the context's
+existing tasks — O(n), and racy once several Bridge workers share one SQLite task
+store (two workers can count the same n). :class:`SequencedTaskStore` is the
+``DatabaseTaskStore`` the durable local factory builds, plus a sequence table keyed
+like the tasks themselves, by ``(owner, context_id)``: :meth:`SequencedTaskStore.save_legs`
+bumps that counter row by a round's leg count and inserts the legs **in one
+transaction**, so ordinals are unique and gap-free across processes without reading
+the context first, and a round is recorded whole or not at all. The legs are inserted,
+never merged: a leg id that already exists fails the transaction (and rolls the counter
+back) instead of overwriting another worker's leg.
+
+The A5 sort key otherwise lives inside the task's metadata Struct (a JSON column), so
+the database can neither filter nor order by it and ``build_exchange_view`` sorts in
+Python after loading every task. This store also projects ``bridge_ordinal`` into a
+real column under an ``(owner, context_id, bridge_ordinal)`` index:
+:meth:`SequencedTaskStore.list_legs` returns a context's legs already in ordinal
+order, a keyset-paged range scan. An existing ``tasks`` table is migrated in place
+(column added, backfilled from the metadata JSON), and the sequence is seeded from
+each exchange's highest stamped ordinal, so the first ``save_leg`` on a migrated
+exchange continues after its existing legs.
+
+The sequence row also carries a **revision**, bumped by every plain ``save`` of a leg
+(a re-stamp, or a leg written outside ``save_legs``) but not by ``save_legs`` appends.
+:meth:`SequencedTaskStore.leg_revision` reports it with the leg count through an
+ordinal, which is how a ledger snapshot is checked against the store
+(:func:`~bridge.exchange.snapshot_is_current`) without reading the legs it folded.
+
+SQLite only (``INSERT … ON CONFLICT … RETURNING``, SQLite ≥ 3.35) — the local durable
+variant runs on ``sqlite+aiosqlite``. Import discipline: pulls ``sqlalchemy``, so it is
+imported lazily by :func:`bridge.adapters.local.build_local_adapter` (a plain
+``import bridge.adapters.local`` stays sqlalchemy-free).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from a2a.server.context import ServerCallContext
+from a2a.server.models import TaskMixin
+from a2a.server.tasks import DatabaseTaskStore
+from a2a.types import Task
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    String,
+    Table,
+    and_,
+    func,
+    inspect,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+
+from bridge.aggregate import DEFAULT_LEG_PAGE_SIZE, ORDINAL_KEY, stamp_ordinal
+
+__all__ = [
+    "ORDINAL_SEQUENCE_TABLE",
+    "LedgerTaskModel",
+    "SequencedTaskStore",
+]
+
+#: Name of the per-context ordinal counter table.
+ORDINAL_SEQUENCE_TABLE = "bridge_ordinal_sequence"
+
+
+class _Base(DeclarativeBase):
+    """Declarative base for the Bridge's task-store tables (kept off the SDK's Base)."""
+
+
+class LedgerTaskModel(TaskMixin, _Base):
+    """The SDK task row plus ``bridge_ordinal`` projected out of the metadata Struct."""
+
+    __tablename__ = "tasks"
+
+    bridge_ordinal: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> tuple[Any, ...]:
+        """The SDK's (owner, last_updated) index + the exchange range-scan index."""
+        return (
+            Index("idx_tasks_owner_last_updated", "owner", "last_updated"),
+            Index("idx_tasks_owner_context_ordinal", "owner", "context_id", "bridge_ordinal"),
+        )
+
+
+_sequence = Table(
+    ORDINAL_SEQUENCE_TABLE,
+    _Base.metadata,
+    Column("owner", String, primary_key=True),
+    Column("context_id", String, primary_key=True),
+    Column("next_ordinal", Integer, nullable=False),
+    Column("revision", Integer, nullable=False, server_default="0"),
+)
+
+
+def _migrate(sync_conn) -> None:
+    """Bring a pre-existing ``tasks`` table up to :class:`LedgerTaskModel` (idempotent)."""
+    table = LedgerTaskModel.__table__
+    columns = {c["name"] for c in inspect(sync_conn).get_columns(table.name)}
+    if "bridge_ordinal" not in columns:
+        sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN bridge_ordinal INTEGER"))
+        sync_conn.execute(
+            text(
+                f"UPDATE {table.name} SET bridge_ordinal = "
+                f"CAST(json_extract(metadata, '$.{ORDINAL_KEY}') AS INTEGER)"
+            )
+        )
+    for index in table.indexes:
+        index.create(sync_conn, checkfirst=True)
+    _seed_sequence(sync_conn)
+
+
+def _seed_sequence(sync_conn) -> None:
+    """Raise every exchange's counter to just past its highest stamped ordinal.
+
+    Idempotent (a counter only moves up), so it covers migrated tables and legs saved
+    through plain ``save`` alike. A covering scan of the ordinal index.
+    """
+    model = LedgerTaskModel
+    highest = (
+        select(model.owner, model.context_id, func.max(model.bridge_ordinal) + 1)
+        .where(model.bridge_ordinal.is_not(None))
+        .group_by(model.owner, model.context_id)
+    )
+    seed = insert(_sequence).from_select(["owner", "context_id", "next_ordinal"], highest)
+    seed = seed.on_conflict_do_update(
+        index_elements=[_sequence.c.owner, _sequence.c.context_id],
+        set_={"next_ordinal": func.max(_sequence.c.next_ordinal, seed.excluded.next_ordinal)},
+    )
+    sync_conn.execute(seed)
+
+
+class SequencedTaskStore(DatabaseTaskStore):
+    """``DatabaseTaskStore`` with atomic per-context ordinals and ordered leg listing.
+
+    Behaves exactly like ``DatabaseTaskStore`` for ``save``/``get``/``list``/``delete``
+    (same ``tasks`` table, same owner scoping); every save also fills the
+    ``bridge_ordinal`` column. :meth:`save_leg` allocates from the sequence;
+    :meth:`list_legs` reads through the ordinal index.
+    """
+
+    def __init__(self, engine, create_table: bool = True, **kwargs: Any) -> None:
+        """Initialize the store over ``engine`` (see ``DatabaseTaskStore``)."""
+        super().__init__(engine, create_table=create_table, **kwargs)
+        self.task_model = LedgerTaskModel
+
+    async def initialize(self) -> None:
+        """Create (or migrate) the task table and the sequence table."""
+        if self._initialized:
+            return
+        if self.create_table:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(_Base.metadata.create_all)
+                await conn.run_sync(_migrate)
+        self._initialized = True
+
+    def _to_orm(self, task: Task, owner: str) -> LedgerTaskModel:
+        """Map a task to its row, projecting the stamped ordinal into its column."""
+        model = super()._to_orm(task, owner)
+        if ORDINAL_KEY in task.metadata:
+            model.bridge_ordinal = int(task.metadata[ORDINAL_KEY])
+        return model
+
+    async def save(self, task: Task, context: ServerCallContext) -> None:
+        """Save or update a task; a leg also bumps its exchange's revision.
+
+        The revision bump and the upsert share one transaction, and the sequence is
+        kept ahead of the leg's ordinal, so a later ``save_legs`` never reuses it.
+        """
+        if ORDINAL_KEY not in task.metadata:
+            await super().save(task, context)
+            return
+        await self._ensure_initialized()
+        owner = self.owner_resolver(context)
+        bump = insert(_sequence).values(
+            owner=owner,
+            context_id=task.context_id,
+            next_ordinal=int(task.metadata[ORDINAL_KEY]) + 1,
+            revision=1,
+        )
+        bump = bump.on_conflict_do_update(
+            index_elements=[_sequence.c.owner, _sequence.c.context_id],
+            set_={
+                "next_ordinal": func.max(_sequence.c.next_ordinal, bump.excluded.next_ordinal),
+                "revision": _sequence.c.revision + 1,
+            },
+        )
+        async with self.async_session_maker.begin() as session:
+            await session.merge(self._to_orm(task, owner))
+            await session.execute(bump)
+
+    async def leg_revision(
+        self, context_id: str, context: ServerCallContext, *, through_ordinal: int | None = None
+    ) -> tuple[int, int]:
+        """Return ``(legs, revision)`` for one exchange.
+
+        Args:
+            context_id: The exchange to read.
+            context: The call context scoping the owner.
+            through_ordinal: Count only legs at or below this ordinal (None: every leg).
+
+        Returns:
+            The number of legs (through ``through_ordinal``) — a covering scan of the
+            ordinal index — and the exchange's revision (0 before any plain leg save).
+        """
+        await self._ensure_initialized()
+        owner = self.owner_resolver(context)
+        model = self.task_model
+        count = select(func.count()).where(
+            model.owner == owner,
+            model.context_id == context_id,
+            model.bridge_ordinal.is_not(None),
+        )
+        if through_ordinal is not None:
+            count = count.where(model.bridge_ordinal <= through_ordinal)
+        revision = select(_sequence.c.revision).where(
+            _sequence.c.owner == owner, _sequence.c.context_id == context_id
+        )
+        async with self.async_session_maker() as session:
+            legs = (await session.execute(count)).scalar_one()
+            current = (await session.execute(revision)).scalar_one_or_none()
+        return legs, current or 0
+
+    async def save_leg(self, task: Task, context: ServerCallContext) -> int:
+        """Allocate the next ordinal for ``task.context_id``, stamp it and insert the task.
+
+        A one-leg :meth:`save_legs`.
+
+        Returns:
+            The allocated 0-based ordinal.
+        """
+        (ordinal,) = await self.save_legs([task], context)
+        return ordinal
+
+    async def save_legs(self, tasks: Sequence[Task], context: ServerCallContext) -> list[int]:
+        """Allocate consecutive ordinals for one context's legs, stamp and insert them.
+
+        The counter bump and every insert share one transaction: the legs are recorded
+        together or not at all. The counter is scoped to the call's owner, like the
+        tasks themselves.
+
+        Args:
+            tasks: The legs, in ledger order, all of one ``context_id``; each one's
+                ``metadata["bridge_ordinal"]`` is (re)stamped.
+            context: The call context scoping the tasks' owner.
+
+        Returns:
+            The allocated 0-based ordinals, in the order of ``tasks``.
+
+        Raises:
+            ValueError: If the legs span more than one context.
+            sqlalchemy.exc.IntegrityError: If a task id already exists (nothing is
+                written; the counter is not advanced).
+        """
+        if not tasks:
+            return []
+        context_ids = {task.context_id for task in tasks}
+        if len(context_ids) != 1:
+            raise ValueError(f"save_legs takes one context's legs, got {sorted(context_ids)}")
+        await self._ensure_initialized()
+        owner = self.owner_resolver(context)
+        count = len(tasks)
+        bump = (
+            insert(_sequence)
+            .values(owner=owner, context_id=context_ids.pop(), next_ordinal=count)
+            .on_conflict_do_update(
+                index_elements=[_sequence.c.owner, _sequence.c.context_id],
+                set_={"next_ordinal": _sequence.c.next_ordinal + count},
+            )
+            .returning(_sequence.c.next_ordinal)
+        )
+        async with self.async_session_maker.begin() as session:
+            first = (await session.execute(bump)).scalar_one() - count
+            ordinals = list(range(first, first + count))
+            for task, ordinal in zip(tasks, ordinals, strict=True):
+                stamp_ordinal(task, ordinal)
+                session.add(self._to_orm(task, owner))
+        return ordinals
+
+    async def list_legs(
+        self,
+        context_id: str,
+        context: ServerCallContext,
+        *,
+        after: tuple[int, str] | None = None,
+        from_ordinal: int = 0,
+        limit: int = DEFAULT_LEG_PAGE_SIZE,
+    ) -> list[Task]:
+        """Return one page of a context's legs in ``(ordinal, task id)`` order.
+
+        Only tasks with a stamped ordinal (legs) are listed. Pages are keyset-based:
+        pass the ``(ordinal, id)`` of the last leg of the previous page as ``after``.
+
+        Args:
+            context_id: The exchange to read.
+            context: The call context scoping the owner.
+            after: Exclusive ``(ordinal, task_id)`` cursor; None starts at the beginning.
+            from_ordinal: Skip legs below this ordinal (e.g. those a snapshot folded).
+            limit: Maximum legs returned.
+
+        Returns:
+            Up to ``limit`` legs; fewer means the exchange is exhausted.
+        """
+        await self._ensure_initialized()
+        owner = self.owner_resolver(context)
+        model = self.task_model
+        stmt = select(model).where(
+            model.owner == owner,
+            model.context_id == context_id,
+            model.bridge_ordinal >= from_ordinal,
+        )
+        if after is not None:
+            ordinal, task_id = after
+            stmt = stmt.where(
+                or_(
+                    model.bridge_ordinal > ordinal,
+                    and_(model.bridge_ordinal == ordinal, model.id > task_id),
+                )
+            )
+        stmt = stmt.order_by(model.bridge_ordinal, model.id).limit(limit)
+        async with self.async_session_maker() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [self._from_orm(row) for row in rows]
@@ -0,0 +1,210 @@
+"""Hierarchical timing-wheel scheduler adapter for very high timer counts (M1.12).
+
+``LocalScheduler`` indexes pending timers in a heap: every insert pays O(log n), and
+with millions of SLA timers clustered on a handful of ticks that is the dominant cost.
+:class:`TimingWheelScheduler` is the same in-memory adapter with the pending heap
+swapped for a hierarchical timing wheel over the integer tick domain ``VirtualClock``
+uses:
+
+- ``levels`` wheels of ``2**slot_bits`` slots each. Level 0 holds one tick per slot;
+  a level-``k`` slot spans ``2**(slot_bits * k)`` ticks. A timer is filed by the
+  highest bit where its ``fire_at`` differs from the wheel's cursor (the next tick to
+  process), so placement is a XOR and a ``bit_length`` — O(1).
+- ``schedule`` / ``cancel`` are O(1): each slot is a dict keyed by timer id, and the
+  pending index maps the id to its slot.
+- ``due(now)`` walks the cursor forward. When it enters a new level-``k`` slot, that
+  slot's timers are re-filed one level (or more) down ("cascade"); a timer cascades at
+  most ``levels`` times before its level-0 slot fires, so the work per fired timer is
+  amortized O(1). Runs of empty slots are skipped a whole block at a time, so a long
+  idle gap costs O(levels), not O(gap).
+- Timers further out than the top wheel spans wait in an overflow slot that is
+  re-filed each time the cursor crosses a top-level block; timers scheduled in the
+  past (``fire_at`` behind the cursor) wait in a late slot and fire on the next
+  ``due()`` ahead of everything else.
+
+Deterministic ordering (lessons-learned.md A5) is kept: ticks fire in order, and the
+timers sharing a tick (one level-0 slot) are sorted by ``(sequence, id)`` — a sort of
+that one slot, not of every pending timer. Exactly-once (A7), the read-model index,
+retention and the bulk operations are :class:`LocalScheduler`'s own.
+
+Optional: pick it explicitly (``TimingWheelScheduler(clock)``); the seam factory still
+builds ``LocalScheduler``. ``heapq`` is C code, so the heap stays competitive in
+CPython — bulk ``schedule_many`` is a single heapify — and the wheel's edge is in
+``due()`` over large pending sets. ``test_scheduler_benchmark_scan_heap_wheel``
+compares the dict-scan baseline, the heap and the wheel (``BRIDGE_BENCH=1`` for the
+100k and 1M sizes).
+"""
+
+from __future__ import annotations
+
+from bridge.adapters.local.scheduler import LocalScheduler
+from bridge.scheduler import RetentionPolicy, Timer, VirtualClock
+
+__all__ = ["TimingWheelScheduler"]
+
+
+class TimingWheelScheduler(LocalScheduler):
+    """In-memory scheduler adapter indexed by a hierarchical timing wheel.
+
+    Same seam behavior as :class:`LocalScheduler` — upsert ``schedule``, idempotent
+    ``cancel``, ``due()`` in ``(fire_at, sequence, id)`` order with every returned timer
+    marked fired in place — with O(1) schedule/cancel and amortized O(1) per fired timer.
+
+    Args:
+        clock: Injectable virtual clock (default: a fresh ``VirtualClock()`` at tick 0).
+            The cursor starts at its current tick.
+        retention: When fired timers are compacted (default: kept forever).
+        slot_bits: log2 of the slots per wheel (default 6: 64 slots).
+        levels: Number of wheels (default 5: ``2**30`` ticks before the overflow slot).
+
+    Raises:
+        ValueError: If ``slot_bits`` or ``levels`` is not positive.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock | None = None,
+        *,
+        retention: RetentionPolicy | None = None,
+        slot_bits: int = 6,
+        levels: int = 5,
+    ):
+        """Initialize an empty wheel with its cursor at the clock's current tick."""
+        if slot_bits <= 0:
+            raise ValueError(f"slot_bits must be positive, got {slot_bits}")
+        if levels <= 0:
+            raise ValueError(f"levels must be positive, got {levels}")
+        super().__init__(clock, retention=retention)
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        # _wheels[level][slot] -> {timer id: timer}; then the overflow and late slots.
+        self._wheels = [[{} for _ in range(1 << slot_bits)] for _ in range(levels)]
+        self._overflow: dict[str, Timer] = {}
+        self._late: dict[str, Timer] = {}
+        # Pending timers per level (levels, then overflow), to skip empty blocks.
+        self._counts = [0] * (levels + 1)
+        # Pending index: timer id -> (level, slot dict); level ``levels`` is overflow,
+        # ``levels + 1`` is late.
+        self._slot_of: dict[str, tuple[int, dict[str, Timer]]] = {}
+        self._cursor = self.clock.now()
+
+    # --- Pending index (overrides LocalScheduler's heap) ---
+
+    def _push_pending(self, timers: list[Timer]) -> None:
+        for timer in timers:
+            self._file(timer)
+
+    def _drop_pending(self, timer_id: str) -> None:
+        located = self._slot_of.pop(timer_id, None)
+        if located is None:
+            return
+        level, slot = located
+        del slot[timer_id]
+        if level <= self._levels:
+            self._counts[level] -= 1
+
+    def _pop_due(self, now: int) -> list[Timer]:
+        ready: list[Timer] = []
+        if self._late:
+            late = [t for t in self._late.values() if t.fire_at <= now]
+            late.sort(key=lambda t: (t.fire_at, t.sequence, t.id))
+            for timer in late:
+                del self._late[timer.id]
+                del self._slot_of[timer.id]
+            ready.extend(late)
+
+        bits, mask, levels, counts = self._bits, self._mask, self._levels, self._counts
+        wheel0 = self._wheels[0]
+        while self._cursor <= now:
+            tick = self._cursor
+            if not tick & mask:
+                self._cascade(tick)
+            slot = wheel0[tick & mask]
+            if slot:
+                fired = sorted(slot.values(), key=lambda t: (t.sequence, t.id))
+                for timer in fired:
+                    del self._slot_of[timer.id]
+                slot.clear()
+                counts[0] -= len(fired)
+                ready.extend(fired)
+            self._cursor = tick + 1
+            if counts[0]:
+                continue
+            # Levels below ``empty`` are empty: jump to the next block that has work.
+            empty = 1
+            while empty <= levels and not counts[empty]:
+                empty += 1
+            if empty > levels:
+                self._cursor = now + 1  # nothing pending in the wheel at all
+                break
+            span = 1 << (bits * empty)
+            self._cursor = min(now + 1, (self._cursor + span - 1) & -span)
+        return ready
+
+    def _cascade(self, tick: int) -> None:
+        """Re-file the slots whose block starts at ``tick`` (highest level first)."""
+        bits, mask = self._bits, self._mask
+        for level in range(self._levels, 0, -1):
+            if tick & ((1 << (bits * level)) - 1):
+                continue
+            if level == self._levels:
+                slot = self._overflow
+            else:
+                slot = self._wheels[level][(tick >> (bits * level)) & mask]
+            if not slot:
+                continue
+            timers = list(slot.values())
+            slot.clear()
+            self._counts[level] -= len(timers)
+            for timer in timers:
+                self._file(timer)
+
+    def _file(self, timer: Timer) -> None:
+        """Place a pending timer relative to the cursor (O(1))."""
+        fire_at, cursor = timer.fire_at, self._cursor
+        if fire_at < cursor:
+            level, slot = self._levels + 1, self._late
+        else:
+            level = max((fire_at ^ cursor).bit_length() - 1, 0) // self._bits
+            if level >= self._levels:
+                level, slot = self._levels, self._overflow
+            else:
+                slot = self._wheels[level][(fire_at >> (self._bits * level)) & self._mask]
+            self._counts[level] += 1
+        slot[timer.id] = timer
+        self._slot_of[timer.id] = (level, slot)
+
+    async def next_fire_at(self) -> int | None:
+        """Return the earliest ``fire_at`` of an unfired timer, or None.
+
+        Not part of the seam Protocol (see ``LocalScheduler.next_fire_at``). A lower
+        level does not always hold the earlier timers: while the cursor sits on a block
+        boundary that has not cascaded yet, that block's timers are still a level up.
+        So this takes the minimum over the first non-empty slot of every level (the
+        earliest slot of its level) plus the late and overflow slots — at most
+        ``levels`` wheel scans.
+        """
+        if self._late:
+            return min(t.fire_at for t in self._late.values())
+        bits, mask = self._bits, self._mask
+        earliest: int | None = None
+        for level in range(self._levels):
+            if not self._counts[level]:
+                continue
+            wheel = self._wheels[level]
+            start = (self._cursor >> (bits * level)) & mask
+            for index in range(start, mask + 1):
+                if wheel[index]:
+                    first = min(t.fire_at for t in wheel[index].values())
+                    earliest = first if earliest is None else min(earliest, first)
+                    break
+        if self._overflow:
+            first = min(t.fire_at for t in self._overflow.values())
+            earliest = first if earliest is None else min(earliest, first)
+        return earliest
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled timers that have not fired yet (O(1))."""
+        return len(self._slot_of)
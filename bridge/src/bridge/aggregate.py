@@ -29,7 +29,7 @@ adapters (the dependency direction is adapters → aggregate). Keep it out of
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass, field
 from uuid import uuid4
 
@@ -37,11 +37,13 @@ from a2a.types import Task, TaskState, TaskStatus
 from pydantic import BaseModel, Field
 
 __all__ = [
+    "DEFAULT_LEG_PAGE_SIZE",
     "ORDINAL_KEY",
     "ExchangeRecord",
     "ExchangeView",
     "build_exchange_view",
     "create_leg_task",
+    "iter_exchange_legs",
     "mint_context_id",
     "next_ordinal",
     "ordinal_of",
@@ -54,6 +56,9 @@ __all__ = [
 #: Metadata key holding the durable per-context ordinal (A5 sort key).
 ORDINAL_KEY = "bridge_ordinal"
 
+#: Legs fetched per page by :func:`iter_exchange_legs`.
+DEFAULT_LEG_PAGE_SIZE = 100
+
 
 def mint_context_id() -> str:
     """Mint a fresh exchange identity = the A2A ``context_id`` (D2, ADR-0003).
@@ -180,9 +185,67 @@ async def tasks_for_context(task_store, context_id: str, *, call_context) -> lis
     that already hold a ``ServerCallContext``. The primary, unit-testable M1.2 API
     is :func:`build_exchange_view` over an explicit task list; this helper feeds it.
 
-    # M1.8 wires this through the A2A edge with its live ServerCallContext.
+    ``TaskStore.list`` is paginated (the SDK default page is 50), so this follows
+    ``next_page_token`` until the listing is exhausted — an exchange with more legs
+    than one page is returned whole. The store's order is not relied on (A5).
     """
     from a2a.types import ListTasksRequest
 
-    response = await task_store.list(ListTasksRequest(context_id=context_id), call_context)
-    return list(response.tasks)
+    tasks: list[Task] = []
+    page_token = ""
+    while True:
+        response = await task_store.list(
+            ListTasksRequest(context_id=context_id, page_token=page_token), call_context
+        )
+        tasks.extend(response.tasks)
+        page_token = response.next_page_token
+        if not page_token:
+            return tasks
+
+
+async def iter_exchange_legs(
+    task_store,
+    context_id: str,
+    *,
+    call_context,
+    from_ordinal: int = 0,
+    page_size: int = DEFAULT_LEG_PAGE_SIZE,
+) -> AsyncIterator[Task]:
+    """Stream the legs of ``context_id`` in ordinal order (streaming :class:`ExchangeView`).
+
+    With a store that lists legs by ordinal (``list_legs(context_id, call_context,
+    after=, limit=)`` — the durable local ``SequencedTaskStore``), pages through it
+    with an ``(ordinal, task id)`` keyset cursor, holding at most ``page_size`` tasks.
+    Any other ``TaskStore`` lists by last update, so ordinal order needs the whole
+    context: it falls back to :func:`tasks_for_context` + :func:`build_exchange_view`,
+    which loads and sorts every task of the context in memory before the first leg is
+    yielded — O(context) memory, the same as the materialized view. Only stamped legs
+    are yielded (request tasks carry no ordinal).
+
+    Args:
+        task_store: The A2A ``TaskStore`` holding the exchange.
+        context_id: The exchange to read.
+        call_context: The ``ServerCallContext`` scoping the listing (owner).
+        from_ordinal: Skip legs below this ordinal (e.g. those a snapshot folded).
+        page_size: Legs fetched per page from an ordinal-listing store.
+
+    Yields:
+        The exchange's legs, in ordinal order (A5).
+    """
+    list_legs = getattr(task_store, "list_legs", None)
+    if list_legs is None:
+        tasks = await tasks_for_context(task_store, context_id, call_context=call_context)
+        for task in build_exchange_view(context_id, tasks).tasks:
+            if ORDINAL_KEY in task.metadata and ordinal_of(task) >= from_ordinal:
+                yield task
+        return
+    after: tuple[int, str] | None = None
+    while True:
+        page = await list_legs(
+            context_id, call_context, after=after, from_ordinal=from_ordinal, limit=page_size
+        )
+        for task in page:
+            yield task
+        if len(page) < page_size:
+            return
+        after = (ordinal_of(page[-1]), page[-1].id)
@@ -3,34 +3,70 @@
 Mirrors the mock's ``create_app`` factory (``agents/src/agents/mock_bridge/app.py``):
 ``DefaultRequestHandler(agent_executor, task_store, agent_card)`` + the canonical
 ``create_agent_card_routes`` / ``create_jsonrpc_routes`` behind a Starlette app whose
-lifespan closes the handler. The real edge differs only in *where the ledger comes
-from* (bridge core, not canned fixtures) and in the trust boundary + ``_status_for``
-mapping carried by :class:`~bridge.edges.a2a.executor.BridgeExecutor`.
+lifespan closes the handler (and revalidates the skill registry on a timer, for hot
+reload). The real edge differs only in *where the ledger comes from* (bridge core, not
+canned fixtures) and in the trust boundary + ``_status_for`` mapping carried by
+:class:`~bridge.edges.a2a.executor.BridgeExecutor`.
 
 The Agent Card is **dynamic**, built from the skill registry (M1.3) — the same source
 the mock→real swap (M1.13) will leave unchanged for the consumer. ``base_url`` defaults
 to ``:8000`` to match the C2 port map (core = 8000).
+
+The card comes from :class:`CachedAgentCard`: built — and rendered to its JSON body
+and a strong ``ETag`` over those bytes — once per registry snapshot. A registry hot
+reload changes the snapshot version, so the next use rebuilds; no explicit
+invalidation. Both consumers follow it: :func:`create_agent_card_route` serves the
+cached bytes (answering a matching ``If-None-Match`` with 304, no serialization per
+request), and the JSON-RPC handler is built with the cache's card — one ``AgentCard``
+message the cache updates in place on a rebuild, revalidated before every request — so
+the route and the handler never disagree about the card.
 """
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import json
+from contextlib import asynccontextmanager, suppress
 
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.routes import create_agent_card_routes, create_jsonrpc_routes
+from a2a.server.request_handlers.response_helpers import agent_card_to_dict
+from a2a.server.routes import create_jsonrpc_routes
 from a2a.server.tasks import InMemoryTaskStore, TaskStore
 from a2a.types import AgentCapabilities, AgentCard
+from a2a.utils.constants import AGENT_CARD_WELL_KNOWN_PATH
 from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from bridge.adapters.local import build_local_adapter
 from bridge.adapters.local.extraction import FixtureExtractionEngine
-from bridge.adapters.local.skill_registry import LocalSkillRegistry
-from bridge.requirements import load_explanations
+from bridge.adapters.local.skill_registry import (
+    DEFAULT_CHECK_INTERVAL,
+    LocalSkillRegistry,
+    refresh_periodically,
+    shared_skill_registry,
+)
+from bridge.seams import Seam
 from bridge.seams.extraction import ExtractionSeam
 
 from .executor import BridgeExecutor
 from .plan import CollectPlan
 
-__all__ = ["build_agent_card", "create_app"]
+__all__ = [
+    "CARD_CACHE_CONTROL",
+    "CachedAgentCard",
+    "build_agent_card",
+    "create_agent_card_route",
+    "create_app",
+]
+
+#: Default ``Cache-Control`` for the card: cacheable, but revalidated on every use
+#: (a 304 against the ETag), so a skill uploaded live is seen on the next fetch.
+CARD_CACHE_CONTROL = "public, no-cache"
 
 
 def build_agent_card(
@@ -48,13 +84,14 @@ def build_agent_card(
     Args:
         base_url: The externally reachable base URL (the card interface URL is
             ``f"{base_url}/"``).
-        registry: The skill registry. Defaults to ``LocalSkillRegistry()``.
+        registry: The skill registry. Defaults to the process-wide
+            ``shared_skill_registry()``.
         version: The card version.
 
     Returns:
         The dynamic Agent Card.
     """
-    registry = registry or LocalSkillRegistry()
+    registry = registry or shared_skill_registry()
     return registry.build_agent_card(
         base_url=base_url,
         version=version,
@@ -62,40 +99,180 @@ def build_agent_card(
     )
 
 
+class CachedAgentCard:
+    """The dynamic Agent Card, built and rendered once per registry snapshot.
+
+    :meth:`card` always returns the same ``AgentCard`` message: a rebuild copies the
+    new snapshot's card into it, so a holder (the request handler) sees the update.
+
+    Args:
+        base_url: The externally reachable base URL (see :func:`build_agent_card`).
+        registry: The skill registry. Defaults to the process-wide
+            ``shared_skill_registry()``.
+        version: The card version.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        registry: LocalSkillRegistry | None = None,
+        version: str = "0.0.0",
+    ) -> None:
+        """Initialize the cache (the card is built on first use)."""
+        self.base_url = base_url
+        self.registry = registry or shared_skill_registry()
+        self.version = version
+        self._card = AgentCard()
+        # (snapshot version, rendered JSON body, strong ETag over the body)
+        self._cached: tuple[int, bytes, str] | None = None
+        self.builds = 0
+        """Number of times the card was built."""
+
+    def _current(self) -> tuple[int, bytes, str]:
+        snapshot_version = self.registry.current().version
+        cached = self._cached
+        if cached is None or cached[0] != snapshot_version:
+            card = build_agent_card(self.base_url, registry=self.registry, version=self.version)
+            body = json.dumps(
+                agent_card_to_dict(card), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            etag = f'"{hashlib.sha256(body).hexdigest()}"'
+            self._card.CopyFrom(card)
+            cached = self._cached = (snapshot_version, body, etag)
+            self.builds += 1
+        return cached
+
+    def card(self) -> AgentCard:
+        """Return the card, brought up to date first if the registry reloaded."""
+        self._current()
+        return self._card
+
+    def rendered(self) -> tuple[bytes, str]:
+        """Return the current card's JSON body and its strong ``ETag`` (both cached)."""
+        _, body, etag = self._current()
+        return body, etag
+
+
+class _CardRevalidation:
+    """ASGI middleware revalidating a :class:`CachedAgentCard` before every request.
+
+    The request handler reads its card's capabilities without going through the cache;
+    touching the cache first updates that card in place after a registry reload.
+    """
+
+    def __init__(self, app: ASGIApp, *, card_cache: CachedAgentCard) -> None:
+        self.app = app
+        self.card_cache = card_cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            self.card_cache.card()
+        await self.app(scope, receive, send)
+
+
+def _if_none_match_hits(header: str, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header selects ``etag`` (weak comparison, RFC 9110)."""
+    candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def create_agent_card_route(
+    cached: CachedAgentCard,
+    *,
+    card_url: str = AGENT_CARD_WELL_KNOWN_PATH,
+    cache_control: str | None = CARD_CACHE_CONTROL,
+) -> Route:
+    """Create the card route serving ``cached``'s current card.
+
+    Serves the body and ``ETag`` the cache rendered for the current snapshot — nothing
+    is serialized or hashed per request — and answers a matching ``If-None-Match``
+    with 304.
+
+    Args:
+        cached: The cached card.
+        card_url: Path the card is served from.
+        cache_control: ``Cache-Control`` header value (None: no header).
+
+    Returns:
+        A Starlette ``GET`` route.
+    """
+
+    async def agent_card(request: Request) -> Response:
+        body, etag = cached.rendered()
+        headers = {"ETag": etag}
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _if_none_match_hits(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    return Route(card_url, agent_card, methods=["GET"])
+
+
 def create_app(
     base_url: str = "http://127.0.0.1:8000",
     *,
     registry: LocalSkillRegistry | None = None,
     engine: ExtractionSeam | None = None,
     task_store: TaskStore | None = None,
+    db_path: str | None = None,
     collect_plan: CollectPlan | None = None,
     strict: bool = False,
     hold_seconds: float = 0.0,
+    card_cache_control: str | None = CARD_CACHE_CONTROL,
+    skills_refresh_interval: float | None = DEFAULT_CHECK_INTERVAL,
 ) -> Starlette:
     """Create the real Bridge's inbound A2A edge Starlette application (M1.8).
 
     Args:
         base_url: The externally reachable base URL (baked into the Agent Card;
             interface URL is ``f"{base_url}/"``). Defaults to ``:8000`` (C2 port map).
-        registry: Skill registry (card source, M1.3). Defaults to
-            ``LocalSkillRegistry()`` (loads ``skills/``; honors ``BRIDGE_SKILLS_DIR``).
+        registry: Skill registry (card source, M1.3). Defaults to the process-wide
+            ``shared_skill_registry()`` (loads ``skills/``; honors ``BRIDGE_SKILLS_DIR``).
         engine: Extraction seam driving collect content. Defaults to
             ``FixtureExtractionEngine()``.
-        task_store: The JSON-RPC handler's task store. Defaults to
-            ``InMemoryTaskStore()`` (the in→durable swap is a no-op for the consumer).
+        task_store: The JSON-RPC handler's task store. When given, it is shared with
+            the executor: legs are persisted alongside the request tasks and an evicted
+            (or restarted) exchange is rehydrated from them — pass a durable store
+            (``SequencedTaskStore``) for restart survival.
+        db_path: SQLite database for a durable task store the app builds itself
+            (``build_local_adapter(Seam.TASK_STORE, durable=True)``, a
+            ``SequencedTaskStore``), wired as ``task_store`` is and disposed on
+            shutdown. Mutually exclusive with ``task_store``. With neither, the handler
+            gets an ``InMemoryTaskStore()`` and legs stay in the executor's bounded
+            context cache only — an evicted exchange starts afresh and **nothing
+            survives a restart**: persisting legs into an unbounded in-memory store
+            would grow it with every exchange and list legs through ``tasks/list``.
         collect_plan: An explicit collect plan applied to every request; when None the
             plan is resolved per-request by skill.
         strict: Trust boundary mode (A6). Permissive by default.
         hold_seconds: Progress hold before completing (shrinkable for tests).
+        card_cache_control: ``Cache-Control`` for the Agent Card response.
+        skills_refresh_interval: Seconds between two revalidations of the registry's
+            tree, run off the event loop for the app's lifetime (hot reload: a skill
+            uploaded live reaches the card and the executor). None disables it.
 
     Returns:
         A Starlette app serving the Agent Card at ``/.well-known/agent-card.json`` and
         JSON-RPC at ``/``.
+
+    Raises:
+        ValueError: If both ``task_store`` and ``db_path`` are given.
     """
-    registry = registry or LocalSkillRegistry()
+    if task_store is not None and db_path is not None:
+        raise ValueError("create_app takes a task_store or a db_path, not both")
+    owned_store = None
+    if db_path is not None:
+        task_store = owned_store = build_local_adapter(
+            Seam.TASK_STORE, durable=True, db_path=db_path
+        )
+    registry = registry or shared_skill_registry()
     engine = engine or FixtureExtractionEngine()
 
-    card = build_agent_card(base_url, registry=registry)
+    card_cache = CachedAgentCard(base_url, registry=registry)
+    card = card_cache.card()
     # The registry loads skills/ by default; the edge advertises the address-proof
     # process skill (M1.3). Fail loud if it is missing rather than serving a card the
     # consumer cannot route against.
@@ -104,16 +281,16 @@ def create_app(
         "BRIDGE_SKILLS_DIR / the skills/ tree)."
     )
 
-    # M1.9: resolve explanations from the address-proof skill for requirements relay.
-    skill = registry._skills.get("address-proof")
-    explanations = load_explanations(skill) if skill is not None else None
-
+    # Leg persistence is opt-in: only a caller-supplied (or db_path) store is shared
+    # with the executor (legs saved alongside the request tasks, evicted exchanges
+    # rehydrated).
     executor = BridgeExecutor(
         engine=engine,
         collect_plan=collect_plan,
-        explanations=explanations,
+        registry=registry,
         strict=strict,
         hold_seconds=hold_seconds,
+        task_store=task_store,
     )
     handler = DefaultRequestHandler(
         agent_executor=executor,
@@ -122,17 +299,34 @@ def create_app(
     )
 
     routes = [
-        *create_agent_card_routes(card),
+        create_agent_card_route(card_cache, cache_control=card_cache_control),
         *create_jsonrpc_routes(handler, rpc_url="/"),
     ]
 
     @asynccontextmanager
     async def lifespan(app):
-        yield
+        refresher = None
+        if skills_refresh_interval is not None:
+            refresher = asyncio.create_task(refresh_periodically(registry, skills_refresh_interval))
+        try:
+            yield
+        finally:
+            if refresher is not None:
+                refresher.cancel()
+                with suppress(asyncio.CancelledError):
+                    await refresher
         await handler.aclose()
+        if owned_store is not None:
+            await owned_store.engine.dispose()
 
-    app = Starlette(routes=routes, lifespan=lifespan)
+    app = Starlette(
+        routes=routes,
+        lifespan=lifespan,
+        middleware=[Middleware(_CardRevalidation, card_cache=card_cache)],
+    )
     # Expose the executor so tests can inspect captured requests (parity with the mock's
     # app.state.mock_executor).
     app.state.executor = executor
+    app.state.handler = handler
+    app.state.card_cache = card_cache
     return app
@@ -23,41 +23,84 @@ an injectable :class:`~bridge.edges.a2a.plan.CollectPlan` fixture stand-in. The
 "done" is the consumer's sense-B decision — the edge supplies only ``outstanding``
 (advisory) + a ``terminal`` flag; it does **not** compute ``is_satisfied``.
 
+Per-context state (party/skill binding, round counter, the incremental leg fold) lives
+in a bounded :class:`~bridge.edges.a2a.state.ContextCache`. When the executor is given
+the handler's ``TaskStore`` it persists each round's minted legs together and stamps
+the request task, so an evicted or restarted exchange is rehydrated from the store on
+its next round.
+Rounds on one ``context_id`` are serialized by a :class:`~bridge.edges.a2a.state.ContextLocks`
+registry (a retrying consumer or a racing upload cannot interleave two rounds); distinct
+exchanges run in parallel.
+
+Path-B extraction is concurrent: a round's documents are extracted in parallel (bounded
+by an executor-wide semaphore, so a network-bound engine is never flooded) under an
+optional per-round time budget, then classified and minted as legs in plan order — the
+ordinals, and so the ledger order, never depend on which extraction finished first
+(A5). An engine that batches (``extract_many``) gets the round as one request.
+
+Long exchanges: with a ``task_store``, an ``exchange_store`` and ``snapshot_every``, the
+executor saves a ledger snapshot of the exchange as the store holds it
+(:func:`~bridge.exchange.save_snapshot`) every N folded legs, and a rehydration that
+finds it still current folds only the legs above it. The snapshot is an optimization:
+a failed write is logged and retried on the next round, never failing the turn.
+
 Import discipline: imports ``contract`` + ``a2a`` + core (``aggregate``/``ledger``/
-``disposition``/``skills``) + the edge's own ``plan``/``trust`` + the extraction seam
-(via the injected engine). Never imports ``agents``.
+``disposition``/``skills``) + the edge's own ``plan``/``state``/``trust`` + the
+extraction + exchange-store seams (injected). Never imports ``agents``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
+import uuid
+from collections import deque
 
 from a2a.helpers.proto_helpers import get_data_parts, new_data_part, new_text_message
 from a2a.server.agent_execution import AgentExecutor
-from a2a.server.tasks import TaskUpdater
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import TaskStore, TaskUpdater
 from a2a.types import Task, TaskState, TaskStatus
 from contract import CollectRequest, Disposition, Extraction
 
 from bridge.adapters.local.extraction import FixtureDocument
-from bridge.adapters.local.skill_registry import LocalSkillRegistry
-from bridge.aggregate import create_leg_task, next_ordinal
+from bridge.adapters.local.skill_registry import LocalSkillRegistry, shared_skill_registry
+from bridge.aggregate import create_leg_task
 from bridge.disposition import classify_document
-from bridge.ledger import build_exchange_turn, ledger_entry_of, stamp_ledger_entry
+from bridge.exchange import ExchangeAccumulator, load_snapshot, save_snapshot
+from bridge.ledger import LedgerEntryCache, stamp_ledger_entry
 from bridge.requirements import (
     SkillExplanations,
-    advisory_satisfaction,
     explain_rejection,
-    load_explanations,
     propose_requirements,
 )
-from bridge.seams.extraction import ExtractionSeam
+from bridge.seams.exchange_store import ExchangeStoreSeam
+from bridge.seams.extraction import (
+    BatchExtractionSeam,
+    ExtractionError,
+    ExtractionSeam,
+    extract_batch,
+)
 from bridge.skills import DispositionThresholds
 
 from .dispatch import PathKind, classify_arrival, looks_like_extraction
 from .plan import CollectPlan, plan_for_skill
+from .state import (
+    DEFAULT_MAX_CONTEXTS,
+    ContextCache,
+    ContextLocks,
+    ContextState,
+    rehydrate_context,
+    stamp_request_state,
+)
 from .trust import authorize_leg
 
-__all__ = ["BridgeExecutor", "_status_for"]
+__all__ = ["DEFAULT_EXTRACT_CONCURRENCY", "BridgeExecutor", "_status_for"]
+
+_log = logging.getLogger(__name__)
+
+#: Default number of document extractions the executor keeps in flight at once.
+DEFAULT_EXTRACT_CONCURRENCY = 8
 
 
 def _status_for(disposition: Disposition) -> TaskState:
@@ -72,13 +115,27 @@ def _status_for(disposition: Disposition) -> TaskState:
     return TaskState.TASK_STATE_COMPLETED
 
 
+def _leg_id(request_task_id: str) -> str:
+    """A leg task id unique across workers (not derived from a worker-local count).
+
+    Two workers folding the same exchange see the same ``len(exchange)``; an id built
+    from it would collide and one worker's leg would replace the other's. The A5 order
+    lives in the stamped ordinal, not the id. Only the A2A task id is random: the
+    ledger entry the leg carries keeps a stable id, so a replay is byte-identical.
+    """
+    return f"{request_task_id}-doc-{uuid.uuid4().hex}"
+
+
 class BridgeExecutor(AgentExecutor):
     """The real Bridge's inbound collect executor (M1.8).
 
-    Stateful per exchange ``context_id``: keeps a per-context round counter and the list
-    of leg tasks minted so far, so :func:`~bridge.ledger.build_exchange_turn` can fold
-    the whole exchange on every round. (Wiring this through the real ``TaskStore.list``
-    via ``aggregate.tasks_for_context`` is a later refinement — M1.8 keeps it in memory.)
+    Stateful per exchange ``context_id``: keeps a per-context round counter and an
+    :class:`~bridge.exchange.ExchangeAccumulator` over the leg tasks minted so far, so
+    each round folds in only its new legs and emits the same turn
+    :func:`~bridge.ledger.build_exchange_turn` would over the whole exchange. That
+    state sits in a bounded :class:`~bridge.edges.a2a.state.ContextCache`; with a
+    ``task_store`` a cache miss is rehydrated through ``aggregate.tasks_for_context``
+    and the stamped ordinals, without one an evicted exchange starts afresh.
     """
 
     def __init__(
@@ -88,8 +145,15 @@ class BridgeExecutor(AgentExecutor):
         collect_plan: CollectPlan | None = None,
         thresholds: DispositionThresholds | None = None,
         explanations: SkillExplanations | None = None,
+        registry: LocalSkillRegistry | None = None,
         strict: bool = False,
         hold_seconds: float = 0.0,
+        task_store: TaskStore | None = None,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        extract_concurrency: int = DEFAULT_EXTRACT_CONCURRENCY,
+        round_timeout: float | None = None,
+        exchange_store: ExchangeStoreSeam | None = None,
+        snapshot_every: int | None = None,
     ) -> None:
         """Initialize the executor.
 
@@ -98,48 +162,195 @@ class BridgeExecutor(AgentExecutor):
             collect_plan: An explicit plan override applied to every request regardless
                 of skill. When None, the plan is resolved per-request by skill
                 (:func:`~bridge.edges.a2a.plan.plan_for_skill`).
-            thresholds: Disposition thresholds. Defaults to ``DispositionThresholds()``
-                (0.55/0.85 — ADR-0002).
-            explanations: Skill explanations for requirements relay (M1.9). When None,
-                lazily resolved from the address-proof skill via LocalSkillRegistry.
+            thresholds: Disposition thresholds, fixed for every round. When None, each
+                round reads the address-proof skill's policy thresholds from
+                ``registry`` (``DispositionThresholds()`` — 0.55/0.85, ADR-0002 — if it
+                has none).
+            explanations: Skill explanations for requirements relay (M1.9), fixed for
+                every round. When None, each round reads the address-proof skill's
+                explanations from ``registry``.
+            registry: The skill registry thresholds and explanations are read from,
+                once per registry snapshot — a hot reload reaches the next round.
+                Defaults to the process-wide ``shared_skill_registry()``.
             strict: Trust boundary mode (A6). Permissive by default.
             hold_seconds: Progress hold before completing (shrinkable for tests; the
                 real edge defaults to 0.0 — the mock's ~10s hold was an M0 demonstrator).
+            task_store: The handler's task store. When set, minted legs are saved to it
+                and evicted/restarted exchanges are rehydrated from it.
+            max_contexts: Exchanges kept warm in memory (terminal ones evicted first).
+            extract_concurrency: Maximum ``engine.extract`` calls in flight at once,
+                across every round the executor is running.
+            round_timeout: Time budget in seconds for extracting one round's documents.
+                None (the default) means unbounded.
+            exchange_store: Where ledger snapshots are kept. With ``snapshot_every`` and a
+                ``task_store``, a rehydration folds only the legs above the snapshot.
+            snapshot_every: Save a ledger snapshot, read from ``task_store``, once this
+                many legs were folded since the last one. None (the default), or no
+                ``task_store``, never snapshots.
+
+        Raises:
+            ValueError: If ``extract_concurrency`` or ``snapshot_every`` is not positive.
         """
+        if extract_concurrency <= 0:
+            raise ValueError(f"extract_concurrency must be positive, got {extract_concurrency}")
+        if snapshot_every is not None and snapshot_every <= 0:
+            raise ValueError(f"snapshot_every must be positive, got {snapshot_every}")
         self._engine = engine
         self._collect_plan = collect_plan
-        self._thresholds = thresholds or DispositionThresholds()
+        self._thresholds = thresholds
+        self._explanations = explanations
+        self._registry = registry
+        # (snapshot version, thresholds, explanations) as last read from the registry
+        self._policy: tuple[int, DispositionThresholds, SkillExplanations] | None = None
         self._strict = strict
         self._hold_seconds = hold_seconds
+        self._task_store = task_store
+        self._extract_slots = asyncio.Semaphore(extract_concurrency)
+        self._round_timeout = round_timeout
+        self._exchange_store = exchange_store
+        self._snapshot_every = (
+            snapshot_every if exchange_store is not None and task_store is not None else None
+        )
 
-        # Explanations: lazily resolve if None (so direct-executor tests keep working).
-        if explanations is None:
-            registry = LocalSkillRegistry()
-            # Synchronous access via the _skills dict (populated in __init__)
-            skill = registry._skills.get("address-proof")
-            if skill is not None:
-                self._explanations = load_explanations(skill)
-            else:
-                self._explanations = SkillExplanations()
-        else:
-            self._explanations = explanations
-
-        # Per-context state.
-        self._rounds: dict[str, int] = {}
-        self._tasks: dict[str, list[Task]] = {}
-        self._party: dict[str, str] = {}
-        self._skill: dict[str, str] = {}
+        # Per-context state (bounded; rehydrated from the task store on a miss).
+        self._contexts = ContextCache(max_contexts)
+        self._locks = ContextLocks()
+        # Parsed-entry memo shared across contexts (each leg is parsed once, on fold-in).
+        self._ledger_cache = LedgerEntryCache()
 
         self.last_request_data: dict | None = None
         """Data part of the most recent first-turn inbound message (test introspection)."""
-        self.context_ids_seen: list[str] = []
-        """Context id of each first-turn inbound message, in arrival order."""
+        self.context_ids_seen: deque[str] = deque(maxlen=max_contexts)
+        """Context id of each recent first-turn inbound message, in arrival order."""
 
-    def _plan_for(self, ctx: str) -> CollectPlan:
+    def _plan_for(self, skill: str | None) -> CollectPlan:
         """Resolve the collect plan for a context (explicit override, else per-skill)."""
         if self._collect_plan is not None:
             return self._collect_plan
-        return plan_for_skill(self._skill.get(ctx, ""))
+        return plan_for_skill(skill)
+
+    def _round_policy(self) -> tuple[DispositionThresholds, SkillExplanations]:
+        """Resolve a round's thresholds and explanations (explicit overrides, else the
+        registry's current snapshot — re-read only when its version moves)."""
+        if self._thresholds is not None and self._explanations is not None:
+            return self._thresholds, self._explanations
+        registry = self._registry or shared_skill_registry()
+        snapshot = registry.current()
+        policy = self._policy
+        if policy is None or policy[0] != snapshot.version:
+            skill = snapshot.get("address-proof")
+            thresholds = (
+                skill.policy.thresholds
+                if skill is not None and skill.policy is not None
+                else DispositionThresholds()
+            )
+            explanations = snapshot.explanations("address-proof") or SkillExplanations()
+            policy = self._policy = (snapshot.version, thresholds, explanations)
+        _, thresholds, explanations = policy
+        return (
+            thresholds if self._thresholds is None else self._thresholds,
+            explanations if self._explanations is None else self._explanations,
+        )
+
+    @staticmethod
+    def _store_context(context) -> ServerCallContext:
+        """The call context to scope task-store access by (the request's, else default)."""
+        call_context = getattr(context, "call_context", None)
+        if isinstance(call_context, ServerCallContext):
+            return call_context
+        return ServerCallContext()
+
+    async def _context_state(self, context) -> ContextState:
+        """Return the exchange's state: cached, else rehydrated, else fresh."""
+        ctx = context.context_id
+        state = self._contexts.get(ctx)
+        if state is not None:
+            return state
+        if self._task_store is not None:
+            snapshot = None
+            if self._snapshot_every is not None:
+                snapshot = await load_snapshot(self._exchange_store, ctx)
+            state = await rehydrate_context(
+                self._task_store,
+                ctx,
+                call_context=self._store_context(context),
+                cache=self._ledger_cache,
+                snapshot=snapshot,
+                request_task=getattr(context, "current_task", None),
+            )
+        if state is None:
+            state = ContextState(
+                context_id=ctx, exchange=ExchangeAccumulator(ctx, cache=self._ledger_cache)
+            )
+        self._contexts.put(state)
+        return state
+
+    async def _extract_round(self, fixture_ids: tuple[str, ...]) -> list[Extraction]:
+        """Extract a round's documents concurrently, returning results in plan order.
+
+        An engine with ``extract_many`` (:class:`~bridge.seams.extraction.BatchExtractionSeam`)
+        gets the whole round as one batched request, holding one extract slot.
+
+        Raises:
+            ExtractionError: If an engine call fails (the round's other extractions are
+                cancelled) or the round overruns ``round_timeout``.
+        """
+        if isinstance(self._engine, BatchExtractionSeam):
+            return await self._extract_round_batched(fixture_ids)
+
+        async def extract_one(fid: str) -> Extraction:
+            async with self._extract_slots:
+                return await self._engine.extract(FixtureDocument(fixture_id=fid), None)
+
+        try:
+            async with asyncio.timeout(self._round_timeout):
+                async with asyncio.TaskGroup() as group:
+                    jobs = [group.create_task(extract_one(fid)) for fid in fixture_ids]
+        except TimeoutError as exc:
+            raise ExtractionError(
+                f"collect round of {len(fixture_ids)} document(s) exceeded its "
+                f"{self._round_timeout}s extraction budget"
+            ) from exc
+        except ExceptionGroup as group_exc:
+            # Surface the first engine fault as-is (callers handle ExtractionError).
+            raise group_exc.exceptions[0] from None
+        return [job.result() for job in jobs]
+
+    async def _extract_round_batched(self, fixture_ids: tuple[str, ...]) -> list[Extraction]:
+        """Extract a round in one ``extract_many`` request (first failure, in plan order)."""
+        requests = [(FixtureDocument(fixture_id=fid), None) for fid in fixture_ids]
+        try:
+            async with asyncio.timeout(self._round_timeout):
+                async with self._extract_slots:
+                    outcomes = await extract_batch(self._engine, requests)
+        except TimeoutError as exc:
+            raise ExtractionError(
+                f"collect round of {len(fixture_ids)} document(s) exceeded its "
+                f"{self._round_timeout}s extraction budget"
+            ) from exc
+        for outcome in outcomes:
+            if isinstance(outcome, ExtractionError):
+                raise outcome
+        return outcomes
+
+    async def _record_legs(self, context, exchange: ExchangeAccumulator, legs: list[Task]) -> None:
+        """Persist a round's stamped legs (when a store is wired), then fold them in.
+
+        Called once per round, after every document of it was classified, so a failed
+        round records nothing and its retry cannot mint a document twice. A store that
+        allocates ordinals itself (``SequencedTaskStore.save_legs``) restamps them
+        atomically with one transaction's inserts — unique across workers sharing it,
+        and all of the round's legs or none.
+        """
+        if self._task_store is not None:
+            save_legs = getattr(self._task_store, "save_legs", None)
+            if save_legs is not None:
+                await save_legs(legs, self._store_context(context))
+            else:
+                for leg in legs:
+                    await self._task_store.save(leg, self._store_context(context))
+        for leg in legs:
+            exchange.add(leg)
 
     @staticmethod
     def _caller_of(context) -> str | None:
@@ -162,20 +373,29 @@ class BridgeExecutor(AgentExecutor):
     async def execute(self, context, event_queue):
         """Drive one core-computed collect round and emit a contract-faithful turn.
 
+        Rounds on the same ``context_id`` run one at a time (in arrival order).
+
         Args:
             context: The a2a-sdk ``RequestContext`` (task_id, context_id, current_task,
                 message, call_context).
             event_queue: The event queue for status/artifact emission.
         """
+        async with self._locks.hold(context.context_id):
+            await self._run_round(context, event_queue)
+
+    async def _run_round(self, context, event_queue):
+        """One collect round for ``context`` (caller holds the context's lock)."""
         ctx = context.context_id
         current = context.current_task
         is_resume = (
             current is not None and current.status.state == TaskState.TASK_STATE_INPUT_REQUIRED
         )
 
+        state = await self._context_state(context)
+
         if is_resume:
-            party = self._party.get(ctx, ctx)
-            skill = self._skill.get(ctx, "")
+            party = state.party or ctx
+            skill = state.skill
         else:
             # Parse the inbound CollectRequest (single JSON DataPart — wire contract).
             message = getattr(context, "message", None)
@@ -188,24 +408,29 @@ class BridgeExecutor(AgentExecutor):
                 self.context_ids_seen.append(ctx)
             party = request.party
             skill = request.skill
-            self._party[ctx] = party
-            self._skill[ctx] = skill
 
         # Trust boundary (A6): permissive no-op for an unauthenticated caller; strict
-        # scoping only under strict=True.
+        # scoping only under strict=True. The context state is bound only once the
+        # caller is authorized, and its round only advances once the round's legs are
+        # recorded — a refused or failed round leaves the exchange as it was.
         authorize_leg(self._caller_of(context), party, strict=self._strict)
+        if not is_resume:
+            state.party = party
+            state.skill = skill
 
-        plan = self._plan_for(ctx)
-        r = self._rounds.get(ctx, 0)
-        self._rounds[ctx] = r + 1
+        plan = self._plan_for(skill)
+        thresholds, explanations = self._round_policy()
+        r = state.rounds
         collect_round = plan.round_for(r)
 
-        # a2a-sdk requires the Task object before any TaskStatusUpdateEvents.
+        # a2a-sdk requires the Task object before any TaskStatusUpdateEvents. The
+        # party/skill/round ride on it so the store can rehydrate this exchange.
         task = Task(
             id=context.task_id,
             context_id=ctx,
             status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
         )
+        stamp_request_state(task, party=party, skill=skill, round_index=r)
         await event_queue.enqueue_event(task)
 
         updater = TaskUpdater(event_queue, context.task_id, context.context_id)
@@ -213,7 +438,7 @@ class BridgeExecutor(AgentExecutor):
         await asyncio.sleep(self._hold_seconds)
 
         # M1.11: Dual-path dispatch — detect Path A (structured Extraction) vs Path B (default)
-        legs = self._tasks.setdefault(ctx, [])
+        exchange = state.exchange
         message = getattr(context, "message", None)
         parts = message.parts if message is not None else []
         path = classify_arrival(parts)
@@ -229,74 +454,77 @@ class BridgeExecutor(AgentExecutor):
 
         # Path A branch: structured response → validate-only (no engine.extract)
         if structured_extraction is not None:
-            doc_id = f"{context.task_id}-doc-{len(legs)}"
+            # The entry id is stable (a replayed exchange emits the same ledger); only
+            # the leg's task id must be unique.
+            doc_id = f"{context.task_id}-doc-{len(exchange)}"
             # Path A: classify the structured response (NO engine.extract call)
-            entry, result = classify_document(
-                doc_id, structured_extraction, thresholds=self._thresholds
-            )
+            entry, result = classify_document(doc_id, structured_extraction, thresholds=thresholds)
 
             # M1.9: stamp rejected entries with reason_code + message (verbatim relay)
             if entry.disposition == Disposition.REJECTED:
-                code, msg = explain_rejection(entry, result.gate, explanations=self._explanations)
+                code, msg = explain_rejection(entry, result.gate, explanations=explanations)
                 entry = entry.model_copy(update={"reason_code": code, "message": msg})
 
             leg = create_leg_task(
                 context_id=ctx,
-                ordinal=next_ordinal(legs),
-                task_id=doc_id,
+                ordinal=len(exchange),  # next_ordinal over the folded legs, O(1)
+                task_id=_leg_id(context.task_id),
             )
             stamp_ledger_entry(leg, entry)
-            legs.append(leg)
+            await self._record_legs(context, exchange, [leg])
 
             # Terminality: reuse plan.is_terminal for scripted terminal/non-terminal rounds
             terminal = plan.is_terminal(r)
 
         # Path B branch (default): existing fixture loop, unchanged
         else:
-            # Drive the round through core: classify each arrived doc, record a leg task.
-            for fid in collect_round.fixture_ids:
-                extraction = await self._engine.extract(FixtureDocument(fixture_id=fid), None)
-                entry, result = classify_document(fid, extraction, thresholds=self._thresholds)
+            # Extract the round's docs concurrently, then classify a leg task per doc in
+            # plan order (deterministic ordinals whatever finished first — A5) and record
+            # the round's legs together.
+            fixture_ids = collect_round.fixture_ids
+            extractions = await self._extract_round(fixture_ids)
+            legs: list[Task] = []
+            for fid, extraction in zip(fixture_ids, extractions, strict=True):
+                entry, result = classify_document(fid, extraction, thresholds=thresholds)
 
                 # M1.9: stamp rejected entries with reason_code + message (verbatim relay)
                 if entry.disposition == Disposition.REJECTED:
-                    code, msg = explain_rejection(
-                        entry, result.gate, explanations=self._explanations
-                    )
+                    code, msg = explain_rejection(entry, result.gate, explanations=explanations)
                     entry = entry.model_copy(update={"reason_code": code, "message": msg})
 
                 leg = create_leg_task(
                     context_id=ctx,
-                    ordinal=next_ordinal(legs),
-                    task_id=f"{context.task_id}-doc-{len(legs)}",
+                    ordinal=len(exchange) + len(legs),  # next_ordinal over folded legs
+                    task_id=_leg_id(context.task_id),
                 )
                 stamp_ledger_entry(leg, entry)
                 legs.append(leg)
+            await self._record_legs(context, exchange, legs)
 
             terminal = plan.is_terminal(r)
+        state.rounds = r + 1
 
         # Non-empty progress before the artifact (A11).
-        collected = len(legs)
+        collected = len(exchange)
         await updater.update_status(
             TaskState.TASK_STATE_WORKING,
             message=new_text_message(f"Classified {collected} document(s) so far…"),
         )
 
-        overall = self._overall_disposition(legs, terminal=terminal)
+        overall = self._overall_disposition(exchange.dispositions, terminal=terminal)
         next_state = _status_for(overall)
 
-        # M1.9: compute advisory satisfaction and build the turn with the real outstanding.
-        # Build a preliminary turn to get the status with the ledger (for advisory input).
-        prelim_turn = build_exchange_turn(ctx, legs, outstanding=[], terminal=terminal)
-        advisory = advisory_satisfaction(prelim_turn.status)
-
-        # Rebuild the turn with the advisory outstanding.
+        # M1.9: the advisory is maintained incrementally by the accumulator, so the turn
+        # is emitted once with the real outstanding — no preliminary fold.
         # NOTE: terminal flag stays plan-driven (not rewired to advisory.done) to avoid
         # perturbing M1.8's park/resume tests and _overall_disposition's PENDING-leg handling.
-        turn = build_exchange_turn(ctx, legs, outstanding=advisory.outstanding, terminal=terminal)
+        advisory = exchange.advisory()
+        turn = exchange.turn(outstanding=advisory.outstanding, terminal=terminal)
 
         # M1.9: build the RequirementsList from the advisory + explanations.
-        requirements = propose_requirements(turn.status, explanations=self._explanations)
+        requirements = propose_requirements(
+            turn.status, explanations=explanations, advisory=advisory
+        )
 
         # M1.9: emit BOTH ExchangeTurn and RequirementsList in one artifact (two data parts).
         # ExchangeTurn part FIRST (critical: existing M1.8 decoders rely on datas[0]).
@@ -308,6 +536,28 @@ class BridgeExecutor(AgentExecutor):
             last_chunk=True,
         )
 
+        # File the exchange by outcome: a completed one is the first to be evicted.
+        state.terminal = next_state != TaskState.TASK_STATE_INPUT_REQUIRED
+        self._contexts.put(state)
+        if (
+            self._snapshot_every is not None
+            and len(exchange) - state.snapshot_legs >= self._snapshot_every
+        ):
+            # Best-effort: the turn is already out, and a missing snapshot only costs a
+            # longer rehydration — a failed write is retried on the next round.
+            try:
+                snapshot = await save_snapshot(
+                    self._exchange_store,
+                    self._task_store,
+                    ctx,
+                    call_context=self._store_context(context),
+                    cache=self._ledger_cache,
+                )
+            except Exception:
+                _log.exception("ledger snapshot of exchange %s failed; retrying next round", ctx)
+            else:
+                state.snapshot_legs = snapshot.legs
+
         if next_state == TaskState.TASK_STATE_INPUT_REQUIRED:
             await updater.update_status(
                 TaskState.TASK_STATE_INPUT_REQUIRED,
@@ -317,15 +567,12 @@ class BridgeExecutor(AgentExecutor):
             await updater.complete()
 
     @staticmethod
-    def _overall_disposition(legs, *, terminal: bool) -> Disposition:
+    def _overall_disposition(dispositions, *, terminal: bool) -> Disposition:
         """Fold the per-leg dispositions into the exchange-level disposition (M1.8 step 7).
 
         ``PENDING`` if not terminal (more rounds outstanding) OR any leg is ``PENDING``;
         else ``ACCEPTED`` if any leg is accepted, else ``REJECTED``.
         """
-        dispositions = [
-            entry.disposition for entry in map(ledger_entry_of, legs) if entry is not None
-        ]
         if not terminal:
             return Disposition.PENDING
         if Disposition.PENDING in dispositions:
@@ -0,0 +1,289 @@
+"""Bounded, rehydratable per-context state for the inbound A2A edge.
+
+:class:`~bridge.edges.a2a.executor.BridgeExecutor` is stateful per exchange
+``context_id``: the party + skill bound on the first turn, the collect-round counter
+and the incremental fold of the legs minted so far. Held in plain dicts that state
+grows with every exchange ever seen and is lost on restart. This module keeps it in a
+bounded LRU (:class:`ContextCache`) and makes every entry *derivable* from the durable
+``TaskStore`` (:func:`rehydrate_context`), so eviction and restart are both just a
+cache miss:
+
+- the **legs** are ordinary tasks in the context, ordered by their stamped ordinal
+  (A5) — refolded by :class:`~bridge.exchange.ExchangeAccumulator`;
+- the **party / skill / round** ride on the request task's metadata
+  (:func:`stamp_request_state`), restamped each round the executor runs.
+
+With an exchange store, a rebuild seeds the fold from the exchange's
+:class:`~bridge.exchange.LedgerSnapshot` and reads only the legs above it — through the
+ordinal index on a ``SequencedTaskStore`` — so rehydrating a long exchange costs
+O(legs since the snapshot), not O(history). The snapshot is checked against the store
+first (:func:`~bridge.exchange.snapshot_is_current`); a stale one is ignored and the
+exchange refolded in full.
+
+Eviction prefers **terminal** exchanges (their task is completed — no resume can
+arrive), then the least-recently-used open exchange, so a burst of completed traffic
+never pushes out a parked one.
+
+Rounds on one exchange must not interleave — two concurrent sends would both read
+``next_ordinal`` (or both rehydrate) before either appends, minting duplicate ordinals
+and breaking the A5 sort guarantee. :class:`ContextLocks` serializes them per
+``context_id`` while different exchanges still run in parallel; a lock lives only
+while a round holds or awaits it, so the registry is bounded by in-flight exchanges.
+
+Import discipline: imports ``a2a`` + core (``aggregate``/``exchange``/``ledger``) only.
+Never imports ``agents``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from a2a.types import Task, TaskState
+
+from bridge.aggregate import (
+    ORDINAL_KEY,
+    build_exchange_view,
+    iter_exchange_legs,
+    ordinal_of,
+    tasks_for_context,
+)
+from bridge.exchange import ExchangeAccumulator, LedgerSnapshot, snapshot_is_current
+from bridge.ledger import LedgerEntryCache
+
+__all__ = [
+    "DEFAULT_MAX_CONTEXTS",
+    "PARTY_KEY",
+    "ROUND_KEY",
+    "SKILL_KEY",
+    "ContextCache",
+    "ContextLocks",
+    "ContextState",
+    "rehydrate_context",
+    "stamp_request_state",
+]
+
+#: Metadata key holding the 0-based collect round last run on a request task.
+ROUND_KEY = "bridge_round"
+#: Metadata key holding the counterparty reference bound on the first turn.
+PARTY_KEY = "bridge_party"
+#: Metadata key holding the requested process skill bound on the first turn.
+SKILL_KEY = "bridge_skill"
+
+#: Default number of exchanges kept warm in memory by the executor.
+DEFAULT_MAX_CONTEXTS = 1024
+
+_TERMINAL_STATES = frozenset(
+    {
+        TaskState.TASK_STATE_COMPLETED,
+        TaskState.TASK_STATE_FAILED,
+        TaskState.TASK_STATE_CANCELED,
+        TaskState.TASK_STATE_REJECTED,
+    }
+)
+
+
+@dataclass
+class ContextState:
+    """Everything the executor tracks for one exchange (derivable from the task store).
+
+    Attributes:
+        context_id: The exchange identity (A2A context_id).
+        exchange: The incremental fold of the exchange's legs.
+        party: Counterparty reference bound on the first turn.
+        skill: Requested process skill bound on the first turn.
+        rounds: Number of collect rounds already run (the next round's index).
+        terminal: True once the exchange's request task reached a terminal state.
+        snapshot_legs: Legs folded when the exchange's ledger snapshot was last saved.
+    """
+
+    context_id: str
+    exchange: ExchangeAccumulator
+    party: str = ""
+    skill: str = ""
+    rounds: int = 0
+    terminal: bool = False
+    snapshot_legs: int = 0
+
+
+def stamp_request_state(task: Task, *, party: str, skill: str, round_index: int) -> None:
+    """Stamp the exchange's party / skill / current round onto the request task.
+
+    The request task is persisted by the JSON-RPC handler, so this is what lets a
+    fresh executor (restart, or a cache eviction) resume the exchange where it parked.
+    """
+    task.metadata[PARTY_KEY] = party
+    task.metadata[SKILL_KEY] = skill
+    task.metadata[ROUND_KEY] = round_index
+
+
+async def rehydrate_context(
+    task_store,
+    context_id: str,
+    *,
+    call_context,
+    cache: LedgerEntryCache | None = None,
+    snapshot: LedgerSnapshot | None = None,
+    request_task: Task | None = None,
+) -> ContextState | None:
+    """Rebuild an exchange's :class:`ContextState` from the durable task store.
+
+    Streams the context's stamped legs in ordinal order
+    (:func:`~bridge.aggregate.iter_exchange_legs`) into a fresh fold — seeded from
+    ``snapshot`` when given and still current against the store, in which case only the
+    legs above its ``through_ordinal`` are read; a stale snapshot is ignored. Party /
+    skill / round come off ``request_task`` when it carries them (the task being
+    resumed), else off the most recent request task in a full listing.
+
+    Args:
+        task_store: The A2A ``TaskStore`` holding the exchange's tasks.
+        context_id: The exchange to rehydrate.
+        call_context: The ``ServerCallContext`` scoping the listing (owner).
+        cache: Optional parse cache for the leg refold.
+        snapshot: Optional ledger snapshot to seed the fold from.
+        request_task: Optional latest request task of the exchange (already loaded).
+
+    Returns:
+        The rehydrated state, or ``None`` if the store holds nothing for the context.
+    """
+    latest = (
+        request_task if request_task is not None and ROUND_KEY in request_task.metadata else None
+    )
+    listed = hasattr(task_store, "list_legs")
+    tasks: list[Task] | None = None
+    if latest is None or not listed:
+        # A store without list_legs is listed whole anyway: list once, use it throughout.
+        tasks = await tasks_for_context(task_store, context_id, call_context=call_context)
+    if latest is None:
+        if not tasks and snapshot is None:
+            return None
+        requests = [t for t in tasks if ROUND_KEY in t.metadata]
+        if requests:
+            latest = max(requests, key=lambda t: int(t.metadata[ROUND_KEY]))
+    if snapshot is not None and not await snapshot_is_current(
+        task_store, snapshot, call_context=call_context, tasks=tasks
+    ):
+        snapshot = None
+    from_ordinal = snapshot.through_ordinal + 1 if snapshot is not None else 0
+    exchange = ExchangeAccumulator(context_id, cache=cache, snapshot=snapshot)
+    if tasks is not None and not listed:
+        # Already holding the whole context: fold from it rather than listing again.
+        legs = (t for t in tasks if ORDINAL_KEY in t.metadata and ordinal_of(t) >= from_ordinal)
+        for leg in build_exchange_view(context_id, legs).tasks:
+            exchange.add(leg)
+    else:
+        async for leg in iter_exchange_legs(
+            task_store, context_id, call_context=call_context, from_ordinal=from_ordinal
+        ):
+            exchange.add(leg)
+    state = ContextState(
+        context_id=context_id,
+        exchange=exchange,
+        snapshot_legs=snapshot.legs if snapshot is not None else 0,
+    )
+    if latest is not None:
+        state.party = latest.metadata[PARTY_KEY] if PARTY_KEY in latest.metadata else ""
+        state.skill = latest.metadata[SKILL_KEY] if SKILL_KEY in latest.metadata else ""
+        state.rounds = int(latest.metadata[ROUND_KEY]) + 1
+        state.terminal = latest.status.state in _TERMINAL_STATES
+    return state
+
+
+class ContextCache:
+    """Bounded LRU of :class:`ContextState`, evicting terminal exchanges first.
+
+    Two recency-ordered pools: terminal and open. On overflow the least-recently-used
+    terminal exchange goes first; an open (possibly parked) exchange is evicted only
+    when no terminal one is left. Eviction is always safe — a miss rehydrates from the
+    task store (:func:`rehydrate_context`).
+
+    Args:
+        maxsize: Maximum number of exchanges held.
+
+    Raises:
+        ValueError: If ``maxsize`` is not positive.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAX_CONTEXTS) -> None:
+        """Initialize an empty cache."""
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._open: OrderedDict[str, ContextState] = OrderedDict()
+        self._terminal: OrderedDict[str, ContextState] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of exchanges held."""
+        return len(self._open) + len(self._terminal)
+
+    def __contains__(self, context_id: object) -> bool:
+        """Return whether ``context_id`` is held (does not touch recency)."""
+        return context_id in self._open or context_id in self._terminal
+
+    def get(self, context_id: str) -> ContextState | None:
+        """Return the held state for ``context_id`` (marking it most recent), else None."""
+        for pool in (self._open, self._terminal):
+            state = pool.get(context_id)
+            if state is not None:
+                pool.move_to_end(context_id)
+                return state
+        return None
+
+    def put(self, state: ContextState) -> None:
+        """Insert or refresh ``state``, filed by its ``terminal`` flag, then evict."""
+        self._open.pop(state.context_id, None)
+        self._terminal.pop(state.context_id, None)
+        pool = self._terminal if state.terminal else self._open
+        pool[state.context_id] = state
+        while len(self) > self.maxsize:
+            victims = self._terminal if self._terminal else self._open
+            victims.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every held exchange (the eviction count is kept)."""
+        self._open.clear()
+        self._terminal.clear()
+
+
+@dataclass
+class _LockEntry:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class ContextLocks:
+    """Per-``context_id`` async lock registry with idle eviction.
+
+    ``async with locks.hold(context_id):`` serializes rounds on one exchange. The lock
+    object is created on first use and dropped as soon as no round holds or awaits it,
+    so idle exchanges cost nothing. Event-loop confined (not thread-safe), like the
+    executor it guards.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._entries: dict[str, _LockEntry] = {}
+
+    def __len__(self) -> int:
+        """Return the number of exchanges with a round holding or awaiting a lock."""
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def hold(self, context_id: str) -> AsyncIterator[None]:
+        """Hold ``context_id``'s lock for the duration of the ``async with`` block."""
+        entry = self._entries.get(context_id)
+        if entry is None:
+            entry = self._entries[context_id] = _LockEntry()
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0:
+                del self._entries[context_id]
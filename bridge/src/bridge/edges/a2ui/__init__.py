@@ -9,7 +9,8 @@ Four capabilities:
    what comes back), JSON-serializable, consumed by any host renderer.
 2. **Ingest structured response** — A2uiResponse + mapper to Path-B intake document.
 3. **Feed Path-B intake into the extraction graph** — pass to run_fulfillment (M1.7),
-   threading attempts for the resubmission loop.
+   or run_fulfillment_many for a multi-document upload, threading attempts for the
+   resubmission loop.
 4. **Render the party-status view** — projection over CollectionStatus (M1.4) +
    RequirementsList (M1.9), plus a reference text renderer (demo furniture).
 
@@ -29,7 +30,13 @@ already imports bridge.adapters.local.*). Never imports agents/. Keep this out
 of bridge/__init__.py (preserve cheap import bridge + no-agents-guard clarity).
 """
 
-from .intake import A2uiResponse, IntakeMode, intake_to_document, submit_intake
+from .intake import (
+    A2uiResponse,
+    IntakeMode,
+    intake_to_document,
+    submit_intake,
+    submit_intakes,
+)
 from .renderer import render_screen
 from .views import (
     A2uiScreen,
@@ -55,6 +62,7 @@ __all__ = [
     "A2uiResponse",
     "intake_to_document",
     "submit_intake",
+    "submit_intakes",
     # Renderer (demo furniture)
     "render_screen",
 ]
@@ -1,9 +1,10 @@
 """A2UI intake: ingest structured response + feed the Path-B graph (M1.10).
 
 Receives structured responses from the A2UI host renderer, maps them to Path-B
-intake documents, and feeds them into the M1.7 fulfillment graph. Threads
-`attempts` forward for the resubmission loop (the caller carries attempts
-across resubmissions).
+intake documents, and feeds them into the M1.7 fulfillment graph — one at a time
+(`submit_intake`) or as a multi-document upload extracted in one batch
+(`submit_intakes`, via `run_fulfillment_many`). Threads `attempts` forward for
+the resubmission loop (the caller carries attempts across resubmissions).
 
 In Phase-1 local, intake is fixture-based (A2uiResponse carries a `fixture_id`
 that maps to a FixtureDocument). Real blob/text→Gemini intake is Sprint-2/Phase-4.
@@ -15,12 +16,13 @@ stdlib enum. Never agents. Keep this out of bridge/__init__.py.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import StrEnum
 
 from pydantic import BaseModel
 
 from bridge.adapters.local.extraction import FixtureDocument
-from bridge.fulfillment import FulfillmentResult, run_fulfillment
+from bridge.fulfillment import FulfillmentResult, run_fulfillment, run_fulfillment_many
 from bridge.seams.extraction import ExtractionSeam
 from bridge.skills import DispositionThresholds
 
@@ -29,6 +31,7 @@ __all__ = [
     "A2uiResponse",
     "intake_to_document",
     "submit_intake",
+    "submit_intakes",
 ]
 
 
@@ -134,3 +137,42 @@ async def submit_intake(
         max_resubmissions=max_resubmissions,
         attempts=attempts,
     )
+
+
+async def submit_intakes(
+    responses: Sequence[A2uiResponse],
+    *,
+    engine: ExtractionSeam,
+    thresholds: DispositionThresholds | None = None,
+    max_resubmissions: int = 3,
+    attempts: int = 0,
+) -> list[FulfillmentResult]:
+    """Feed a multi-document Path-B intake into the M1.7 fulfillment graph.
+
+    The batched sibling of :func:`submit_intake`: every response is mapped to a
+    document up front, then the documents go through :func:`run_fulfillment_many`,
+    so they are extracted in one batch and each is gated and routed exactly as
+    `submit_intake` would route it on its own.
+
+    Args:
+        responses: The structured responses from the A2UI host renderer.
+        engine: The extraction engine (ExtractionSeam).
+        thresholds: Disposition thresholds. Defaults to DispositionThresholds().
+        max_resubmissions: Max resubmissions before escalation. Defaults to 3.
+        attempts: Resubmissions requested so far, for every document. Defaults to 0.
+
+    Returns:
+        One FulfillmentResult per response, in input order.
+
+    Raises:
+        ValueError: If any response lacks a fixture_id (before anything is extracted).
+    """
+    documents = [intake_to_document(response) for response in responses]
+
+    return await run_fulfillment_many(
+        documents,
+        engine=engine,
+        thresholds=thresholds or DispositionThresholds(),
+        max_resubmissions=max_resubmissions,
+        attempts=attempts,
+    )
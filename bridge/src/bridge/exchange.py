@@ -0,0 +1,399 @@
+"""Incremental exchange fold — ledger + advisory maintained leg by leg.
+
+:func:`bridge.ledger.build_exchange_turn` is the reference read path: a pure fold that
+filters, sorts and parses every leg of an exchange on each call (ADR-0003 "view, not
+record"). The edge runs that fold once per collect round, so a long exchange pays for
+its whole history every round. :class:`ExchangeAccumulator` holds the *result* of that
+fold for one exchange and folds in only the legs a round appends — the classified
+ledger (ordinal order, A5), the advisory tally (accepted gov-id + accepted-issuer set,
+M1.9) and the set of per-leg dispositions — so a round costs O(new legs).
+
+It is a derived cache, not a record: an accumulator built from the same tasks always
+emits the same ``ExchangeTurn`` as :func:`~bridge.ledger.build_exchange_turn`
+(byte-identical on the wire), and it can be dropped and rebuilt from the tasks at any
+time.
+
+Snapshots (:class:`LedgerSnapshot`): an exchange that runs for weeks would still refold
+its whole history whenever its accumulator is rebuilt (restart, eviction). A snapshot
+freezes the fold — the ordinal-ordered entries plus the highest folded ordinal — into
+the materialized exchange record (``ExchangeStoreSeam.materialize`` + ``save``, under
+:data:`SNAPSHOT_KEY`), so a rebuild seeds from it and folds only the newer legs. It is
+derived, never authoritative: :func:`discard_snapshot` (or an unknown snapshot version)
+just means the next rebuild refolds everything.
+
+A snapshot is taken from the task store (:func:`save_snapshot` folds the store's
+ordinal-ordered legs), never from one worker's in-memory fold, which can miss a leg
+another worker wrote. A new snapshot extends the previous one: while that is still
+current it folds only the legs above its ordinal, so snapshotting every N legs costs
+O(N) reads, not O(history). Before seeding from it, a rebuild checks it against the store
+(:func:`snapshot_is_current`): the leg count through its ordinal plus the store's leg
+revision where the store keeps one (``SequencedTaskStore.leg_revision``), else a
+digest of the folded legs. A lower-ordinal leg written later, or a re-stamped leg,
+makes it stale, and the rebuild refolds everything.
+
+Import discipline: imports ``contract`` + ``a2a.types`` + core (``aggregate``/
+``ledger``/``requirements``) only. Never imports ``agents``, ``seams`` or ``adapters``
+(the exchange and task stores are passed in and used through their methods).
+Keep it out of ``bridge/__init__.py`` (preserve cheap ``import bridge``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+from a2a.types import Task
+from contract import CollectionStatus, Disposition, ExchangeTurn, LedgerEntry
+
+from bridge.aggregate import ORDINAL_KEY, iter_exchange_legs, ordinal_of
+from bridge.ledger import LEDGER_ENTRY_KEY, LedgerEntryCache, ledger_entry_of
+from bridge.requirements import AdvisoryResult, AdvisoryTally
+
+__all__ = [
+    "SNAPSHOT_KEY",
+    "SNAPSHOT_VERSION",
+    "ExchangeAccumulator",
+    "LedgerSnapshot",
+    "discard_snapshot",
+    "legs_digest",
+    "load_snapshot",
+    "save_snapshot",
+    "snapshot_is_current",
+]
+
+#: ``ExchangeRecord.state`` key holding the serialized :class:`LedgerSnapshot`.
+SNAPSHOT_KEY = "ledger_snapshot"
+
+#: Serialization version of :class:`LedgerSnapshot` (other versions are ignored).
+SNAPSHOT_VERSION = 2
+
+
+@dataclass(frozen=True)
+class LedgerSnapshot:
+    """A frozen fold of an exchange's legs up to ``through_ordinal``.
+
+    Attributes:
+        context_id: The exchange identity (A2A context_id).
+        through_ordinal: Highest leg ordinal folded (-1 for an empty fold); a rebuild
+            folds only legs above it.
+        legs: Legs folded when the snapshot was taken (stamped or not).
+        entries: ``(ordinal, entry)`` pairs in ledger (ordinal) order.
+        digest: :func:`legs_digest` of the folded legs ("" when the store keeps a leg
+            revision, which checks the snapshot instead, or when not taken from a store).
+        revision: The task store's leg revision when the snapshot was taken, or None
+            for a store that keeps none.
+    """
+
+    context_id: str
+    through_ordinal: int
+    legs: int
+    entries: tuple[tuple[int, LedgerEntry], ...]
+    digest: str = ""
+    revision: int | None = None
+
+    def to_state(self) -> dict:
+        """Serialize for ``ExchangeRecord.state`` (JSON-safe)."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "through_ordinal": self.through_ordinal,
+            "legs": self.legs,
+            "digest": self.digest,
+            "revision": self.revision,
+            "entries": [
+                {"ordinal": ordinal, "entry": entry.model_dump(mode="json")}
+                for ordinal, entry in self.entries
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, context_id: str, state: dict) -> LedgerSnapshot | None:
+        """Deserialize :meth:`to_state` output; ``None`` for an unknown version."""
+        if state.get("version") != SNAPSHOT_VERSION:
+            return None
+        return cls(
+            context_id=context_id,
+            through_ordinal=state["through_ordinal"],
+            legs=state["legs"],
+            entries=tuple(
+                (item["ordinal"], LedgerEntry.model_validate(item["entry"]))
+                for item in state["entries"]
+            ),
+            digest=state["digest"],
+            revision=state["revision"],
+        )
+
+
+class ExchangeAccumulator:
+    """Append-only, incrementally maintained fold of one exchange's legs.
+
+    ``add`` folds a leg in O(log n) for the ordinal insert plus one entry parse (served
+    by the optional :class:`~bridge.ledger.LedgerEntryCache`); the ledger, advisory and
+    dispositions are then read without refolding. Legs are expected to be added once
+    their entry is stamped — an unstamped (in-flight) leg is kept in :attr:`legs` but
+    contributes nothing to the ledger, exactly as :func:`~bridge.ledger.project_ledger`
+    skips it.
+
+    Args:
+        context_id: The exchange identity (A2A context_id); legs from any other
+            context are ignored (parity with ``build_exchange_view``'s filter).
+        tasks: Legs already collected (folded in input order; ordering is by ordinal).
+        cache: Optional parse cache shared with other readers.
+        snapshot: Optional snapshot to seed the fold from; ``tasks`` (and later
+            ``add`` calls) should then be only the legs above its ``through_ordinal``.
+    """
+
+    def __init__(
+        self,
+        context_id: str,
+        tasks: Iterable[Task] = (),
+        *,
+        cache: LedgerEntryCache | None = None,
+        snapshot: LedgerSnapshot | None = None,
+    ) -> None:
+        """Initialize the accumulator, folding in any ``tasks`` already collected."""
+        self.context_id = context_id
+        self._cache = cache
+        self._legs: list[Task] = []
+        self._ordinals: list[int] = []
+        self._entries: list[LedgerEntry] = []
+        self._tally = AdvisoryTally()
+        self._dispositions: set[Disposition] = set()
+        self._snapshot_legs = 0
+        self._through = -1
+        if snapshot is not None:
+            self._snapshot_legs = snapshot.legs
+            self._through = snapshot.through_ordinal
+            for ordinal, entry in snapshot.entries:
+                self._ordinals.append(ordinal)
+                self._entries.append(entry)
+                self._tally.add(entry)
+                self._dispositions.add(entry.disposition)
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Task) -> LedgerEntry | None:
+        """Fold one leg into the exchange.
+
+        Args:
+            task: The leg task (ordinal + ledger entry stamped).
+
+        Returns:
+            The leg's classified entry, or ``None`` if the task is unstamped or belongs
+            to another context.
+        """
+        if task.context_id != self.context_id:
+            return None
+        self._legs.append(task)
+        ordinal = ordinal_of(task)
+        self._through = max(self._through, ordinal)
+        entry = ledger_entry_of(task, cache=self._cache)
+        if entry is None:
+            return None
+        # bisect_right keeps equal ordinals in arrival order — the same tie-break the
+        # stable sort in build_exchange_view applies.
+        index = bisect_right(self._ordinals, ordinal)
+        self._ordinals.insert(index, ordinal)
+        self._entries.insert(index, entry)
+        self._tally.add(entry)
+        self._dispositions.add(entry.disposition)
+        return entry
+
+    @property
+    def legs(self) -> list[Task]:
+        """The leg tasks folded so far, in arrival order (a copy; excludes a seed snapshot)."""
+        return list(self._legs)
+
+    def __len__(self) -> int:
+        """Return the number of legs folded so far (stamped or not, snapshot included)."""
+        return self._snapshot_legs + len(self._legs)
+
+    def snapshot(self) -> LedgerSnapshot:
+        """Freeze the current fold (see :class:`LedgerSnapshot`)."""
+        return LedgerSnapshot(
+            context_id=self.context_id,
+            through_ordinal=self._through,
+            legs=len(self),
+            entries=tuple(zip(self._ordinals, self._entries, strict=True)),
+        )
+
+    @property
+    def ledger(self) -> list[LedgerEntry]:
+        """The classified ledger in ordinal order (a copy; entries are shared)."""
+        return list(self._entries)
+
+    @property
+    def dispositions(self) -> frozenset[Disposition]:
+        """The distinct per-leg dispositions recorded so far."""
+        return frozenset(self._dispositions)
+
+    def advisory(self) -> AdvisoryResult:
+        """The advisory satisfaction verdict over the ledger (M1.9, O(issuers))."""
+        return self._tally.result()
+
+    def status(
+        self, *, outstanding: Iterable[str] = (), terminal: bool = False
+    ) -> CollectionStatus:
+        """Assemble the ``CollectionStatus`` (same shape as ``project_collection_status``)."""
+        return CollectionStatus(
+            ledger=list(self._entries),
+            outstanding=list(outstanding),
+            terminal=terminal,
+        )
+
+    def turn(self, *, outstanding: Iterable[str] = (), terminal: bool = False) -> ExchangeTurn:
+        """Assemble the ``ExchangeTurn`` (same output as ``build_exchange_turn``)."""
+        return ExchangeTurn(
+            context_id=self.context_id,
+            status=self.status(outstanding=outstanding, terminal=terminal),
+        )
+
+
+def legs_digest(legs: Iterable[Task], *, through_ordinal: int | None = None) -> str:
+    """SHA-256 over the legs' ``(ordinal, task id, stamped entry)``, in that order.
+
+    Order-independent in its input (the legs are sorted by ``(ordinal, id)`` first),
+    so a fold and a store listing of the same legs agree.
+
+    Args:
+        legs: Leg tasks; tasks without an ordinal are ignored.
+        through_ordinal: Digest only the legs at or below this ordinal (None: all).
+    """
+    keyed = sorted(
+        (
+            ordinal_of(leg),
+            leg.id,
+            leg.metadata[LEDGER_ENTRY_KEY] if LEDGER_ENTRY_KEY in leg.metadata else "",
+        )
+        for leg in legs
+        if ORDINAL_KEY in leg.metadata
+    )
+    sha = hashlib.sha256()
+    for ordinal, task_id, entry in keyed:
+        if through_ordinal is not None and ordinal > through_ordinal:
+            break
+        sha.update(f"{ordinal}\0{task_id}\0{entry}\0".encode())
+    return sha.hexdigest()
+
+
+async def load_snapshot(exchange_store, context_id: str) -> LedgerSnapshot | None:
+    """Read the exchange's ledger snapshot, if one was saved (and is a known version)."""
+    record = await exchange_store.get(context_id)
+    if record is None or SNAPSHOT_KEY not in record.state:
+        return None
+    return LedgerSnapshot.from_state(context_id, record.state[SNAPSHOT_KEY])
+
+
+async def save_snapshot(
+    exchange_store,
+    task_store,
+    context_id: str,
+    *,
+    call_context,
+    cache: LedgerEntryCache | None = None,
+) -> LedgerSnapshot:
+    """Snapshot the exchange as the task store holds it into its materialized record.
+
+    Extends the exchange's previous snapshot when it is still current
+    (:func:`snapshot_is_current`): only the legs above its ``through_ordinal`` are read
+    (``list_legs`` pages from that ordinal where the store has it). Without a current
+    snapshot every leg is folded, in ordinal order. The store's leg revision is read
+    first, so a re-stamp racing the listing leaves the snapshot stale, not wrong. A
+    store without a leg revision is listed whole once — its digest check needs every
+    leg — and only the legs above the previous snapshot are folded.
+
+    Args:
+        exchange_store: An ``ExchangeStoreSeam`` implementation.
+        task_store: The A2A ``TaskStore`` holding the exchange's legs.
+        context_id: The exchange to snapshot.
+        call_context: The ``ServerCallContext`` scoping the listing (owner).
+        cache: Optional parse cache for the fold.
+
+    Returns:
+        The snapshot written.
+    """
+    revision = listed = None
+    leg_revision = getattr(task_store, "leg_revision", None)
+    if leg_revision is not None:
+        _, revision = await leg_revision(context_id, call_context)
+    else:
+        listed = [
+            leg
+            async for leg in iter_exchange_legs(task_store, context_id, call_context=call_context)
+        ]
+    previous = await load_snapshot(exchange_store, context_id)
+    if previous is not None and not await snapshot_is_current(
+        task_store, previous, call_context=call_context, tasks=listed
+    ):
+        previous = None
+    from_ordinal = previous.through_ordinal + 1 if previous is not None else 0
+    if listed is None:
+        legs = [
+            leg
+            async for leg in iter_exchange_legs(
+                task_store, context_id, call_context=call_context, from_ordinal=from_ordinal
+            )
+        ]
+    else:
+        legs = [leg for leg in listed if ordinal_of(leg) >= from_ordinal]
+    snapshot = replace(
+        ExchangeAccumulator(context_id, legs, cache=cache, snapshot=previous).snapshot(),
+        digest=legs_digest(listed) if listed is not None else "",
+        revision=revision,
+    )
+    record = await exchange_store.materialize(context_id)
+    state = {**record.state, SNAPSHOT_KEY: snapshot.to_state()}
+    await exchange_store.save(record.model_copy(update={"state": state}))
+    return snapshot
+
+
+async def snapshot_is_current(
+    task_store,
+    snapshot: LedgerSnapshot,
+    *,
+    call_context,
+    tasks: Iterable[Task] | None = None,
+) -> bool:
+    """Whether the task store still holds exactly the legs ``snapshot`` folded.
+
+    With a store that reports a leg revision (``leg_revision``), compares the leg count
+    through ``snapshot.through_ordinal`` and the revision — two indexed reads. Any
+    other store is listed (or ``tasks``, the context's tasks already in hand, is used)
+    and the folded legs' digest compared.
+
+    Args:
+        task_store: The A2A ``TaskStore`` holding the exchange's legs.
+        snapshot: The snapshot to check.
+        call_context: The ``ServerCallContext`` scoping the listing (owner).
+        tasks: Optional, the exchange's tasks already listed from ``task_store``.
+    """
+    context_id = snapshot.context_id
+    leg_revision = getattr(task_store, "leg_revision", None)
+    if leg_revision is not None:
+        legs, revision = await leg_revision(
+            context_id, call_context, through_ordinal=snapshot.through_ordinal
+        )
+        return (legs, revision) == (snapshot.legs, snapshot.revision)
+    if tasks is None:
+        tasks = [
+            leg
+            async for leg in iter_exchange_legs(task_store, context_id, call_context=call_context)
+        ]
+    folded = [
+        task
+        for task in tasks
+        if task.context_id == context_id
+        and ORDINAL_KEY in task.metadata
+        and ordinal_of(task) <= snapshot.through_ordinal
+    ]
+    return len(folded) == snapshot.legs and legs_digest(folded) == snapshot.digest
+
+
+async def discard_snapshot(exchange_store, context_id: str) -> None:
+    """Drop the exchange's snapshot; the next rebuild refolds every leg."""
+    record = await exchange_store.get(context_id)
+    if record is None or SNAPSHOT_KEY not in record.state:
+        return
+    state = {k: v for k, v in record.state.items() if k != SNAPSHOT_KEY}
+    await exchange_store.save(record.model_copy(update={"state": state}))
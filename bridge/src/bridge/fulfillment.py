@@ -47,13 +47,19 @@ import bridge + the no-agents-guard clarity).
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import StrEnum
 
 from contract import Disposition, Extraction, LedgerEntry
 from pydantic import BaseModel
 
 from bridge.disposition import DispositionResult, Gate, classify_document
-from bridge.seams.extraction import ExtractionError, ExtractionSeam
+from bridge.seams.extraction import (
+    ExtractionError,
+    ExtractionOutcome,
+    ExtractionSeam,
+    extract_batch,
+)
 from bridge.skills import DispositionThresholds
 
 __all__ = [
@@ -62,6 +68,7 @@ __all__ = [
     "TERMINAL_PHASES",
     "FulfillmentResult",
     "run_fulfillment",
+    "run_fulfillment_many",
     "resume_fulfillment",
     "route_disposition",
     "validate_only",
@@ -308,7 +315,72 @@ async def run_fulfillment(
     # Step 2: extract_with_quality_gate — try to extract
     try:
         extraction = await engine.extract(document, doctype_skill)
-    except ExtractionError:
+    except ExtractionError as exc:
+        extraction = exc
+    return _route_extraction(
+        document,
+        extraction,
+        thresholds=thresholds,
+        max_resubmissions=max_resubmissions,
+        doc_id=doc_id,
+        attempts=attempts,
+    )
+
+
+async def run_fulfillment_many(
+    documents: Sequence[object],
+    doctype_skill: object = None,
+    *,
+    engine: ExtractionSeam,
+    thresholds: DispositionThresholds = DispositionThresholds(),
+    max_resubmissions: int = 3,
+    attempts: int = 0,
+) -> list[FulfillmentResult]:
+    """Run the Path-B graph over several documents with one batched extraction.
+
+    The documents are extracted together through
+    :func:`~bridge.seams.extraction.extract_batch` (one ``extract_many`` request when
+    the engine supports it, else a concurrent fan-out to ``extract``); each is then
+    gated and routed exactly as :func:`run_fulfillment` would. A document whose
+    extraction failed gets its own EXTRACTION_ERROR result — the others are unaffected.
+
+    Args:
+        documents: The documents to extract (engine-specific types).
+        doctype_skill: Per-doctype skill context, shared by every document.
+        engine: The extraction engine (ExtractionSeam).
+        thresholds: Disposition thresholds. Defaults to DispositionThresholds().
+        max_resubmissions: Max resubmissions before escalation. Defaults to 3.
+        attempts: Resubmissions requested so far, for every document. Defaults to 0.
+
+    Returns:
+        One FulfillmentResult per document, in input order. Each doc_id defaults as in
+        :func:`run_fulfillment`.
+    """
+    outcomes = await extract_batch(engine, [(document, doctype_skill) for document in documents])
+    return [
+        _route_extraction(
+            document,
+            outcome,
+            thresholds=thresholds,
+            max_resubmissions=max_resubmissions,
+            doc_id=None,
+            attempts=attempts,
+        )
+        for document, outcome in zip(documents, outcomes, strict=True)
+    ]
+
+
+def _route_extraction(
+    document: object,
+    extraction: ExtractionOutcome,
+    *,
+    thresholds: DispositionThresholds,
+    max_resubmissions: int,
+    doc_id: str | None,
+    attempts: int,
+) -> FulfillmentResult:
+    """Steps 3–4 of the graph for one extraction outcome (shared by single + batch)."""
+    if isinstance(extraction, ExtractionError):
         # Engine fault (illegible-beyond-recovery or unknown document)
         # → EXTRACTION_ERROR, disposition=PENDING, terminal + non-resumable
         return FulfillmentResult(
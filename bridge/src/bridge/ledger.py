@@ -15,6 +15,36 @@ Three tiers:
   producing ``CollectionStatus`` / ``ExchangeTurn`` — with ``outstanding`` and
   ``terminal`` as **caller-supplied inputs** (they are *not* computed here).
 
+Carry format (v1, packed): the entry rides as a *positional* JSON array — a version
+tag followed by the ``LedgerEntry`` field values in a fixed order — instead of the
+entry's own keyed JSON. Dropping the repeated key names shrinks each durable row by
+roughly 40-70% and makes the stamp cheaper. A cold read re-keys the array and
+validates it through ``LedgerEntry`` itself — the same contract checks as a keyed read
+— and the parse cache amortizes that to once per leg. Entries stamped as a JSON object
+(the pre-v1 carry) are always read. A ``protobuf.Struct`` cannot hold raw bytes and the Bridge
+takes no msgpack dependency, so "compact" here is the positional text encoding, not a
+binary blob.
+
+Writes stay on the keyed JSON carry unless ``BRIDGE_LEDGER_CARRY_V1=1``
+(:data:`LEDGER_CARRY_ENV`): a worker that predates v1 cannot read a packed row, so a
+mixed-version fleet flips the flag only once every reader is on v1.
+
+Parse cache (:class:`LedgerEntryCache`): the fold stays pure, but re-parsing every
+stamped string on every read makes a collect round O(legs) in pydantic validation.
+An optional, bounded cache keyed by ``(task id, metadata digest)`` lets a round parse
+only the legs whose stamped entry changed. It is a memo of a pure function, not state —
+dropping it never changes the projection.
+
+Streaming (:func:`iter_ledger`): for exchanges too large to list at once (RFP-style —
+thousands of legs), the same fold runs over an async stream of legs
+(:func:`bridge.aggregate.iter_exchange_legs` pages the store in ordinal order) and
+yields the entries one at a time. Only the legs stream: there is no streaming
+``project_collection_status``. The outbound ``ExchangeTurn`` is a single DataPart (the
+wire contract, A12), so the status — every ``LedgerEntry`` — is always materialized,
+and a serialized stream of it would reach no client. What streaming bounds is the
+task side: an ordinal-listing store (``SequencedTaskStore``) holds one page of legs at
+a time; any other store is listed whole first (see ``iter_exchange_legs``).
+
 **Ownership split (docs/lessons-learned.md A5, wiki/bridge-collect.md sense-A/B):**
 M1.4 carries ``outstanding`` and ``terminal`` as passthrough fields. The sense-A/sense-B
 split makes ``outstanding`` an **advisory** the skill rule proposes (M1.6/M1.9) and
@@ -32,16 +62,24 @@ clarity, same rule M1.2 followed for ``aggregate``).
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import hashlib
+import os
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 
 from a2a.types import Task
 from contract import CollectionStatus, ExchangeTurn, LedgerEntry
+from pydantic_core import from_json, to_json
 
 from bridge.aggregate import ExchangeView, build_exchange_view
 
 __all__ = [
+    "LEDGER_CARRY_ENV",
+    "LEDGER_CARRY_VERSION",
     "LEDGER_ENTRY_KEY",
+    "LedgerEntryCache",
     "build_exchange_turn",
+    "iter_ledger",
     "ledger_entry_of",
     "project_collection_status",
     "project_ledger",
@@ -51,12 +89,105 @@ __all__ = [
 #: Metadata key holding the durable per-task classified entry (M1.4 D2).
 LEDGER_ENTRY_KEY = "bridge_ledger_entry"
 
+#: Version tag leading the packed carry array written by :func:`stamp_ledger_entry`.
+LEDGER_CARRY_VERSION = 1
+
+#: Env var that switches :func:`stamp_ledger_entry` to the v1 packed carry (``"1"``).
+LEDGER_CARRY_ENV = "BRIDGE_LEDGER_CARRY_V1"
+
+#: Values in the v1 packed carry after its version tag (see :func:`_pack_entry`).
+_V1_LENGTH = 13
+
+
+def _pack_entry(entry: LedgerEntry) -> str:
+    """Encode ``entry`` in the v1 packed carry (positional JSON array)."""
+    extraction = entry.extraction
+    fields = extraction.fields
+    return to_json(
+        [
+            LEDGER_CARRY_VERSION,
+            entry.id,
+            entry.doctype,
+            entry.issuer,
+            entry.disposition,
+            fields.doctype,
+            fields.issuer,
+            fields.key_fields,
+            extraction.overall_confidence,
+            extraction.field_confidence,
+            extraction.legible,
+            extraction.flagged_fields,
+            entry.reason_code,
+            entry.message,
+        ]
+    ).decode()
+
+
+def _unpack_entry(raw: str) -> LedgerEntry:
+    """Decode a stamped entry: the v1 packed carry, or a pre-v1 keyed JSON object.
+
+    The packed array is re-keyed and validated by ``LedgerEntry`` itself, so a packed
+    row is held to exactly the contract a keyed one is (types, ``extra="forbid"``).
+
+    Raises:
+        ValueError: If the carry is not JSON, is packed under an unknown version or
+            shape, or a value does not match its contract field type.
+    """
+    if raw.startswith("{"):
+        return LedgerEntry.model_validate_json(raw)
+    packed = from_json(raw)
+    if not isinstance(packed, list) or not packed:
+        raise ValueError(f"ledger carry is neither a keyed entry nor a packed array: {raw!r}")
+    if packed[0] != LEDGER_CARRY_VERSION:
+        raise ValueError(f"unsupported ledger carry version {packed[0]!r}")
+    if len(packed) != _V1_LENGTH + 1:
+        raise ValueError(f"ledger carry v1 holds {_V1_LENGTH} values, got {len(packed) - 1}")
+    (
+        _,
+        entry_id,
+        doctype,
+        issuer,
+        disposition,
+        fields_doctype,
+        fields_issuer,
+        key_fields,
+        overall_confidence,
+        field_confidence,
+        legible,
+        flagged_fields,
+        reason_code,
+        message,
+    ) = packed
+    return LedgerEntry.model_validate(
+        {
+            "id": entry_id,
+            "doctype": doctype,
+            "issuer": issuer,
+            "disposition": disposition,
+            "extraction": {
+                "fields": {
+                    "doctype": fields_doctype,
+                    "issuer": fields_issuer,
+                    "key_fields": key_fields,
+                },
+                "overall_confidence": overall_confidence,
+                "field_confidence": field_confidence,
+                "legible": legible,
+                "flagged_fields": flagged_fields,
+            },
+            "reason_code": reason_code,
+            "message": message,
+        }
+    )
 
-def stamp_ledger_entry(task: Task, entry: LedgerEntry) -> None:
+
+def stamp_ledger_entry(task: Task, entry: LedgerEntry, *, packed: bool | None = None) -> None:
     """Stamp a classified ledger entry onto ``task.metadata`` (D2).
 
-    Stores the entry as a JSON *string* scalar under :data:`LEDGER_ENTRY_KEY`. This
-    is the durable, backend-independent carry convention — the entry survives the
+    Stores the entry as a *string* scalar under :data:`LEDGER_ENTRY_KEY`: the
+    entry's keyed JSON, or the v1 packed carry when :data:`LEDGER_CARRY_ENV` is
+    ``"1"`` (see the module docstring). This is the durable,
+    backend-independent carry convention — the entry survives the
     ``DatabaseTaskStore`` restart and needs no separate store, honoring "view, not
     record" (docs/lessons-learned A5).
 
@@ -67,29 +198,98 @@ def stamp_ledger_entry(task: Task, entry: LedgerEntry) -> None:
     Args:
         task: The A2A task to stamp.
         entry: The classified ledger entry to attach.
+        packed: Write the v1 packed carry (None: follow :data:`LEDGER_CARRY_ENV`).
     """
-    task.metadata[LEDGER_ENTRY_KEY] = entry.model_dump_json()
+    if packed is None:
+        packed = os.environ.get(LEDGER_CARRY_ENV) == "1"
+    task.metadata[LEDGER_ENTRY_KEY] = _pack_entry(entry) if packed else entry.model_dump_json()
 
 
-def ledger_entry_of(task: Task) -> LedgerEntry | None:
+def ledger_entry_of(task: Task, *, cache: LedgerEntryCache | None = None) -> LedgerEntry | None:
     """Read the stamped classified entry off a task, if any (D2).
 
     Returns ``None`` for a task with no stamped entry (e.g. an in-flight leg before
-    disposition ran). Round-trips the JSON string stamped by
-    :func:`stamp_ledger_entry`.
+    disposition ran). Round-trips the string stamped by :func:`stamp_ledger_entry`
+    (packed v1, or a pre-v1 JSON object).
 
     Args:
         task: The A2A task to read from.
+        cache: Optional parse cache; when given, an unchanged stamped entry is served
+            without re-parsing (see :class:`LedgerEntryCache`).
 
     Returns:
         The classified entry if stamped, else ``None``.
     """
-    if LEDGER_ENTRY_KEY in task.metadata:
-        return LedgerEntry.model_validate_json(task.metadata[LEDGER_ENTRY_KEY])
-    return None
+    if LEDGER_ENTRY_KEY not in task.metadata:
+        return None
+    if cache is not None:
+        return cache.entry_of(task)
+    return _unpack_entry(task.metadata[LEDGER_ENTRY_KEY])
+
 
+class LedgerEntryCache:
+    """Bounded LRU memo of parsed ledger entries, keyed by ``(task id, metadata digest)``.
 
-def project_ledger(view: ExchangeView) -> list[LedgerEntry]:
+    The digest is taken over the stamped string, so a re-stamped task (e.g. a
+    HITL decision rewriting the entry) misses and is re-parsed, while an unchanged leg
+    is served from the cache. Eviction is least-recently-used once ``maxsize`` keys
+    are held; an evicted leg is simply parsed again on its next read.
+
+    Cached entries are shared between reads — treat them as read-only (derive changes
+    with ``model_copy(update=...)``, as the edge already does).
+
+    Attributes:
+        hits: Reads served from the cache.
+        misses: Reads that parsed the stamped carry (the per-round cost the cache bounds).
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of parsed entries held. Must be positive.
+
+        Raises:
+            ValueError: If ``maxsize`` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], LedgerEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def entry_of(self, task: Task) -> LedgerEntry | None:
+        """Return the parsed entry stamped on ``task`` (``None`` if unstamped)."""
+        if LEDGER_ENTRY_KEY not in task.metadata:
+            return None
+        raw = task.metadata[LEDGER_ENTRY_KEY]
+        digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        key = (task.id, digest)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+        self.misses += 1
+        entry = _unpack_entry(raw)
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        self._entries.clear()
+
+
+def project_ledger(
+    view: ExchangeView, *, cache: LedgerEntryCache | None = None
+) -> list[LedgerEntry]:
     """Project the classified ledger from an exchange view (D4).
 
     Folds over ``view.tasks`` (already ordinal-sorted by :func:`build_exchange_view`)
@@ -103,23 +303,47 @@ def project_ledger(view: ExchangeView) -> list[LedgerEntry]:
 
     Args:
         view: The exchange view (filtered + ordinal-sorted).
+        cache: Optional parse cache (only changed legs are re-parsed).
 
     Returns:
         A list of classified ledger entries, in ordinal order.
     """
     ledger = []
     for task in view.tasks:
-        entry = ledger_entry_of(task)
+        entry = ledger_entry_of(task, cache=cache)
         if entry is not None:
             ledger.append(entry)
     return ledger
 
 
+async def iter_ledger(
+    legs: AsyncIterable[Task], *, cache: LedgerEntryCache | None = None
+) -> AsyncIterator[LedgerEntry]:
+    """Streaming :func:`project_ledger`: yield each leg's entry as the legs arrive.
+
+    ``legs`` must already be in ordinal order (as
+    :func:`~bridge.aggregate.iter_exchange_legs` yields them); in-flight legs without
+    an entry are skipped.
+
+    Args:
+        legs: The exchange's legs, ordinal-ordered.
+        cache: Optional parse cache.
+
+    Yields:
+        Classified ledger entries, in ordinal order.
+    """
+    async for task in legs:
+        entry = ledger_entry_of(task, cache=cache)
+        if entry is not None:
+            yield entry
+
+
 def project_collection_status(
     view: ExchangeView,
     *,
     outstanding: Iterable[str] = (),
     terminal: bool = False,
+    cache: LedgerEntryCache | None = None,
 ) -> CollectionStatus:
     """Assemble a ``CollectionStatus`` from an exchange view (D3).
 
@@ -133,12 +357,13 @@ def project_collection_status(
         view: The exchange view (filtered + ordinal-sorted).
         outstanding: The advisory list of outstanding document references (M1.9).
         terminal: Whether the exchange is terminal (M1.6 + app-owned ``done``).
+        cache: Optional parse cache forwarded to :func:`project_ledger`.
 
     Returns:
         The assembled collection status.
     """
     return CollectionStatus(
-        ledger=project_ledger(view),
+        ledger=project_ledger(view, cache=cache),
         outstanding=list(outstanding),
         terminal=terminal,
     )
@@ -150,6 +375,7 @@ def build_exchange_turn(
     *,
     outstanding: Iterable[str] = (),
     terminal: bool = False,
+    cache: LedgerEntryCache | None = None,
 ) -> ExchangeTurn:
     """Build an ``ExchangeTurn`` from raw tasks (D5).
 
@@ -163,10 +389,13 @@ def build_exchange_turn(
         tasks: The candidate tasks (will be filtered to ``context_id``).
         outstanding: The advisory list of outstanding document references (M1.9).
         terminal: Whether the exchange is terminal (M1.6 + app-owned ``done``).
+        cache: Optional parse cache forwarded to :func:`project_ledger`.
 
     Returns:
         The assembled exchange turn.
     """
     view = build_exchange_view(context_id, tasks)
-    status = project_collection_status(view, outstanding=outstanding, terminal=terminal)
+    status = project_collection_status(
+        view, outstanding=outstanding, terminal=terminal, cache=cache
+    )
     return ExchangeTurn(context_id=context_id, status=status)
@@ -26,6 +26,8 @@ Never ``agents``, never ``seams``/``adapters``. Keep this out of ``bridge/__init
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import yaml
 from contract import (
     CollectionStatus,
@@ -51,6 +53,7 @@ __all__ = [
     "SkillExplanations",
     "load_explanations",
     "AdvisoryResult",
+    "AdvisoryTally",
     "advisory_satisfaction",
     "propose_requirements",
     "explain_rejection",
@@ -168,26 +171,47 @@ def advisory_satisfaction(status: CollectionStatus) -> AdvisoryResult:
         Parity is **terminal-outcome, not ledger-identical** (lessons A2): same done
         verdict + same accepted-issuer set across every scenario in expected.json.
     """
-    accepted = [e for e in status.ledger if e.disposition == Disposition.ACCEPTED]
+    return AdvisoryTally(status.ledger).result()
 
-    gov_id_ok = any(e.doctype == GOV_ID for e in accepted)
 
-    bill_issuers = sorted(
-        {
-            e.issuer
-            for e in accepted
-            if e.doctype == UTILITY_BILL and e.issuer  # exclude None/empty
-        }
-    )
+class AdvisoryTally:
+    """Incremental form of :func:`advisory_satisfaction` — O(1) per added entry.
 
-    done = gov_id_ok or len(bill_issuers) >= REQUIRED_DISTINCT_ISSUERS
-    outstanding = [] if done else [GOV_ID, UTILITY_BILL]
+    Folds ledger entries one at a time into the two facts the rule reads (an accepted
+    gov-id, the set of accepted bill issuers), so a caller that appends legs round by
+    round never re-scans the ledger. :func:`advisory_satisfaction` is this tally over a
+    whole ledger, so the two cannot drift apart.
+    """
 
-    return AdvisoryResult(done=done, outstanding=outstanding, accepted_issuers=bill_issuers)
+    def __init__(self, entries: Iterable[LedgerEntry] = ()) -> None:
+        """Initialize the tally, folding in any ``entries`` already collected."""
+        self._gov_id_ok = False
+        self._bill_issuers: set[str] = set()
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: LedgerEntry) -> None:
+        """Fold one classified entry into the tally (non-accepted entries are ignored)."""
+        if entry.disposition != Disposition.ACCEPTED:
+            return
+        if entry.doctype == GOV_ID:
+            self._gov_id_ok = True
+        elif entry.doctype == UTILITY_BILL and entry.issuer:  # exclude None/empty
+            self._bill_issuers.add(entry.issuer)
+
+    def result(self) -> AdvisoryResult:
+        """Return the advisory verdict for everything folded so far."""
+        bill_issuers = sorted(self._bill_issuers)
+        done = self._gov_id_ok or len(bill_issuers) >= REQUIRED_DISTINCT_ISSUERS
+        outstanding = [] if done else [GOV_ID, UTILITY_BILL]
+        return AdvisoryResult(done=done, outstanding=outstanding, accepted_issuers=bill_issuers)
 
 
 def propose_requirements(
-    status: CollectionStatus, *, explanations: SkillExplanations
+    status: CollectionStatus,
+    *,
+    explanations: SkillExplanations,
+    advisory: AdvisoryResult | None = None,
 ) -> RequirementsList:
     """Build the app-owned RequirementsList artifact (M1.9).
 
@@ -199,6 +223,8 @@ def propose_requirements(
     Args:
         status: CollectionStatus containing the classified ledger.
         explanations: The skill-authored explanations (verbatim relay source).
+        advisory: The advisory verdict for ``status``, when the caller already holds it
+            (e.g. from an :class:`AdvisoryTally`); recomputed from the ledger if None.
 
     Returns:
         A RequirementsList artifact.
@@ -209,7 +235,8 @@ def propose_requirements(
           accepted bill issuer (and no accepted gov-id), else ``PROOF_REQUIRED``
         - No message interpolation — keep strings static so "verbatim relay" is literal
     """
-    advisory = advisory_satisfaction(status)
+    if advisory is None:
+        advisory = advisory_satisfaction(status)
 
     if advisory.done:
         # Satisfied: one requirement with status=SATISFIED, no reason/message
@@ -32,29 +32,33 @@ Import discipline: imports ``contract`` (if needed) + ``bridge.skills`` (types o
 module OUT of ``bridge/__init__.py`` (preserve cheap ``import bridge`` + the
 no-agents-guard clarity).
 
-Note: "Durable" in M1.12 describes the **seam concept** — the local adapter is
-in-memory; restart-durability of the timer store is the Sprint-2 GCP adapter (Cloud
-Tasks; A7 "deletion is the fired signal"), analogous to the local/Database split for
-Sessions/Task-store (M1.2).
+Note: "Durable" in M1.12 describes the **seam concept** — ``LocalScheduler`` is
+in-memory; ``DatabaseScheduler`` is its SQLite-backed local twin, and the GCP timer
+store is the Sprint-2 adapter (Cloud Tasks; A7 "deletion is the fired signal"),
+analogous to the local/Database split for Sessions/Task-store (M1.2).
 """
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Iterable
+from typing import Callable, Iterable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from bridge.skills import SlaPolicy
 
 __all__ = [
     "VirtualClock",
+    "WallClock",
     "TimerKind",
     "Timer",
     "plan_followups",
     "FollowupState",
     "FollowupStatus",
+    "FollowupTally",
+    "RetentionPolicy",
     "followup_status",
 ]
 
@@ -83,11 +87,21 @@ class VirtualClock:
             start: The initial tick value (default 0).
         """
         self._tick = start
+        self._listeners: list[Callable[[int], None]] = []
 
     def now(self) -> int:
         """Return the current tick."""
         return self._tick
 
+    def add_listener(self, listener: Callable[[int], None]) -> None:
+        """Call ``listener(new_tick)`` after every :meth:`advance` (e.g. to wake a runner)."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int], None]) -> None:
+        """Stop calling ``listener`` (no error if it was not added)."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     def advance(self, ticks: int = 1) -> int:
         """Advance the clock by the given number of ticks.
 
@@ -103,9 +117,42 @@ class VirtualClock:
         if ticks < 0:
             raise ValueError(f"Cannot advance by negative ticks: {ticks}")
         self._tick += ticks
+        for listener in list(self._listeners):
+            listener(self._tick)
         return self._tick
 
 
+class WallClock:
+    """Real-time clock in integer ticks (``tick_seconds`` of wall time per tick).
+
+    The production counterpart of :class:`VirtualClock`: ``now()`` is the current
+    epoch time floored to ticks, and :meth:`seconds_until` tells a driver how long to
+    sleep before a tick arrives (a ``VirtualClock`` only moves when advanced).
+
+    Args:
+        tick_seconds: Wall-clock seconds per tick (must be positive).
+        time_fn: Source of epoch seconds (injectable for tests; default ``time.time``).
+
+    Raises:
+        ValueError: If ``tick_seconds`` is not positive.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, *, time_fn: Callable[[], float] = time.time):
+        """Initialize the wall clock."""
+        if tick_seconds <= 0:
+            raise ValueError(f"tick_seconds must be positive, got {tick_seconds}")
+        self.tick_seconds = tick_seconds
+        self._time_fn = time_fn
+
+    def now(self) -> int:
+        """Return the current tick."""
+        return int(self._time_fn() // self.tick_seconds)
+
+    def seconds_until(self, tick: int) -> float:
+        """Return the wall-clock seconds until ``tick`` begins (≤ 0 if already reached)."""
+        return tick * self.tick_seconds - self._time_fn()
+
+
 class TimerKind(StrEnum):
     """The two kinds of timers in the SLA ladder."""
 
@@ -203,6 +250,24 @@ def plan_followups(
     return timers
 
 
+class RetentionPolicy(BaseModel, frozen=True):
+    """How long a scheduler keeps fired timers before compacting them.
+
+    A7 marks a fired timer in place rather than deleting it, so without compaction a
+    scheduler holds every timer it ever fired. Compaction drops the timer object but
+    keeps its count in the context's :class:`FollowupTally` (the per-context summary),
+    so ``followup_status`` stays correct. The summary still tracks a live context's
+    compacted timer ids (a cancel or re-schedule must un-count them); retiring the
+    exchange reduces it to counts.
+
+    Attributes:
+        fired_ticks: Keep a fired timer this many ticks past its ``fire_at``, then
+            compact it. ``None`` (the default) keeps fired timers forever.
+    """
+
+    fired_ticks: int | None = Field(default=None, ge=0)
+
+
 class FollowupState(StrEnum):
     """The three states of the overdue → escalated transition."""
 
@@ -215,7 +280,8 @@ class FollowupStatus(BaseModel, frozen=True):
     """Read-model projection of the follow-up state for a context.
 
     This is a **read-model snapshot** (immutable), not a stored record. It is
-    computed on-demand by ``followup_status`` over the current timer set.
+    computed on-demand by ``followup_status`` over the current timer set (or read off
+    a scheduler's per-context ``FollowupTally``).
     """
 
     context_id: str
@@ -250,24 +316,98 @@ def followup_status(timers: Iterable[Timer], *, context_id: str) -> FollowupStat
         >>> followup_status(timers, context_id="c1")  # doctest: +ELLIPSIS
         FollowupStatus(context_id='c1', state=..., nudges_fired=1, ...)
     """
-    # Filter to the context
-    context_timers = [t for t in timers if t.context_id == context_id]
-
-    # Count fired timers
-    nudges_fired = sum(1 for t in context_timers if t.fired and t.kind == TimerKind.NUDGE)
-    escalated = any(t.fired and t.kind == TimerKind.ESCALATION for t in context_timers)
-
-    # Derive state
-    if escalated:
-        state = FollowupState.ESCALATED
-    elif nudges_fired > 0:
-        state = FollowupState.OVERDUE
-    else:
-        state = FollowupState.ON_TRACK
-
-    return FollowupStatus(
-        context_id=context_id,
-        state=state,
-        nudges_fired=nudges_fired,
-        escalated=escalated,
-    )
+    # Filter to the context, then count the fired timers
+    return FollowupTally(t for t in timers if t.context_id == context_id).status(context_id)
+
+
+class FollowupTally:
+    """Incremental form of :func:`followup_status` — O(1) per fired timer.
+
+    Counts one context's fired nudges and escalations, so a scheduler that records each
+    timer as it fires (and un-records it if a fired timer is cancelled or replaced)
+    answers the read-model without re-scanning its timers. :func:`followup_status` is
+    this tally over a timer set, so the two cannot drift apart.
+
+    The count is keyed by timer id: adding a timer id already counted is a no-op, and
+    removing one un-counts it even after the scheduler dropped the timer itself
+    (compaction), so a compacted timer that is scheduled again is not counted twice.
+    :meth:`seal` drops the ids once no timer of the context can change any more (a
+    retired exchange), leaving only the counts and the last fire tick.
+    """
+
+    def __init__(self, timers: Iterable[Timer] = ()) -> None:
+        """Initialize the tally, folding in any ``timers`` already fired."""
+        self.nudges_fired = 0
+        self.escalations_fired = 0
+        self.last_fired_at: int | None = None
+        """The latest ``fire_at`` among the counted timers (None: nothing counted)."""
+        self.sealed = False
+        # counted timer id -> (kind, fire_at); emptied by seal()
+        self._fired: dict[str, tuple[TimerKind, int]] = {}
+        for timer in timers:
+            self.add(timer)
+
+    def add(self, timer: Timer) -> None:
+        """Count ``timer`` if it has fired (unfired or already counted: ignored).
+
+        Raises:
+            ValueError: If the tally is sealed.
+        """
+        if self.sealed:
+            raise ValueError(f"follow-up tally is sealed; cannot count timer {timer.id!r}")
+        if timer.fired and timer.id not in self._fired:
+            self._fired[timer.id] = (timer.kind, timer.fire_at)
+            self._count(timer.kind, 1)
+            if self.last_fired_at is None or timer.fire_at > self.last_fired_at:
+                self.last_fired_at = timer.fire_at
+
+    def remove(self, timer: Timer) -> None:
+        """Un-count the fired timer with ``timer``'s id, if counted (cancelled or replaced)."""
+        self.discard(timer.id)
+
+    def discard(self, timer_id: str) -> None:
+        """Un-count the fired timer ``timer_id``, if counted (the timer may be long gone)."""
+        counted = self._fired.pop(timer_id, None)
+        if counted is None:
+            return
+        kind, fire_at = counted
+        self._count(kind, -1)
+        if fire_at == self.last_fired_at:
+            self.last_fired_at = max((at for _, at in self._fired.values()), default=None)
+
+    def seal(self) -> None:
+        """Keep only the counts and the last fire tick: stop tracking timer ids.
+
+        For a context whose timers can no longer be cancelled or replaced (a retired
+        exchange). A sealed tally refuses :meth:`add`; :meth:`discard` finds nothing.
+        """
+        self.sealed = True
+        self._fired.clear()
+
+    @property
+    def timer_ids(self) -> list[str]:
+        """Ids of every fired timer counted and still tracked (none once sealed)."""
+        return list(self._fired)
+
+    def _count(self, kind: TimerKind, step: int) -> None:
+        if kind == TimerKind.NUDGE:
+            self.nudges_fired += step
+        elif kind == TimerKind.ESCALATION:
+            self.escalations_fired += step
+
+    def status(self, context_id: str) -> FollowupStatus:
+        """Return the read-model for everything counted so far."""
+        escalated = self.escalations_fired > 0
+        if escalated:
+            state = FollowupState.ESCALATED
+        elif self.nudges_fired > 0:
+            state = FollowupState.OVERDUE
+        else:
+            state = FollowupState.ON_TRACK
+
+        return FollowupStatus(
+            context_id=context_id,
+            state=state,
+            nudges_fired=self.nudges_fired,
+            escalated=escalated,
+        )
@@ -0,0 +1,190 @@
+"""Wake-on-deadline driver for the scheduler seam (M1.12 follow-up).
+
+``SchedulerSeam.due(now)`` only fires timers when someone calls it — today the
+time-warp ``/advance`` endpoint. :class:`SchedulerRunner` is the production driver: it
+claims the due timers, hands each to the handler for its :class:`~bridge.scheduler.TimerKind`
+(nudge / escalation), then **sleeps until the next ``fire_at``** — no fixed polling
+interval, so idle exchanges cost nothing between deadlines.
+
+Clocks:
+- :class:`~bridge.scheduler.WallClock` — the runner sleeps ``seconds_until(next)``.
+- :class:`~bridge.scheduler.VirtualClock` — time moves only when advanced; the runner
+  subscribes to the clock and wakes on every ``advance`` (time-warp stays the driver).
+
+Early wake: scheduling through :meth:`SchedulerRunner.schedule` (or calling
+:meth:`SchedulerRunner.wake` after scheduling elsewhere) re-evaluates the next deadline,
+so a sooner timer is not stuck behind a long sleep. Across processes sharing a durable
+store no in-process signal exists; ``max_sleep`` caps each sleep for that case.
+
+Handlers run concurrently, at most ``max_concurrency`` at a time (claiming pauses while
+every slot is busy). A handler that raises is recorded in :attr:`SchedulerRunner.errors`
+and does not stop the runner. The timer was already claimed (A7), so a failed handler
+is not retried — delivery is at most once, exactly like a caller of ``due()``.
+
+Shutdown: :meth:`SchedulerRunner.stop` ends the loop after the current claim and waits
+for in-flight handlers; cancelling :meth:`SchedulerRunner.run` cancels them.
+
+Import discipline: imports core (``scheduler``) + the scheduler seam (types only).
+Never imports ``agents`` or ``adapters``. Keep it out of ``bridge/__init__.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextlib import suppress
+
+from bridge.scheduler import Timer, TimerKind, VirtualClock, WallClock
+from bridge.seams.scheduler import SchedulerSeam
+
+__all__ = ["DEFAULT_HANDLER_CONCURRENCY", "SchedulerRunner", "TimerHandler"]
+
+#: Default number of timer handlers running at once.
+DEFAULT_HANDLER_CONCURRENCY = 16
+
+#: An async callable invoked with each fired timer.
+TimerHandler = Callable[[Timer], Awaitable[None]]
+
+
+class SchedulerRunner:
+    """Drive a ``SchedulerSeam``: claim due timers, dispatch them, sleep to the next.
+
+    The scheduler must offer ``next_fire_at()`` (both local adapters do) unless
+    ``max_sleep`` is set, in which case a scheduler without it is re-checked every
+    ``max_sleep`` seconds.
+
+    Args:
+        scheduler: The scheduler seam to drive.
+        handlers: Handler per timer kind; fired timers of a kind with no handler are
+            claimed and dropped.
+        clock: The clock ``due()`` is evaluated against (``WallClock`` or
+            ``VirtualClock``). Defaults to the scheduler's own ``clock``.
+        max_concurrency: Maximum handlers running at once.
+        max_sleep: Optional cap in seconds on any single sleep.
+
+    Raises:
+        ValueError: If ``max_concurrency`` or ``max_sleep`` is not positive, no clock
+            is available, or the scheduler cannot report its next deadline and no
+            ``max_sleep`` is set.
+    """
+
+    def __init__(
+        self,
+        scheduler: SchedulerSeam,
+        handlers: Mapping[TimerKind, TimerHandler],
+        *,
+        clock: VirtualClock | WallClock | None = None,
+        max_concurrency: int = DEFAULT_HANDLER_CONCURRENCY,
+        max_sleep: float | None = None,
+    ) -> None:
+        """Initialize the runner (it does nothing until :meth:`run`)."""
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if max_sleep is not None and max_sleep <= 0:
+            raise ValueError(f"max_sleep must be positive, got {max_sleep}")
+        clock = clock if clock is not None else getattr(scheduler, "clock", None)
+        if clock is None:
+            raise ValueError("SchedulerRunner needs a clock (none given, none on the scheduler)")
+        if not hasattr(scheduler, "next_fire_at") and max_sleep is None:
+            raise ValueError("scheduler has no next_fire_at(); set max_sleep to re-check")
+        self.scheduler = scheduler
+        self.clock = clock
+        self._handlers = dict(handlers)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._max_sleep = max_sleep
+        self._wake_event = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self.dispatched = 0
+        """Number of timers handed to a handler so far."""
+        self.errors: deque[tuple[Timer, BaseException]] = deque(maxlen=100)
+        """The most recent handler failures, as ``(timer, exception)``."""
+
+    def wake(self, *_: object) -> None:
+        """Re-evaluate the next deadline now (a sooner timer, or a clock advance)."""
+        self._wake_event.set()
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return after the current claim (in-flight handlers drain)."""
+        self._stopping = True
+        self._wake_event.set()
+
+    async def schedule(self, timer: Timer) -> None:
+        """Schedule ``timer`` on the driven scheduler and wake the runner."""
+        await self.scheduler.schedule(timer)
+        self.wake()
+
+    async def schedule_many(self, timers: Iterable[Timer]) -> None:
+        """Schedule a batch on the driven scheduler and wake the runner once."""
+        await self.scheduler.schedule_many(timers)
+        self.wake()
+
+    async def run(self) -> None:
+        """Claim → dispatch → sleep until the next deadline, until :meth:`stop`."""
+        listen = isinstance(self.clock, VirtualClock)
+        if listen:
+            self.clock.add_listener(self.wake)
+        try:
+            async with asyncio.TaskGroup() as handlers:
+                while not self._stopping:
+                    self._wake_event.clear()
+                    for timer in await self.scheduler.due(self.clock.now()):
+                        await self._dispatch(handlers, timer)
+                    if self._stopping:
+                        break
+                    await self._sleep(await self._delay())
+        finally:
+            if listen:
+                self.clock.remove_listener(self.wake)
+
+    async def __aenter__(self) -> SchedulerRunner:
+        """Start :meth:`run` in the background."""
+        self._task = asyncio.create_task(self.run())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the runner and wait for it (and its in-flight handlers) to finish."""
+        self.stop()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _dispatch(self, handlers: asyncio.TaskGroup, timer: Timer) -> None:
+        handler = self._handlers.get(timer.kind)
+        if handler is None:
+            return
+        await self._slots.acquire()
+        self.dispatched += 1
+        handlers.create_task(self._handle(handler, timer))
+
+    async def _handle(self, handler: TimerHandler, timer: Timer) -> None:
+        try:
+            await handler(timer)
+        except Exception as exc:  # isolate handlers: one failure never stops the runner
+            self.errors.append((timer, exc))
+        finally:
+            self._slots.release()
+
+    async def _delay(self) -> float | None:
+        """Seconds to sleep before the next claim (None: until woken)."""
+        next_fire_at = getattr(self.scheduler, "next_fire_at", None)
+        if next_fire_at is None:
+            return self._max_sleep
+        fire_at = await next_fire_at()
+        if fire_at is None:
+            delay = None
+        elif isinstance(self.clock, WallClock):
+            delay = max(0.0, self.clock.seconds_until(fire_at))
+        else:
+            delay = 0.0 if fire_at <= self.clock.now() else None  # wait for an advance
+        if self._max_sleep is not None:
+            delay = self._max_sleep if delay is None else min(delay, self._max_sleep)
+        return delay
+
+    async def _sleep(self, delay: float | None) -> None:
+        if delay is not None and delay <= 0:
+            return
+        with suppress(TimeoutError):
+            async with asyncio.timeout(delay):
+                await self._wake_event.wait()
@@ -17,13 +17,34 @@ C3 for the env-var selection contract (BRIDGE_EXTRACTION_ENGINE).
 The fixture engine returns the existing contract.Extraction type. ADR-0004
 SignalProvider (four-signal disposition model) is downstream (M1.6) and reads
 signals engine-agnostically.
+
+Batching is optional: a model-backed engine that takes several documents per request
+also implements :class:`BatchExtractionSeam` (``extract_many``). Callers holding
+several documents go through :func:`extract_batch`, which uses ``extract_many`` when the
+engine has it and otherwise fans out to ``extract`` (a bounded number at a time, and an
+engine fault cancels the rest) — so every engine serves the batched path, and
+``ExtractionSeam`` itself stays single-method.
 """
 
+import asyncio
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 from contract import Extraction
 
-__all__ = ["ExtractionSeam", "ExtractionError"]
+__all__ = [
+    "DEFAULT_BATCH_CONCURRENCY",
+    "BatchExtractionSeam",
+    "ExtractionError",
+    "ExtractionOutcome",
+    "ExtractionRequest",
+    "ExtractionSeam",
+    "extract_batch",
+]
+
+
+#: Default number of ``extract`` calls :func:`extract_batch` keeps in flight at once.
+DEFAULT_BATCH_CONCURRENCY = 8
 
 
 class ExtractionError(Exception):
@@ -66,3 +87,83 @@ class ExtractionSeam(Protocol):
         # M1.6 implements the SignalProvider (ADR-0004).
         """
         ...
+
+
+#: One document to extract: ``(document, doctype_skill)``.
+ExtractionRequest = tuple[object, object]
+
+#: Per-document result of a batch: the Extraction, or the error that document raised.
+ExtractionOutcome = Extraction | ExtractionError
+
+
+@runtime_checkable
+class BatchExtractionSeam(ExtractionSeam, Protocol):
+    """An extraction engine that also extracts several documents in one request.
+
+    Optional capability: detect it with ``isinstance(engine, BatchExtractionSeam)``, or
+    call :func:`extract_batch`, which falls back to ``extract`` per document.
+    """
+
+    async def extract_many(self, requests: Sequence[ExtractionRequest]) -> list[ExtractionOutcome]:
+        """Extract a batch of documents, tolerating per-document failures.
+
+        Args:
+            requests: ``(document, doctype_skill)`` pairs.
+
+        Returns:
+            One outcome per request, in request order: the Extraction, or the
+            ExtractionError that document raised (returned, not raised — one bad
+            document does not fail the batch). Other exceptions are engine faults and
+            propagate.
+        """
+        ...
+
+
+async def extract_batch(
+    engine: ExtractionSeam,
+    requests: Sequence[ExtractionRequest],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[ExtractionOutcome]:
+    """Extract several documents through ``engine``, batched when it supports it.
+
+    Uses ``engine.extract_many`` if present; otherwise runs ``engine.extract`` for
+    the requests, at most ``concurrency`` at a time, and returns each ExtractionError
+    in its document's place. Any other exception is an engine fault: the batch's
+    other extractions are cancelled and it propagates.
+
+    Args:
+        engine: Any extraction engine.
+        requests: ``(document, doctype_skill)`` pairs.
+        concurrency: Maximum ``engine.extract`` calls in flight in the fallback.
+
+    Returns:
+        One outcome per request, in request order (see
+        :meth:`BatchExtractionSeam.extract_many`).
+
+    Raises:
+        ValueError: If ``concurrency`` is not positive.
+    """
+    if concurrency <= 0:
+        raise ValueError(f"concurrency must be positive, got {concurrency}")
+    if not requests:
+        return []
+    if isinstance(engine, BatchExtractionSeam):
+        return await engine.extract_many(requests)
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def extract_one(document: object, doctype_skill: object) -> ExtractionOutcome:
+        async with slots:
+            try:
+                return await engine.extract(document, doctype_skill)
+            except ExtractionError as exc:
+                return exc
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            jobs = [group.create_task(extract_one(doc, skill)) for doc, skill in requests]
+    except ExceptionGroup as group_exc:
+        # Surface the first engine fault as-is, as a single extract call would.
+        raise group_exc.exceptions[0] from None
+    return [job.result() for job in jobs]
@@ -16,6 +16,7 @@ implementation must preserve this contract, and any persistent adapter must enfo
 it (e.g., via an atomic mark-as-fired + return operation).
 """
 
+from collections.abc import Iterable
 from typing import Any, Protocol, runtime_checkable
 
 __all__ = ["SchedulerSeam"]
@@ -25,7 +26,8 @@ __all__ = ["SchedulerSeam"]
 class SchedulerSeam(Protocol):
     """Seam for durable timers and virtual clock.
 
-    Local adapter: LocalScheduler (bridge.adapters.local, injectable clock)
+    Local adapter: LocalScheduler (bridge.adapters.local, injectable clock);
+        durable: DatabaseScheduler (SQLite, atomic UPDATE … RETURNING claim)
     GCP adapter: DatabaseScheduler + CloudScheduler (Sprint 2)
 
     Manages proactive follow-up:
@@ -59,3 +61,22 @@ class SchedulerSeam(Protocol):
     async def cancel(self, timer_id: str) -> None:
         """Cancel a scheduled timer by ID."""
         ...
+
+    async def schedule_many(self, timers: Iterable[object]) -> None:
+        """Schedule a batch of timers (upsert by id) — one pass / one transaction.
+
+        Same result as ``schedule`` per timer; program fan-out opens every leg's SLA
+        ladder with a single call.
+        """
+        ...
+
+    async def cancel_context(self, context_id: str) -> int:
+        """Cancel every unfired timer of an exchange in one operation; returns how many.
+
+        Fired timers are kept, so the follow-up read-model survives closing the exchange.
+        """
+        ...
+
+    async def cancel_task(self, task_id: str) -> int:
+        """Cancel every unfired timer scoped to ``task_id`` in one operation (fired kept)."""
+        ...
@@ -23,8 +23,11 @@ __all__ = [
     "SlaPolicy",
     "SkillPolicy",
     "Skill",
+    "SkillIndexEntry",
     "resolve_default_skills_dir",
     "parse_skill_md",
+    "parse_skill_frontmatter",
+    "index_skill",
     "load_skill",
 ]
 
@@ -96,6 +99,20 @@ class Skill(BaseModel, frozen=True):
         return self.path / rel
 
 
+class SkillIndexEntry(BaseModel, frozen=True):
+    """A skill as indexed from its SKILL.md frontmatter alone (lazy registry mode).
+
+    Enough to route and card the skill; the body, policy and assets are read only
+    when the full :class:`Skill` is loaded.
+    """
+
+    name: str
+    description: str
+    kind: SkillKind
+    metadata: dict[str, str]
+    path: Path
+
+
 def resolve_default_skills_dir() -> Path:
     """Resolve the default skills directory.
 
@@ -158,6 +175,44 @@ def parse_skill_md(path: Path) -> tuple[dict, str]:
         raise ValueError(f"Malformed frontmatter in {path}: missing closing ---")
 
     frontmatter_str, body = parts
+    return (_load_frontmatter(frontmatter_str, path), body.strip())
+
+
+def parse_skill_frontmatter(path: Path) -> dict:
+    """Parse only the YAML frontmatter of a SKILL.md file.
+
+    Reads up to the closing ``---`` fence and stops: the Markdown body is never read
+    (the lazy registry's startup index). Same result and errors as the metadata half
+    of :func:`parse_skill_md`.
+
+    Args:
+        path: Path to the SKILL.md file.
+
+    Returns:
+        The frontmatter dict (empty if the file has no frontmatter).
+
+    Raises:
+        ValueError: If the file cannot be parsed or frontmatter is malformed.
+    """
+    if not path.exists():
+        raise ValueError(f"SKILL.md not found: {path}")
+
+    with path.open(encoding="utf-8") as f:
+        if f.readline() != "---\n":
+            return {}
+        lines = []
+        for line in f:
+            if line == "---\n":
+                break
+            lines.append(line)
+        else:
+            raise ValueError(f"Malformed frontmatter in {path}: missing closing ---")
+
+    # parse_skill_md splits on "\n---\n": the newline before the fence is not YAML.
+    return _load_frontmatter("".join(lines).removesuffix("\n"), path)
+
+
+def _load_frontmatter(frontmatter_str: str, path: Path) -> dict:
     try:
         metadata = yaml.safe_load(frontmatter_str) or {}
     except yaml.YAMLError as e:
@@ -166,24 +221,35 @@ def parse_skill_md(path: Path) -> tuple[dict, str]:
     if not isinstance(metadata, dict):
         raise ValueError(f"Frontmatter in {path} must be a dict, got {type(metadata)}")
 
-    return (metadata, body.strip())
+    return metadata
 
 
-def load_skill(folder: Path) -> Skill:
-    """Load a skill from an Agent Skills folder.
+def index_skill(folder: Path) -> SkillIndexEntry:
+    """Index a skill from its SKILL.md frontmatter only (no body, policy or assets).
 
     Args:
         folder: Path to the skill folder (must contain SKILL.md).
 
     Returns:
-        A Skill instance.
+        A SkillIndexEntry.
 
     Raises:
-        ValueError: If the skill is malformed or required fields are missing.
+        ValueError: If the frontmatter is malformed or required fields are missing.
     """
     skill_md_path = folder / "SKILL.md"
-    metadata, body = parse_skill_md(skill_md_path)
+    metadata = parse_skill_frontmatter(skill_md_path)
+    name, description, kind, skill_metadata = _index_fields(metadata, skill_md_path)
+    return SkillIndexEntry(
+        name=name,
+        description=description,
+        kind=kind,
+        metadata={k: str(v) for k, v in skill_metadata.items()},
+        path=folder,
+    )
+
 
+def _index_fields(metadata: dict, skill_md_path: Path) -> tuple[str, str, SkillKind, dict]:
+    """Validate the frontmatter fields every skill needs: name, description, kind."""
     # Required fields
     name = metadata.get("name")
     if not name:
@@ -207,6 +273,25 @@ def load_skill(folder: Path) -> Skill:
     except ValueError as e:
         raise ValueError(f"Invalid bridge-kind '{bridge_kind}' in {skill_md_path}") from e
 
+    return name, description, kind, skill_metadata
+
+
+def load_skill(folder: Path) -> Skill:
+    """Load a skill from an Agent Skills folder.
+
+    Args:
+        folder: Path to the skill folder (must contain SKILL.md).
+
+    Returns:
+        A Skill instance.
+
+    Raises:
+        ValueError: If the skill is malformed or required fields are missing.
+    """
+    skill_md_path = folder / "SKILL.md"
+    metadata, body = parse_skill_md(skill_md_path)
+    name, description, kind, skill_metadata = _index_fields(metadata, skill_md_path)
+
     # Convert metadata values to strings for uniformity
     skill_metadata_str = {k: str(v) for k, v in skill_metadata.items()}
 
@@ -2,7 +2,9 @@
 
 Convention for testing managed-service seams with both local and GCP adapters.
 The `adapter` fixture yields a built adapter instance, dispatched by the seam
-marker on the test. `local` always runs; `gcp` only when BRIDGE_TEST_GCP=1 is set.
+marker on the test. `local` always runs; `durable` runs for the seams with a
+SQLite-backed local variant (sessions, task_store, scheduler); `gcp` only when
+BRIDGE_TEST_GCP=1 is set.
 
 The same test asserts both adapters, locking parity: the mock→real and local→GCP
 swaps must be no-ops for the agent.
@@ -22,7 +24,10 @@ from bridge.seams import Seam
 
 __all__ = ["adapter", "gcp_test_enabled"]
 
-ADAPTER_MODES = ("local", "gcp")
+ADAPTER_MODES = ("local", "durable", "gcp")
+
+#: Seams whose local factory has a ``durable=True`` (SQLite) variant.
+DURABLE_SEAMS = (Seam.SESSIONS, Seam.TASK_STORE, Seam.SCHEDULER)
 
 
 def gcp_test_enabled() -> bool:
@@ -37,7 +42,9 @@ def adapter(request) -> object:
     The test MUST have a @pytest.mark.seam(<name>) marker; this fixture reads it
     and builds the matching adapter for the current mode (local or gcp).
 
-    `local` always runs (via build_local_adapter); `gcp` skips unless BRIDGE_TEST_GCP=1.
+    `local` always runs (via build_local_adapter); `durable` builds the
+    ``durable=True`` variant on a per-test SQLite file and skips for seams without
+    one; `gcp` skips unless BRIDGE_TEST_GCP=1.
 
     Extraction axis nuance: Extraction is a capability axis (fixture|gemini|docai),
     not local↔gcp. The `local` param maps to the fixture engine; the `gcp` param
@@ -76,6 +83,13 @@ def adapter(request) -> object:
         # All other seams: GCP adapters land in Sprint 2
         pytest.skip(f"{seam.value} GCP adapter lands in Sprint 2")
 
+    # Durable branch: the SQLite-backed local variant, on a per-test database file
+    if mode == "durable":
+        if seam not in DURABLE_SEAMS:
+            pytest.skip(f"{seam.value} has no durable local variant")
+        db_path = request.getfixturevalue("tmp_path") / "seam.db"
+        return build_local_adapter(seam, durable=True, db_path=str(db_path))
+
     # Local branch: build via the factory
     # Note: For extraction, this builds the fixture engine (the local capability)
     return build_local_adapter(seam)
@@ -5,6 +5,10 @@ exchange-as-view read path (ADR-0003, lessons-learned A5). No seam fixture — t
 are pure unit tests over ``bridge.aggregate``.
 """
 
+import pytest
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import InMemoryTaskStore
+
 from bridge.aggregate import (
     ORDINAL_KEY,
     ExchangeRecord,
@@ -15,6 +19,7 @@ from bridge.aggregate import (
     ordinal_of,
     party_scope,
     session_id_for_task,
+    tasks_for_context,
 )
 
 
@@ -92,3 +97,19 @@ def test_exchange_record_defaults():
     assert rec.context_id == "ctx-x"
     assert rec.materialized is True
     assert rec.state == {}
+
+
+@pytest.mark.anyio
+async def test_tasks_for_context_follows_every_page():
+    """An exchange larger than one ``TaskStore.list`` page is returned whole (D3)."""
+    store = InMemoryTaskStore()
+    call_context = ServerCallContext()
+    for i in range(120):  # > the SDK's 50-task default page
+        await store.save(
+            create_leg_task(context_id="ctx-big", ordinal=i, task_id=f"leg-{i}"), call_context
+        )
+    await store.save(create_leg_task(context_id="ctx-other", ordinal=0, task_id="x"), call_context)
+
+    tasks = await tasks_for_context(store, "ctx-big", call_context=call_context)
+    view = build_exchange_view("ctx-big", tasks)
+    assert [ordinal_of(t) for t in view.tasks] == list(range(120))
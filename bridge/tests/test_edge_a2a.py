@@ -115,6 +115,195 @@ async def test_dynamic_agent_card():
         assert data["capabilities"]["streaming"] is True
 
 
+@pytest.mark.seam("skill_registry")
+@pytest.mark.anyio
+async def test_agent_card_is_cached_per_snapshot_with_etag_revalidation(tmp_path):
+    """The card is built and rendered once per registry snapshot and served as cached
+    bytes with a strong ETag + Cache-Control; If-None-Match answers 304; a registry
+    reload changes the tag and reaches the JSON-RPC handler's card too."""
+    import os
+    import shutil
+
+    from bridge.adapters.local.skill_registry import LocalSkillRegistry
+    from bridge.skills import resolve_default_skills_dir
+
+    skills = tmp_path / "skills"
+    shutil.copytree(resolve_default_skills_dir(), skills)
+    registry = LocalSkillRegistry(skills, check_interval=0)
+    app = create_app(base_url=BASE_URL, registry=registry, hold_seconds=0.0)
+    cache = app.state.card_cache
+    url = "/.well-known/agent-card.json"
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL) as hx:
+        first = await hx.get(url)
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert not etag.startswith("W/")
+        assert (first.content, etag) == cache.rendered()
+        assert first.headers["cache-control"] == "public, no-cache"
+        for _ in range(5):
+            assert (await hx.get(url)).content == first.content
+        assert cache.builds == 1
+
+        revalidated = await hx.get(url, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == etag
+        assert (await hx.get(url, headers={"If-None-Match": '"other"'})).status_code == 200
+
+        skill_md = skills / "address-proof" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("description:", "description: Live."))
+        stat = skill_md.stat()
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        reloaded = await hx.get(url, headers={"If-None-Match": etag})
+        assert reloaded.status_code == 200
+        assert reloaded.headers["etag"] != etag
+        assert "Live." in reloaded.json()["description"]
+        assert cache.builds == 2
+        assert "Live." in app.state.handler._agent_card.description
+        weak = f'"other", W/{reloaded.headers["etag"]}'
+        assert (await hx.get(url, headers={"If-None-Match": weak})).status_code == 304
+        assert (await hx.get(url, headers={"If-None-Match": "*"})).status_code == 304
+
+
+@pytest.mark.seam("skill_registry")
+@pytest.mark.anyio
+async def test_handler_card_is_a_real_agent_card_that_follows_reloads(tmp_path):
+    """The JSON-RPC handler is built with the cache's AgentCard (a real, protobuf-
+    serializable message), answers the GetExtendedAgentCard RPC from its capabilities,
+    and sees a registry reload on its next request: the app revalidates the cache,
+    which updates that same message in place."""
+    import os
+    import shutil
+
+    from a2a.types import AgentCard
+    from google.protobuf.json_format import MessageToDict
+
+    from bridge.adapters.local.skill_registry import LocalSkillRegistry
+    from bridge.skills import resolve_default_skills_dir
+
+    skills = tmp_path / "skills"
+    shutil.copytree(resolve_default_skills_dir(), skills)
+    registry = LocalSkillRegistry(skills, check_interval=0)
+    app = create_app(base_url=BASE_URL, registry=registry, hold_seconds=0.0)
+    cache = app.state.card_cache
+
+    card = cache.card()
+    assert type(card) is AgentCard
+    # Guard: the SDK handler must keep the very card it was given (not a copy).
+    assert app.state.handler._agent_card is card
+    assert AgentCard.FromString(card.SerializeToString()) == card
+    copy = AgentCard()
+    copy.CopyFrom(card)
+    assert MessageToDict(copy)["name"] == card.name
+
+    rpc = {"jsonrpc": "2.0", "id": 1, "method": "GetExtendedAgentCard", "params": {}}
+    headers = {"A2A-Version": "1.0"}
+    unsupported = "The agent does not support authenticated extended cards"
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL) as hx:
+        resp = (await hx.post("/", json=rpc, headers=headers)).json()
+        assert not card.capabilities.extended_agent_card
+        assert resp["error"]["message"] == unsupported
+
+        skill_md = skills / "address-proof" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("description:", "description: Live."))
+        stat = skill_md.stat()
+        os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        resp = (await hx.post("/", json=rpc, headers=headers)).json()
+        assert resp["error"]["message"] == unsupported
+
+    assert cache.builds == 2
+    assert "Live." in card.description
+    assert app.state.handler._agent_card is card
+
+
+@pytest.mark.seam("skill_registry")
+@pytest.mark.anyio
+async def test_served_app_hot_reloads_a_skill_dropped_into_the_tree(tmp_path):
+    """The app's lifespan revalidates the registry in the background: a skill folder
+    dropped into the tree reaches the served card without a read-time check."""
+    import shutil
+
+    from bridge.adapters.local.skill_registry import LocalSkillRegistry
+    from bridge.skills import resolve_default_skills_dir
+
+    skills = tmp_path / "skills"
+    shutil.copytree(resolve_default_skills_dir(), skills)
+    registry = LocalSkillRegistry(skills)  # no check_interval: nothing refreshes on read
+    app = create_app(
+        base_url=BASE_URL, registry=registry, hold_seconds=0.0, skills_refresh_interval=0.01
+    )
+    url = "/.well-known/agent-card.json"
+
+    def skill_ids(card: dict) -> set[str]:
+        return {skill["id"] for skill in card["skills"]}
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url=BASE_URL
+        ) as hx:
+            assert "proof-of-income" not in skill_ids((await hx.get(url)).json())
+
+            shutil.copytree(skills / "address-proof", tmp_path / "proof-of-income")
+            skill_md = tmp_path / "proof-of-income" / "SKILL.md"
+            skill_md.write_text(
+                skill_md.read_text().replace("name: address-proof", "name: proof-of-income")
+            )
+            (tmp_path / "proof-of-income").rename(skills / "proof-of-income")
+
+            for _ in range(200):
+                card = (await hx.get(url)).json()
+                if "proof-of-income" in skill_ids(card):
+                    break
+                await asyncio.sleep(0.01)
+            assert skill_ids(card) >= {"address-proof", "proof-of-income"}
+
+
+@pytest.mark.seam("skill_registry")
+@pytest.mark.anyio
+async def test_registry_reload_reaches_the_next_round_explanations(tmp_path):
+    """The app's executor reads explanations from the registry's current snapshot each
+    round: an edited explanations file is relayed from the next round on."""
+    import os
+    import shutil
+
+    from bridge.adapters.local.skill_registry import LocalSkillRegistry
+    from bridge.skills import resolve_default_skills_dir
+
+    skills = tmp_path / "skills"
+    shutil.copytree(resolve_default_skills_dir(), skills)
+    registry = LocalSkillRegistry(skills)
+    app = create_app(
+        base_url=BASE_URL, registry=registry, collect_plan=REJECT_RESUBMIT, hold_seconds=0.0
+    )
+    executor = app.state.executor
+    message = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+
+    async def rejection_message(context_id: str) -> str:
+        queue = _FakeQueue()
+        context = SimpleNamespace(
+            task_id=f"t-{context_id}",
+            context_id=context_id,
+            current_task=None,
+            message=message,
+            call_context=None,
+        )
+        await executor.execute(context, queue)
+        artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+        entry = ExchangeTurn.model_validate(get_data_parts(artifact.parts)[0]).status.ledger[0]
+        assert entry.reason_code == "illegible"
+        return entry.message
+
+    original = "This document was too blurry to read. Please resend a clearer copy."
+    assert await rejection_message("ctx-before") == original
+
+    path = skills / "address-proof" / "assets" / "explanations.yaml"
+    path.write_text(path.read_text().replace(original, "Blurry scan, please resend."))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert registry.refresh()
+
+    assert await rejection_message("ctx-after") == "Blurry scan, please resend."
+
+
 # --------------------------------------------------------------------------- #
 # 2 — _status_for mapping (pure, no server)
 # --------------------------------------------------------------------------- #
@@ -440,3 +629,736 @@ async def test_existing_decoders_still_work():
     assert len(turn.status.ledger) == 1
     assert turn.status.ledger[0].id == "gov-id-clean"
     assert turn.status.ledger[0].disposition == Disposition.ACCEPTED
+
+
+# --------------------------------------------------------------------------- #
+# 8 — Incremental turn builder: wire output unchanged
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_incremental_turn_matches_full_refold():
+    """Each round's artifact is byte-identical to a full refold of the exchange's legs.
+
+    The executor folds legs incrementally (ExchangeAccumulator); this recomputes the
+    turn + RequirementsList the pre-accumulator way (build_exchange_turn twice +
+    advisory_satisfaction) from the same legs and compares the JSON payloads.
+    """
+    from bridge.adapters.local.extraction import FixtureExtractionEngine
+    from bridge.ledger import build_exchange_turn
+    from bridge.requirements import advisory_satisfaction, propose_requirements
+
+    executor = BridgeExecutor(engine=FixtureExtractionEngine(), collect_plan=REJECT_RESUBMIT)
+    message = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+    current = None
+    for round_index in range(2):
+        queue = _FakeQueue()
+        context = SimpleNamespace(
+            task_id="t-inc",
+            context_id="ctx-inc",
+            current_task=current,
+            message=message,
+            call_context=None,
+        )
+        await executor.execute(context, queue)
+        current = SimpleNamespace(status=SimpleNamespace(state=TaskState.TASK_STATE_INPUT_REQUIRED))
+
+        terminal = REJECT_RESUBMIT.is_terminal(round_index)
+        legs = executor._contexts.get("ctx-inc").exchange.legs
+        prelim = build_exchange_turn("ctx-inc", legs, terminal=terminal)
+        advisory = advisory_satisfaction(prelim.status)
+        expected_turn = build_exchange_turn(
+            "ctx-inc", legs, outstanding=advisory.outstanding, terminal=terminal
+        )
+        expected_reqs = propose_requirements(
+            expected_turn.status, explanations=executor._round_policy()[1]
+        )
+
+        artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+        datas = get_data_parts(artifact.parts)
+        assert datas[0] == expected_turn.model_dump(mode="json")
+        assert datas[1] == expected_reqs.model_dump(mode="json")
+
+
+# --------------------------------------------------------------------------- #
+# 9 — Bounded, rehydratable per-context state
+# --------------------------------------------------------------------------- #
+
+
+def _state(context_id: str, *, terminal: bool = False):
+    from bridge.edges.a2a.state import ContextState
+    from bridge.exchange import ExchangeAccumulator
+
+    return ContextState(
+        context_id=context_id, exchange=ExchangeAccumulator(context_id), terminal=terminal
+    )
+
+
+def test_context_cache_evicts_terminal_before_open():
+    """Overflow drops the LRU terminal exchange; a parked one survives the burst."""
+    from bridge.edges.a2a.state import ContextCache
+
+    cache = ContextCache(2)
+    cache.put(_state("parked"))
+    cache.put(_state("done-1", terminal=True))
+    cache.put(_state("done-2", terminal=True))
+    assert "parked" in cache and "done-2" in cache and "done-1" not in cache
+
+    # With no terminal exchange left to drop, the LRU open one goes.
+    cache.put(_state("done-2"))  # reopened → refiled as open
+    cache.get("parked")
+    cache.put(_state("fresh"))
+    assert "parked" in cache and "fresh" in cache and "done-2" not in cache
+    assert cache.evictions == 2
+
+
+def test_context_cache_stays_flat_over_100k_completed_exchanges():
+    """Memory is bounded by maxsize, not by the number of exchanges ever seen."""
+    from bridge.edges.a2a.state import ContextCache
+
+    cache = ContextCache(256)
+    cache.put(_state("parked"))
+    for i in range(100_000):
+        cache.put(_state(f"ctx-{i}", terminal=True))
+    assert len(cache) == 256
+    assert cache.evictions == 100_000 - 255
+    assert "parked" in cache
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_executor_state_bounded_across_completed_exchanges():
+    """Direct executor: completed exchanges never grow the per-context state past the cap."""
+    from bridge.adapters.local.extraction import FixtureExtractionEngine
+
+    executor = BridgeExecutor(
+        engine=FixtureExtractionEngine(), collect_plan=GOV_ID_INSTANT, max_contexts=16
+    )
+    message = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+    for i in range(500):
+        context = SimpleNamespace(
+            task_id=f"t-{i}",
+            context_id=f"ctx-{i}",
+            current_task=None,
+            message=message,
+            call_context=None,
+        )
+        await executor.execute(context, _FakeQueue())
+    assert len(executor._contexts) == 16
+    assert len(executor.context_ids_seen) == 16
+    assert len(executor._ledger_cache) <= executor._ledger_cache.maxsize
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_default_app_keeps_legs_out_of_the_handler_store():
+    """Without a caller-supplied store, legs live only in the bounded context cache:
+    the handler's in-memory store holds one task per exchange and tasks/list shows
+    no legs."""
+    from a2a.server.tasks import InMemoryTaskStore
+    from a2a.types import ListTasksRequest
+
+    app = create_app(base_url=BASE_URL, hold_seconds=0.0, collect_plan=TWO_BILLS_DISTINCT)
+    assert app.state.executor._task_store is None
+    assert isinstance(app.state.handler.task_store, InMemoryTaskStore)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL) as hx:
+        card = await A2ACardResolver(hx, BASE_URL).get_agent_card()
+        factory = ClientFactory(ClientConfig(httpx_client=hx, streaming=False, polling=True))
+        client = factory.create(card)
+        msg = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+        async for resp in client.send_message(SendMessageRequest(message=msg)):
+            task = resp.task
+            break
+        task, _ = await _poll(client, task, TaskState.TASK_STATE_INPUT_REQUIRED)
+        listed = await client.list_tasks(ListTasksRequest(context_id=task.context_id))
+
+    assert [t.id for t in listed.tasks] == [task.id]
+    assert len(_turn_from_task(task).status.ledger) == 1
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_refused_or_failed_round_leaves_the_context_state_unbound():
+    """A caller refused at the trust boundary binds no party/skill, and a round whose
+    extraction fails does not advance the round counter."""
+    from bridge.adapters.local.extraction import FixtureExtractionEngine
+    from bridge.seams.extraction import ExtractionError
+
+    class _Failing:
+        async def extract(self, document, doctype_skill):
+            raise ExtractionError("illegible")
+
+    message = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+
+    def _context(caller):
+        call_context = SimpleNamespace(user=None, state={"caller": caller})
+        return SimpleNamespace(
+            task_id="t1",
+            context_id="ctx-bind",
+            current_task=None,
+            message=message,
+            call_context=call_context,
+        )
+
+    executor = BridgeExecutor(engine=FixtureExtractionEngine(), strict=True)
+    with pytest.raises(TrustBoundaryError):
+        await executor.execute(_context("impersonator"), _FakeQueue())
+    state = executor._contexts.get("ctx-bind")
+    assert state is None or (state.party, state.skill, state.rounds) == ("", "", 0)
+
+    executor = BridgeExecutor(engine=_Failing(), collect_plan=TWO_BILLS_DISTINCT)
+    with pytest.raises(ExtractionError):
+        await executor.execute(_context(None), _FakeQueue())
+    state = executor._contexts.get("ctx-bind")
+    assert state is None or (state.rounds, len(state.exchange)) == (0, 0)
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_parked_exchange_rehydrates_in_a_fresh_app():
+    """Park on one app, resume on a fresh one sharing the task store: the new executor
+    rehydrates party/skill/round + the parked leg from the store and completes."""
+    from a2a.server.tasks import InMemoryTaskStore
+
+    store = InMemoryTaskStore()
+
+    async def _client(hx):
+        card = await A2ACardResolver(hx, BASE_URL).get_agent_card()
+        factory = ClientFactory(ClientConfig(httpx_client=hx, streaming=False, polling=True))
+        return factory.create(card)
+
+    first = create_app(
+        base_url=BASE_URL, hold_seconds=0.0, collect_plan=TWO_BILLS_DISTINCT, task_store=store
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=first), base_url=BASE_URL) as hx:
+        client = await _client(hx)
+        msg = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+        async for resp in client.send_message(SendMessageRequest(message=msg)):
+            task = resp.task
+            break
+        task, _ = await _poll(client, task, TaskState.TASK_STATE_INPUT_REQUIRED)
+
+    second = create_app(
+        base_url=BASE_URL, hold_seconds=0.0, collect_plan=TWO_BILLS_DISTINCT, task_store=store
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=second), base_url=BASE_URL
+    ) as hx:
+        client = await _client(hx)
+        resume = new_text_message("Second proof.", context_id=task.context_id, task_id=task.id)
+        async for resp in client.send_message(SendMessageRequest(message=resume)):
+            task = resp.task
+            break
+        task, _ = await _poll(client, task, TaskState.TASK_STATE_COMPLETED)
+
+    final = _turn_from_task(task)
+    assert final.status.terminal is True
+    assert [e.id for e in final.status.ledger] == ["bill-powerco-clean", "bill-aquautil-clean"]
+    state = second.state.executor._contexts.get(task.context_id)
+    assert (state.party, state.skill, state.rounds, state.terminal) == (PARTY, SKILL, 2, True)
+
+
+@pytest.mark.seam("task_store")
+def test_create_app_takes_a_task_store_or_a_db_path(tmp_path):
+    """A caller-supplied store and a db_path for the app's own store clash."""
+    from a2a.server.tasks import InMemoryTaskStore
+
+    with pytest.raises(ValueError, match="not both"):
+        create_app(
+            base_url=BASE_URL, task_store=InMemoryTaskStore(), db_path=str(tmp_path / "t.db")
+        )
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_db_path_app_survives_a_restart(tmp_path):
+    """create_app(db_path=...) wires a durable SequencedTaskStore into the handler and
+    the executor: an exchange parked before a restart resumes on a fresh app."""
+    from bridge.adapters.local.task_store import SequencedTaskStore
+
+    db_path = str(tmp_path / "bridge.db")
+
+    async def _client(hx):
+        card = await A2ACardResolver(hx, BASE_URL).get_agent_card()
+        factory = ClientFactory(ClientConfig(httpx_client=hx, streaming=False, polling=True))
+        return factory.create(card)
+
+    def _app():
+        app = create_app(
+            base_url=BASE_URL,
+            hold_seconds=0.0,
+            collect_plan=TWO_BILLS_DISTINCT,
+            db_path=db_path,
+            skills_refresh_interval=None,
+        )
+        store = app.state.handler.task_store
+        assert isinstance(store, SequencedTaskStore)
+        assert app.state.executor._task_store is store
+        return app
+
+    first = _app()
+    async with first.router.lifespan_context(first):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=first), base_url=BASE_URL
+        ) as hx:
+            client = await _client(hx)
+            msg = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+            async for resp in client.send_message(SendMessageRequest(message=msg)):
+                task = resp.task
+                break
+            task, _ = await _poll(client, task, TaskState.TASK_STATE_INPUT_REQUIRED)
+
+    second = _app()
+    async with second.router.lifespan_context(second):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=second), base_url=BASE_URL
+        ) as hx:
+            client = await _client(hx)
+            resume = new_text_message("Second proof.", context_id=task.context_id, task_id=task.id)
+            async for resp in client.send_message(SendMessageRequest(message=resume)):
+                task = resp.task
+                break
+            task, _ = await _poll(client, task, TaskState.TASK_STATE_COMPLETED)
+
+    final = _turn_from_task(task)
+    assert [e.id for e in final.status.ledger] == ["bill-powerco-clean", "bill-aquautil-clean"]
+
+
+# --------------------------------------------------------------------------- #
+# 10 — Concurrent Path-B extraction (bounded, deterministic ordinals, time budget)
+# --------------------------------------------------------------------------- #
+
+
+class _DelayedEngine:
+    """Fixture engine behind per-document delays; records peak in-flight calls."""
+
+    def __init__(self, delays: dict[str, float]):
+        from bridge.adapters.local.extraction import FixtureExtractionEngine
+
+        self._inner = FixtureExtractionEngine()
+        self._delays = delays
+        self.in_flight = 0
+        self.peak = 0
+        self.finished: list[str] = []
+
+    async def extract(self, document, doctype_skill):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays.get(document.fixture_id, 0.0))
+            extraction = await self._inner.extract(document, doctype_skill)
+        finally:
+            self.in_flight -= 1
+        self.finished.append(document.fixture_id)
+        return extraction
+
+
+_THREE_DOCS = ("gov-id-clean", "bill-powerco-clean", "bill-aquautil-clean")
+
+
+def _three_doc_context(task_id: str):
+    return SimpleNamespace(
+        task_id=task_id,
+        context_id=f"ctx-{task_id}",
+        current_task=None,
+        message=_request_message(CollectRequest(party=PARTY, skill=SKILL)),
+        call_context=None,
+    )
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_round_extracts_concurrently_with_plan_ordered_ledger():
+    """Docs finishing in reverse order still land at plan-order ordinals (A5), under the
+    concurrency cap."""
+    from bridge.aggregate import ordinal_of
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+
+    engine = _DelayedEngine(dict(zip(_THREE_DOCS, (0.06, 0.04, 0.02), strict=True)))
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    executor = BridgeExecutor(engine=engine, collect_plan=plan, extract_concurrency=2)
+    queue = _FakeQueue()
+
+    await executor.execute(_three_doc_context("conc"), queue)
+
+    assert engine.finished != list(_THREE_DOCS)  # completion order differs from plan order
+    assert engine.peak == 2
+    legs = executor._contexts.get("ctx-conc").exchange.legs
+    assert [ordinal_of(leg) for leg in legs] == [0, 1, 2]
+    artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+    turn = ExchangeTurn.model_validate(get_data_parts(artifact.parts)[0])
+    assert [e.id for e in turn.status.ledger] == list(_THREE_DOCS)
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_round_timeout_fails_the_round_without_minting_legs():
+    """A round overrunning its budget raises ExtractionError and records nothing."""
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.seams.extraction import ExtractionError
+
+    engine = _DelayedEngine({"bill-aquautil-clean": 5.0})
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    executor = BridgeExecutor(engine=engine, collect_plan=plan, round_timeout=0.05)
+
+    with pytest.raises(ExtractionError, match="extraction budget"):
+        await executor.execute(_three_doc_context("slow"), _FakeQueue())
+
+    assert engine.in_flight == 0  # the straggler was cancelled
+    assert len(executor._contexts.get("ctx-slow").exchange) == 0
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_a_round_failing_midway_records_none_of_its_legs(tmp_path, monkeypatch):
+    """A document failing after others were classified records nothing, so the retried
+    round mints each document exactly once."""
+    from a2a.server.context import ServerCallContext
+
+    from bridge.adapters.local import build_local_adapter
+    from bridge.aggregate import ordinal_of, tasks_for_context
+    from bridge.edges.a2a import executor as executor_module
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.seams import Seam
+
+    classify = executor_module.classify_document
+
+    def flaky(doc_id, *args, **kwargs):
+        if doc_id == _THREE_DOCS[1]:
+            raise RuntimeError("classifier down")
+        return classify(doc_id, *args, **kwargs)
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    executor = BridgeExecutor(engine=_DelayedEngine({}), collect_plan=plan, task_store=store)
+
+    monkeypatch.setattr(executor_module, "classify_document", flaky)
+    with pytest.raises(RuntimeError, match="classifier down"):
+        await executor.execute(_three_doc_context("mid"), _FakeQueue())
+    assert await tasks_for_context(store, "ctx-mid", call_context=ServerCallContext()) == []
+    assert len(executor._contexts.get("ctx-mid").exchange) == 0
+
+    monkeypatch.setattr(executor_module, "classify_document", classify)
+    await executor.execute(_three_doc_context("mid"), _FakeQueue())
+
+    legs = await tasks_for_context(store, "ctx-mid", call_context=ServerCallContext())
+    assert sorted(ordinal_of(leg) for leg in legs) == [0, 1, 2]
+    assert len(executor._contexts.get("ctx-mid").exchange) == 3
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_batching_engine_gets_the_round_as_one_request():
+    """An engine with extract_many sees the round once; a failed document fails it."""
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.seams.extraction import ExtractionError, extract_batch
+
+    class BatchEngine(_DelayedEngine):
+        def __init__(self):
+            super().__init__({})
+            self.batches: list[int] = []
+
+        async def extract_many(self, requests):
+            self.batches.append(len(requests))
+            return await extract_batch(self._inner, requests)
+
+    engine = BatchEngine()
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    executor = BridgeExecutor(engine=engine, collect_plan=plan)
+    queue = _FakeQueue()
+
+    await executor.execute(_three_doc_context("batch"), queue)
+
+    assert engine.batches == [3]
+    assert engine.finished == []  # never called one document at a time
+    artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+    turn = ExchangeTurn.model_validate(get_data_parts(artifact.parts)[0])
+    assert [e.id for e in turn.status.ledger] == list(_THREE_DOCS)
+
+    bad = CollectPlan(rounds=(CollectRound(fixture_ids=("gov-id-clean", "nope"), terminal=True),))
+    executor = BridgeExecutor(engine=engine, collect_plan=bad)
+    with pytest.raises(ExtractionError, match="nope"):
+        await executor.execute(_three_doc_context("batch-bad"), _FakeQueue())
+    assert len(executor._contexts.get("ctx-batch-bad").exchange) == 0
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_every_demo_fixture_replays_through_the_edge():
+    """Load-test replay: every fixture of every eval corpus runs one round through the
+    real executor, and each lands on the ledger in plan order."""
+    from bridge.adapters.local.extraction import FixtureExtractionEngine
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+
+    engine = FixtureExtractionEngine()
+    fixture_ids = engine.index.ids()
+    assert set(engine.index.corpora) >= {"address", "benefits", "rfp"}
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=fixture_ids, terminal=True),))
+    executor = BridgeExecutor(engine=engine, collect_plan=plan)
+    queue = _FakeQueue()
+
+    await executor.execute(_three_doc_context("replay"), queue)
+
+    artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+    turn = ExchangeTurn.model_validate(get_data_parts(artifact.parts)[0])
+    assert [e.id for e in turn.status.ledger] == list(fixture_ids)
+
+
+def test_extract_concurrency_must_be_positive():
+    """A zero-slot semaphore would deadlock every round — refuse it up front."""
+    from bridge.adapters.local.extraction import FixtureExtractionEngine
+
+    with pytest.raises(ValueError):
+        BridgeExecutor(engine=FixtureExtractionEngine(), extract_concurrency=0)
+
+
+# --------------------------------------------------------------------------- #
+# 11 — Per-context serialization of concurrent sends
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.anyio
+async def test_context_locks_serialize_one_context_and_evict_when_idle():
+    """Same context → one holder at a time; other contexts proceed; idle locks drop."""
+    from bridge.edges.a2a.state import ContextLocks
+
+    locks = ContextLocks()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def hold(ctx: str):
+        async with locks.hold(ctx):
+            active[ctx] = active.get(ctx, 0) + 1
+            peak[ctx] = max(peak.get(ctx, 0), active[ctx])
+            await asyncio.sleep(0.001)
+            active[ctx] -= 1
+
+    await asyncio.gather(*(hold(f"ctx-{i % 3}") for i in range(30)))
+    assert peak == {"ctx-0": 1, "ctx-1": 1, "ctx-2": 1}
+    assert len(locks) == 0
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_concurrent_sends_on_few_contexts_mint_unique_ordinals():
+    """Stress: 1k concurrent sends across 8 contexts sharing a task store whose I/O
+    yields (as a database store's would). Each context's persisted legs carry gap-free,
+    duplicate-free ordinals (A5) and the round counter saw every send exactly once."""
+    from a2a.server.context import ServerCallContext
+    from a2a.server.tasks import InMemoryTaskStore
+
+    from bridge.aggregate import ordinal_of, tasks_for_context
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+
+    class _YieldingStore(InMemoryTaskStore):
+        async def list(self, params, context):
+            await asyncio.sleep(0)
+            return await super().list(params, context)
+
+        async def save(self, task, context):
+            await asyncio.sleep(0)
+            await super().save(task, context)
+
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=("bill-powerco-clean",), terminal=False),))
+    store = _YieldingStore()
+    executor = BridgeExecutor(engine=_DelayedEngine({}), collect_plan=plan, task_store=store)
+    message = _request_message(CollectRequest(party=PARTY, skill=SKILL))
+    contexts = [f"ctx-stress-{i}" for i in range(8)]
+
+    async def send(i: int):
+        context = SimpleNamespace(
+            task_id=f"t-stress-{i}",
+            context_id=contexts[i % len(contexts)],
+            current_task=None,
+            message=message,
+            call_context=None,
+        )
+        await executor.execute(context, _FakeQueue())
+
+    await asyncio.gather(*(send(i) for i in range(1000)))
+
+    for ctx in contexts:
+        legs = await tasks_for_context(store, ctx, call_context=ServerCallContext())
+        assert sorted(ordinal_of(leg) for leg in legs) == list(range(125))
+        assert executor._contexts.get(ctx).rounds == 125
+    assert len(executor._locks) == 0
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_executor_takes_ordinals_from_a_sequenced_store(tmp_path):
+    """With a durable SequencedTaskStore the leg ordinals come from its sequence row."""
+    from a2a.server.context import ServerCallContext
+
+    from bridge.adapters.local import build_local_adapter
+    from bridge.aggregate import (
+        build_exchange_view,
+        create_leg_task,
+        ordinal_of,
+        tasks_for_context,
+    )
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.seams import Seam
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    executor = BridgeExecutor(engine=_DelayedEngine({}), collect_plan=plan, task_store=store)
+
+    await executor.execute(_three_doc_context("seq"), _FakeQueue())
+
+    legs = await tasks_for_context(store, "ctx-seq", call_context=ServerCallContext())
+    view = build_exchange_view("ctx-seq", legs)
+    assert [ordinal_of(t) for t in view.tasks] == [0, 1, 2]
+    assert len({t.id for t in view.tasks}) == 3
+    leg = create_leg_task(context_id="ctx-seq", ordinal=-1, task_id="seq-extra")
+    assert await store.save_leg(leg, ServerCallContext()) == 3  # the sequence moved on
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_two_workers_on_one_exchange_keep_every_leg(tmp_path):
+    """Two executors (workers) sharing a durable store and one context: neither
+    overwrites the other's legs, and the store hands out distinct ordinals."""
+    from a2a.server.context import ServerCallContext
+
+    from bridge.adapters.local import build_local_adapter
+    from bridge.aggregate import ordinal_of, tasks_for_context
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.seams import Seam
+
+    db_path = str(tmp_path / "t.db")
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+    stores = [build_local_adapter(Seam.TASK_STORE, durable=True, db_path=db_path) for _ in (0, 1)]
+    await stores[0].initialize()
+    slow = dict.fromkeys(_THREE_DOCS, 0.05)  # both rehydrate the empty exchange first
+    workers = [
+        BridgeExecutor(engine=_DelayedEngine(slow), collect_plan=plan, task_store=store)
+        for store in stores
+    ]
+
+    await asyncio.gather(
+        *(worker.execute(_three_doc_context("shared"), _FakeQueue()) for worker in workers)
+    )
+
+    legs = await tasks_for_context(stores[0], "ctx-shared", call_context=ServerCallContext())
+    assert len({leg.id for leg in legs}) == 6
+    assert sorted(ordinal_of(leg) for leg in legs) == list(range(6))
+    for store in stores:
+        await store.engine.dispose()
+
+
+@pytest.mark.seam("extraction")
+@pytest.mark.anyio
+async def test_replayed_path_a_exchange_emits_a_byte_identical_ledger():
+    """Leg task ids are unique per run, but the ledger a replay emits is not perturbed."""
+    from a2a.helpers.proto_helpers import new_data_part
+
+    from bridge.adapters.local.extraction import FixtureDocument, FixtureExtractionEngine
+
+    engine = FixtureExtractionEngine()
+    extraction = await engine.extract(FixtureDocument(fixture_id="gov-id-clean"), None)
+
+    async def run() -> tuple[str, list[str]]:
+        context = _three_doc_context("replay")
+        context.message.parts.append(new_data_part(extraction.model_dump(mode="json")))
+        executor, queue = BridgeExecutor(engine=engine), _FakeQueue()
+        await executor.execute(context, queue)
+        artifact = [e for e in queue.events if hasattr(e, "artifact")][-1].artifact
+        turn = ExchangeTurn.model_validate(get_data_parts(artifact.parts)[0])
+        legs = executor._contexts.get("ctx-replay").exchange.legs
+        return turn.status.model_dump_json(), [leg.id for leg in legs]
+
+    (ledger1, legs1), (ledger2, legs2) = await run(), await run()
+
+    assert ledger1 == ledger2
+    assert '"id":"replay-doc-0"' in ledger1
+    assert legs1 != legs2
+
+
+@pytest.mark.seam("exchange_store")
+@pytest.mark.anyio
+async def test_executor_snapshots_and_a_fresh_executor_seeds_from_it():
+    """snapshot_every=2: a 3-leg round saves a snapshot; a fresh executor seeds from it
+    and lists no leg from the task store."""
+    from a2a.server.tasks import InMemoryTaskStore
+
+    from bridge.adapters.local.exchange_store import LocalExchangeStore
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+    from bridge.exchange import load_snapshot
+
+    store, exchanges = InMemoryTaskStore(), LocalExchangeStore()
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=True),))
+
+    def executor():
+        return BridgeExecutor(
+            engine=_DelayedEngine({}),
+            collect_plan=plan,
+            task_store=store,
+            exchange_store=exchanges,
+            snapshot_every=2,
+        )
+
+    first = executor()
+    await first.execute(_three_doc_context("snap"), _FakeQueue())
+    snapshot = await load_snapshot(exchanges, "ctx-snap")
+    assert (snapshot.legs, snapshot.through_ordinal) == (3, 2)
+
+    second = executor()
+    state = await second._context_state(_three_doc_context("snap"))
+    assert (len(state.exchange), state.exchange.legs, state.snapshot_legs) == (3, [], 3)
+    assert state.exchange.ledger == first._contexts.get("ctx-snap").exchange.ledger
+
+
+@pytest.mark.seam("exchange_store")
+@pytest.mark.anyio
+async def test_a_failed_snapshot_write_does_not_fail_the_round(caplog):
+    """An exchange store that cannot materialize is logged: the round still completes,
+    and the snapshot is retried on the next round."""
+    from a2a.server.tasks import InMemoryTaskStore
+
+    from bridge.adapters.local.exchange_store import LocalExchangeStore
+    from bridge.edges.a2a.plan import CollectPlan, CollectRound
+
+    class FailingStore(LocalExchangeStore):
+        def __init__(self):
+            super().__init__()
+            self.attempts = 0
+
+        async def materialize(self, context_id, **kwargs):
+            self.attempts += 1
+            raise RuntimeError("exchange store down")
+
+    exchanges = FailingStore()
+    plan = CollectPlan(rounds=(CollectRound(fixture_ids=_THREE_DOCS, terminal=False),))
+    executor = BridgeExecutor(
+        engine=_DelayedEngine({}),
+        collect_plan=plan,
+        task_store=InMemoryTaskStore(),
+        exchange_store=exchanges,
+        snapshot_every=2,
+    )
+
+    queue = _FakeQueue()
+    await executor.execute(_three_doc_context("snap-fail"), queue)
+
+    states = [e.status.state for e in queue.events if hasattr(e, "status")]
+    assert states[-1] == TaskState.TASK_STATE_INPUT_REQUIRED
+    assert executor._contexts.get("ctx-snap-fail").snapshot_legs == 0
+    assert "exchange store down" in caplog.text
+
+    resumed = _three_doc_context("snap-fail")
+    resumed.current_task = SimpleNamespace(
+        status=SimpleNamespace(state=TaskState.TASK_STATE_INPUT_REQUIRED)
+    )
+    await executor.execute(resumed, _FakeQueue())
+    assert exchanges.attempts == 2
+
+
+def test_snapshot_every_must_be_positive():
+    """A non-positive snapshot interval is a configuration error."""
+    with pytest.raises(ValueError, match="snapshot_every"):
+        BridgeExecutor(engine=_DelayedEngine({}), snapshot_every=0)
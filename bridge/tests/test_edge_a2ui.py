@@ -5,6 +5,7 @@ Validates:
 - build_screen: emits declarative A2uiScreen with intake affordances (None when done)
 - intake_to_document: maps A2uiResponse to FixtureDocument
 - submit_intake: feeds Path-B intake into run_fulfillment, threads attempts for resubmission
+- submit_intakes: feeds a multi-document intake through one batched extraction
 - render_screen: reference/demo renderer (smoke test)
 - JSON-serializable: A2uiScreen round-trips via model_dump(mode="json")
 
@@ -34,6 +35,7 @@ from bridge.edges.a2ui import (
     party_status_view,
     render_screen,
     submit_intake,
+    submit_intakes,
 )
 from bridge.fulfillment import Phase, run_fulfillment
 from bridge.requirements import (
@@ -41,6 +43,7 @@ from bridge.requirements import (
     load_explanations,
     propose_requirements,
 )
+from bridge.seams.extraction import extract_batch
 
 
 async def _build_ledger_and_requirements(*fixture_ids: str):
@@ -287,6 +290,41 @@ async def test_submit_intake_threads_attempts():
     assert result.awaiting_resubmission is False
 
 
+@pytest.mark.anyio
+async def test_submit_intakes_batches_the_upload_and_matches_submit_intake():
+    """A multi-document upload is extracted in one batch; each result matches submit_intake."""
+
+    class _BatchEngine(FixtureExtractionEngine):
+        def __init__(self):
+            super().__init__()
+            self.batches: list[list[str]] = []
+
+        async def extract_many(self, requests):
+            self.batches.append([doc.fixture_id for doc, _ in requests])
+            return await extract_batch(FixtureExtractionEngine(), requests)
+
+    fixture_ids = ["gov-id-clean", "bill-aquautil-blurry", "passport-unsupported"]
+    engine = _BatchEngine()
+    responses = [A2uiResponse(fixture_id=fid) for fid in fixture_ids]
+
+    results = await submit_intakes(responses, engine=engine, attempts=1)
+
+    assert engine.batches == [fixture_ids]
+    for response, result in zip(responses, results, strict=True):
+        single = await submit_intake(response, engine=FixtureExtractionEngine(), attempts=1)
+        assert (result.phase, result.disposition, result.attempts) == (
+            single.phase,
+            single.disposition,
+            single.attempts,
+        )
+
+    with pytest.raises(ValueError):
+        await submit_intakes(
+            [A2uiResponse(fixture_id="gov-id-clean"), A2uiResponse()], engine=engine
+        )
+    assert len(engine.batches) == 1  # nothing is extracted when a response is malformed
+
+
 # --------------------------------------------------------------------------- #
 # render_screen — demo furniture smoke test
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,143 @@
+"""Tests for the incremental exchange fold (ExchangeAccumulator).
+
+The accumulator is a derived cache of the M1.4 projection + the M1.9 advisory, so every
+test pins it against the reference pure fold (``build_exchange_turn`` /
+``advisory_satisfaction``) rather than against hand-written expectations. Entries are
+built from ``wiki/evals/address/expected.json`` (no ``agents`` import).
+"""
+
+import json
+import random
+from pathlib import Path
+
+from contract import Disposition, Extraction, LedgerEntry
+
+from bridge.aggregate import create_leg_task
+from bridge.exchange import SNAPSHOT_VERSION, ExchangeAccumulator, LedgerSnapshot
+from bridge.ledger import LedgerEntryCache, build_exchange_turn, stamp_ledger_entry
+from bridge.requirements import AdvisoryTally, advisory_satisfaction
+
+
+def _eval_entries() -> list[LedgerEntry]:
+    """Every address eval document as a LedgerEntry (expected disposition)."""
+    path = Path(__file__).resolve().parents[2] / "wiki" / "evals" / "address" / "expected.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [
+        LedgerEntry(
+            id=raw["id"],
+            doctype=raw["doctype"],
+            issuer=raw["issuer"],
+            disposition=Disposition(raw["expected_disposition"]),
+            extraction=Extraction.model_validate(raw["extraction"]),
+        )
+        for raw in data["documents"]
+    ]
+
+
+def _legs(ctx: str, entries: list[LedgerEntry]):
+    legs = []
+    for ordinal, entry in enumerate(entries):
+        leg = create_leg_task(context_id=ctx, ordinal=ordinal, task_id=f"{ctx}-doc-{ordinal}")
+        stamp_ledger_entry(leg, entry)
+        legs.append(leg)
+    return legs
+
+
+def test_incremental_turn_is_byte_identical_to_pure_fold():
+    """Round by round, the accumulator's turn serializes exactly like build_exchange_turn."""
+    ctx = "ctx-acc"
+    legs = _legs(ctx, _eval_entries())
+    acc = ExchangeAccumulator(ctx)
+    for n, leg in enumerate(legs, start=1):
+        acc.add(leg)
+        reference = build_exchange_turn(ctx, legs[:n], terminal=n == len(legs))
+        advisory = advisory_satisfaction(reference.status)
+        assert acc.advisory() == advisory
+        reference = build_exchange_turn(
+            ctx, legs[:n], outstanding=advisory.outstanding, terminal=n == len(legs)
+        )
+        turn = acc.turn(outstanding=acc.advisory().outstanding, terminal=n == len(legs))
+        assert turn.model_dump_json() == reference.model_dump_json()
+
+
+def test_out_of_order_legs_fold_into_ordinal_order():
+    """Legs added in shuffled order still yield the ordinal-ordered ledger (A5)."""
+    ctx = "ctx-shuffled"
+    legs = _legs(ctx, _eval_entries())
+    shuffled = legs[:]
+    random.Random(7).shuffle(shuffled)
+
+    acc = ExchangeAccumulator(ctx, shuffled)
+
+    reference = build_exchange_turn(ctx, shuffled)
+    assert [e.id for e in acc.ledger] == [e.id for e in reference.status.ledger]
+
+
+def test_other_context_and_unstamped_legs():
+    """Foreign-context legs are ignored; unstamped legs count as legs but not entries."""
+    ctx = "ctx-a"
+    entry = _eval_entries()[0]
+    mine = _legs(ctx, [entry])[0]
+    foreign = _legs("ctx-b", [entry])[0]
+    in_flight = create_leg_task(context_id=ctx, ordinal=1, task_id="in-flight")
+
+    acc = ExchangeAccumulator(ctx)
+    assert acc.add(foreign) is None
+    assert acc.add(in_flight) is None
+    assert acc.add(mine) == entry
+
+    assert len(acc) == 2
+    assert [e.id for e in acc.ledger] == [entry.id]
+    assert acc.dispositions == {entry.disposition}
+
+
+def test_accumulator_parses_each_leg_once():
+    """With a shared cache, folding a leg costs exactly one parse."""
+    ctx = "ctx-cost"
+    cache = LedgerEntryCache()
+    acc = ExchangeAccumulator(ctx, cache=cache)
+    for leg in _legs(ctx, _eval_entries()):
+        acc.add(leg)
+        acc.turn(outstanding=acc.advisory().outstanding)
+    assert cache.misses == len(acc)
+    assert cache.hits == 0
+
+
+def test_advisory_tally_matches_pure_advisory_on_every_prefix():
+    """AdvisoryTally folded entry by entry agrees with advisory_satisfaction."""
+    from contract import CollectionStatus
+
+    entries = _eval_entries()
+    tally = AdvisoryTally()
+    for n, entry in enumerate(entries, start=1):
+        tally.add(entry)
+        assert tally.result() == advisory_satisfaction(CollectionStatus(ledger=entries[:n]))
+
+
+def test_snapshot_seeded_fold_matches_full_refold():
+    """Snapshot (through JSON) + the newer legs emits the full fold's turn, byte for byte."""
+    ctx = "ctx-snap"
+    legs = _legs(ctx, _eval_entries())
+    half = len(legs) // 2
+    snapshot = ExchangeAccumulator(ctx, legs[:half]).snapshot()
+    assert (snapshot.through_ordinal, snapshot.legs) == (half - 1, half)
+
+    state = json.loads(json.dumps(snapshot.to_state()))
+    restored = ExchangeAccumulator(ctx, legs[half:], snapshot=LedgerSnapshot.from_state(ctx, state))
+
+    full = ExchangeAccumulator(ctx, legs)
+    assert len(restored) == len(full) and restored.legs == legs[half:]
+    assert restored.advisory() == full.advisory()
+    outstanding = full.advisory().outstanding
+    assert (
+        restored.turn(outstanding=outstanding, terminal=True).model_dump_json()
+        == build_exchange_turn(ctx, legs, outstanding=outstanding, terminal=True).model_dump_json()
+    )
+    assert restored.snapshot() == full.snapshot()
+
+
+def test_snapshot_of_unknown_version_is_ignored():
+    """A snapshot written by another version reads as no snapshot (the caller refolds)."""
+    state = ExchangeAccumulator("ctx-v").snapshot().to_state()
+    assert state["through_ordinal"] == -1
+    assert LedgerSnapshot.from_state("ctx-v", {**state, "version": SNAPSHOT_VERSION + 1}) is None
@@ -0,0 +1,223 @@
+"""Batched extraction tests (M1.7 follow-up).
+
+``extract_batch`` uses an engine's optional ``extract_many`` and otherwise fans out to
+``extract`` (bounded, cancelled on an engine fault); either way one bad document does
+not fail the batch.
+``run_fulfillment_many`` routes every document of one batched extraction, and
+``MicroBatchingExtractionEngine`` coalesces concurrent single ``extract`` calls.
+"""
+
+import asyncio
+
+import pytest
+
+from bridge.adapters.local.extraction import FixtureDocument, FixtureExtractionEngine
+from bridge.adapters.local.extraction_batching import MicroBatchingExtractionEngine
+from bridge.fulfillment import Phase, run_fulfillment, run_fulfillment_many
+from bridge.seams.extraction import (
+    BatchExtractionSeam,
+    ExtractionError,
+    ExtractionSeam,
+    extract_batch,
+)
+
+_DOCS = ("gov-id-clean", "missing-fixture", "bill-powerco-clean")
+
+
+class _BatchEngine:
+    """Fixture engine with extract_many; records each batch's fixture ids."""
+
+    def __init__(self, fault: Exception | None = None):
+        self.inner = FixtureExtractionEngine()
+        self.fault = fault
+        self.batches: list[list[str]] = []
+        self.singles = 0
+
+    async def extract(self, document, doctype_skill):
+        self.singles += 1
+        return await self.inner.extract(document, doctype_skill)
+
+    async def extract_many(self, requests):
+        self.batches.append([doc.fixture_id for doc, _ in requests])
+        if self.fault is not None:
+            raise self.fault
+        return await extract_batch(self.inner, requests)
+
+
+def _requests(*fixture_ids):
+    return [(FixtureDocument(fixture_id=fid), None) for fid in fixture_ids]
+
+
+@pytest.mark.anyio
+async def test_extract_batch_falls_back_to_extract_with_partial_failures():
+    """Without extract_many, each document is extracted alone; errors come back in place."""
+    engine = FixtureExtractionEngine()
+    assert isinstance(engine, ExtractionSeam)
+    assert not isinstance(engine, BatchExtractionSeam)
+
+    outcomes = await extract_batch(engine, _requests(*_DOCS))
+
+    assert [type(o).__name__ for o in outcomes] == ["Extraction", "ExtractionError", "Extraction"]
+    assert outcomes[0] == await engine.extract(FixtureDocument(fixture_id="gov-id-clean"), None)
+    assert "missing-fixture" in str(outcomes[1])
+    assert await extract_batch(engine, []) == []
+
+
+class _SlowEngine:
+    """Single-document engine that sleeps per call, tracks peak in-flight calls, and
+    raises an engine fault (not an ExtractionError) for one fixture id."""
+
+    def __init__(self, fault_on: str | None = None):
+        self.inner = FixtureExtractionEngine()
+        self.fault_on = fault_on
+        self.in_flight = self.peak = 0
+        self.cancelled = 0
+
+    async def extract(self, document, doctype_skill):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if document.fixture_id == self.fault_on:
+                raise RuntimeError("engine down")
+            await asyncio.sleep(0.01)
+            return await self.inner.extract(document, doctype_skill)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.anyio
+async def test_extract_batch_fallback_is_bounded_and_cancels_on_a_fault():
+    """The fallback keeps at most ``concurrency`` extracts in flight; an engine fault
+    cancels the extractions still running and propagates as itself."""
+    engine = _SlowEngine()
+    outcomes = await extract_batch(engine, _requests(*(_DOCS * 10)), concurrency=4)
+    assert len(outcomes) == 30 and engine.peak == 4
+
+    engine = _SlowEngine(fault_on="missing-fixture")
+    with pytest.raises(RuntimeError, match="engine down"):
+        await extract_batch(engine, _requests(*_DOCS), concurrency=4)
+    assert engine.cancelled == 2 and engine.in_flight == 0
+
+    with pytest.raises(ValueError, match="concurrency"):
+        await extract_batch(engine, _requests(*_DOCS), concurrency=0)
+
+
+@pytest.mark.anyio
+async def test_run_fulfillment_many_uses_one_batched_request():
+    """Several documents → one extract_many; each routes exactly as run_fulfillment."""
+    engine = _BatchEngine()
+    assert isinstance(engine, BatchExtractionSeam)
+    documents = [FixtureDocument(fixture_id=fid) for fid in _DOCS]
+
+    results = await run_fulfillment_many(documents, engine=engine)
+
+    assert engine.batches == [list(_DOCS)]
+    assert engine.singles == 0
+    assert results[1].phase == Phase.EXTRACTION_ERROR
+    for document, result in zip(documents, results, strict=True):
+        assert result == await run_fulfillment(document, engine=FixtureExtractionEngine())
+
+
+@pytest.mark.anyio
+async def test_micro_batching_coalesces_concurrent_extract_calls():
+    """Concurrent single calls inside the window go out as one batch."""
+    engine = _BatchEngine()
+    batching = MicroBatchingExtractionEngine(engine, window=0.01)
+    assert isinstance(batching, BatchExtractionSeam)
+
+    outcomes = await asyncio.gather(
+        *(batching.extract(FixtureDocument(fixture_id=fid), None) for fid in _DOCS),
+        return_exceptions=True,
+    )
+
+    assert engine.batches == [list(_DOCS)]
+    assert (batching.batches, batching.documents) == (1, 3)
+    assert outcomes[0].fields.doctype == "gov-id"
+    assert isinstance(outcomes[1], ExtractionError)  # only that caller fails
+    assert outcomes[2].fields.doctype == "utility-bill"
+
+
+@pytest.mark.anyio
+async def test_micro_batching_sends_a_full_batch_without_waiting():
+    """max_batch documents flush at once; the rest wait for the next window."""
+    engine = _BatchEngine()
+    batching = MicroBatchingExtractionEngine(engine, window=10.0, max_batch=2)
+    first_two = [
+        asyncio.create_task(batching.extract(FixtureDocument(fixture_id=fid), None))
+        for fid in ("gov-id-clean", "bill-powerco-clean")
+    ]
+
+    async with asyncio.timeout(1):
+        await asyncio.gather(*first_two)
+    assert engine.batches == [["gov-id-clean", "bill-powerco-clean"]]
+
+    with pytest.raises(ValueError, match="max_batch"):
+        MicroBatchingExtractionEngine(engine, max_batch=0)
+    with pytest.raises(ValueError, match="window"):
+        MicroBatchingExtractionEngine(engine, window=-1)
+
+
+@pytest.mark.anyio
+async def test_micro_batching_request_fault_and_cancelled_callers():
+    """A whole-request fault reaches every caller; a cancelled caller is not sent."""
+    engine = _BatchEngine(fault=RuntimeError("engine down"))
+    batching = MicroBatchingExtractionEngine(engine, window=0.01)
+    outcomes = await asyncio.gather(
+        *(batching.extract(FixtureDocument(fixture_id=fid), None) for fid in _DOCS[::2]),
+        return_exceptions=True,
+    )
+    assert [str(o) for o in outcomes] == ["engine down", "engine down"]
+
+    engine = _BatchEngine()
+    batching = MicroBatchingExtractionEngine(engine, window=0.01)
+    dropped = asyncio.create_task(
+        batching.extract(FixtureDocument(fixture_id="gov-id-clean"), None)
+    )
+    kept = asyncio.create_task(
+        batching.extract(FixtureDocument(fixture_id="bill-powerco-clean"), None)
+    )
+    await asyncio.sleep(0)
+    dropped.cancel()
+    assert (await kept).fields.doctype == "utility-bill"
+    assert engine.batches == [["bill-powerco-clean"]]
+
+
+@pytest.mark.anyio
+async def test_micro_batching_resolves_every_caller_when_the_batch_goes_wrong():
+    """A batch answered with too few outcomes, or a send cancelled mid-request, fails
+    every caller in it instead of leaving some waiting forever."""
+
+    class _ShortEngine(_BatchEngine):
+        async def extract_many(self, requests):
+            return (await super().extract_many(requests))[:-1]
+
+    batching = MicroBatchingExtractionEngine(_ShortEngine(), window=0.01)
+    async with asyncio.timeout(1):
+        outcomes = await asyncio.gather(
+            *(batching.extract(FixtureDocument(fixture_id=fid), None) for fid in _DOCS[::2]),
+            return_exceptions=True,
+        )
+    assert all(isinstance(o, RuntimeError) and "1 outcomes for 2" in str(o) for o in outcomes)
+
+    class _HungEngine(_BatchEngine):
+        async def extract_many(self, requests):
+            self.batches.append([doc.fixture_id for doc, _ in requests])
+            await asyncio.Event().wait()
+
+    for started in (True, False):  # cancelled mid-request, or before the send ran at all
+        engine = _HungEngine()
+        batching = MicroBatchingExtractionEngine(engine, window=0.0)
+        callers = [
+            asyncio.create_task(batching.extract(FixtureDocument(fixture_id=fid), None))
+            for fid in _DOCS[::2]
+        ]
+        while not (engine.batches if started else batching._flushes):
+            await asyncio.sleep(0)
+        for send in list(batching._flushes):
+            send.cancel()
+        async with asyncio.timeout(1):
+            outcomes = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(o, RuntimeError) and "without an outcome" in str(o) for o in outcomes)
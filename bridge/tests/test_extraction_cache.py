@@ -0,0 +1,261 @@
+"""Content-addressed extraction cache tests (M1.7 follow-up).
+
+A re-sent document (same bytes, same doctype skill version) is answered from cache
+instead of the engine; a new skill version, a failure, or an uncacheable document
+reaches the engine. The SQLite tier survives a fresh cache over the same file, and
+a failing read or write on it does not fail the extraction.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from bridge.adapters.local import extraction_cache
+from bridge.adapters.local.durable_extraction_cache import DatabaseExtractionCache
+from bridge.adapters.local.extraction import FixtureDocument, FixtureExtractionEngine
+from bridge.adapters.local.extraction_cache import (
+    CachingExtractionEngine,
+    ExtractionCacheStore,
+    extraction_cache_key,
+)
+from bridge.fulfillment import Phase, run_fulfillment
+from bridge.seams.extraction import ExtractionError, ExtractionSeam
+from bridge.skills import load_skill
+
+
+class _CountingEngine:
+    """Fixture engine that counts (and can slow down) its extract calls."""
+
+    def __init__(self, delay: float = 0.0):
+        self.inner = FixtureExtractionEngine()
+        self.calls = 0
+        self.delay = delay
+
+    async def extract(self, document, doctype_skill):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return await self.inner.extract(document, doctype_skill)
+
+
+def _skill(version: str):
+    return SimpleNamespace(name="gov-id", metadata={"version": version})
+
+
+def test_cache_key_is_content_plus_skill_version():
+    """Same bytes + same skill version share a key; either changing makes a new one."""
+    photo = b"\x89PNG identical photo"
+    key = extraction_cache_key(photo, _skill("1.0"))
+
+    assert key == extraction_cache_key(bytearray(photo), _skill("1.0"))
+    assert key == extraction_cache_key(SimpleNamespace(content=photo), _skill("1.0"))
+    assert key != extraction_cache_key(photo, _skill("1.1"))
+    assert key != extraction_cache_key(photo + b"!", _skill("1.0"))
+    assert extraction_cache_key(object(), None) is None
+
+
+def test_unversioned_skill_is_keyed_by_its_folder_content(tmp_path):
+    """A skill without metadata.version re-keys when a file in its folder changes."""
+    folder = tmp_path / "gov-id"
+    (folder / "assets").mkdir(parents=True)
+    (folder / "SKILL.md").write_text(
+        "---\nname: gov-id\ndescription: Government ID\n"
+        "metadata:\n  bridge-kind: doctype\n---\n\nBody.\n"
+    )
+    (folder / "assets" / "schema.json").write_text('{"type": "object"}')
+    photo = b"\x89PNG identical photo"
+
+    skill = load_skill(folder)
+    key = extraction_cache_key(photo, skill)
+    assert key == extraction_cache_key(photo, skill)
+    assert key == extraction_cache_key(photo, load_skill(folder))
+
+    (folder / "assets" / "schema.json").write_text('{"type": "object", "required": ["dob"]}')
+    assert extraction_cache_key(photo, load_skill(folder)) != key
+
+
+@pytest.mark.anyio
+async def test_folder_digest_is_read_off_the_event_loop(tmp_path, monkeypatch):
+    """extract() digests an unversioned skill's folder in a worker thread, once."""
+    folder = tmp_path / "gov-id"
+    folder.mkdir()
+    (folder / "SKILL.md").write_text(
+        "---\nname: gov-id\ndescription: Government ID\n"
+        "metadata:\n  bridge-kind: doctype\n---\n\nBody.\n"
+    )
+    threads: list[threading.Thread] = []
+    digest = extraction_cache.skill_folder_digest
+
+    def spy(path):
+        threads.append(threading.current_thread())
+        return digest(path)
+
+    monkeypatch.setattr(extraction_cache, "skill_folder_digest", spy)
+    cache = CachingExtractionEngine(_CountingEngine())
+    skill = load_skill(folder)
+    doc = FixtureDocument(fixture_id="gov-id-clean")
+    await cache.extract(doc, skill)
+    await cache.extract(doc, skill)
+
+    assert len(threads) == 1 and threads[0] is not threading.current_thread()
+    assert cache.hits == 1
+
+
+@pytest.mark.anyio
+async def test_resent_document_hits_the_cache():
+    """run_fulfillment on a re-sent document does not call the engine again."""
+    engine = _CountingEngine()
+    cache = CachingExtractionEngine(engine)
+    assert isinstance(cache, ExtractionSeam)
+
+    first = await run_fulfillment(FixtureDocument(fixture_id="gov-id-clean"), engine=cache)
+    again = await run_fulfillment(FixtureDocument(fixture_id="gov-id-clean"), engine=cache)
+
+    assert again == first
+    assert engine.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    await cache.extract(FixtureDocument(fixture_id="gov-id-clean"), _skill("2.0"))
+    assert engine.calls == 2  # a new skill version re-extracts
+
+
+@pytest.mark.anyio
+async def test_failures_are_not_cached_and_uncacheable_documents_pass_through():
+    """An ExtractionError reaches the caller every time; bare objects bypass the cache."""
+    engine = _CountingEngine()
+    cache = CachingExtractionEngine(engine)
+    failing = FixtureDocument(fixture_id="gov-id-clean", fail=True)
+
+    for _ in range(2):
+        with pytest.raises(ExtractionError):
+            await cache.extract(failing, None)
+        result = await run_fulfillment(failing, engine=cache)
+        assert result.phase == Phase.EXTRACTION_ERROR
+    assert engine.calls == 4
+    assert len(cache) == 0
+
+    with pytest.raises(ExtractionError):
+        await cache.extract(object(), None)
+    assert cache.bypassed == 1
+
+
+@pytest.mark.anyio
+async def test_memory_tier_is_a_bounded_lru():
+    """The in-memory tier evicts the least recently used key past max_entries."""
+    engine = _CountingEngine()
+    cache = CachingExtractionEngine(engine, max_entries=2)
+    a, b, c = (
+        FixtureDocument(fixture_id=i)
+        for i in ("gov-id-clean", "bill-aquautil-blurry", "gov-id-expired")
+    )
+
+    await cache.extract(a, None)
+    await cache.extract(b, None)
+    await cache.extract(a, None)  # a is now the most recent
+    await cache.extract(c, None)  # evicts b
+    assert len(cache) == 2
+    await cache.extract(a, None)
+    await cache.extract(b, None)
+
+    assert engine.calls == 4  # a, b, c, then b again
+    assert (cache.hits, cache.misses) == (2, 4)
+    with pytest.raises(ValueError, match="max_entries"):
+        CachingExtractionEngine(engine, max_entries=0)
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicates_are_coalesced():
+    """Simultaneous uploads of one document run the engine once."""
+    engine = _CountingEngine(delay=0.01)
+    cache = CachingExtractionEngine(engine)
+    doc = FixtureDocument(fixture_id="gov-id-clean")
+
+    results = await asyncio.gather(*(cache.extract(doc, None) for _ in range(5)))
+
+    assert engine.calls == 1
+    assert all(r is results[0] for r in results)
+    assert (cache.hits, cache.misses) == (4, 1)
+
+    # A cancelled leader does not fail its waiters: one of them re-runs the engine.
+    other = FixtureDocument(fixture_id="gov-id-expired")
+    leader = asyncio.create_task(cache.extract(other, None))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.extract(other, None))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert (await waiter).fields.doctype == "gov-id"
+    assert engine.calls == 3
+
+
+@pytest.mark.anyio
+async def test_sqlite_tier_survives_a_restart(tmp_path):
+    """A fresh cache over the same SQLite file answers from the persistent tier."""
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'extractions.db'}"
+    doc = FixtureDocument(fixture_id="bill-powerco-clean")
+
+    store1 = DatabaseExtractionCache(create_async_engine(db_url))
+    assert isinstance(store1, ExtractionCacheStore)
+    engine1 = _CountingEngine()
+    first = await CachingExtractionEngine(engine1, store=store1).extract(doc, _skill("1.0"))
+    await store1.engine.dispose()
+
+    store2 = DatabaseExtractionCache(create_async_engine(db_url))
+    engine2 = _CountingEngine()
+    cache2 = CachingExtractionEngine(engine2, store=store2)
+    restored = await cache2.extract(doc, _skill("1.0"))
+    await cache2.extract(doc, _skill("1.0"))
+
+    assert restored == first
+    assert engine1.calls == 1 and engine2.calls == 0
+    assert (cache2.hits, cache2.store_hits, cache2.misses) == (2, 1, 0)
+    assert await store2.get("missing") is None
+    await store2.engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_a_failing_store_write_is_logged_and_the_extraction_returned(caplog):
+    class _BrokenStore:
+        async def get(self, key):
+            return None
+
+        async def put(self, key, extraction):
+            raise OSError("disk full")
+
+    engine = _CountingEngine()
+    cache = CachingExtractionEngine(engine, store=_BrokenStore())
+    doc = FixtureDocument(fixture_id="gov-id-clean")
+
+    with caplog.at_level("ERROR", logger="bridge.adapters.local.extraction_cache"):
+        extraction = await cache.extract(doc, _skill("1.0"))
+
+    assert extraction == await FixtureExtractionEngine().extract(doc, None)
+    assert cache.store_errors == 1
+    assert "write-through failed" in caplog.text
+    assert "disk full" in caplog.text
+    # The result is still remembered in memory.
+    assert await cache.extract(doc, _skill("1.0")) is extraction
+    assert (engine.calls, cache.hits) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_a_failing_store_read_is_a_logged_miss(caplog):
+    class _BrokenStore:
+        async def get(self, key):
+            raise OSError("database is locked")
+
+        async def put(self, key, extraction):
+            pass
+
+    engine = _CountingEngine()
+    cache = CachingExtractionEngine(engine, store=_BrokenStore())
+    doc = FixtureDocument(fixture_id="gov-id-clean")
+
+    with caplog.at_level("ERROR", logger="bridge.adapters.local.extraction_cache"):
+        extraction = await cache.extract(doc, _skill("1.0"))
+
+    assert extraction == await FixtureExtractionEngine().extract(doc, None)
+    assert (engine.calls, cache.misses, cache.store_errors) == (1, 1, 1)
+    assert "read failed" in caplog.text and "database is locked" in caplog.text
@@ -4,12 +4,16 @@ Verify the FixtureExtractionEngine deterministically extracts from eval fixtures
 handles inline extractions, and raises ExtractionError on unknown/fail.
 """
 
+import json
+
 import pytest
 from contract import Extraction
 
 from bridge.adapters.local.extraction import (
     FixtureDocument,
     FixtureExtractionEngine,
+    default_fixture_corpora,
+    load_fixture_index,
     resolve_extraction_engine,
 )
 from bridge.seams.extraction import ExtractionError
@@ -118,3 +122,104 @@ def test_resolve_extraction_engine_docai_raises():
     """Verify docai mode raises NotImplementedError."""
     with pytest.raises(NotImplementedError, match="Document AI extraction engine is Phase 4"):
         resolve_extraction_engine(mode="docai")
+
+
+# --- Indexed, multi-corpus store ---
+
+
+def _corpus(path, use_case, *ids, extraction=True):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = {"doctype": f"{use_case}-doc"}
+    documents = [
+        {"id": i, "extraction": {"fields": fields, "legible": True} if extraction else None}
+        for i in ids
+    ]
+    path.write_text(json.dumps({"use_case": use_case, "documents": documents}))
+    return path
+
+
+@pytest.mark.anyio
+async def test_engine_indexes_every_corpus_once(tmp_path, monkeypatch):
+    """Fixtures of several corpora are validated once and looked up by id."""
+    address = _corpus(tmp_path / "address" / "expected.json", "address", "a-1", "a-2")
+    benefits = _corpus(tmp_path / "benefits" / "expected.json", "benefits", "b-1")
+    empty = _corpus(tmp_path / "rfp" / "expected.json", "rfp", "r-1", extraction=False)
+    validations = []
+    real_validate = Extraction.model_validate
+    monkeypatch.setattr(
+        Extraction, "model_validate", lambda data: validations.append(1) or real_validate(data)
+    )
+
+    engine = FixtureExtractionEngine(corpora=[address, benefits, empty])
+    assert engine.index.ids("benefits") == ("b-1",)
+    assert engine.index.ids() == ("a-1", "a-2", "b-1", "r-1")
+    first = await engine.extract(FixtureDocument(fixture_id="b-1"), None)
+    assert first.fields.doctype == "benefits-doc"
+    for _ in range(10):
+        assert (
+            await FixtureExtractionEngine(corpora=[address, benefits, empty]).extract(
+                FixtureDocument(fixture_id="b-1"), None
+            )
+            is first
+        )
+    assert len(validations) == 3  # once per fixture with an extraction, at index time
+    with pytest.raises(ExtractionError, match="has no extraction data"):
+        await engine.extract(FixtureDocument(fixture_id="r-1"), None)
+
+
+@pytest.mark.anyio
+async def test_a_fixture_id_in_two_corpora_fails_only_that_id(tmp_path):
+    """The clash is reported on the later corpus; every other fixture still extracts."""
+    first = _corpus(tmp_path / "one" / "expected.json", "one", "dup", "one-1")
+    second = _corpus(tmp_path / "two" / "expected.json", "two", "two-1", "dup")
+
+    index = load_fixture_index((first, second))
+    assert index.errors == {str(second): f"Duplicate fixture id 'dup' (also in {first})"}
+    assert index.duplicates == {"dup": (str(first), str(second))}
+    assert index.ids() == ("one-1", "two-1")
+
+    engine = FixtureExtractionEngine(corpora=[first, second])
+    for fixture_id, doctype in (("one-1", "one-doc"), ("two-1", "two-doc")):
+        extraction = await engine.extract(FixtureDocument(fixture_id=fixture_id), None)
+        assert extraction.fields.doctype == doctype
+    with pytest.raises(ExtractionError, match="'dup' is defined in several corpora"):
+        await engine.extract(FixtureDocument(fixture_id="dup"), None)
+
+
+@pytest.mark.anyio
+async def test_a_broken_corpus_is_scoped_to_its_own_use_case(tmp_path):
+    """An invalid or unreadable corpus is reported, and the others still extract."""
+    address = _corpus(tmp_path / "address" / "expected.json", "address", "a-1")
+    rfp = tmp_path / "rfp" / "expected.json"
+    rfp.parent.mkdir()
+    rfp.write_text(json.dumps({"documents": [{"id": "r-1", "extraction": {"legible": 1}}]}))
+    missing = tmp_path / "benefits" / "expected.json"
+
+    engine = FixtureExtractionEngine(corpora=[address, rfp, missing])
+    assert (await engine.extract(FixtureDocument(fixture_id="a-1"), None)).fields
+    assert set(engine.index.errors) == {str(rfp), str(missing)}
+    assert "fields" in engine.index.errors[str(rfp)]
+    with pytest.raises(ExtractionError, match="corpora not loaded"):
+        await engine.extract(FixtureDocument(fixture_id="r-1"), None)
+
+    _corpus(rfp, "rfp", "r-1")  # fixed in place: picked up without a restart
+    assert (await engine.extract(FixtureDocument(fixture_id="r-1"), None)).fields.doctype == (
+        "rfp-doc"
+    )
+    assert engine.index.errors.keys() == {str(missing)}
+
+
+def test_an_edited_corpus_is_revalidated_by_stat(tmp_path):
+    """The index is reused while the files are unchanged and rebuilt once one moves."""
+    path = _corpus(tmp_path / "address" / "expected.json", "address", "a-1")
+    first = load_fixture_index((path,))
+    assert load_fixture_index((path,)) is first
+
+    _corpus(path, "address", "a-1", "a-2")
+    assert load_fixture_index((path,)).ids() == ("a-1", "a-2")
+
+
+def test_default_corpora_cover_every_use_case():
+    """The default engine serves address first, then every other eval corpus."""
+    corpora = default_fixture_corpora()
+    assert [p.parent.name for p in corpora] == ["address", "benefits", "rfp"]
@@ -0,0 +1,243 @@
+"""Extraction router tests: deadline, hedging, fallback, circuit breaker (ADR-0005).
+
+Driven by a delay-injecting stub engine over the fixture engine, so the tail-latency
+behavior is exercised locally with real (small) sleeps.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from bridge.adapters.local.extraction import FixtureDocument, FixtureExtractionEngine
+from bridge.adapters.local.extraction_router import ExtractionRouter
+from bridge.fulfillment import Phase, run_fulfillment
+from bridge.seams.extraction import ExtractionError, ExtractionSeam
+
+DOC = FixtureDocument(fixture_id="gov-id-clean")
+
+
+class _StubEngine:
+    """Fixture engine behind an injectable delay and failure mode."""
+
+    def __init__(
+        self,
+        delay: float = 0.0,
+        fault: Exception | None = None,
+        gate: asyncio.Event | None = None,
+    ):
+        self.inner = FixtureExtractionEngine()
+        self.delay = delay
+        self.fault = fault
+        self.gate = gate
+        self.calls = 0
+        self.cancelled = 0
+        self.parked = False
+
+    async def extract(self, document, doctype_skill):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fault is None:
+                extraction = await self.inner.extract(document, doctype_skill)
+            if self.gate is not None:  # released together, gated calls finish together
+                self.parked = True
+                await self.gate.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fault is not None:
+            raise self.fault
+        return extraction
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.anyio
+async def test_fast_primary_is_not_hedged():
+    """A primary answering inside its hedge delay is the only engine called."""
+    primary, secondary = _StubEngine(), _StubEngine()
+    router = ExtractionRouter([primary, secondary], hedge_after=0.5)
+    assert isinstance(router, ExtractionSeam)
+
+    extraction = await router.extract(DOC, None)
+
+    assert extraction.fields.doctype == "gov-id"
+    assert (primary.calls, secondary.calls, router.hedges) == (1, 0, 0)
+
+
+@pytest.mark.anyio
+async def test_slow_primary_is_hedged_and_the_first_good_result_wins():
+    """Past the hedge delay the secondary is called too; the loser is cancelled."""
+    primary, secondary = _StubEngine(delay=5.0), _StubEngine(delay=0.01)
+    router = ExtractionRouter([primary, secondary], hedge_after=0.02)
+
+    started = time.perf_counter()
+    extraction = await router.extract(DOC, None)
+
+    assert time.perf_counter() - started < 1.0
+    assert extraction.fields.doctype == "gov-id"
+    assert router.hedges == 1
+    assert (secondary.calls, primary.cancelled) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_hedge_delay_tracks_the_engines_p95():
+    """After min_samples calls the hedge delay is the observed p95, not hedge_after."""
+    primary = _StubEngine(delay=0.005)
+    router = ExtractionRouter([primary, _StubEngine()], hedge_after=9.0, min_samples=5)
+    assert router.hedge_delay(primary) == 9.0
+
+    for _ in range(5):
+        await router.extract(DOC, None)
+
+    delay = router.hedge_delay(primary)
+    assert 0.005 <= delay < 1.0
+    with pytest.raises(ValueError, match="not routed"):
+        router.hedge_delay(_StubEngine())
+
+
+@pytest.mark.anyio
+async def test_deadline_bounds_a_hung_engine():
+    """Overrunning the deadline cancels the call and surfaces as ExtractionError."""
+    engine = _StubEngine(delay=5.0)
+    router = ExtractionRouter([engine], deadline=0.05)
+
+    with pytest.raises(ExtractionError, match="deadline"):
+        await router.extract(DOC, None)
+    result = await run_fulfillment(DOC, engine=router)
+
+    assert result.phase == Phase.EXTRACTION_ERROR
+    assert router.timeouts == 2
+    assert engine.cancelled == 2
+
+
+@pytest.mark.anyio
+async def test_faulted_engine_falls_back_to_the_next():
+    """A fault hands the document on at once; all faulting raises ExtractionError."""
+    primary = _StubEngine(fault=RuntimeError("503"))
+    router = ExtractionRouter([primary, _StubEngine()])
+    assert (await router.extract(DOC, None)).fields.doctype == "gov-id"
+    assert router.fallbacks == 1
+
+    router = ExtractionRouter([primary, _StubEngine(fault=RuntimeError("also 503"))])
+    with pytest.raises(ExtractionError, match="every extraction engine failed") as info:
+        await router.extract(DOC, None)
+    assert isinstance(info.value.__cause__, RuntimeError)
+    assert "also 503" in str(info.value)
+
+
+@pytest.mark.anyio
+async def test_extraction_error_is_final_and_does_not_open_the_circuit():
+    """An engine's verdict on the document is raised at once and is not a fault."""
+    primary, secondary = _StubEngine(fault=ExtractionError("illegible")), _StubEngine()
+    router = ExtractionRouter([primary, secondary], failure_threshold=2, clock=_Clock())
+
+    for _ in range(3):
+        with pytest.raises(ExtractionError, match="illegible"):
+            await router.extract(DOC, None)
+
+    assert (primary.calls, secondary.calls, router.fallbacks) == (3, 0, 0)
+    assert not router.is_open(primary)
+
+
+@pytest.mark.anyio
+async def test_a_success_finishing_with_a_failure_wins():
+    """When a failure and a success complete together, the success is returned."""
+    gate = asyncio.Event()
+    primary = _StubEngine(fault=ExtractionError("illegible"), gate=gate)
+    secondary, third = _StubEngine(gate=gate), _StubEngine()
+    router = ExtractionRouter([primary, secondary, third], hedge_after=0.01)
+
+    call = asyncio.create_task(router.extract(DOC, None))
+    while not (primary.parked and secondary.parked):
+        await asyncio.sleep(0)
+    gate.set()
+
+    assert (await call).fields.doctype == "gov-id"
+    assert (router.hedges, router.fallbacks, third.calls) == (1, 0, 0)
+
+
+@pytest.mark.anyio
+async def test_a_hedged_refusal_waits_for_the_primary():
+    """A verdict from the hedge does not cancel a primary still running: its good result
+    wins, and when it faults instead the held verdict is raised."""
+    primary, secondary = _StubEngine(delay=0.1), _StubEngine(fault=ExtractionError("illegible"))
+    router = ExtractionRouter([primary, secondary, _StubEngine()], hedge_after=0.01)
+
+    assert (await router.extract(DOC, None)).fields.doctype == "gov-id"
+    assert (primary.cancelled, router.hedges, router.fallbacks) == (0, 1, 0)
+
+    primary.fault = RuntimeError("503")
+    with pytest.raises(ExtractionError, match="illegible"):
+        await router.extract(DOC, None)
+    assert router.fallbacks == 0
+
+
+@pytest.mark.anyio
+async def test_a_cancelled_hedge_loser_counts_toward_the_p95():
+    """The loser's elapsed time is kept as a lower-bound sample, not dropped."""
+    primary, secondary = _StubEngine(delay=5.0), _StubEngine(delay=0.1)
+    router = ExtractionRouter([primary, secondary], hedge_after=0.01, min_samples=1)
+
+    await router.extract(DOC, None)
+
+    assert primary.cancelled == 1
+    assert 0.1 <= router.hedge_delay(primary) < 1.0
+
+
+@pytest.mark.anyio
+async def test_circuit_opens_skips_the_engine_then_probes_it():
+    """Consecutive failures open the circuit; after reset_after one probe closes it."""
+    clock = _Clock()
+    primary, secondary = _StubEngine(fault=RuntimeError("down")), _StubEngine()
+    router = ExtractionRouter(
+        [primary, secondary], failure_threshold=2, reset_after=30.0, clock=clock
+    )
+
+    for _ in range(2):
+        await router.extract(DOC, None)
+    assert router.is_open(primary)
+    await router.extract(DOC, None)
+    assert primary.calls == 2  # skipped while open
+
+    clock.now = 31.0
+    primary.fault = None
+    await router.extract(DOC, None)
+    assert primary.calls == 3  # the probe
+    assert not router.is_open(primary)
+    assert secondary.calls == 3
+
+
+@pytest.mark.anyio
+async def test_every_circuit_open_fails_fast():
+    """With no engine available the router raises without calling anything."""
+    engine = _StubEngine(fault=RuntimeError("down"))
+    router = ExtractionRouter([engine], failure_threshold=1, clock=_Clock())
+
+    with pytest.raises(ExtractionError):
+        await router.extract(DOC, None)
+    with pytest.raises(ExtractionError, match="every circuit is open"):
+        await router.extract(DOC, None)
+    assert engine.calls == 1
+
+
+def test_router_rejects_bad_configuration():
+    """No engines, or an out-of-range bound, is refused up front."""
+    engine = _StubEngine()
+    with pytest.raises(ValueError, match="at least one engine"):
+        ExtractionRouter([])
+    with pytest.raises(ValueError, match="deadline"):
+        ExtractionRouter([engine], deadline=0)
+    with pytest.raises(ValueError, match="hedge_quantile"):
+        ExtractionRouter([engine], hedge_quantile=1.5)
+    with pytest.raises(ValueError, match="min_samples"):
+        ExtractionRouter([engine], min_samples=10, latency_window=5)
+    with pytest.raises(ValueError, match="failure_threshold"):
+        ExtractionRouter([engine], failure_threshold=0)
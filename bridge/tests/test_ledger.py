@@ -6,10 +6,21 @@ Pure unit tests (no fixtures, no async — direct construction). Build test task
 ``wiki/evals/...`` and do not import ``agents``).
 """
 
+import os
+import timeit
+
+import pytest
 from contract import CollectionStatus, Disposition, ExtractedFields, Extraction, LedgerEntry
 
 from bridge.aggregate import create_leg_task, ordinal_of
-from bridge.ledger import build_exchange_turn, ledger_entry_of, stamp_ledger_entry
+from bridge.ledger import (
+    LEDGER_CARRY_ENV,
+    LEDGER_ENTRY_KEY,
+    LedgerEntryCache,
+    build_exchange_turn,
+    ledger_entry_of,
+    stamp_ledger_entry,
+)
 
 
 def test_round_trip():
@@ -222,3 +233,297 @@ def test_shape_parity():
     # Verify ledger entries have the expected structure
     assert len(dumped["status"]["ledger"]) == 1
     assert dumped["status"]["ledger"][0]["id"] == "doc-1"
+
+
+# --- Parsed-entry cache ---
+
+
+def _gov_id_entry(doc_id: str, disposition: Disposition = Disposition.ACCEPTED) -> LedgerEntry:
+    return LedgerEntry(
+        id=doc_id,
+        doctype="gov-id",
+        disposition=disposition,
+        extraction=Extraction(fields=ExtractedFields(doctype="gov-id")),
+    )
+
+
+def test_cache_serves_unchanged_entry_without_reparse():
+    """A second read of an unchanged leg is a hit and returns an equal entry."""
+    cache = LedgerEntryCache()
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="task-1")
+    stamp_ledger_entry(task, _gov_id_entry("doc-1"))
+
+    first = ledger_entry_of(task, cache=cache)
+    second = ledger_entry_of(task, cache=cache)
+
+    assert first == second == ledger_entry_of(task)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_cache_reparses_restamped_entry():
+    """Re-stamping a leg changes the metadata digest, so the new entry is parsed."""
+    cache = LedgerEntryCache()
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="task-1")
+    stamp_ledger_entry(task, _gov_id_entry("doc-1", Disposition.PENDING))
+    assert ledger_entry_of(task, cache=cache).disposition == Disposition.PENDING
+
+    stamp_ledger_entry(task, _gov_id_entry("doc-1", Disposition.ACCEPTED))
+    assert ledger_entry_of(task, cache=cache).disposition == Disposition.ACCEPTED
+    assert cache.misses == 2
+
+
+def test_cache_unstamped_task_is_none():
+    """An unstamped leg reads as None and never touches the cache."""
+    cache = LedgerEntryCache()
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="task-1")
+    assert ledger_entry_of(task, cache=cache) is None
+    assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+
+
+def test_cache_is_bounded_lru():
+    """The cache never holds more than maxsize entries; the least-recent is evicted."""
+    cache = LedgerEntryCache(maxsize=2)
+    tasks = []
+    for i in range(3):
+        task = create_leg_task(context_id="ctx-1", ordinal=i, task_id=f"task-{i}")
+        stamp_ledger_entry(task, _gov_id_entry(f"doc-{i}"))
+        tasks.append(task)
+
+    ledger_entry_of(tasks[0], cache=cache)
+    ledger_entry_of(tasks[1], cache=cache)
+    ledger_entry_of(tasks[0], cache=cache)  # task-0 is now most recent
+    ledger_entry_of(tasks[2], cache=cache)  # evicts task-1
+    assert len(cache) == 2
+
+    misses = cache.misses
+    ledger_entry_of(tasks[0], cache=cache)
+    assert cache.misses == misses  # still cached
+    ledger_entry_of(tasks[1], cache=cache)
+    assert cache.misses == misses + 1  # evicted → re-parsed
+
+
+def test_cache_rejects_non_positive_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        LedgerEntryCache(maxsize=0)
+
+
+def test_cached_projection_matches_uncached():
+    """The cache is a memo: the projected turn is identical with or without it."""
+    ctx = "ctx-1"
+    tasks = []
+    for i in range(5):
+        task = create_leg_task(context_id=ctx, ordinal=i, task_id=f"task-{i}")
+        if i != 2:  # leave one in-flight leg unstamped
+            stamp_ledger_entry(task, _gov_id_entry(f"doc-{i}"))
+        tasks.append(task)
+
+    cache = LedgerEntryCache()
+    cached = build_exchange_turn(ctx, list(reversed(tasks)), terminal=True, cache=cache)
+    plain = build_exchange_turn(ctx, list(reversed(tasks)), terminal=True)
+    assert cached.model_dump_json() == plain.model_dump_json()
+
+
+def test_benchmark_per_round_parse_cost_stays_flat():
+    """Benchmark: a growing exchange parses only the round's new leg, whatever its size.
+
+    Simulates 64 collect rounds, each appending one leg and re-projecting the whole
+    exchange twice (as the edge does). Without the cache the parse count per round
+    grows linearly with the exchange; with it the count is the number of new legs.
+    """
+    ctx = "ctx-bench"
+    cache = LedgerEntryCache()
+    legs = []
+    per_round = []
+    for i in range(64):
+        leg = create_leg_task(context_id=ctx, ordinal=i, task_id=f"task-{i}")
+        stamp_ledger_entry(leg, _gov_id_entry(f"doc-{i}"))
+        legs.append(leg)
+
+        before = cache.misses
+        build_exchange_turn(ctx, legs, cache=cache)
+        turn = build_exchange_turn(ctx, legs, terminal=True, cache=cache)
+        per_round.append(cache.misses - before)
+        assert len(turn.status.ledger) == i + 1
+
+    assert per_round == [1] * 64
+
+
+# --------------------------------------------------------------------------- #
+# Packed carry format (v1) + pre-v1 JSON read fallback
+# --------------------------------------------------------------------------- #
+
+
+def _bill_entry(i: int) -> LedgerEntry:
+    return LedgerEntry(
+        id=f"bill-{i}",
+        doctype="utility-bill",
+        issuer="power-co",
+        disposition=Disposition.REJECTED,
+        extraction=Extraction(
+            fields=ExtractedFields(
+                doctype="utility-bill",
+                issuer="power-co",
+                key_fields={"name": "Jordan Lee", "address": "12 Elm St", "date": "2026-08-01"},
+            ),
+            overall_confidence=0.41,
+            field_confidence={"name": 0.97, "address": 0.38},
+            legible=True,
+            flagged_fields=["address"],
+        ),
+        reason_code="address-mismatch",
+        message="The address on the bill does not match the one on file.",
+    )
+
+
+def test_packed_carry_round_trips_every_field():
+    """The v1 carry is a version-tagged positional array that round-trips exactly."""
+    for entry in (_bill_entry(1), _gov_id_entry("doc-min")):
+        task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="t")
+        stamp_ledger_entry(task, entry, packed=True)
+        assert task.metadata[LEDGER_ENTRY_KEY].startswith("[1,")
+        assert ledger_entry_of(task).model_dump_json() == entry.model_dump_json()
+        assert ledger_entry_of(task) == entry
+        keyed = LedgerEntry.model_validate_json(entry.model_dump_json())
+        assert ledger_entry_of(task).model_dump(exclude_unset=True) == keyed.model_dump(
+            exclude_unset=True
+        )
+
+
+def test_packed_carry_is_written_only_behind_the_flag(monkeypatch):
+    """Stamps stay keyed JSON (readable by pre-v1 workers) until the flag is set."""
+    entry = _bill_entry(4)
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="t")
+    monkeypatch.delenv(LEDGER_CARRY_ENV, raising=False)
+    stamp_ledger_entry(task, entry)
+    assert task.metadata[LEDGER_ENTRY_KEY] == entry.model_dump_json()
+
+    monkeypatch.setenv(LEDGER_CARRY_ENV, "1")
+    stamp_ledger_entry(task, entry)
+    assert task.metadata[LEDGER_ENTRY_KEY].startswith("[1,")
+    stamp_ledger_entry(task, entry, packed=False)
+    assert task.metadata[LEDGER_ENTRY_KEY].startswith("{")
+    assert ledger_entry_of(task) == entry
+
+
+def test_packed_carry_values_are_validated():
+    """The fast v1 read still type-checks every position against the contract."""
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="bad")
+    stamp_ledger_entry(task, _bill_entry(5), packed=True)
+    task.metadata[LEDGER_ENTRY_KEY] = task.metadata[LEDGER_ENTRY_KEY].replace(
+        '"rejected"', '"lost"'
+    )
+    with pytest.raises(ValueError, match="disposition|enum"):
+        ledger_entry_of(task)
+
+
+def test_packed_carry_covers_the_contract_fields():
+    """Guard: a new contract field must be added to the packed carry (as a v2)."""
+    assert list(LedgerEntry.model_fields) == [
+        "id",
+        "doctype",
+        "issuer",
+        "disposition",
+        "extraction",
+        "reason_code",
+        "message",
+    ]
+    assert list(Extraction.model_fields) == [
+        "fields",
+        "overall_confidence",
+        "field_confidence",
+        "legible",
+        "flagged_fields",
+    ]
+    assert list(ExtractedFields.model_fields) == ["doctype", "issuer", "key_fields"]
+
+
+def test_pre_v1_json_carry_reads_transparently():
+    """Tasks stamped with the entry's keyed JSON (pre-v1) still read, cached or not."""
+    entry = _bill_entry(2)
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="legacy")
+    task.metadata[LEDGER_ENTRY_KEY] = entry.model_dump_json()
+    assert ledger_entry_of(task) == entry
+    assert LedgerEntryCache().entry_of(task) == entry
+
+
+def test_unknown_carry_version_is_rejected():
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="future")
+    stamp_ledger_entry(task, _bill_entry(3), packed=True)
+    task.metadata[LEDGER_ENTRY_KEY] = "[2," + task.metadata[LEDGER_ENTRY_KEY][3:]
+    with pytest.raises(ValueError, match="carry version 2"):
+        ledger_entry_of(task)
+
+
+def test_packed_carry_of_the_wrong_shape_is_rejected():
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="short")
+    stamp_ledger_entry(task, _bill_entry(3), packed=True)
+    task.metadata[LEDGER_ENTRY_KEY] = task.metadata[LEDGER_ENTRY_KEY][:-1] + ',"extra"]'
+    with pytest.raises(ValueError, match="holds 13 values, got 14"):
+        ledger_entry_of(task)
+
+
+@pytest.mark.parametrize("raw", ["42", '"entry"', "null", "[]", '["1"]', "not json"])
+def test_malformed_carry_is_a_value_error(raw):
+    """A carry that is not a keyed object or a versioned array fails as ValueError."""
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="garbled")
+    task.metadata[LEDGER_ENTRY_KEY] = raw
+    with pytest.raises(ValueError):
+        ledger_entry_of(task)
+    with pytest.raises(ValueError):
+        LedgerEntryCache().entry_of(task)
+
+
+def _carry_rows() -> tuple[list[LedgerEntry], list[str], list[str]]:
+    """A hundred bill / gov-id entries and their packed and keyed carries."""
+    entries = [_bill_entry(i) for i in range(50)] + [_gov_id_entry(f"g-{i}") for i in range(50)]
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="t")
+    packed_rows, keyed_rows = [], []
+    for entry in entries:
+        stamp_ledger_entry(task, entry, packed=True)
+        packed_rows.append(task.metadata[LEDGER_ENTRY_KEY])
+        stamp_ledger_entry(task, entry, packed=False)
+        keyed_rows.append(task.metadata[LEDGER_ENTRY_KEY])
+    return entries, packed_rows, keyed_rows
+
+
+def test_benchmark_packed_carry_bytes_per_entry():
+    """Benchmark: bytes per entry, packed v1 vs the keyed JSON carry."""
+    _, packed_rows, keyed_rows = _carry_rows()
+    packed = sum(len(row.encode()) for row in packed_rows)
+    keyed = sum(len(row.encode()) for row in keyed_rows)
+    assert packed / keyed < 0.65  # key names dominate the keyed JSON
+
+
+@pytest.mark.skipif(os.environ.get("BRIDGE_BENCH") != "1", reason="benchmark: set BRIDGE_BENCH=1")
+def test_benchmark_packed_carry_throughput():
+    """Benchmark: stamp and cold-read time per entry, packed v1 vs the keyed carry.
+
+    Reports the best of five runs (``pytest -s``) without asserting on it. Measured
+    locally the packed stamp is ~10% faster and a cold read ~1.5x the keyed read: the
+    array is re-keyed in Python and validated by ``LedgerEntry`` from Python objects.
+    Reads go through LedgerEntryCache / ExchangeAccumulator, so a leg is parsed once
+    per process, while every durable row shrinks.
+    """
+    entries, packed_rows, keyed_rows = _carry_rows()
+    task = create_leg_task(context_id="ctx-1", ordinal=0, task_id="t")
+
+    def best(run) -> float:
+        return min(timeit.repeat(run, number=20, repeat=5))
+
+    def stamp(packed: bool):
+        return lambda: [stamp_ledger_entry(task, e, packed=packed) for e in entries]
+
+    def read(rows):
+        def run():
+            for row in rows:
+                task.metadata[LEDGER_ENTRY_KEY] = row
+                ledger_entry_of(task)
+
+        return run
+
+    timings = {
+        "stamp": (best(stamp(True)), best(stamp(False))),
+        "read": (best(read(packed_rows)), best(read(keyed_rows))),
+    }
+    for name, (packed, keyed) in timings.items():
+        print(f"{name}: packed {packed:.4f}s, keyed {keyed:.4f}s ({packed / keyed:.2f}x)")
@@ -0,0 +1,283 @@
+"""Streaming exchange view + ledger projection over a paged task store.
+
+``iter_exchange_legs`` → ``iter_ledger`` must produce exactly what the materialized
+fold (``build_exchange_view`` → ``project_collection_status``) produces — byte-identical
+JSON once assembled — while an ordinal-listing store is read one page at a time.
+Covered against both the SDK ``InMemoryTaskStore`` (whole-context fallback) and
+the durable ``SequencedTaskStore`` (keyset paging).
+"""
+
+import random
+
+import pytest
+from a2a.server.context import ServerCallContext
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Task
+from contract import CollectionStatus, Disposition, ExtractedFields, Extraction, LedgerEntry
+
+from bridge.adapters.local import build_local_adapter
+from bridge.adapters.local.exchange_store import LocalExchangeStore
+from bridge.aggregate import (
+    build_exchange_view,
+    create_leg_task,
+    iter_exchange_legs,
+    ordinal_of,
+    tasks_for_context,
+)
+from bridge.edges.a2a.state import rehydrate_context, stamp_request_state
+from bridge.exchange import (
+    discard_snapshot,
+    load_snapshot,
+    save_snapshot,
+    snapshot_is_current,
+)
+from bridge.ledger import iter_ledger, project_collection_status, stamp_ledger_entry
+from bridge.seams import Seam
+
+CONTEXT = "ctx-rfp"
+LEGS = 250
+
+
+def _entry(i: int) -> LedgerEntry:
+    return LedgerEntry(
+        id=f"doc-{i}",
+        doctype="utility-bill",
+        disposition=Disposition.ACCEPTED if i % 3 else Disposition.REJECTED,
+        issuer=f"supplier-{i % 7}",
+        extraction=Extraction(fields=ExtractedFields(doctype="utility-bill")),
+    )
+
+
+async def _fill(store) -> None:
+    """Save LEGS stamped legs (shuffled), one unstamped leg and noise in another context."""
+    call_context = ServerCallContext()
+    ordinals = list(range(LEGS))
+    random.Random(7).shuffle(ordinals)
+    for ordinal in ordinals:
+        leg = create_leg_task(context_id=CONTEXT, ordinal=ordinal, task_id=f"leg-{ordinal:04d}")
+        stamp_ledger_entry(leg, _entry(ordinal))
+        await store.save(leg, call_context)
+    in_flight = create_leg_task(context_id=CONTEXT, ordinal=LEGS, task_id="leg-in-flight")
+    await store.save(in_flight, call_context)
+    other = create_leg_task(context_id="ctx-other", ordinal=0, task_id="other")
+    stamp_ledger_entry(other, _entry(999))
+    await store.save(other, call_context)
+
+
+async def _streamed(store, *, outstanding=(), terminal=False) -> str:
+    legs = iter_exchange_legs(store, CONTEXT, call_context=ServerCallContext(), page_size=32)
+    ledger = [entry async for entry in iter_ledger(legs)]
+    status = CollectionStatus(ledger=ledger, outstanding=list(outstanding), terminal=terminal)
+    return status.model_dump_json()
+
+
+async def _materialized(store, **kwargs) -> str:
+    tasks = await tasks_for_context(store, CONTEXT, call_context=ServerCallContext())
+    status = project_collection_status(build_exchange_view(CONTEXT, tasks), **kwargs)
+    return status.model_dump_json()
+
+
+@pytest.fixture
+async def sequenced_store(tmp_path):
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    yield store
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+@pytest.mark.parametrize("terminal", [False, True])
+async def test_stream_matches_materialized_status_in_memory(terminal):
+    """Fallback path (SDK store, last-updated listing): byte-identical JSON."""
+    store = InMemoryTaskStore()
+    await _fill(store)
+    kwargs = {"outstanding": ["utility-bill"], "terminal": terminal}
+    assert await _streamed(store, **kwargs) == await _materialized(store, **kwargs)
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_stream_matches_materialized_status_sequenced(sequenced_store):
+    """Keyset-paged path: byte-identical JSON, empty outstanding included."""
+    await _fill(sequenced_store)
+    assert await _streamed(sequenced_store) == await _materialized(sequenced_store)
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_iter_exchange_legs_reads_one_page_at_a_time(sequenced_store):
+    """The ordinal-listing store is paged with a keyset cursor; no page exceeds page_size."""
+    await _fill(sequenced_store)
+    pages: list[int] = []
+    list_legs = sequenced_store.list_legs
+
+    async def spy(*args, **kwargs):
+        page = await list_legs(*args, **kwargs)
+        pages.append(len(page))
+        return page
+
+    sequenced_store.list_legs = spy
+    legs = iter_exchange_legs(
+        sequenced_store, CONTEXT, call_context=ServerCallContext(), page_size=32
+    )
+    ordinals = [ordinal_of(leg) async for leg in legs]
+
+    assert ordinals == list(range(LEGS + 1))  # the unstamped-entry leg still has an ordinal
+    assert max(pages) == 32 and len(pages) == (LEGS + 1) // 32 + 1
+
+
+@pytest.mark.anyio
+async def test_stream_of_empty_exchange():
+    """No legs → the empty status, still byte-identical."""
+    store = InMemoryTaskStore()
+    assert await _streamed(store) == await _materialized(store)
+
+
+async def _append(store, first: int, count: int) -> None:
+    """Append ``count`` stamped legs through save_legs (ordinals from the sequence)."""
+    legs = []
+    for i in range(first, first + count):
+        leg = create_leg_task(context_id=CONTEXT, ordinal=-1, task_id=f"leg-{i:04d}")
+        stamp_ledger_entry(leg, _entry(i))
+        legs.append(leg)
+    await store.save_legs(legs, ServerCallContext())
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_rehydrate_from_snapshot_reads_only_newer_legs(sequenced_store):
+    """A snapshot through ordinal 199 → only the 50 newer legs are listed; the turn is the
+    full refold's. Discarding the snapshot refolds everything to the same turn."""
+    exchanges = LocalExchangeStore()
+    call_context = ServerCallContext()
+    request = Task(id="req", context_id=CONTEXT)
+    stamp_request_state(request, party="acme", skill="address-proof", round_index=3)
+
+    await _append(sequenced_store, 0, 200)
+    snapshot = await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+    assert (snapshot.legs, snapshot.through_ordinal) == (200, 199)
+    await _append(sequenced_store, 200, 50)
+    full = await rehydrate_context(
+        sequenced_store, CONTEXT, call_context=call_context, request_task=request
+    )
+
+    listed: list[int] = []
+    list_legs = sequenced_store.list_legs
+
+    async def spy(*args, **kwargs):
+        page = await list_legs(*args, **kwargs)
+        listed.extend(ordinal_of(leg) for leg in page)
+        return page
+
+    sequenced_store.list_legs = spy
+    snapshot = await load_snapshot(exchanges, CONTEXT)
+    state = await rehydrate_context(
+        sequenced_store, CONTEXT, call_context=call_context, snapshot=snapshot, request_task=request
+    )
+
+    assert listed == list(range(200, 250))
+    assert (state.party, state.rounds, state.snapshot_legs) == ("acme", 4, 200)
+    assert len(state.exchange) == len(full.exchange) == 250
+    assert state.exchange.turn().model_dump_json() == full.exchange.turn().model_dump_json()
+
+    await discard_snapshot(exchanges, CONTEXT)
+    assert await load_snapshot(exchanges, CONTEXT) is None
+    assert (await exchanges.get(CONTEXT)).materialized  # the record itself stays
+    refolded = await rehydrate_context(
+        sequenced_store, CONTEXT, call_context=call_context, request_task=request
+    )
+    assert refolded.exchange.turn().model_dump_json() == full.exchange.turn().model_dump_json()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_a_restamped_leg_makes_the_snapshot_stale(sequenced_store):
+    """Re-saving a folded leg bumps the store's revision: the rebuild refolds in full."""
+    exchanges, call_context = LocalExchangeStore(), ServerCallContext()
+    await _append(sequenced_store, 0, 10)
+    snapshot = await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+
+    leg = await sequenced_store.get("leg-0003", call_context)
+    stamp_ledger_entry(leg, _entry(3).model_copy(update={"issuer": "restamped"}))
+    await sequenced_store.save(leg, call_context)
+    state = await rehydrate_context(
+        sequenced_store, CONTEXT, call_context=call_context, snapshot=snapshot
+    )
+
+    assert state.snapshot_legs == 0
+    assert state.exchange.ledger[3].issuer == "restamped"
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_a_lower_ordinal_leg_written_later_makes_the_snapshot_stale():
+    """A leg landing below the snapshot's ordinal after it was taken (another worker's)
+    fails the digest check against a plain TaskStore: the rebuild keeps that leg."""
+    store, exchanges, call_context = InMemoryTaskStore(), LocalExchangeStore(), ServerCallContext()
+    for ordinal in (0, 2):
+        leg = create_leg_task(context_id=CONTEXT, ordinal=ordinal, task_id=f"leg-{ordinal}")
+        stamp_ledger_entry(leg, _entry(ordinal))
+        await store.save(leg, call_context)
+    snapshot = await save_snapshot(exchanges, store, CONTEXT, call_context=call_context)
+    assert await snapshot_is_current(store, snapshot, call_context=call_context)
+
+    late = create_leg_task(context_id=CONTEXT, ordinal=1, task_id="leg-1")
+    stamp_ledger_entry(late, _entry(1))
+    await store.save(late, call_context)
+    state = await rehydrate_context(store, CONTEXT, call_context=call_context, snapshot=snapshot)
+
+    assert not await snapshot_is_current(store, snapshot, call_context=call_context)
+    assert [entry.id for entry in state.exchange.ledger] == ["doc-0", "doc-1", "doc-2"]
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_save_snapshot_extends_a_current_snapshot(sequenced_store):
+    """The next snapshot reads only the legs above the previous one and equals a full
+    refold; once the previous one is stale, the next snapshot refolds every leg."""
+    exchanges, call_context = LocalExchangeStore(), ServerCallContext()
+    await _append(sequenced_store, 0, 200)
+    await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+    await _append(sequenced_store, 200, 50)
+
+    listed: list[int] = []
+    list_legs = sequenced_store.list_legs
+
+    async def spy(*args, **kwargs):
+        page = await list_legs(*args, **kwargs)
+        listed.extend(ordinal_of(leg) for leg in page)
+        return page
+
+    sequenced_store.list_legs = spy
+    extended = await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+    assert listed == list(range(200, 250))
+    assert (extended.legs, extended.through_ordinal) == (250, 249)
+    assert await snapshot_is_current(sequenced_store, extended, call_context=call_context)
+    await discard_snapshot(exchanges, CONTEXT)
+    full = await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+    assert extended.to_state() == full.to_state()
+
+    leg = await sequenced_store.get("leg-0003", call_context)
+    stamp_ledger_entry(leg, _entry(3).model_copy(update={"issuer": "restamped"}))
+    await sequenced_store.save(leg, call_context)
+    listed.clear()
+    refolded = await save_snapshot(exchanges, sequenced_store, CONTEXT, call_context=call_context)
+    assert listed == list(range(250))
+    assert refolded.entries[3][1].issuer == "restamped"
+
+
+@pytest.mark.anyio
+async def test_save_snapshot_extends_over_a_plain_task_store():
+    """Without a leg revision the store is listed once; the extended snapshot still
+    carries the digest of every folded leg, so it checks as current."""
+    store, exchanges, call_context = InMemoryTaskStore(), LocalExchangeStore(), ServerCallContext()
+    for ordinal in range(6):
+        leg = create_leg_task(context_id=CONTEXT, ordinal=ordinal, task_id=f"leg-{ordinal}")
+        stamp_ledger_entry(leg, _entry(ordinal))
+        await store.save(leg, call_context)
+        if ordinal in (2, 5):
+            snapshot = await save_snapshot(exchanges, store, CONTEXT, call_context=call_context)
+
+    assert (snapshot.legs, snapshot.through_ordinal) == (6, 5)
+    assert [entry.id for _, entry in snapshot.entries] == [f"doc-{i}" for i in range(6)]
+    assert await snapshot_is_current(store, snapshot, call_context=call_context)
@@ -17,6 +17,8 @@ Protocol shows a simpler shape — it conforms by method name only); we pass a d
 ``ServerCallContext()``.
 """
 
+import asyncio
+
 import pytest
 from a2a.server.context import ServerCallContext
 from a2a.server.tasks import InMemoryTaskStore
@@ -24,7 +26,7 @@ from google.adk.events import Event, EventActions
 from google.genai import types
 
 from bridge.adapters.local import build_local_adapter
-from bridge.aggregate import create_leg_task, ordinal_of
+from bridge.aggregate import build_exchange_view, create_leg_task, ordinal_of, tasks_for_context
 from bridge.seams import Seam
 
 APP_NAME = "bridge"
@@ -58,6 +60,34 @@ async def test_task_store_survives_restart(tmp_path):
     await store2.engine.dispose()
 
 
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_save_leg_allocates_unique_gap_free_ordinals_across_workers(tmp_path):
+    """Two durable stores on one file (two workers) mint ordinals concurrently: the
+    per-context sequence row hands out 0..n-1 exactly once, per context (A5)."""
+    from bridge.adapters.local.task_store import SequencedTaskStore
+
+    db_path = str(tmp_path / "tasks.db")
+    ctx = ServerCallContext()
+    workers = [build_local_adapter(Seam.TASK_STORE, durable=True, db_path=db_path) for _ in (0, 1)]
+    assert all(isinstance(w, SequencedTaskStore) for w in workers)
+    await workers[0].initialize()  # create the schema once before the race
+
+    async def mint(i: int) -> int:
+        leg = create_leg_task(context_id=f"ctx-seq-{i % 2}", ordinal=-1, task_id=f"leg-{i}")
+        return await workers[i % 3 % 2].save_leg(leg, ctx)
+
+    allocated = await asyncio.gather(*(mint(i) for i in range(40)))
+
+    assert sorted(allocated) == sorted([*range(20), *range(20)])
+    for context_id in ("ctx-seq-0", "ctx-seq-1"):
+        legs = await tasks_for_context(workers[1], context_id, call_context=ctx)
+        ordinals = [ordinal_of(t) for t in build_exchange_view(context_id, legs).tasks]
+        assert ordinals == list(range(20))  # stamped on the persisted row, gap-free
+    for worker in workers:
+        await worker.engine.dispose()
+
+
 def test_durable_requires_db_path():
     """durable=True for SESSIONS/TASK_STORE without a db_path is a ValueError."""
     with pytest.raises(ValueError, match="requires a db_path"):
@@ -114,3 +144,139 @@ async def test_session_service_survives_restart(tmp_path):
 
     assert isinstance(svc2, DatabaseSessionService)
     await svc2.db_engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_list_legs_pages_in_ordinal_order(tmp_path):
+    """Legs come back ordered by the indexed ordinal column, keyset-paged, request tasks
+    (no ordinal) and other contexts excluded."""
+    from a2a.types import Task
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    ctx = ServerCallContext()
+    for ordinal in (7, 2, 9, 0, 4, 1, 8, 3, 6, 5):  # saved out of order
+        await store.save(
+            create_leg_task(context_id="ctx-a", ordinal=ordinal, task_id=f"z{ordinal}"), ctx
+        )
+    await store.save(create_leg_task(context_id="ctx-b", ordinal=0, task_id="other"), ctx)
+    await store.save(Task(id="request", context_id="ctx-a"), ctx)
+
+    pages, after = [], None
+    while page := await store.list_legs("ctx-a", ctx, after=after, limit=4):
+        pages.append([ordinal_of(t) for t in page])
+        after = (ordinal_of(page[-1]), page[-1].id)
+    assert pages == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_list_legs_is_an_indexed_range_scan(tmp_path):
+    """The leg query is served by the (owner, context_id, bridge_ordinal) index."""
+    from sqlalchemy import text
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    await store.initialize()
+    async with store.engine.connect() as conn:
+        plan = await conn.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE owner = 'u' AND context_id = 'c'"
+                " AND bridge_ordinal IS NOT NULL AND bridge_ordinal > 3"
+                " ORDER BY bridge_ordinal, id LIMIT 100"
+            )
+        )
+        detail = " ".join(row[-1] for row in plan)
+    assert "idx_tasks_owner_context_ordinal" in detail
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_sequenced_store_migrates_a_plain_database_task_store(tmp_path):
+    """A file written by the plain DatabaseTaskStore gains the ordinal column, backfilled
+    from the metadata JSON, when the sequenced store first opens it."""
+    from a2a.server.tasks import DatabaseTaskStore
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    db_path = str(tmp_path / "legacy.db")
+    ctx = ServerCallContext()
+    legacy = DatabaseTaskStore(engine=create_async_engine(f"sqlite+aiosqlite:///{db_path}"))
+    for ordinal in (2, 0, 1):
+        await legacy.save(
+            create_leg_task(context_id="ctx-old", ordinal=ordinal, task_id=f"t{ordinal}"), ctx
+        )
+    await legacy.engine.dispose()
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=db_path)
+    legs = await store.list_legs("ctx-old", ctx)
+    assert [t.id for t in legs] == ["t0", "t1", "t2"]
+    # The sequence was seeded from the backfilled ordinals: no duplicate ordinal 0.
+    leg = create_leg_task(context_id="ctx-old", ordinal=-1, task_id="t-new")
+    assert await store.save_leg(leg, ctx) == 3
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_save_leg_sequences_per_owner_and_never_overwrites(tmp_path):
+    """Owners sharing a context_id get their own counters; re-inserting a leg id fails
+    without touching the stored leg or advancing the counter."""
+    from a2a.auth.user import User
+    from sqlalchemy.exc import IntegrityError
+
+    class _Named(User):
+        def __init__(self, name: str):
+            self._name = name
+
+        @property
+        def is_authenticated(self) -> bool:
+            return True
+
+        @property
+        def user_name(self) -> str:
+            return self._name
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    alice, bob = ServerCallContext(user=_Named("alice")), ServerCallContext(user=_Named("bob"))
+
+    for i in range(2):
+        leg = create_leg_task(context_id="ctx", ordinal=-1, task_id=f"a{i}")
+        assert await store.save_leg(leg, alice) == i
+    assert (
+        await store.save_leg(create_leg_task(context_id="ctx", ordinal=-1, task_id="b0"), bob) == 0
+    )
+
+    with pytest.raises(IntegrityError):
+        await store.save_leg(create_leg_task(context_id="ctx", ordinal=-1, task_id="a0"), alice)
+    assert ordinal_of(await store.get("a0", alice)) == 0
+    assert (
+        await store.save_leg(create_leg_task(context_id="ctx", ordinal=-1, task_id="a2"), alice)
+        == 2
+    )
+    await store.engine.dispose()
+
+
+@pytest.mark.seam("task_store")
+@pytest.mark.anyio
+async def test_save_legs_records_a_round_whole_or_not_at_all(tmp_path):
+    """save_legs stamps consecutive ordinals in one transaction; one bad leg writes none."""
+    from sqlalchemy.exc import IntegrityError
+
+    store = build_local_adapter(Seam.TASK_STORE, durable=True, db_path=str(tmp_path / "t.db"))
+    ctx = ServerCallContext()
+
+    def legs(*ids: str):
+        return [create_leg_task(context_id="ctx", ordinal=-1, task_id=i) for i in ids]
+
+    assert await store.save_legs(legs("a", "b"), ctx) == [0, 1]
+    with pytest.raises(IntegrityError):
+        await store.save_legs(legs("c", "a", "d"), ctx)
+    assert await store.get("c", ctx) is None
+    assert await store.save_legs(legs("c", "d"), ctx) == [2, 3]
+    assert await store.save_legs([], ctx) == []
+    with pytest.raises(ValueError, match="one context"):
+        await store.save_legs(
+            [create_leg_task(context_id=c, ordinal=-1, task_id=c) for c in ("x", "y")], ctx
+        )
+    await store.engine.dispose()
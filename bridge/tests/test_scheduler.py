@@ -11,19 +11,27 @@ Key invariants tested:
 - Read-model: overdue → escalated transition surfaced via followup_status.
 """
 
+import os
+import time
+
 import pytest
 
+from bridge.adapters.local import build_local_adapter
 from bridge.adapters.local.scheduler import LocalScheduler
 from bridge.adapters.local.skill_registry import LocalSkillRegistry
+from bridge.adapters.local.wheel_scheduler import TimingWheelScheduler
 from bridge.scheduler import (
     FollowupState,
+    RetentionPolicy,
     SlaPolicy,
     Timer,
     TimerKind,
     VirtualClock,
+    WallClock,
     followup_status,
     plan_followups,
 )
+from bridge.seams import Seam
 
 # --- VirtualClock tests ---
 
@@ -109,14 +117,29 @@ def test_plan_followups_with_task_id():
         assert timer.task_id == "task-1"
 
 
-# --- LocalScheduler seam tests ---
+# --- Scheduler seam tests (every local adapter) ---
+
+
+@pytest.fixture(params=["local", "durable", "wheel"])
+async def scheduler(request, tmp_path):
+    """Each seam test runs against every local scheduler adapter."""
+    if request.param == "local":
+        yield build_local_adapter(Seam.SCHEDULER)
+        return
+    if request.param == "wheel":
+        yield TimingWheelScheduler()
+        return
+    durable = build_local_adapter(
+        Seam.SCHEDULER, durable=True, db_path=str(tmp_path / "s.db"), clock=VirtualClock()
+    )
+    yield durable
+    await durable.engine.dispose()
 
 
 @pytest.mark.seam("scheduler")
 @pytest.mark.anyio
-async def test_scheduler_due_returns_only_due_timers():
+async def test_scheduler_due_returns_only_due_timers(scheduler):
     """due(now) returns only timers with fire_at <= now, sorted deterministically."""
-    scheduler = LocalScheduler()
     sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
     timers = plan_followups(sla, start=0, context_id="ctx-1")
     for timer in timers:
@@ -134,9 +157,8 @@ async def test_scheduler_due_returns_only_due_timers():
 
 @pytest.mark.seam("scheduler")
 @pytest.mark.anyio
-async def test_scheduler_due_deterministic_sort():
+async def test_scheduler_due_deterministic_sort(scheduler):
     """due() sorts by (fire_at, sequence, id) when multiple timers share a fire_at."""
-    scheduler = LocalScheduler()
 
     # Create two timers with the same fire_at but different sequences
     timer_a = Timer(id="z-timer", context_id="ctx", fire_at=10, kind=TimerKind.NUDGE, sequence=2)
@@ -153,12 +175,11 @@ async def test_scheduler_due_deterministic_sort():
 
 @pytest.mark.seam("scheduler")
 @pytest.mark.anyio
-async def test_scheduler_exactly_once_a7():
+async def test_scheduler_exactly_once_a7(scheduler):
     """A7 load-bearing: due(now) marks timers fired, NEVER re-returns them.
 
     This is THE test the no-duplicate guarantee rides on.
     """
-    scheduler = LocalScheduler()
     sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
     timers = plan_followups(sla, start=0, context_id="ctx-1")
     for timer in timers:
@@ -177,13 +198,13 @@ async def test_scheduler_exactly_once_a7():
     scheduler.clock.advance(10)
     due3 = await scheduler.due()
     assert len(due3) == 0
+    assert (await scheduler.load_followups("ctx-1")).state == FollowupState.ESCALATED
 
 
 @pytest.mark.seam("scheduler")
 @pytest.mark.anyio
-async def test_scheduler_cancel():
+async def test_scheduler_cancel(scheduler):
     """A cancelled timer never appears in due(), even past its fire_at."""
-    scheduler = LocalScheduler()
     timer = Timer(id="cancel-me", context_id="ctx", fire_at=5, kind=TimerKind.NUDGE, sequence=1)
     await scheduler.schedule(timer)
     await scheduler.cancel("cancel-me")
@@ -195,15 +216,15 @@ async def test_scheduler_cancel():
 
 @pytest.mark.seam("scheduler")
 @pytest.mark.anyio
-async def test_scheduler_schedule_idempotency():
+async def test_scheduler_schedule_idempotency(scheduler):
     """Scheduling the same timer.id twice keeps one entry (upsert)."""
-    scheduler = LocalScheduler()
     timer1 = Timer(id="same-id", context_id="ctx", fire_at=5, kind=TimerKind.NUDGE, sequence=1)
     timer2 = Timer(id="same-id", context_id="ctx", fire_at=10, kind=TimerKind.NUDGE, sequence=2)
     await scheduler.schedule(timer1)
     await scheduler.schedule(timer2)
 
     # Only the second timer (fire_at=10) should be scheduled
+    assert [t.fire_at for t in await scheduler.load_timers("ctx")] == [10]
     due = await scheduler.due(now=10)
     assert len(due) == 1
     assert due[0].fire_at == 10
@@ -345,3 +366,679 @@ async def test_end_to_end_sla_progression():
     status = scheduler.followups_for("ctx-demo")
     assert status.state == FollowupState.ESCALATED
     assert status.escalated
+
+
+# --- Heap index (due() pops only ready timers; lazy-deletion cancel) ---
+
+
+def _reference_due(timers: dict[str, Timer], now: int) -> list[tuple[str, int]]:
+    """The pre-heap due(): scan every timer, sort the due subset, mark fired."""
+    ready = sorted(
+        (t for t in timers.values() if not t.fired and t.fire_at <= now),
+        key=lambda t: (t.fire_at, t.sequence, t.id),
+    )
+    for timer in ready:
+        timer.fired = True
+    return [(t.id, t.fire_at) for t in ready]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "make_scheduler",
+    [LocalScheduler, TimingWheelScheduler, lambda: TimingWheelScheduler(slot_bits=2, levels=2)],
+    ids=["heap", "wheel", "small-wheel"],
+)
+async def test_indexed_scheduler_matches_reference_scan_under_churn(make_scheduler):
+    """Random schedules, upserts and cancels: every due() equals the full-scan reference
+    (same timers, same A5 order), and nothing fires twice (A7)."""
+    import random
+
+    rng = random.Random(11)
+    scheduler = make_scheduler()
+    reference: dict[str, Timer] = {}
+    fired: list[str] = []
+    for now in range(200):
+        for _ in range(rng.randrange(30)):
+            timer_id = f"t-{rng.randrange(400)}"
+            fire_at = now + rng.randrange(20)
+            sequence = rng.randrange(3)
+            await scheduler.schedule(
+                Timer(timer_id, "ctx", fire_at, TimerKind.NUDGE, sequence=sequence)
+            )
+            reference[timer_id] = Timer(timer_id, "ctx", fire_at, TimerKind.NUDGE, sequence)
+        for _ in range(rng.randrange(10)):
+            timer_id = f"t-{rng.randrange(400)}"
+            await scheduler.cancel(timer_id)
+            reference.pop(timer_id, None)
+        due = await scheduler.due(now)
+        assert all(t.fired for t in due)
+        assert [(t.id, t.fire_at) for t in due] == _reference_due(reference, now)
+        fired.extend(f"{t.id}@{t.fire_at}" for t in due)
+    assert len(fired) == len(set(fired))
+    assert scheduler.pending == sum(not t.fired for t in reference.values())
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_due_pops_only_ready_timers_and_cancels_stay_bounded():
+    """20k ladders: a tick touches only its ready timers; mass cancels compact the heap."""
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    for i in range(20_000):
+        await scheduler.schedule_followups(sla, context_id=f"ctx-{i}", start=i % 100)
+    assert scheduler.pending == 60_000
+
+    due = await scheduler.due(now=3)  # only the ladders started at tick 0
+    assert [t.id for t in due] == sorted(f"ctx-{i}-nudge-1" for i in range(0, 20_000, 100))
+    assert len(scheduler._heap) == 60_000 - 200
+
+    for i in range(1, 20_000):
+        for suffix in ("nudge-1", "nudge-2", "escalation"):
+            await scheduler.cancel(f"ctx-{i}-{suffix}")
+    assert scheduler.pending == 2  # ctx-0's nudge-2 + escalation
+    assert len(scheduler._heap) <= 2 * 64  # stale entries rebuilt away, not left to rot
+    assert [t.id for t in await scheduler.due(now=10_000)] == ["ctx-0-nudge-2", "ctx-0-escalation"]
+
+
+# --- Durable scheduler (SQLite timer table) ---
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_durable_scheduler_survives_restart(tmp_path):
+    """Timers (and their fired flags) outlive the scheduler: a fresh one on the same file
+    fires only what is left, and the read-model still sees the earlier nudge (A13)."""
+    db_path = str(tmp_path / "timers.db")
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+
+    first = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=db_path)
+    await first.schedule_followups(sla, context_id="ctx-r", start=0)
+    assert [t.id for t in await first.due(now=3)] == ["ctx-r-nudge-1"]
+    await first.engine.dispose()
+
+    second = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=db_path)
+    status = await second.load_followups("ctx-r")
+    assert (status.state, status.nudges_fired) == (FollowupState.OVERDUE, 1)
+    assert [t.id for t in await second.due(now=7)] == ["ctx-r-nudge-2", "ctx-r-escalation"]
+    assert (await second.load_followups("ctx-r")).state == FollowupState.ESCALATED
+    await second.engine.dispose()
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_durable_factory_defaults_to_a_wall_clock(tmp_path):
+    """The durable scheduler's ticks are wall-clock ticks unless a clock is injected: a
+    virtual clock restarting at tick 0 would read persisted fire_at ticks differently."""
+    db_path = str(tmp_path / "timers.db")
+    durable = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=db_path)
+    assert isinstance(durable.clock, WallClock)
+    assert abs(durable.clock.now() - WallClock().now()) <= 1
+
+    clock = VirtualClock(start=5)
+    injected = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=db_path, clock=clock)
+    assert injected.clock is clock
+    assert build_local_adapter(Seam.SCHEDULER).clock.now() == 0
+    await durable.engine.dispose()
+    await injected.engine.dispose()
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_durable_scheduler_concurrent_workers_never_double_fire(tmp_path):
+    """Four workers (own engines, one file) poll the same ticks: every timer is claimed
+    exactly once across them (A7 via the atomic UPDATE … RETURNING)."""
+    import asyncio
+
+    db_path = str(tmp_path / "timers.db")
+    workers = [build_local_adapter(Seam.SCHEDULER, durable=True, db_path=db_path) for _ in range(4)]
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    for i in range(100):
+        await workers[0].schedule_followups(sla, context_id=f"ctx-{i}", start=i % 10)
+
+    claimed: list[str] = []
+    for now in range(0, 20):
+        batches = await asyncio.gather(*(worker.due(now) for worker in workers))
+        claimed.extend(t.id for batch in batches for t in batch)
+
+    assert len(claimed) == len(set(claimed)) == 300
+    for worker in workers:
+        await worker.engine.dispose()
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_durable_due_scans_the_pending_index(tmp_path):
+    """The claim's WHERE (fired, fire_at <= now) is served by the pending index."""
+    from sqlalchemy import text
+
+    scheduler = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=str(tmp_path / "s.db"))
+    await scheduler.initialize()
+    async with scheduler.engine.connect() as conn:
+        plan = (
+            await conn.execute(
+                text(
+                    "EXPLAIN QUERY PLAN UPDATE bridge_timers SET fired = 1 "
+                    "WHERE fired = 0 AND fire_at <= 5 RETURNING id"
+                )
+            )
+        ).all()
+    assert any("idx_bridge_timers_pending" in str(row) for row in plan)
+    await scheduler.engine.dispose()
+
+
+# --- Per-context index + incremental followup tally ---
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_followups_for_matches_full_scan_under_churn():
+    """Fires, cancels (of fired timers too) and upserts: the O(1) tally always equals
+    followup_status over every timer, and timers_for equals the filtered timer set."""
+    import random
+
+    rng = random.Random(5)
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    contexts = [f"ctx-{i}" for i in range(20)]
+    for now in range(60):
+        for _ in range(rng.randrange(4)):
+            await scheduler.schedule_followups(sla, context_id=rng.choice(contexts), start=now)
+        for _ in range(rng.randrange(3)):
+            suffix = rng.choice(("nudge-1", "nudge-2", "escalation"))
+            await scheduler.cancel(f"{rng.choice(contexts)}-{suffix}")
+        await scheduler.due(now)
+        for ctx in contexts:
+            every = list(scheduler._timers.values())
+            assert scheduler.followups_for(ctx) == followup_status(every, context_id=ctx)
+            assert scheduler.timers_for(ctx) == sorted(
+                (t for t in every if t.context_id == ctx),
+                key=lambda t: (t.fire_at, t.sequence, t.id),
+            )
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_followups_for_does_not_scan_other_contexts():
+    """With 10k open ladders, a status lookup never walks the global timer set."""
+
+    class _NoScan(dict):
+        def values(self):
+            raise AssertionError("followups_for scanned every timer")
+
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    for i in range(10_000):
+        await scheduler.schedule_followups(sla, context_id=f"ctx-{i}", start=i % 2)
+    await scheduler.due(now=3)
+    scheduler._timers = _NoScan(scheduler._timers)
+
+    assert scheduler.followups_for("ctx-0").state == FollowupState.OVERDUE
+    assert scheduler.followups_for("ctx-1").state == FollowupState.ON_TRACK
+    assert scheduler.followups_for("ctx-unknown").state == FollowupState.ON_TRACK
+    assert [t.id for t in scheduler.timers_for("ctx-0")][0] == "ctx-0-nudge-1"
+
+
+# --- Retention: compacting fired timers into the per-context summary ---
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_retention_compacts_fired_timers_without_changing_the_read_model():
+    """fired_ticks=2: a fired timer is dropped two ticks after its fire_at, while
+    followups_for stays equal to a twin scheduler that keeps every timer."""
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    compacting = LocalScheduler(retention=RetentionPolicy(fired_ticks=2))
+    keeping = LocalScheduler()
+    contexts = [f"ctx-{i}" for i in range(50)]
+    for i, ctx in enumerate(contexts):
+        for scheduler in (compacting, keeping):
+            await scheduler.schedule_followups(sla, context_id=ctx, start=i % 5)
+
+    for now in range(15):
+        assert [t.id for t in await compacting.due(now)] == [t.id for t in await keeping.due(now)]
+        for ctx in contexts:
+            assert compacting.followups_for(ctx) == keeping.followups_for(ctx)
+        held = compacting._timers.values()
+        assert all(not t.fired or t.fire_at > now - 2 for t in held)
+
+    assert compacting._timers == {} and compacting.compacted == 150
+    assert compacting.followups_for("ctx-0").state == FollowupState.ESCALATED
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_compact_context_and_forget():
+    """A terminal exchange's fired timers fold into its summary at once; pending ones
+    stay. forget() drops the summary and cancels what is left."""
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    await scheduler.schedule_followups(sla, context_id="ctx-done", start=0)
+    await scheduler.due(now=5)
+    before = scheduler.followups_for("ctx-done")
+
+    assert scheduler.compact_context("ctx-done") == 2
+    assert scheduler.followups_for("ctx-done") == before
+    assert [t.id for t in scheduler.timers_for("ctx-done")] == ["ctx-done-escalation"]
+
+    scheduler.forget("ctx-done")
+    assert scheduler.followups_for("ctx-done").state == FollowupState.ON_TRACK
+    assert await scheduler.due(now=100) == [] and scheduler.pending == 0
+    assert scheduler._compacted == {}
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_cancelling_a_compacted_timer_uncounts_it():
+    """cancel() of a fired timer un-counts it whether or not it was compacted: the
+    read-model matches a twin that never compacts, down to ON_TRACK."""
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    compacting = LocalScheduler(retention=RetentionPolicy(fired_ticks=0))
+    keeping = LocalScheduler()
+    for scheduler in (compacting, keeping):
+        await scheduler.schedule_followups(sla, context_id="ctx-c", start=0)
+        await scheduler.due(now=3)
+    assert compacting.compacted == 1
+
+    for scheduler in (compacting, keeping):
+        await scheduler.cancel("ctx-c-nudge-1")
+    assert compacting.followups_for("ctx-c") == keeping.followups_for("ctx-c")
+    assert compacting.followups_for("ctx-c").state == FollowupState.ON_TRACK
+
+    for scheduler in (compacting, keeping):
+        await scheduler.cancel("ctx-c-nudge-2")
+        await scheduler.cancel("ctx-c-escalation")
+    assert compacting._tallies == {} and compacting._compacted == {}
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_retire_context_keeps_the_read_model():
+    """Retiring an exchange after a nudge fired withdraws what is pending and compacts
+    what fired, and it still reads OVERDUE with the nudge counted."""
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    await scheduler.schedule_followups(sla, context_id="c", start=0)
+    await scheduler.schedule_followups(sla, context_id="other", start=0)
+    await scheduler.due(now=3)
+
+    assert scheduler.retire_context("c") == 1
+    status = scheduler.followups_for("c")
+    assert (status.state, status.nudges_fired) == (FollowupState.OVERDUE, 1)
+    assert scheduler.timers_for("c") == []
+    assert [t.context_id for t in await scheduler.due(now=100)] == ["other", "other"]
+    assert scheduler.followups_for("c").nudges_fired == 1
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_retired_contexts_keep_counts_only():
+    """Retiring N exchanges (some policy-compacted already) leaves no per-timer state:
+    no compacted ids, no tracked ids in any tally — only counts and the last fire tick."""
+    scheduler = LocalScheduler(retention=RetentionPolicy(fired_ticks=2))
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    contexts = [f"done-{i}" for i in range(100)]
+    for ctx in contexts:
+        await scheduler.schedule_followups(sla, context_id=ctx, start=0)
+    await scheduler.schedule_followups(sla, context_id="open", start=100)
+    await scheduler.due(now=7)
+    assert scheduler._compacted  # fired_ticks=2 compacted the early nudges
+
+    for ctx in contexts:
+        scheduler.retire_context(ctx)
+
+    assert len(scheduler._compacted) == 0
+    assert all(tally.timer_ids == [] for tally in scheduler._tallies.values())
+    assert len(scheduler._timers) == scheduler.pending == 3
+    tally = scheduler._tallies["done-0"]
+    assert (tally.nudges_fired, tally.escalations_fired, tally.last_fired_at) == (2, 1, 7)
+    assert scheduler.followups_for("done-99").state == FollowupState.ESCALATED
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_retired_context_refuses_timers():
+    """A retired exchange refuses a re-schedule (the batch is not applied) and a cancel
+    of one of its timers leaves its summary alone."""
+    scheduler = LocalScheduler()
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    await scheduler.schedule_followups(sla, context_id="c", start=0)
+    await scheduler.due(now=3)
+    scheduler.retire_context("c")
+    before = scheduler.followups_for("c")
+
+    with pytest.raises(ValueError, match="retired"):
+        await scheduler.schedule(Timer("c-nudge-1", "c", 9, TimerKind.NUDGE, 1))
+    with pytest.raises(ValueError, match="retired"):
+        await scheduler.schedule_many(
+            [Timer("x", "other", 9, TimerKind.NUDGE, 1), Timer("y", "c", 9, TimerKind.NUDGE, 1)]
+        )
+    assert scheduler.pending == 0
+    await scheduler.cancel("c-nudge-1")
+    assert scheduler.followups_for("c") == before
+
+    scheduler.forget("c")
+    await scheduler.schedule(Timer("c-nudge-1", "c", 9, TimerKind.NUDGE, 1))
+    assert scheduler.pending == 1
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_rescheduling_a_compacted_timer_counts_it_once():
+    """A compacted ladder scheduled again supersedes its counts like an upsert of held
+    timers: the read-model matches a twin that never compacts, before and after firing."""
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    compacting = LocalScheduler(retention=RetentionPolicy(fired_ticks=0))
+    keeping = LocalScheduler()
+    for scheduler in (compacting, keeping):
+        await scheduler.schedule_followups(sla, context_id="ctx-r", start=0)
+        await scheduler.due(now=5)
+    assert compacting.compacted == 2
+    assert compacting.followups_for("ctx-r").nudges_fired == 2
+
+    for scheduler in (compacting, keeping):
+        await scheduler.schedule_followups(sla, context_id="ctx-r", start=10)
+    assert compacting.followups_for("ctx-r") == keeping.followups_for("ctx-r")
+    for now in (13, 15, 17):
+        await compacting.due(now)
+        await keeping.due(now)
+        assert compacting.followups_for("ctx-r") == keeping.followups_for("ctx-r")
+    assert compacting.followups_for("ctx-r").nudges_fired == 2
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_retention_memory_tracks_open_work():
+    """10k escalated ladders + 10 open ones under fired_ticks=0: only the open timers
+    are held, every escalated exchange still reads ESCALATED."""
+    scheduler = LocalScheduler(retention=RetentionPolicy(fired_ticks=0))
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    for i in range(10_000):
+        await scheduler.schedule_followups(sla, context_id=f"done-{i}", start=0)
+    for i in range(10):
+        await scheduler.schedule_followups(sla, context_id=f"open-{i}", start=100)
+    await scheduler.due(now=7)
+
+    assert len(scheduler._timers) == scheduler.pending == 30
+    assert scheduler.followups_for("done-9999").state == FollowupState.ESCALATED
+    assert scheduler.followups_for("open-0").state == FollowupState.ON_TRACK
+
+
+def test_retention_policy_rejects_negative_window():
+    """A negative retention window is a validation error."""
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        RetentionPolicy(fired_ticks=-1)
+
+
+# --- Bulk schedule / cancel (program fan-out) ---
+
+
+def _program_timers(legs: int) -> list[Timer]:
+    sla = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+    return [
+        timer
+        for i in range(legs)
+        for timer in plan_followups(
+            sla,
+            start=i % 3,
+            context_id=f"carrier-{i % 4}",
+            task_id=f"leg-{i}",
+            id_prefix=f"leg-{i}",
+        )
+    ]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_schedule_many_matches_one_by_one(scheduler):
+    """A batch (duplicate id: the later one wins) fires exactly like per-timer schedules."""
+    timers = _program_timers(50)
+    moved = Timer("leg-0-nudge-1", "carrier-0", 9, TimerKind.NUDGE, 1, task_id="leg-0")
+    await scheduler.schedule_many([*timers, moved])
+
+    reference = LocalScheduler()
+    for timer in _program_timers(50):
+        await reference.schedule(timer)
+    await reference.schedule(Timer("leg-0-nudge-1", "carrier-0", 9, TimerKind.NUDGE, 1))
+
+    for now in range(12):
+        got = [t.id for t in await scheduler.due(now)]
+        assert got == [t.id for t in await reference.due(now)]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_cancel_context_and_cancel_task(scheduler):
+    """Bulk cancels remove exactly the context's / task's timers and report the count."""
+    await scheduler.schedule_many(_program_timers(40))
+
+    assert await scheduler.cancel_task("leg-1") == 3
+    assert await scheduler.cancel_task("leg-1") == 0
+    assert await scheduler.cancel_context("carrier-0") == 30
+    assert await scheduler.cancel_context("carrier-0") == 0
+
+    fired = await scheduler.due(now=100)
+    assert len(fired) == 120 - 3 - 30
+    assert not any(t.context_id == "carrier-0" or t.task_id == "leg-1" for t in fired)
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_bulk_cancel_keeps_fired_timers_and_their_counts(scheduler):
+    """Closing a program withdraws only what has not fired: the escalated and overdue
+    legs still read that way afterwards."""
+    await scheduler.schedule_many(_program_timers(8))
+    await scheduler.due(now=7)  # legs started at tick 0 escalated, the others overdue
+    before = {ctx: await scheduler.load_followups(ctx) for ctx in ("carrier-0", "carrier-1")}
+
+    assert await scheduler.cancel_task("leg-1") == 1  # leg-1 started at 1: escalation left
+    assert await scheduler.cancel_context("carrier-0") == 1  # leg-4's escalation
+    assert await scheduler.cancel_context("carrier-0") == 0
+    for ctx, status in before.items():
+        assert await scheduler.load_followups(ctx) == status
+    assert before["carrier-0"].state == FollowupState.ESCALATED
+    assert before["carrier-1"].state == FollowupState.OVERDUE
+    assert all(t.fired for t in await scheduler.load_timers("carrier-0"))
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_durable_program_fan_out_is_one_transaction(tmp_path):
+    """Opening and closing a 1,000-leg program costs one commit each."""
+    from sqlalchemy import event
+
+    scheduler = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=str(tmp_path / "s.db"))
+    await scheduler.initialize()
+    commits: list[int] = []
+    event.listen(scheduler.engine.sync_engine, "commit", lambda conn: commits.append(1))
+
+    await scheduler.schedule_many(_program_timers(1000))
+    assert len(commits) == 1
+    assert sum([await scheduler.cancel_context(f"carrier-{i}") for i in range(4)]) == 3000
+    assert len(commits) == 5
+    assert await scheduler.due(now=100) == []
+    await scheduler.engine.dispose()
+
+
+# --- Timing wheel (O(1) schedule/cancel for very high timer counts) ---
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_timing_wheel_cascades_overflow_and_late_timers():
+    """Far-future (overflow), past (late) and block-boundary timers fire in A5 order,
+    across idle gaps, and next_fire_at tracks the earliest pending one."""
+    import random
+
+    rng = random.Random(5)
+    wheel = TimingWheelScheduler(VirtualClock(start=100), slot_bits=2, levels=3)  # 64 ticks
+    reference = LocalScheduler()
+    fire_ats = [0, 99, 100, 103, 104, 163, 164, 1_000, 5_000, *rng.sample(range(6_000), 200)]
+    for i, fire_at in enumerate(fire_ats):
+        for scheduler in (wheel, reference):
+            await scheduler.schedule(Timer(f"t-{i}", "ctx", fire_at, TimerKind.NUDGE, i % 3))
+
+    for now in (100, 101, 163, 170, 1_000, 4_999, 7_000):
+        assert await wheel.next_fire_at() == await reference.next_fire_at()
+        got = [t.id for t in await wheel.due(now)]
+        assert got == [t.id for t in await reference.due(now)]
+        assert wheel.pending == reference.pending
+    assert await wheel.next_fire_at() is None
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+@pytest.mark.parametrize("geometry", [(6, 5), (2, 3)], ids=["wheel", "small-wheel"])
+async def test_timing_wheel_next_fire_at_matches_heap(geometry):
+    """next_fire_at equals LocalScheduler's after every step, including while the
+    cursor sits on an uncascaded block boundary (a runner must never sleep past it)."""
+    import random
+
+    slot_bits, levels = geometry
+    wheel = TimingWheelScheduler(slot_bits=slot_bits, levels=levels)
+    reference = LocalScheduler()
+
+    # The reported repro: a block-boundary timer, then a later one filed a level lower.
+    for scheduler in (wheel, reference):
+        await scheduler.schedule(Timer("edge", "ctx", 4096, TimerKind.NUDGE))
+        await scheduler.due(4095)
+        await scheduler.schedule(Timer("later", "ctx", 4196, TimerKind.NUDGE))
+    assert await wheel.next_fire_at() == await reference.next_fire_at() == 4096
+
+    rng = random.Random(17)
+    now = 4095
+    for step in range(400):
+        for _ in range(rng.randrange(4)):
+            fire_at = now + rng.choice([rng.randrange(1, 8), rng.randrange(1, 20_000)])
+            timer = Timer(f"r-{step}-{rng.randrange(50)}", "ctx", fire_at, TimerKind.NUDGE)
+            for scheduler in (wheel, reference):
+                await scheduler.schedule(Timer(timer.id, "ctx", fire_at, TimerKind.NUDGE))
+        if rng.random() < 0.2:
+            timer_id = f"r-{rng.randrange(step + 1)}-{rng.randrange(50)}"
+            for scheduler in (wheel, reference):
+                await scheduler.cancel(timer_id)
+        assert await wheel.next_fire_at() == await reference.next_fire_at()
+        next_at = await reference.next_fire_at()
+        # Advance to just before / exactly onto the next deadline, or jump ahead.
+        now = rng.choice([now + 1, (next_at or now + 1) - 1, next_at or now + 1, now + 500])
+        got = [t.id for t in await wheel.due(now)]
+        assert got == [t.id for t in await reference.due(now)]
+        assert await wheel.next_fire_at() == await reference.next_fire_at()
+
+
+def test_timing_wheel_rejects_bad_geometry():
+    with pytest.raises(ValueError, match="slot_bits"):
+        TimingWheelScheduler(slot_bits=0)
+    with pytest.raises(ValueError, match="levels"):
+        TimingWheelScheduler(levels=0)
+
+
+class _ScanScheduler:
+    """The original dict-scan scheduler: every due() scans and sorts all timers."""
+
+    def __init__(self) -> None:
+        self._timers: dict[str, Timer] = {}
+        self.visited = 0
+
+    async def schedule_many(self, timers) -> None:
+        self._timers.update((timer.id, timer) for timer in timers)
+
+    async def cancel(self, timer_id: str) -> None:
+        self._timers.pop(timer_id, None)
+
+    async def due(self, now: int) -> list[Timer]:
+        self.visited += len(self._timers)
+        ready = sorted(
+            (t for t in self._timers.values() if not t.fired and t.fire_at <= now),
+            key=lambda t: (t.fire_at, t.sequence, t.id),
+        )
+        for timer in ready:
+            timer.fired = True
+        return ready
+
+
+class _CountingHeap(LocalScheduler):
+    """LocalScheduler counting the heap entries its due() calls pop (live or stale)."""
+
+    visited = 0
+
+    def _pop_due(self, now: int) -> list[Timer]:
+        before = len(self._heap)
+        ready = super()._pop_due(now)
+        self.visited += before - len(self._heap)
+        return ready
+
+
+class _CountingWheel(TimingWheelScheduler):
+    """TimingWheelScheduler counting the timers its due() calls fire or re-file."""
+
+    visited = 0
+    _in_due = False
+
+    def _pop_due(self, now: int) -> list[Timer]:
+        self._in_due = True
+        try:
+            ready = super()._pop_due(now)
+        finally:
+            self._in_due = False
+        self.visited += len(ready)
+        return ready
+
+    def _file(self, timer: Timer) -> None:
+        self.visited += self._in_due  # a cascade re-filing the timer a level down
+        super()._file(timer)
+
+
+_BENCH = pytest.mark.skipif(
+    os.environ.get("BRIDGE_BENCH") != "1", reason="large benchmark: set BRIDGE_BENCH=1"
+)
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "count", [10_000, pytest.param(100_000, marks=_BENCH), pytest.param(1_000_000, marks=_BENCH)]
+)
+async def test_scheduler_benchmark_scan_heap_wheel(count):
+    """``count`` timers as SLA ladders clustered on 60 ticks, a tenth cancelled, then
+    one due() per tick: all three indexes fire the same timers in the same order, and
+    each index touches every timer at most once where the scan re-reads all of them on
+    every tick. With ``BRIDGE_BENCH=1`` (which also runs the large sizes) neither index
+    may spend longer in due() than the full scan.
+    """
+    sla = SlaPolicy(deadline=7, cadence=2, max_nudges=2)
+    results = {}
+    visited = {}
+    due_seconds = {}
+    for name, make in (
+        ("dict-scan", _ScanScheduler),
+        ("heap", _CountingHeap),
+        ("wheel", _CountingWheel),
+    ):
+        scheduler = make()
+        timers = [
+            timer
+            for i in range(count // 3)
+            for timer in plan_followups(sla, start=i % 50, context_id=f"ctx-{i}")
+        ]
+        await scheduler.schedule_many(timers)
+        for i in range(0, count // 3, 10):
+            await scheduler.cancel(f"ctx-{i}-escalation")
+        started = time.perf_counter()
+        fired = [t.id for now in range(64) for t in await scheduler.due(now)]
+        due_seconds[name] = time.perf_counter() - started
+        results[name] = fired
+        visited[name] = scheduler.visited
+    scheduled = count // 3 * 3
+    live = scheduled - len(range(0, count // 3, 10))
+    assert results["heap"] == results["dict-scan"]
+    assert results["wheel"] == results["dict-scan"]
+    assert len(results["wheel"]) == live
+    assert visited["dict-scan"] == 64 * live
+    assert visited["heap"] <= scheduled  # each entry popped once, fired or stale
+    assert visited["wheel"] <= scheduled  # one level-0 span: each fired, never re-filed
+    if os.environ.get("BRIDGE_BENCH") == "1":
+        assert due_seconds["heap"] < 1.5 * due_seconds["dict-scan"]
+        assert due_seconds["wheel"] < 1.5 * due_seconds["dict-scan"]
@@ -0,0 +1,183 @@
+"""SchedulerRunner: wake-on-deadline driving of the scheduler seam.
+
+The runner must fire each timer once it is due (A7 through ``due()``), sleep — not
+poll — between deadlines, wake early for a sooner timer or a virtual-clock advance,
+bound handler concurrency and shut down cleanly. Wall-clock tests use a 10 ms tick so
+they stay fast.
+"""
+
+import asyncio
+
+import pytest
+
+from bridge.adapters.local import build_local_adapter
+from bridge.adapters.local.scheduler import LocalScheduler
+from bridge.scheduler import SlaPolicy, Timer, TimerKind, VirtualClock, WallClock
+from bridge.scheduler_runner import SchedulerRunner
+from bridge.seams import Seam
+
+SLA = SlaPolicy(deadline=3, cadence=2, max_nudges=2)
+TICK = 0.01
+
+
+class _CountingScheduler(LocalScheduler):
+    """LocalScheduler counting due() calls (each is one wake of the runner)."""
+
+    def __init__(self, clock=None):
+        super().__init__(clock=clock)
+        self.due_calls = 0
+
+    async def due(self, now=None):
+        self.due_calls += 1
+        return await super().due(now)
+
+
+def _recorder(fired: list[str]):
+    async def handle(timer: Timer) -> None:
+        fired.append(timer.id)
+
+    return {TimerKind.NUDGE: handle, TimerKind.ESCALATION: handle}
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_virtual_clock_runner_fires_on_advance_and_idles_between():
+    """Nothing happens until the clock moves; each advance wakes exactly one claim."""
+    clock = VirtualClock()
+    scheduler = _CountingScheduler(clock)
+    await scheduler.schedule_followups(SLA, context_id="ctx", start=0)
+    fired: list[str] = []
+
+    async with SchedulerRunner(scheduler, _recorder(fired)):
+        await asyncio.sleep(0.05)
+        assert (fired, scheduler.due_calls) == ([], 1)  # asleep, not polling
+
+        clock.advance(3)
+        await _settle()
+        assert fired == ["ctx-nudge-1"]
+
+        clock.advance(4)
+        await _settle()
+        assert fired == ["ctx-nudge-1", "ctx-nudge-2", "ctx-escalation"]
+        calls = scheduler.due_calls
+
+    assert calls <= 4
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_wall_clock_runner_sleeps_until_the_deadline():
+    """With a wall clock the runner wakes at fire_at — a handful of claims, no polling."""
+    clock = WallClock(TICK)
+    scheduler = _CountingScheduler()
+    fired: list[str] = []
+    start = clock.now()
+    await scheduler.schedule_followups(SLA, context_id="ctx", start=start)
+
+    async with SchedulerRunner(scheduler, _recorder(fired), clock=clock):
+        await asyncio.sleep(12 * TICK)
+
+    assert fired == ["ctx-nudge-1", "ctx-nudge-2", "ctx-escalation"]
+    assert scheduler.due_calls <= 6  # one per deadline (+ start / timer slack)
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_sooner_timer_wakes_a_sleeping_runner():
+    """Asleep until a deadline 10 s out, the runner still fires a timer scheduled 20 ms out."""
+    clock = WallClock(TICK)
+    scheduler = LocalScheduler()
+    fired: list[str] = []
+    far = Timer("far", "ctx", clock.now() + 1000, TimerKind.ESCALATION)
+    await scheduler.schedule(far)
+
+    async with SchedulerRunner(scheduler, _recorder(fired), clock=clock) as runner:
+        await asyncio.sleep(TICK)
+        await runner.schedule(Timer("soon", "ctx", clock.now() + 2, TimerKind.NUDGE, 1))
+        await asyncio.sleep(6 * TICK)
+        assert fired == ["soon"]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_handlers_are_bounded_and_failures_isolated():
+    """20 due timers, 3 slots: never more than 3 handlers at once; a raising handler is
+    recorded and the rest still run."""
+    clock = VirtualClock()
+    scheduler = LocalScheduler(clock)
+    for i in range(20):
+        await scheduler.schedule(Timer(f"t-{i:02d}", "ctx", 1, TimerKind.NUDGE, 1))
+    running = peak = 0
+    done: list[str] = []
+
+    async def handle(timer: Timer) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.005)
+            if timer.id == "t-07":
+                raise RuntimeError("nudge channel down")
+            done.append(timer.id)
+        finally:
+            running -= 1
+
+    runner = SchedulerRunner(scheduler, {TimerKind.NUDGE: handle}, max_concurrency=3)
+    async with runner:
+        clock.advance(1)
+        await asyncio.sleep(0.1)
+
+    assert peak == 3
+    assert runner.dispatched == 20 and len(done) == 19
+    assert [(t.id, type(e)) for t, e in runner.errors] == [("t-07", RuntimeError)]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_stop_drains_in_flight_handlers():
+    """Exiting the runner waits for a running handler instead of dropping it."""
+    clock = VirtualClock()
+    scheduler = LocalScheduler(clock)
+    await scheduler.schedule(Timer("slow", "ctx", 1, TimerKind.ESCALATION))
+    finished: list[str] = []
+    started = asyncio.Event()
+
+    async def handle(timer: Timer) -> None:
+        started.set()
+        await asyncio.sleep(0.02)
+        finished.append(timer.id)
+
+    async with SchedulerRunner(scheduler, {TimerKind.ESCALATION: handle}):
+        clock.advance(1)
+        await started.wait()
+
+    assert finished == ["slow"]
+
+
+@pytest.mark.seam("scheduler")
+@pytest.mark.anyio
+async def test_runner_drives_the_durable_scheduler(tmp_path):
+    """The runner works over the SQLite adapter (next_fire_at from the pending index)."""
+    scheduler = build_local_adapter(Seam.SCHEDULER, durable=True, db_path=str(tmp_path / "s.db"))
+    clock = WallClock(TICK)
+    fired: list[str] = []
+    await scheduler.schedule_followups(SLA, context_id="ctx", start=clock.now())
+
+    async with SchedulerRunner(scheduler, _recorder(fired), clock=clock):
+        await asyncio.sleep(15 * TICK)
+
+    assert fired == ["ctx-nudge-1", "ctx-nudge-2", "ctx-escalation"]
+    await scheduler.engine.dispose()
+
+
+def test_runner_rejects_bad_configuration():
+    """Non-positive bounds are configuration errors."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        SchedulerRunner(LocalScheduler(), {}, max_concurrency=0)
+    with pytest.raises(ValueError, match="max_sleep"):
+        SchedulerRunner(LocalScheduler(), {}, max_sleep=0)
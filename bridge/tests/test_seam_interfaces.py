@@ -5,8 +5,9 @@ These tests verify that:
 2. build_local_adapter returns conforming instances for all seams
 3. Skeleton methods raise NotImplementedError (documenting the M1.x deferral)
 
-The fixture-based tests run twice (local, gcp); gcp skips until Sprint 2, proving
-the parity wiring is intact. Direct factory tests run once (local only, no fixture).
+The fixture-based tests run three times (local, durable, gcp); durable builds the
+SQLite-backed variant where a seam has one, and gcp skips until Sprint 2, proving the
+parity wiring is intact. Direct factory tests run once (local only, no fixture).
 """
 
 import pytest
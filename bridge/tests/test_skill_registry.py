@@ -4,17 +4,22 @@ Tests the LocalSkillRegistry adapter and the Skill/SkillPolicy loading logic:
 1. Isolated parsing (tmp dir, minimal fixtures)
 2. Real demo tree (lock C1/ADR-0002 values)
 3. Agent Card generation
+4. Hot reload (versioned snapshots) and the process-wide shared registry
+5. Lazy mode (frontmatter-only index)
 """
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
-from bridge.adapters.local.skill_registry import LocalSkillRegistry
+from bridge.adapters.local.skill_registry import LocalSkillRegistry, shared_skill_registry
 from bridge.skills import (
     Skill,
     SkillKind,
     load_skill,
+    parse_skill_frontmatter,
     parse_skill_md,
     resolve_default_skills_dir,
 )
@@ -503,3 +508,182 @@ async def test_real_demo_tree_agent_card():
     assert card.description  # Non-empty
     assert len(card.skills) >= 1
     assert any(s.id == "address-proof" for s in card.skills)
+
+
+# Hot reload: versioned snapshots, revalidated by mtime/hash
+
+
+def _write_process_skill(folder: Path, *, deadline: int, description: str = "Live") -> None:
+    (folder / "assets").mkdir(parents=True, exist_ok=True)
+    (folder / "SKILL.md").write_text(
+        f"""\
+---
+name: {folder.name}
+description: {description}
+metadata:
+  bridge-kind: process
+  bridge-policy: assets/policy.yaml
+---
+"""
+    )
+    (folder / "assets" / "policy.yaml").write_text(
+        f"thresholds: {{}}\nsla:\n  deadline: {deadline}\n  cadence: 2\n  max_nudges: 2\n"
+    )
+
+
+def _bump_mtimes(folder: Path) -> None:
+    """Move every file's mtime forward (coarse filesystem clocks can hide a rewrite)."""
+    for path in folder.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.mark.anyio
+async def test_registry_hot_reload_swaps_versioned_snapshots(tmp_path):
+    """An edited policy, a new skill and a removed skill each swap in a new snapshot;
+    unchanged skills are reused, and a touch without a content change is not a reload."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    _write_process_skill(tmp_path / "beta", deadline=5)
+    registry = LocalSkillRegistry(tmp_path, check_interval=0)
+    first = registry.current()
+    assert first.version == 1
+
+    _bump_mtimes(tmp_path / "alpha")  # touched, same bytes: re-hashed, not re-parsed
+    assert registry.current() is first
+
+    _write_process_skill(tmp_path / "alpha", deadline=9)
+    _bump_mtimes(tmp_path / "alpha")
+    second = registry.current()
+    assert second.version == 2
+    assert second.get("alpha").policy.sla.deadline == 9
+    assert second.get("beta") is first.get("beta")  # unchanged folder: same object
+    assert first.get("alpha").policy.sla.deadline == 3  # old snapshot is immutable
+
+    _write_process_skill(tmp_path / "gamma", deadline=1)
+    shutil.rmtree(tmp_path / "beta")
+    assert [s.name for s in await registry.list_skills()] == ["alpha", "gamma"]
+    assert registry.current().version == 3
+
+
+def test_registry_keeps_last_good_snapshot_on_a_broken_upload(tmp_path):
+    """A malformed skill on reload keeps the previous snapshot and is retried."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    registry = LocalSkillRegistry(tmp_path, check_interval=None)
+    (tmp_path / "alpha" / "SKILL.md").write_text("---\nname: alpha\n")  # no closing fence
+    _bump_mtimes(tmp_path / "alpha")
+
+    assert registry.refresh() is False
+    assert isinstance(registry.reload_error, ValueError)
+    assert registry.current().get("alpha").policy.sla.deadline == 3
+
+    _write_process_skill(tmp_path / "alpha", deadline=4)
+    _bump_mtimes(tmp_path / "alpha")
+    assert registry.refresh() is True
+    assert registry.reload_error is None
+    assert registry.current().get("alpha").policy.sla.deadline == 4
+
+
+def test_registry_keeps_last_good_snapshot_on_any_reload_error(tmp_path):
+    """An empty policy.yaml fails with AttributeError, not ValueError: still kept aside."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    registry = LocalSkillRegistry(tmp_path)
+    (tmp_path / "alpha" / "assets" / "policy.yaml").write_text("")
+    _bump_mtimes(tmp_path / "alpha")
+
+    assert registry.refresh() is False
+    assert registry.reload_error is not None
+    assert registry.current().get("alpha").policy.sla.deadline == 3
+
+
+def test_registry_does_not_revalidate_on_read_by_default(tmp_path, monkeypatch):
+    """Hot reload is opt-in: reads never rescan the tree unless check_interval is set."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    registry = LocalSkillRegistry(tmp_path)
+    assert registry.check_interval is None
+    scans = []
+    monkeypatch.setattr(registry, "_skill_folders", lambda: scans.append(1) or [])
+    registry._checked = float("-inf")  # any interval would be long overdue
+    registry.current()
+    registry.explanations("alpha")
+    assert scans == []
+
+
+def test_registry_revalidates_at_most_every_check_interval(tmp_path, monkeypatch):
+    """Reads between checks serve the snapshot without touching the filesystem."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    registry = LocalSkillRegistry(tmp_path, check_interval=60)
+    scans = []
+    monkeypatch.setattr(registry, "_skill_folders", lambda: scans.append(1) or [])
+    for _ in range(100):
+        registry.current()
+    assert scans == []
+
+
+def test_shared_skill_registry_is_one_instance_per_root(tmp_path):
+    """Every caller of the shared registry gets the same loaded instance."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    shared = shared_skill_registry(tmp_path)
+    assert shared_skill_registry(str(tmp_path)) is shared
+    assert shared_skill_registry(tmp_path / ".") is shared
+    assert shared_skill_registry() is not shared  # the default (repo) tree
+    assert shared_skill_registry().current().get("address-proof") is not None
+
+
+# Lazy mode: frontmatter-only index, body/policy/explanations on first use
+
+
+def test_parse_skill_frontmatter_matches_parse_skill_md(tmp_path):
+    """The frontmatter-only parser yields parse_skill_md's metadata and errors."""
+    for folder in resolve_default_skills_dir().iterdir():
+        if (folder / "SKILL.md").exists():
+            metadata, _ = parse_skill_md(folder / "SKILL.md")
+            assert parse_skill_frontmatter(folder / "SKILL.md") == metadata
+
+    (tmp_path / "SKILL.md").write_text("---\nname: test\n")  # No closing ---
+    with pytest.raises(ValueError, match="missing closing ---"):
+        parse_skill_frontmatter(tmp_path / "SKILL.md")
+
+
+@pytest.mark.anyio
+async def test_lazy_registry_indexes_frontmatter_and_loads_on_first_use(tmp_path, monkeypatch):
+    """300 skills: startup parses no body or policy; the card reads the index only; a
+    skill (and its explanations) is loaded once, on first use, then cached."""
+    import bridge.adapters.local.skill_registry as module
+
+    for i in range(300):
+        _write_process_skill(tmp_path / f"skill-{i:03}", deadline=i + 1)
+    (tmp_path / "skill-007" / "assets" / "explanations.yaml").write_text(
+        "requirement: {item: proof}\nreasons: {illegible: Retake the photo.}\n"
+    )
+    loads = []
+    real_load = module.load_skill
+    monkeypatch.setattr(
+        module, "load_skill", lambda path: loads.append(path.name) or real_load(path)
+    )
+
+    registry = LocalSkillRegistry(tmp_path, lazy=True)
+    card = registry.build_agent_card(base_url="http://test")
+    assert len(card.skills) == 300
+    assert loads == []
+
+    skill = await registry.get_skill("skill-007")
+    assert skill.policy.sla.deadline == 8
+    assert await registry.get_skill("skill-007") is skill
+    assert registry.explanations("skill-007").message_for("illegible") == "Retake the photo."
+    assert registry.explanations("skill-007") is registry.explanations("skill-007")
+    assert loads == ["skill-007"]
+
+
+def test_lazy_registry_reload_drops_the_loaded_skill(tmp_path):
+    """An edited folder is re-indexed; its skill is loaded afresh on the next use."""
+    _write_process_skill(tmp_path / "alpha", deadline=3)
+    registry = LocalSkillRegistry(tmp_path, lazy=True, check_interval=0)
+    assert registry.current().get("alpha").policy.sla.deadline == 3
+
+    _write_process_skill(tmp_path / "alpha", deadline=6, description="Edited")
+    _bump_mtimes(tmp_path / "alpha")
+    snapshot = registry.current()
+    assert snapshot.version == 2
+    assert snapshot.index["alpha"].description == "Edited"
+    assert snapshot.get("alpha").policy.sla.deadline == 6